@@ -16,6 +16,7 @@
 )
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import CANCELABLE_RUN_STATUSES
+from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.error import serializable_error_info_from_exc_info
 from starlette.concurrency import (
@@ -36,6 +37,10 @@
     resume_partition_backfill as resume_partition_backfill,
     retry_partition_backfill as retry_partition_backfill,
 )
+from dagster_graphql.implementation.execution.run_event_hub import (
+    get_run_events_broadcaster,
+    storage_id_for_cursor,
+)
 from dagster_graphql.implementation.utils import assert_permission, assert_permission_for_location
 
 if TYPE_CHECKING:
@@ -280,25 +285,57 @@ async def gen_events_for_run(
         has_more = connection.has_more
         after_cursor = connection.cursor
 
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[tuple[Any, Any]] = asyncio.Queue()
-
-    def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
-
-    # watch for live events
-    instance.watch_event_logs(run_id, after_cursor, _enqueue)
+    # watch for live events, sharing a single watch of the run's event log with any other
+    # subscribers to the run in this process
+    subscriber, hub_storage_id = get_run_events_broadcaster(instance).subscribe(
+        instance,
+        run_id,
+        run.job_name,
+        storage_id_for_cursor(instance, run_id, after_cursor),
+    )
     try:
+        # catch up on any events that were broadcast to other subscribers before this one joined
+        storage_id = subscriber.storage_id
+        while storage_id < hub_storage_id:
+            connection = await run_in_threadpool(
+                instance.get_records_for_run,
+                run_id=run_id,
+                cursor=EventLogCursor.from_storage_id(storage_id).to_string(),
+                limit=chunk_size,
+            )
+            records = [
+                record for record in connection.records if record.storage_id <= hub_storage_id
+            ]
+            if not records:
+                break
+            storage_id = records[-1].storage_id
+            yield GraphenePipelineRunLogsSubscriptionSuccess(
+                run=GrapheneRun(record),
+                messages=[
+                    from_event_record(record.event_log_entry, run.job_name) for record in records
+                ],
+                hasMorePastEvents=False,
+                cursor=EventLogCursor.from_storage_id(storage_id).to_string(),
+            )
+
         while True:
-            event, cursor = await queue.get()
+            event_messages = await subscriber.get()
+            if event_messages is None:
+                yield GraphenePipelineRunLogsSubscriptionFailure(
+                    message=(
+                        f"Stopped streaming events for run {run_id} because the subscription fell"
+                        " too far behind."
+                    ),
+                )
+                return
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
-                messages=[from_event_record(event, run.job_name)],
+                messages=event_messages.messages,
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=event_messages.cursor,
             )
     finally:
-        instance.end_watch_event_logs(run_id, _enqueue)
+        subscriber.close()
 
 
 async def gen_captured_log_data(
@@ -0,0 +1,259 @@
+import asyncio
+import os
+import threading
+import weakref
+from collections.abc import Sequence
+from typing import Any, NamedTuple, Optional
+
+import dagster._check as check
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.base import EventLogCursor
+
+
+def get_subscriber_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_UI_RUN_EVENTS_SUBSCRIBER_BUFFER_SIZE", "10000"))
+
+
+def storage_id_for_cursor(instance: DagsterInstance, run_id: str, cursor: Optional[str]) -> int:
+    """Returns the storage id of the last event of the run before the given cursor, or -1 if the
+    cursor is before the first event.
+    """
+    if cursor is None:
+        return -1
+
+    cursor_obj = EventLogCursor.parse(cursor)
+    if cursor_obj.is_id_cursor():
+        return cursor_obj.storage_id()
+
+    # offset cursors point after the nth event of the run, so look up the storage id of that event
+    offset = cursor_obj.offset()
+    if offset <= 0:
+        return -1
+    connection = instance.get_records_for_run(
+        run_id, cursor=EventLogCursor.from_offset(offset - 1).to_string(), limit=1
+    )
+    return connection.records[0].storage_id if connection.records else -1
+
+
+class RunEventMessages(NamedTuple):
+    """GraphQL messages for a contiguous range of events of a run, and the cursor after them."""
+
+    messages: Sequence[Any]
+    cursor: str
+
+
+class RunEventsSubscriber:
+    """Receives the GraphQL messages broadcast by a RunEventsHub on an asyncio event loop.
+
+    Messages are buffered until they are consumed with `get`. If the buffer grows beyond
+    `max_buffer_size` messages, the subscriber is evicted from the hub and `get` returns None once
+    the buffered messages are consumed.
+    """
+
+    def __init__(
+        self,
+        hub: "RunEventsHub",
+        loop: asyncio.AbstractEventLoop,
+        storage_id: int,
+        max_buffer_size: int,
+    ):
+        self._hub = hub
+        self._loop = loop
+        # messages for events at or before this storage id have already been sent to the consumer
+        self._storage_id = storage_id
+        self._max_buffer_size = max_buffer_size
+        self._queue: asyncio.Queue[Optional[tuple[Any, str]]] = asyncio.Queue()
+        self._evicted = False
+
+    @property
+    def storage_id(self) -> int:
+        return self._storage_id
+
+    @property
+    def evicted(self) -> bool:
+        return self._evicted
+
+    def publish(self, storage_id: int, message: Any, cursor: str) -> None:
+        # called by the hub from the thread that is watching the event log
+        if storage_id <= self._storage_id:
+            return
+        self._loop.call_soon_threadsafe(self._put, message, cursor)
+
+    def _put(self, message: Any, cursor: str) -> None:
+        if self._evicted:
+            return
+        if self._queue.qsize() >= self._max_buffer_size:
+            self._evicted = True
+            self._queue.put_nowait(None)
+            self._hub.unsubscribe(self)
+            return
+        self._queue.put_nowait((message, cursor))
+
+    async def get(self) -> Optional[RunEventMessages]:
+        """Waits for new messages, then returns all of the buffered messages at once. Returns None
+        if the subscriber has been evicted.
+        """
+        item = await self._queue.get()
+        items = [item]
+        while item is not None and not self._queue.empty():
+            item = self._queue.get_nowait()
+            items.append(item)
+
+        if items[-1] is None:
+            return None
+
+        return RunEventMessages(
+            messages=[message for message, _ in items],  # pyright: ignore[reportOptionalIterable]
+            cursor=items[-1][1],
+        )
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+
+
+class RunEventsHub:
+    """Watches the event log of a single run on behalf of all of its GraphQL subscribers.
+
+    Each new event is converted to a GraphQL message once and broadcast to every subscriber, rather
+    than each subscriber watching the event log and converting the event separately.
+    """
+
+    def __init__(
+        self,
+        broadcaster: "RunEventsBroadcaster",
+        instance: DagsterInstance,
+        run_id: str,
+        job_name: str,
+        storage_id: int,
+    ):
+        self._broadcaster = broadcaster
+        self._instance = instance
+        self._run_id = run_id
+        self._job_name = job_name
+        self._lock = threading.Lock()
+        self._subscribers: list[RunEventsSubscriber] = []
+        # the storage id of the last event that was broadcast
+        self._storage_id = storage_id
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def storage_id(self) -> int:
+        return self._storage_id
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def start_watch(self) -> None:
+        self._instance.watch_event_logs(
+            self._run_id,
+            EventLogCursor.from_storage_id(self._storage_id).to_string(),
+            self.handle_event,
+        )
+
+    def end_watch(self) -> None:
+        self._instance.end_watch_event_logs(self._run_id, self.handle_event)
+
+    def add_subscriber(self, subscriber: RunEventsSubscriber) -> int:
+        """Adds a subscriber and returns the storage id of the last event broadcast by the hub.
+        The subscriber will receive every event after both this storage id and its own.
+        """
+        with self._lock:
+            self._subscribers.append(subscriber)
+            return self._storage_id
+
+    def unsubscribe(self, subscriber: RunEventsSubscriber) -> None:
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers.remove(subscriber)
+            is_empty = not self._subscribers
+        if is_empty:
+            self._broadcaster.remove_hub_if_unused(self)
+
+    def handle_event(self, event: EventLogEntry, cursor: str) -> None:
+        from dagster_graphql.implementation.events import from_event_record
+
+        storage_id = EventLogCursor.parse(cursor).storage_id()
+        message = from_event_record(event, self._job_name)
+        with self._lock:
+            if storage_id <= self._storage_id:
+                # already broadcast
+                return
+            self._storage_id = storage_id
+            for subscriber in list(self._subscribers):
+                try:
+                    subscriber.publish(storage_id, message, cursor)
+                except RuntimeError:
+                    # the event loop of the subscriber has been closed
+                    self._subscribers.remove(subscriber)
+
+
+class RunEventsBroadcaster:
+    """Holds the RunEventsHub, and so a single event log watch, for each run of an instance that
+    has GraphQL subscribers in this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hubs_by_run_id: dict[str, RunEventsHub] = {}
+
+    def get_hub(self, run_id: str) -> Optional[RunEventsHub]:
+        with self._lock:
+            return self._hubs_by_run_id.get(run_id)
+
+    def subscribe(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        job_name: str,
+        storage_id: int,
+        max_buffer_size: Optional[int] = None,
+    ) -> tuple[RunEventsSubscriber, int]:
+        """Subscribes to the events of a run after the given storage id, from the running asyncio
+        event loop.
+
+        Returns the subscriber and the storage id of the last event broadcast by the run's hub. If
+        the hub is ahead of the given storage id, the caller must fetch the events in between from
+        storage itself.
+        """
+        check.str_param(run_id, "run_id")
+        loop = asyncio.get_running_loop()
+        if max_buffer_size is None:
+            max_buffer_size = get_subscriber_buffer_size()
+
+        with self._lock:
+            hub = self._hubs_by_run_id.get(run_id)
+            if hub is None:
+                hub = RunEventsHub(self, instance, run_id, job_name, storage_id)
+                self._hubs_by_run_id[run_id] = hub
+                hub.start_watch()
+            subscriber = RunEventsSubscriber(hub, loop, storage_id, max_buffer_size)
+            hub_storage_id = hub.add_subscriber(subscriber)
+
+        return subscriber, hub_storage_id
+
+    def remove_hub_if_unused(self, hub: RunEventsHub) -> None:
+        with self._lock:
+            if self._hubs_by_run_id.get(hub.run_id) is not hub or hub.subscriber_count:
+                return
+            del self._hubs_by_run_id[hub.run_id]
+        hub.end_watch()
+
+
+_broadcasters_lock = threading.Lock()
+_broadcasters: "weakref.WeakKeyDictionary[DagsterInstance, RunEventsBroadcaster]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_run_events_broadcaster(instance: DagsterInstance) -> RunEventsBroadcaster:
+    with _broadcasters_lock:
+        if instance not in _broadcasters:
+            _broadcasters[instance] = RunEventsBroadcaster()
+        return _broadcasters[instance]
@@ -1,4 +1,4 @@
-import datetime
+import itertools
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, AbstractSet, Any, Optional, Union  # noqa: UP035
@@ -15,7 +15,6 @@
 from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.tags import BACKFILL_ID_TAG, TagType, get_tag_type
 from dagster._record import copy, record
-from dagster._time import datetime_from_timestamp
 from dagster._utils.warnings import disable_dagster_warnings
 
 from dagster_graphql.implementation.external import ensure_valid_config, get_remote_job_or_raise
@@ -506,25 +505,6 @@ def _bulk_action_filters_from_run_filters(filters: RunsFilter) -> BulkActionsFil
     )
 
 
-def _replace_created_before_with_cursor(
-    filters: RunsFilter, created_before_cursor: Optional[datetime.datetime]
-):
-    """After the first page of results is returned, created_before_cursor will be less than
-    filters.created_before. For pagination of results to work, we need to ensure that the
-    created_before filter is set to the minimum of created_before_cursor and filters.created_before.
-    """
-    if filters.created_before and created_before_cursor:
-        created_before = min(created_before_cursor, filters.created_before)
-    elif created_before_cursor:
-        created_before = created_before_cursor
-    elif filters.created_before:
-        created_before = filters.created_before
-    else:  # no created_before should be applied, return filters as is
-        return filters
-
-    return copy(filters, created_before=created_before)
-
-
 def get_runs_feed_entries(
     graphene_info: "ResolveInfo",
     limit: int,
@@ -557,14 +537,6 @@ def get_runs_feed_entries(
     # the user chooses the "RUNS" view, we want to flatten backfills into their runs.
     exclude_subruns = view == GrapheneRunsFeedView.ROOTS
 
-    # if using limit, fetch limit+1 of each type to know if there are more than limit remaining
-    fetch_limit = limit + 1
-    # filter out any backfills/runs that are newer than the cursor timestamp. See RunsFeedCursor docstring
-    # for case when this is necessary
-    created_before_cursor = (
-        datetime_from_timestamp(runs_feed_cursor.timestamp) if runs_feed_cursor.timestamp else None
-    )
-
     should_fetch_backfills = (
         view == GrapheneRunsFeedView.ROOTS or view == GrapheneRunsFeedView.BACKFILLS
     ) and (_filters_apply_to_backfills(filters) if filters else True)
@@ -575,64 +547,41 @@ def get_runs_feed_entries(
         )
         with disable_dagster_warnings():
             run_filters = copy(filters, exclude_subruns=exclude_subruns)
-            run_filters = _replace_created_before_with_cursor(run_filters, created_before_cursor)
-        backfill_filters = (
-            _bulk_action_filters_from_run_filters(run_filters) if should_fetch_backfills else None
-        )
+        backfill_filters = _bulk_action_filters_from_run_filters(run_filters)
     else:
         with disable_dagster_warnings():
-            run_filters = RunsFilter(
-                created_before=created_before_cursor, exclude_subruns=exclude_subruns
-            )
-        backfill_filters = BulkActionsFilter(created_before=created_before_cursor)
-
-    if should_fetch_backfills:
-        backfills = [
-            GraphenePartitionBackfill(backfill)
-            for backfill in instance.get_backfills(
-                cursor=runs_feed_cursor.backfill_cursor,
-                limit=fetch_limit,
-                filters=backfill_filters,
-            )
-        ]
-    else:
-        backfills = []
+            run_filters = RunsFilter(exclude_subruns=exclude_subruns)
+        backfill_filters = BulkActionsFilter()
 
     # if we are not showing runs within backfills and the backfill_id filter is set, we know
     # there will be no results, so we can skip fetching runs
     should_fetch_runs = (
         view == GrapheneRunsFeedView.ROOTS or view == GrapheneRunsFeedView.RUNS
     ) and not (exclude_subruns and run_filters.tags.get(BACKFILL_ID_TAG) is not None)
-    if should_fetch_runs:
-        runs = [
-            GrapheneRun(run)
-            for run in instance.get_run_records(
-                limit=fetch_limit, cursor=runs_feed_cursor.run_cursor, filters=run_filters
-            )
-        ]
-    else:
-        runs = []
-
-    # if we fetched limit+1 of either runs or backfills, we know there must be more results
-    # to fetch on the next call since we will return limit results for this call. Additionally,
-    # if we fetched more than limit of runs and backfill combined, we know there are more results
-    has_more = (
-        len(backfills) == fetch_limit
-        or len(runs) == fetch_limit
-        or len(backfills) + len(runs) > limit
-    )
-
-    all_entries = backfills + runs
 
-    # order runs and backfills by create_time. typically we sort by storage id but that won't work here since
-    # they are different tables
-    all_entries = sorted(
-        all_entries,
-        key=lambda x: x.creation_timestamp,
-        reverse=True,
+    # runs and backfills are merged by creation time in storage. fetch limit+1 entries to know if
+    # there are more than limit remaining. Entries that are newer than the cursor timestamp are
+    # filtered out, see RunsFeedCursor docstring for the case when this is necessary
+    fetch_limit = limit + 1
+    entries = list(
+        itertools.islice(
+            instance.iter_runs_feed_entries(
+                run_filters if should_fetch_runs else None,
+                backfill_filters if should_fetch_backfills else None,
+                run_cursor=runs_feed_cursor.run_cursor,
+                backfill_cursor=runs_feed_cursor.backfill_cursor,
+                max_creation_timestamp=runs_feed_cursor.timestamp,
+                page_size=fetch_limit,
+            ),
+            fetch_limit,
+        )
     )
+    has_more = len(entries) > limit
 
-    to_return = all_entries[:limit]
+    to_return = [
+        GrapheneRun(entry) if isinstance(entry, RunRecord) else GraphenePartitionBackfill(entry)
+        for entry in entries[:limit]
+    ]
 
     new_run_cursor = None
     new_backfill_cursor = None
@@ -10,6 +10,7 @@
 from dagster._core.definitions.data_time import CachingDataTimeResolver
 from dagster._core.definitions.data_version import (
     NULL_DATA_VERSION,
+    StaleCause,
     StaleCauseCategory,
     StaleStatus,
 )
@@ -708,17 +709,20 @@ def resolve_staleStatusByPartition(
             partitions = self._get_partitions_def().get_partition_keys()
         else:
             self._validate_partitions_existence()
-        return [
-            self.stale_status_loader.get_status(self._asset_node_snap.asset_key, partition)
-            for partition in partitions
-        ]
+        return self.stale_status_loader.get_status_by_partition(
+            self._asset_node_snap.asset_key, partitions
+        )
 
     def resolve_staleCauses(
         self, graphene_info: ResolveInfo, partition: Optional[str] = None
     ) -> Sequence[GrapheneAssetStaleCause]:
         if partition:
             self._validate_partitions_existence()
-        return self._get_staleCauses(partition)
+        return self._to_graphene_stale_causes(
+            self.stale_status_loader.get_stale_root_causes(
+                self._asset_node_snap.asset_key, partition
+            )
+        )
 
     def resolve_staleCausesByPartition(
         self,
@@ -729,14 +733,16 @@ def resolve_staleCausesByPartition(
             partitions = self._get_partitions_def().get_partition_keys()
         else:
             self._validate_partitions_existence()
-        return [self._get_staleCauses(partition) for partition in partitions]
+        return [
+            self._to_graphene_stale_causes(causes)
+            for causes in self.stale_status_loader.get_stale_root_causes_by_partition(
+                self._asset_node_snap.asset_key, partitions
+            )
+        ]
 
-    def _get_staleCauses(
-        self, partition: Optional[str] = None
+    def _to_graphene_stale_causes(
+        self, causes: Sequence[StaleCause]
     ) -> Sequence[GrapheneAssetStaleCause]:
-        causes = self.stale_status_loader.get_stale_root_causes(
-            self._asset_node_snap.asset_key, partition
-        )
         return [
             GrapheneAssetStaleCause(
                 GrapheneAssetKey(path=cause.asset_key.path),
@@ -770,12 +776,9 @@ def resolve_dataVersionByPartition(
             partitions = self._get_partitions_def().get_partition_keys()
         else:
             self._validate_partitions_existence()
-        data_versions = [
-            self.stale_status_loader.get_current_data_version(
-                self._asset_node_snap.asset_key, partition
-            )
-            for partition in partitions
-        ]
+        data_versions = self.stale_status_loader.get_current_data_version_by_partition(
+            self._asset_node_snap.asset_key, partitions
+        )
         return [
             None if version == NULL_DATA_VERSION else version.value for version in data_versions
         ]
@@ -0,0 +1,192 @@
+import asyncio
+from unittest import mock
+
+from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster_graphql.implementation.execution import gen_events_for_run
+from dagster_graphql.implementation.execution.run_event_hub import (
+    get_run_events_broadcaster,
+    storage_id_for_cursor,
+)
+
+
+def _get_records(instance, run_id):
+    return instance.get_records_for_run(run_id).records
+
+
+def test_subscribers_share_watch():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        broadcaster = get_run_events_broadcaster(instance)
+
+        async def _subscribe():
+            with mock.patch.object(
+                instance, "watch_event_logs", wraps=instance.watch_event_logs
+            ) as watch_event_logs:
+                subscriber_one, _ = broadcaster.subscribe(instance, run.run_id, "foo", -1)
+                subscriber_two, _ = broadcaster.subscribe(instance, run.run_id, "foo", -1)
+            assert watch_event_logs.call_count == 1
+
+            instance.report_engine_event("hello", run)
+            try:
+                messages_one = await asyncio.wait_for(subscriber_one.get(), timeout=30)
+                messages_two = await asyncio.wait_for(subscriber_two.get(), timeout=30)
+            finally:
+                subscriber_one.close()
+                subscriber_two.close()
+
+            assert messages_one
+            assert messages_two
+            assert [message.message for message in messages_one.messages] == ["hello"]
+            # the event is converted to a GraphQL message once for both subscribers
+            assert messages_one.messages[0] is messages_two.messages[0]
+            assert messages_one.cursor == messages_two.cursor
+            assert broadcaster.get_hub(run.run_id) is None
+
+        asyncio.run(_subscribe())
+
+
+def test_subscriber_cursors():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        for i in range(3):
+            instance.report_engine_event(f"event {i}", run)
+        records = _get_records(instance, run.run_id)
+        broadcaster = get_run_events_broadcaster(instance)
+
+        async def _subscribe():
+            subscriber_one, hub_storage_id = broadcaster.subscribe(
+                instance, run.run_id, "foo", records[0].storage_id
+            )
+            assert hub_storage_id == records[0].storage_id
+            subscriber_two, _ = broadcaster.subscribe(
+                instance, run.run_id, "foo", records[1].storage_id
+            )
+            hub = broadcaster.get_hub(run.run_id)
+            assert hub
+            for record in records[1:]:
+                hub.handle_event(
+                    record.event_log_entry,
+                    EventLogCursor.from_storage_id(record.storage_id).to_string(),
+                )
+
+            messages_one = await subscriber_one.get()
+            messages_two = await subscriber_two.get()
+            subscriber_one.close()
+            subscriber_two.close()
+
+            assert messages_one
+            assert [message.message for message in messages_one.messages] == [
+                "event 1",
+                "event 2",
+            ]
+            assert messages_two
+            assert [message.message for message in messages_two.messages] == ["event 2"]
+
+        asyncio.run(_subscribe())
+
+
+def test_slow_subscriber_evicted():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        for i in range(3):
+            instance.report_engine_event(f"event {i}", run)
+        records = _get_records(instance, run.run_id)
+        broadcaster = get_run_events_broadcaster(instance)
+
+        async def _subscribe():
+            slow_subscriber, _ = broadcaster.subscribe(
+                instance, run.run_id, "foo", -1, max_buffer_size=2
+            )
+            subscriber, _ = broadcaster.subscribe(instance, run.run_id, "foo", -1)
+            hub = broadcaster.get_hub(run.run_id)
+            assert hub
+            for record in records:
+                hub.handle_event(
+                    record.event_log_entry,
+                    EventLogCursor.from_storage_id(record.storage_id).to_string(),
+                )
+
+            # let the event loop deliver the messages to the subscribers
+            await asyncio.sleep(0)
+            assert slow_subscriber.evicted
+            assert hub.subscriber_count == 1
+            assert await slow_subscriber.get() is None
+
+            messages = await subscriber.get()
+            assert messages
+            assert len(messages.messages) == 3
+            subscriber.close()
+            assert broadcaster.get_hub(run.run_id) is None
+
+        asyncio.run(_subscribe())
+
+
+def test_storage_id_for_offset_cursor():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        for i in range(3):
+            instance.report_engine_event(f"event {i}", run)
+        records = _get_records(instance, run.run_id)
+
+        assert storage_id_for_cursor(instance, run.run_id, None) == -1
+        assert (
+            storage_id_for_cursor(instance, run.run_id, EventLogCursor.from_offset(0).to_string())
+            == -1
+        )
+        assert (
+            storage_id_for_cursor(instance, run.run_id, EventLogCursor.from_offset(2).to_string())
+            == records[1].storage_id
+        )
+        assert (
+            storage_id_for_cursor(
+                instance,
+                run.run_id,
+                EventLogCursor.from_storage_id(records[2].storage_id).to_string(),
+            )
+            == records[2].storage_id
+        )
+
+
+def test_gen_events_for_run_catches_up():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        instance.report_engine_event("event 0", run)
+        broadcaster = get_run_events_broadcaster(instance)
+        graphene_info = mock.MagicMock()
+        graphene_info.context.instance = instance
+        get_records_for_run = instance.get_records_for_run
+
+        async def _subscribe():
+            other_subscriber, _ = broadcaster.subscribe(instance, run.run_id, "foo", -1)
+            hub = broadcaster.get_hub(run.run_id)
+            assert hub
+
+            def _get_records_for_run(*args, **kwargs):
+                connection = get_records_for_run(*args, **kwargs)
+                if not hub.storage_id > -1:
+                    # the hub broadcasts an event after the history of the run has been loaded,
+                    # but before the new subscriber joins
+                    instance.report_engine_event("event 1", run)
+                    for record in get_records_for_run(run.run_id).records:
+                        hub.handle_event(
+                            record.event_log_entry,
+                            EventLogCursor.from_storage_id(record.storage_id).to_string(),
+                        )
+                return connection
+
+            events = gen_events_for_run(graphene_info, run.run_id)
+            try:
+                with mock.patch.object(instance, "get_records_for_run", _get_records_for_run):
+                    history = await events.__anext__()
+                    caught_up = await events.__anext__()
+                assert [message.message for message in history.messages] == ["event 0"]
+                assert [message.message for message in caught_up.messages] == ["event 1"]
+                assert hub.subscriber_count == 2
+            finally:
+                await events.aclose()
+                other_subscriber.close()
+
+            assert broadcaster.get_hub(run.run_id) is None
+
+        asyncio.run(_subscribe())
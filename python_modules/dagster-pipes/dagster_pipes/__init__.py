@@ -917,12 +917,15 @@ class PipesDefaultMessageWriter(PipesMessageWriter):
     The write location is configured by the params received by the writer. If the params include a
     key `path`, then messages will be written to a file at the specified path. If the params instead
     include a key `stdio`, then messages then the corresponding value must specify either `stderr`
-    or `stdout`, and messages will be written to the selected stream.
+    or `stdout`, and messages will be written to the selected stream. The key `buffered_stdio` works
+    the same way, but buffers messages until the writer is closed, or until
+    `buffered_stdio_batch_size` messages have been buffered if that key is also present.
     """
 
     FILE_PATH_KEY = "path"
     STDIO_KEY = "stdio"
     BUFFERED_STDIO_KEY = "buffered_stdio"
+    BUFFERED_STDIO_BATCH_SIZE_KEY = "buffered_stdio_batch_size"
     STDERR = "stderr"
     STDOUT = "stdout"
     INCLUDE_STDIO_IN_MESSAGES_KEY: str = "include_stdio_in_messages"
@@ -963,7 +966,10 @@ def open(self, params: PipesParams) -> Iterator[PipesMessageWriterChannel]:
                 )
 
             target = sys.stderr if stream == self.STDERR else sys.stdout
-            channel = PipesBufferedStreamMessageWriterChannel(target)
+            batch_size = _assert_opt_env_param_type(
+                params, self.BUFFERED_STDIO_BATCH_SIZE_KEY, int, self.__class__
+            )
+            channel = PipesBufferedStreamMessageWriterChannel(target, batch_size=batch_size)
             try:
                 yield channel
             finally:
@@ -1000,18 +1006,29 @@ def write_message(self, message: PipesMessage) -> None:
 class PipesBufferedStreamMessageWriterChannel(PipesMessageWriterChannel):
     """Message writer channel that buffers messages and then writes them all out to a
     `TextIO` stream on close.
+
+    Args:
+        stream (TextIO): The stream to write messages to.
+        batch_size (Optional[int]): If set, the buffer is also written out whenever it holds this
+            many messages, rather than only on close. Each batch is written with a single call to
+            `write`, so that readers on the orchestration side receive whole batches of lines.
     """
 
-    def __init__(self, stream: TextIO):
+    def __init__(self, stream: TextIO, batch_size: Optional[int] = None):
         self._buffer = []
         self._stream = stream
+        self._batch_size = _assert_opt_param_type(
+            batch_size, int, self.__class__.__name__, "batch_size"
+        )
 
     def write_message(self, message: PipesMessage) -> None:
         self._buffer.append(message)
+        if self._batch_size is not None and len(self._buffer) >= self._batch_size:
+            self.flush()
 
     def flush(self):
-        for message in self._buffer:
-            self._stream.writelines((json.dumps(message), "\n"))
+        if self._buffer:
+            self._stream.write("".join(f"{json.dumps(message)}\n" for message in self._buffer))
         self._buffer = []
 
 
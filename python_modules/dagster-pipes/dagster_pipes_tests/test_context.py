@@ -1,3 +1,5 @@
+import io
+import json
 from collections.abc import Iterator
 from contextlib import contextmanager
 from unittest.mock import MagicMock
@@ -7,6 +9,7 @@
     PIPES_PROTOCOL_VERSION,
     PIPES_PROTOCOL_VERSION_FIELD,
     DagsterPipesError,
+    PipesBufferedStreamMessageWriterChannel,
     PipesContext,
     PipesContextData,
     PipesContextLoader,
@@ -271,3 +274,19 @@ def test_multiple_close():
     # `close` is idempotent, multiple calls should not raise an error
     context.close()
     context.close()
+
+
+def test_buffered_stream_message_writer_channel_batch_size():
+    stream = MagicMock(wraps=io.StringIO())
+    channel = PipesBufferedStreamMessageWriterChannel(stream, batch_size=2)
+    messages = [
+        _make_pipes_message(method="log", params={"level": "INFO", "message": str(i)})
+        for i in range(5)
+    ]
+    for message in messages:
+        channel.write_message(message)
+    assert stream.write.call_count == 2
+
+    channel.flush()
+    assert stream.write.call_count == 3
+    assert [json.loads(line) for line in stream.getvalue().splitlines()] == messages
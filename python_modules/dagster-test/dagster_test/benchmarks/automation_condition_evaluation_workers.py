@@ -0,0 +1,155 @@
+# ruff: noqa: T201
+import argparse
+import datetime
+from collections.abc import Sequence
+
+from dagster import (
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._core.instance_for_test import instance_for_test
+from dagster._time import get_current_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time when evaluating automation conditions with a varying number of evaluation
+workers. The asset graph has two topological levels, each with N assets:
+
+    [N partitions]           [N partitions]
+    (root_0)  ------------>  (downstream_0)
+    ...                      ...
+    (root_N)  ------------>  (downstream_N)
+
+N is configurable via the `--assets-per-level` arg, and each downstream asset has an eager
+condition. A single tick is evaluated once for each number of workers given by `--num-workers`,
+and the execution time of each evaluation is logged. Evaluation spends most of its time waiting on
+storage queries, so the speedup from additional workers depends on the latency of the storage
+backend and on the number of assets in each level.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="automation_condition_evaluation_workers",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--assets-per-level",
+    type=int,
+    nargs="+",
+    default=[10, 50, 200],
+    help="The numbers of assets in each topological level to benchmark.",
+)
+
+parser.add_argument(
+    "--num-workers",
+    type=int,
+    nargs="+",
+    default=[1, 2, 4, 8],
+    help="The numbers of evaluation workers to benchmark.",
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    default=30,
+    help="Set the number of partitions of each asset.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_definitions(
+    assets_per_level: int, partitions_def: DailyPartitionsDefinition
+) -> Definitions:
+    roots = [
+        asset(name=f"root_{i}", partitions_def=partitions_def)(lambda: None)
+        for i in range(assets_per_level)
+    ]
+    downstreams = [
+        asset(
+            name=f"downstream_{i}",
+            partitions_def=partitions_def,
+            deps=[root],
+            automation_condition=AutomationCondition.eager(),
+        )(lambda: None)
+        for i, root in enumerate(roots)
+    ]
+    return Definitions(assets=[*roots, *downstreams])
+
+
+def evaluate(defs: Definitions, instance: DagsterInstance, num_evaluation_workers: int) -> int:
+    asset_graph = defs.get_asset_graph()
+    evaluator = AutomationConditionEvaluator(
+        entity_keys={
+            key
+            for key in asset_graph.get_all_asset_keys()
+            if asset_graph.get(key).automation_condition is not None
+        },
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=AssetDaemonCursor.empty(),
+        emit_backfills=False,
+        num_evaluation_workers=num_evaluation_workers,
+    )
+    _, requested_subsets = evaluator.evaluate()
+    return sum(subset.size for subset in requested_subsets)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(assets_per_level: Sequence[int], num_workers: Sequence[int], num_partitions: int) -> None:
+    end = get_current_datetime()
+    partitions_def = DailyPartitionsDefinition(
+        start_date=end - datetime.timedelta(days=num_partitions), end_offset=0
+    )
+    session = ProfilingSession(
+        name="Automation condition evaluation workers",
+        experiment_settings={
+            "assets_per_level": assets_per_level,
+            "num_workers": num_workers,
+            "num_partitions": num_partitions,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    for num_assets in assets_per_level:
+        defs = get_definitions(num_assets, partitions_def)
+        with instance_for_test() as instance:
+            with session.logged_execution_time(f"Materialize {num_assets} root assets"):
+                partition_key = partitions_def.get_last_partition_key()
+                for i in range(num_assets):
+                    instance.report_runless_asset_event(
+                        AssetMaterialization(f"root_{i}", partition=partition_key)
+                    )
+
+            num_requested = None
+            for workers in num_workers:
+                with session.logged_execution_time(
+                    f"Evaluate {num_assets} assets per level with {workers} workers"
+                ):
+                    result = evaluate(defs, instance, workers)
+                # every number of workers must produce the same requests
+                assert num_requested is None or result == num_requested
+                num_requested = result
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.assets_per_level, args.num_workers, args.num_partitions)
@@ -0,0 +1,122 @@
+# ruff: noqa: T201
+import argparse
+import os
+from multiprocessing import forkserver
+
+from dagster import AssetsDefinition, Definitions, asset, define_asset_job, reconstructable
+from dagster._core.execution.api import execute_job
+from dagster._core.instance_for_test import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time taken by step processes of the multiprocess executor to load the definitions of a
+job, with and without the `preload_definitions` option of the forkserver start method. The job
+selects a few assets out of a large set of assets, all of which are rebuilt whenever the
+definitions are reconstructed.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="definitions_preload",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets", type=int, default=2000, help="Set the number of assets in the definitions."
+)
+parser.add_argument(
+    "--num-steps", type=int, default=8, help="Set the number of assets selected by the job."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def _build_assets(num_assets: int) -> list[AssetsDefinition]:
+    assets = []
+    for i in range(num_assets):
+        deps = [f"asset_{i - 1}"] if i > 0 else []
+
+        @asset(name=f"asset_{i}", deps=deps)
+        def _asset() -> None:
+            pass
+
+        assets.append(_asset)
+
+    return assets
+
+
+def define_benchmark_job():
+    num_assets = int(os.environ["DEFINITIONS_PRELOAD_NUM_ASSETS"])
+    num_steps = int(os.environ["DEFINITIONS_PRELOAD_NUM_STEPS"])
+    defs = Definitions(
+        assets=_build_assets(num_assets),
+        jobs=[
+            define_asset_job("benchmark_job", selection=[f"asset_{i}" for i in range(num_steps)])
+        ],
+    )
+    return defs.get_job_def("benchmark_job")
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_steps: int) -> None:
+    session = ProfilingSession(
+        name="Definitions preload",
+        experiment_settings={"num_assets": num_assets, "num_steps": num_steps},
+    ).start()
+    session.log_start_message()
+
+    # inherited by the forkserver and step processes, which reconstruct the job
+    os.environ["DEFINITIONS_PRELOAD_NUM_ASSETS"] = str(num_assets)
+    os.environ["DEFINITIONS_PRELOAD_NUM_STEPS"] = str(num_steps)
+
+    load_times = {}
+    for preload_definitions in [False, True]:
+        label = "preloaded" if preload_definitions else "reconstructed"
+        # restart the forkserver process, which only preloads the job when it starts
+        forkserver._forkserver._stop()  # noqa: SLF001
+        with instance_for_test() as instance:
+            with session.logged_execution_time(
+                f"Execute {num_steps} steps with {label} definitions"
+            ):
+                with execute_job(
+                    reconstructable(define_benchmark_job),
+                    instance=instance,
+                    run_config={
+                        "execution": {
+                            "config": {
+                                "multiprocess": {
+                                    "start_method": {
+                                        "forkserver": {"preload_definitions": preload_definitions}
+                                    }
+                                }
+                            }
+                        }
+                    },
+                ) as result:
+                    assert result.success
+                    load_times[label] = [
+                        event.engine_event_data.metadata["load_time_ms"].value
+                        for event in result.all_events
+                        if event.is_engine_event
+                        and "load_time_ms" in event.engine_event_data.metadata
+                    ]
+
+    forkserver._forkserver._stop()  # noqa: SLF001
+    session.log_result_summary()
+
+    for label, times in load_times.items():
+        print(
+            f"{label} definitions: {len(times)} step processes, mean load time"
+            f" {sum(times) / len(times):.1f} ms, total {sum(times):.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_steps)
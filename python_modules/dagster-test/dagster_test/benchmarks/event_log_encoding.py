@@ -0,0 +1,139 @@
+# ruff: noqa: T201
+import argparse
+
+import sqlalchemy as db
+from dagster import AssetKey, AssetMaterialization, MetadataValue, Output, job, op
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.storage.event_log.migration import reencode_event_log_data
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._core.test_utils import create_run_for_test
+from dagster._utils.env import environ
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the size and read throughput of event log entries stored as plain serialized JSON and as
+compressed values (DAGSTER_EVENT_LOG_COMPRESSION). The script executes a job whose ops log messages
+and report asset materializations with metadata, stores the resulting events in a fresh SQLite
+event log with each encoding, and reads them back. It then rewrites the plain events of a run in the
+compressed encoding with the re-encoding migration.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_log_encoding",
+    description=DESC,
+)
+
+parser.add_argument("--num-ops", type=int, default=10, help="Set the number of ops in the job.")
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=50,
+    help="Set the number of log messages and asset materializations emitted by each op.",
+)
+parser.add_argument(
+    "--num-reads", type=int, default=5, help="Set the number of times the events are read back."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_job(num_ops: int, num_events: int):
+    ops = []
+    for i in range(num_ops):
+
+        @op(name=f"op_{i}")
+        def _op(context):
+            for j in range(num_events):
+                context.log.info(f"Processing batch {j}")
+                context.log_event(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["benchmark", context.op.name, f"table_{j}"]),
+                        metadata={
+                            "rows": MetadataValue.int(j * 100),
+                            "path": MetadataValue.path(f"/data/{context.op.name}/table_{j}"),
+                            "description": "A table of benchmark data",
+                        },
+                    )
+                )
+            yield Output(None)
+
+        ops.append(_op)
+
+    @job
+    def encoding_job():
+        for _op in ops:
+            _op()
+
+    return encoding_job
+
+
+def _event_column_bytes(storage, run_id: str) -> int:
+    with storage.run_connection(run_id) as conn:
+        return conn.execute(
+            db_select([db.func.sum(db.func.length(SqlEventLogStorageTable.c.event))])
+        ).scalar()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_events: int, num_reads: int) -> None:
+    session = ProfilingSession(
+        name="Event log encoding",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_events": num_events,
+            "num_reads": num_reads,
+        },
+    ).start()
+    session.log_start_message()
+
+    with instance_for_test() as instance:
+        result = build_job(num_ops, num_events).execute_in_process(instance=instance)
+        run = instance.get_run_by_id(result.run_id)
+        assert run
+        events = instance.all_logs(result.run_id)
+    print(f"Generated {len(events)} events")
+
+    sizes = {}
+    for label, compression in [("plain", "0"), ("compressed", "1")]:
+        with environ({"DAGSTER_EVENT_LOG_COMPRESSION": compression}):
+            with instance_for_test() as instance:
+                create_run_for_test(instance, run_id=run.run_id, job_name=run.job_name)
+                storage = instance.event_log_storage
+                run_id = run.run_id
+                with session.logged_execution_time(f"Store {len(events)} {label} events"):
+                    for event in events:
+                        storage.store_event(event)
+
+                sizes[label] = _event_column_bytes(storage, run_id)
+
+                with session.logged_execution_time(
+                    f"Read {len(events)} {label} events {num_reads} times"
+                ):
+                    for _ in range(num_reads):
+                        assert len(storage.get_logs_for_run(run_id)) == len(events)
+
+                if compression == "0":
+                    with environ({"DAGSTER_EVENT_LOG_COMPRESSION": "1"}):
+                        with session.logged_execution_time(
+                            f"Compress {len(events)} stored events with the re-encoding migration"
+                        ):
+                            reencode_event_log_data(instance)
+                    assert _event_column_bytes(storage, run_id) < sizes[label]
+
+    session.log_result_summary()
+
+    for label, size in sizes.items():
+        print(f"{label} event column size: {size / 1e6:.2f} MB ({size / len(events):.0f} B/event)")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_events, args.num_reads)
@@ -0,0 +1,145 @@
+# ruff: noqa: T201
+import argparse
+
+from dagster import DynamicOut, DynamicOutput, In, Nothing, OpDefinition, graph, op
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.system_config.objects import ResolvedRunConfig
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time when building execution plans for a large generated job. The job is a chain
+of layers of ops fed by a dynamic fan-out, where each op depends on a few ops in the previous layer.
+The script builds the full plan, subset plans for a re-execution of a single layer, and re-execution
+plans whose dynamic steps are resolved from known state, and logs the execution time for each step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="execution_plan_build",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-layers", type=int, default=100, help="Set the number of layers in the generated job."
+)
+parser.add_argument(
+    "--layer-width", type=int, default=100, help="Set the number of ops in each layer."
+)
+parser.add_argument(
+    "--fan-in",
+    type=int,
+    default=3,
+    help="Set the number of ops in the previous layer that each op depends on.",
+)
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=3,
+    help="Set the number of times each plan is built.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_job(num_layers: int, layer_width: int, fan_in: int) -> JobDefinition:
+    @op(out=DynamicOut())
+    def fan_out():
+        for i in range(3):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def mapped(x):
+        return x
+
+    @op
+    def collect(xs):
+        return xs
+
+    layer_ops = [
+        [
+            OpDefinition(
+                name=f"op_{layer}_{i}",
+                ins={"upstream": In(Nothing)},
+                compute_fn=lambda _context, **_kwargs: None,
+            )
+            for i in range(layer_width)
+        ]
+        for layer in range(num_layers)
+    ]
+
+    @graph
+    def large_graph():
+        collected = collect(fan_out().map(mapped).collect())
+        previous = [collected]
+        for ops in layer_ops:
+            previous = [
+                op_def(
+                    upstream=[
+                        previous[(i + j) % len(previous)] for j in range(min(fan_in, len(previous)))
+                    ]
+                )
+                for i, op_def in enumerate(ops)
+            ]
+
+    return large_graph.to_job()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_layers: int, layer_width: int, fan_in: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Execution plan build",
+        experiment_settings={
+            "num_layers": num_layers,
+            "layer_width": layer_width,
+            "fan_in": fan_in,
+            "num_iterations": num_iterations,
+        },
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build job"):
+        job_def = build_job(num_layers, layer_width, fan_in)
+
+    with session.logged_execution_time("Build full plan (first time)"):
+        full_plan = create_execution_plan(job_def)
+
+    with session.logged_execution_time(f"Build full plan {num_iterations} times"):
+        for _ in range(num_iterations):
+            create_execution_plan(job_def)
+
+    layer_step_keys = [f"op_{num_layers // 2}_{i}" for i in range(layer_width)]
+    with session.logged_execution_time(f"Build single-layer subset plan {num_iterations} times"):
+        for _ in range(num_iterations):
+            create_execution_plan(job_def, step_keys_to_execute=layer_step_keys)
+
+    resolved_run_config = ResolvedRunConfig.build(job_def)
+    with session.logged_execution_time(f"Subset the full plan {num_iterations} times"):
+        for _ in range(num_iterations):
+            full_plan.build_subset_plan(layer_step_keys, job_def, resolved_run_config)
+
+    known_state = KnownExecutionState(
+        dynamic_mappings={"fan_out": {"result": ["0", "1", "2"]}},
+    )
+    downstream_step_keys = [step.key for step in full_plan.steps if step.key != "fan_out"]
+    with session.logged_execution_time(
+        f"Build re-execution plan with dynamic mappings {num_iterations} times"
+    ):
+        for _ in range(num_iterations):
+            create_execution_plan(
+                job_def, step_keys_to_execute=downstream_step_keys, known_state=known_state
+            )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_layers, args.layer_width, args.fan_in, args.num_iterations)
@@ -0,0 +1,112 @@
+# ruff: noqa: T201
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time it takes to import dagster through the entry points used by different processes.
+Each entry point is imported in a fresh interpreter, repeatedly, and the script logs the median
+import time and the number of dagster modules and total modules imported. Run this before and after
+changes to the import structure of dagster to catch import time regressions.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="import_time",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=5,
+    help="Set the number of fresh interpreters each entry point is imported in.",
+)
+
+# ########################
+# ##### ENTRY POINTS
+# ########################
+
+ENTRY_POINTS = {
+    "import dagster": "import dagster",
+    "definitions": "from dagster import Definitions, asset, define_asset_job, job, op",
+    "serdes": "from dagster._serdes import deserialize_value, serialize_value",
+    "instance": "from dagster._core.instance import DagsterInstance",
+    "grpc server": "from dagster._grpc.server import DagsterApiServer",
+    "step worker": (
+        "import click\n"
+        "from dagster._cli import cli\n"
+        "cli.get_command(click.Context(cli), 'api').get_command(click.Context(cli), 'execute_step')"
+    ),
+    "cli": (
+        "import click\n"
+        "from dagster._cli import cli\n"
+        "ctx = click.Context(cli)\n"
+        "[cli.get_command(ctx, name) for name in cli.list_commands(ctx)]"
+    ),
+}
+
+MEASURE_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+exec(compile({code!r}, "<entry point>", "exec"))
+elapsed = time.perf_counter() - start
+print(
+    json.dumps(
+        {{
+            "time": elapsed,
+            "dagster_modules": len([m for m in sys.modules if m.split(".")[0] == "dagster"]),
+            "modules": len(sys.modules),
+        }}
+    )
+)
+"""
+
+
+def measure(code: str) -> dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Import time",
+        experiment_settings={"num_iterations": num_iterations},
+    ).start()
+    session.log_start_message()
+
+    results = {}
+    for name, code in ENTRY_POINTS.items():
+        with session.logged_execution_time(f"Import {name}"):
+            results[name] = [measure(code) for _ in range(num_iterations)]
+
+    session.log_result_summary()
+
+    for name, measurements in results.items():
+        median_time = statistics.median(m["time"] for m in measurements)
+        print(
+            f"{name}: {median_time:.3f}s median,"
+            f" {int(measurements[0]['dagster_modules'])} dagster modules,"
+            f" {int(measurements[0]['modules'])} modules"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_iterations)
@@ -0,0 +1,123 @@
+# ruff: noqa: T201
+import argparse
+
+from dagster import (
+    AssetsDefinition,
+    Config,
+    Definitions,
+    StaticPartitionsDefinition,
+    asset,
+    define_asset_job,
+)
+from dagster._core.definitions.repository_definition import RepositoryDefinition
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._serdes import deserialize_value, serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the size of repository snapshots, and the time it takes to build, serialize and deserialize
+them, for a large generated repository. The assets are split into groups, each a chain of assets
+with an asset job, and alternate groups are partitioned. The script compares snapshots which include
+each job's snapshot in full with snapshots which share config type, Dagster type and node definition
+snapshots between jobs.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="repository_snapshots",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets", type=int, default=5000, help="Set the number of assets in the repository."
+)
+parser.add_argument(
+    "--group-size", type=int, default=100, help="Set the number of assets in each asset job."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+class AssetConfig(Config):
+    multiplier: int = 1
+    label: str = "default"
+
+
+def build_repository(num_assets: int, group_size: int) -> RepositoryDefinition:
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10)])
+    assets: list[AssetsDefinition] = []
+    jobs = []
+    for group_index, group_start in enumerate(range(0, num_assets, group_size)):
+        group_name = f"group_{group_index}"
+        previous = None
+        for i in range(group_start, min(group_start + group_size, num_assets)):
+
+            @asset(
+                name=f"asset_{i}",
+                group_name=group_name,
+                deps=[previous] if previous else None,
+                partitions_def=partitions_def if group_index % 2 else None,
+            )
+            def _asset(config: AssetConfig) -> None: ...
+
+            assets.append(_asset)
+            previous = _asset
+        jobs.append(define_asset_job(f"{group_name}_job", selection=f"group:{group_name}"))
+
+    return Definitions(assets=assets, jobs=jobs).get_repository_def()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, group_size: int) -> None:
+    session = ProfilingSession(
+        name="Repository snapshots",
+        experiment_settings={"num_assets": num_assets, "group_size": group_size},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build repository"):
+        repository_def = build_repository(num_assets, group_size)
+        repository_def.get_all_jobs()
+
+    with session.logged_execution_time("Build repository snapshot"):
+        repository_snap = RepositorySnap.from_def(repository_def)
+
+    with session.logged_execution_time("Build shared repository snapshot"):
+        shared_repository_snap = RepositorySnap.from_def(repository_def, share_job_snapshots=True)
+
+    with session.logged_execution_time("Serialize repository snapshot"):
+        serialized = serialize_value(repository_snap)
+
+    with session.logged_execution_time("Serialize shared repository snapshot"):
+        shared_serialized = serialize_value(shared_repository_snap)
+
+    with session.logged_execution_time("Deserialize repository snapshot"):
+        deserialize_value(serialized, RepositorySnap)
+
+    with session.logged_execution_time("Deserialize shared repository snapshot"):
+        loaded_shared_repository_snap = deserialize_value(shared_serialized, RepositorySnap)
+
+    job_snap_table = loaded_shared_repository_snap.job_snap_table
+    assert job_snap_table
+    with session.logged_execution_time("Load one job from shared repository snapshot"):
+        job_snap_table.get_job_data(job_snap_table.job_names[0])
+
+    with session.logged_execution_time("Load all jobs from shared repository snapshot"):
+        loaded_shared_repository_snap.get_job_datas()
+
+    session.log_result_summary()
+
+    print(f"Jobs: {len(job_snap_table.job_names)}")
+    print(f"Repository snapshot size: {len(serialized) / 1e6:.2f} MB")
+    print(f"Shared repository snapshot size: {len(shared_serialized) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.group_size)
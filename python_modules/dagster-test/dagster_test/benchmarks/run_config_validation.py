@@ -0,0 +1,167 @@
+# ruff: noqa: T201
+import argparse
+from typing import Any
+
+from dagster import (
+    Array,
+    Enum,
+    EnumValue,
+    Field,
+    GraphDefinition,
+    Noneable,
+    OpDefinition,
+    ResourceDefinition,
+    Selector,
+    Shape,
+)
+from dagster._config import process_config
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.system_config.objects import ResolvedRunConfig
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time when validating run config and resolving config defaults for a large
+generated job. Each op and resource in the job has a config schema mixing shapes, arrays, selectors,
+enums, noneable fields and fields with defaults. The script validates the same run config repeatedly
+(as happens on run launch and in every step worker) and logs the execution time for each step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="run_config_validation",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops", type=int, default=500, help="Set the number of ops in the generated job."
+)
+parser.add_argument(
+    "--num-resources",
+    type=int,
+    default=100,
+    help="Set the number of resources in the generated job.",
+)
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=10,
+    help="Set the number of times the run config is validated.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+CONFIG_SCHEMA = {
+    "name": Field(str),
+    "count": Field(int, default_value=1),
+    "ratio": Field(float, is_required=False),
+    "enabled": Field(bool, default_value=True),
+    "tags": Field([str], default_value=[]),
+    "mode": Field(
+        Enum("Mode", [EnumValue("FAST"), EnumValue("SLOW")]),
+        default_value="FAST",
+    ),
+    "target": Field(
+        Selector({"path": Field(str), "table": Field(Shape({"schema": str, "name": str}))}),
+    ),
+    "retries": Field(
+        Shape(
+            {
+                "max_retries": Field(int, default_value=3),
+                "delay": Field(Noneable(float), default_value=None),
+            }
+        ),
+        is_required=False,
+    ),
+    "columns": Field(
+        Array(Shape({"name": str, "type": Field(str, default_value="string")})),
+        is_required=False,
+    ),
+}
+
+
+def _config_value(i: int) -> dict[str, Any]:
+    return {
+        "name": f"item_{i}",
+        "ratio": 0.5,
+        "tags": ["a", "b"],
+        "target": {"table": {"schema": "public", "name": f"table_{i}"}},
+        "columns": [{"name": f"col_{j}"} for j in range(5)],
+    }
+
+
+def build_job(num_ops: int, num_resources: int) -> JobDefinition:
+    resource_keys = {f"resource_{i}" for i in range(num_resources)}
+    ops = [
+        OpDefinition(
+            name=f"op_{i}",
+            compute_fn=lambda _context: None,
+            config_schema=CONFIG_SCHEMA,
+            required_resource_keys=resource_keys,
+        )
+        for i in range(num_ops)
+    ]
+    resources = {
+        key: ResourceDefinition(resource_fn=lambda _context: None, config_schema=CONFIG_SCHEMA)
+        for key in resource_keys
+    }
+    return GraphDefinition(name="large_graph", node_defs=ops).to_job(resource_defs=resources)
+
+
+def build_run_config(num_ops: int, num_resources: int) -> dict[str, Any]:
+    return {
+        "ops": {f"op_{i}": {"config": _config_value(i)} for i in range(num_ops)},
+        "resources": {
+            f"resource_{i}": {"config": _config_value(i)} for i in range(num_resources)
+        },
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_resources: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Run config validation",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_resources": num_resources,
+            "num_iterations": num_iterations,
+        },
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("Build job"):
+        job_def = build_job(num_ops, num_resources)
+        run_config = build_run_config(num_ops, num_resources)
+        run_config_schema_type = job_def.run_config_schema.run_config_schema_type
+
+    with session.logged_execution_time("Validate run config (first use of schema)"):
+        assert process_config(run_config_schema_type, run_config).success
+
+    with session.logged_execution_time(f"Validate run config {num_iterations} times"):
+        for _ in range(num_iterations):
+            assert process_config(run_config_schema_type, run_config).success
+
+    invalid_run_config = build_run_config(num_ops, num_resources)
+    for op_config in invalid_run_config["ops"].values():
+        del op_config["config"]["name"]
+    with session.logged_execution_time(
+        f"Validate invalid run config {num_iterations} times ({num_ops} errors each)"
+    ):
+        for _ in range(num_iterations):
+            assert not process_config(run_config_schema_type, invalid_run_config).success
+
+    with session.logged_execution_time(f"Build ResolvedRunConfig {num_iterations} times"):
+        for _ in range(num_iterations):
+            ResolvedRunConfig.build(job_def, run_config)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_resources, args.num_iterations)
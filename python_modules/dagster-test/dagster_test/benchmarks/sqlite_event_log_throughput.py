@@ -0,0 +1,179 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    DynamicOut,
+    DynamicOutput,
+    job,
+    multiprocess_executor,
+    op,
+    reconstructable,
+)
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.api import execute_job
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.storage.event_log import SqliteEventLogStorage
+from dagster._core.utils import make_new_run_id
+from dagster._time import get_current_timestamp
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze event write throughput of the default run-sharded SQLite event log storage. The script
+executes a job on the multiprocess executor where a dynamic fan-out of ops each log messages and
+report asset materializations, so every step process writes to its run shard and the index shard at
+the same time. It then stores events directly from a pool of threads, individually and in batches,
+across several run shards. Execution time is logged for each step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="sqlite_event_log_throughput",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops", type=int, default=16, help="Set the number of mapped ops in the job."
+)
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=50,
+    help="Set the number of log messages and asset materializations emitted by each op.",
+)
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=4,
+    help="Set the maximum number of step processes and writer threads.",
+)
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=25,
+    help="Set the number of events in each batch when storing events in batches.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op(out=DynamicOut(), config_schema={"num_ops": int})
+def fan_out(context):
+    for i in range(context.op_config["num_ops"]):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op(config_schema={"num_events": int})
+def emit_events(context, i: int) -> int:
+    for j in range(context.op_config["num_events"]):
+        context.log.info(f"event {j}")
+        context.log_event(AssetMaterialization(asset_key=AssetKey(["benchmark", f"asset_{i}"])))
+    return i
+
+
+@op
+def collect(values: list[int]) -> int:
+    return len(values)
+
+
+@job(executor_def=multiprocess_executor)
+def event_throughput_job():
+    collect(fan_out().map(emit_events).collect())
+
+
+def _materialization_event(run_id: str, asset_key: AssetKey) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=get_current_timestamp(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "nonce",
+            event_specific_data=StepMaterializationData(AssetMaterialization(asset_key=asset_key)),
+        ),
+    )
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_events: int, max_concurrent: int, batch_size: int) -> None:
+    session = ProfilingSession(
+        name="SQLite event log throughput",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_events": num_events,
+            "max_concurrent": max_concurrent,
+            "batch_size": batch_size,
+        },
+    ).start()
+    session.log_start_message()
+
+    run_config = {
+        "ops": {
+            "fan_out": {"config": {"num_ops": num_ops}},
+            "emit_events": {"config": {"num_events": num_events}},
+        },
+        "execution": {"config": {"max_concurrent": max_concurrent}},
+    }
+    with instance_for_test() as instance:
+        with session.logged_execution_time(
+            f"Execute job with {num_ops} ops on the multiprocess executor"
+        ):
+            with execute_job(
+                reconstructable(event_throughput_job), instance=instance, run_config=run_config
+            ) as result:
+                assert result.success
+                run_id = result.run_id
+
+        num_stored = len(instance.all_logs(run_id))
+        print(f"Stored {num_stored} events for run {run_id}")
+
+    num_runs = max_concurrent
+    num_events_per_run = num_ops * num_events
+    with tempfile.TemporaryDirectory() as base_dir:
+        storage = SqliteEventLogStorage(base_dir)
+        run_events = [
+            [
+                _materialization_event(run_id, AssetKey(["benchmark", f"asset_{i % num_ops}"]))
+                for i in range(num_events_per_run)
+            ]
+            for run_id in [make_new_run_id() for _ in range(num_runs)]
+        ]
+
+        def store_individually(events: list[EventLogEntry]) -> None:
+            for event in events:
+                storage.store_event(event)
+
+        def store_in_batches(events: list[EventLogEntry]) -> None:
+            for i in range(0, len(events), batch_size):
+                storage.store_event_batch(events[i : i + batch_size])
+
+        for label, store_fn in [
+            ("individually", store_individually),
+            ("in batches", store_in_batches),
+        ]:
+            with session.logged_execution_time(
+                f"Store {num_runs}x{num_events_per_run} asset events {label} from {num_runs} threads"
+            ):
+                with ThreadPoolExecutor(max_workers=num_runs) as executor:
+                    list(executor.map(store_fn, run_events))
+
+        storage.dispose()
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_events, args.max_concurrent, args.batch_size)
@@ -0,0 +1,130 @@
+# ruff: noqa: T201
+import argparse
+import random
+from collections.abc import Sequence
+from datetime import timedelta
+
+import dagster._core.definitions.time_window_partitions as time_window_partitions
+from dagster import PartitionKeyRange, TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindow
+from dagster._time import get_current_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time of the lookups that map time window partition keys to time windows and count
+partitions, for an hourly partitions definition in a timezone with DST transitions and for a
+weekday partitions definition without a fixed interval. Each lookup is run against the cached
+partition timeline and against the cron schedule iterators that are used when the timeline is
+disabled, and the execution time for each step is logged.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-years",
+    type=int,
+    default=3,
+    help="Set the number of years of partitions in each partitions definition.",
+)
+parser.add_argument(
+    "--num-lookups",
+    type=int,
+    default=2000,
+    help="Set the number of partition keys and time windows that are looked up.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_partitions_defs(num_years: int) -> Sequence[TimeWindowPartitionsDefinition]:
+    start = get_current_datetime() - timedelta(days=365 * num_years)
+    return [
+        TimeWindowPartitionsDefinition(
+            start=start.strftime("%Y-%m-%d-%H:00"),
+            cron_schedule="0 * * * *",
+            fmt="%Y-%m-%d-%H:%M",
+            timezone="America/Los_Angeles",
+        ),
+        TimeWindowPartitionsDefinition(
+            start=start.strftime("%Y-%m-%d"),
+            cron_schedule="0 9 * * 1-5",
+            fmt="%Y-%m-%d",
+        ),
+    ]
+
+
+def _clear_caches() -> None:
+    time_window_partitions.get_partition_timeline.cache_clear()
+    for method in [
+        TimeWindowPartitionsDefinition.time_window_for_partition_key,
+        TimeWindowPartitionsDefinition.time_windows_for_partition_keys,
+        TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+    ]:
+        method.cache_clear()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_years: int, num_lookups: int) -> None:
+    session = ProfilingSession(
+        name="Time window partitions",
+        experiment_settings={"num_years": num_years, "num_lookups": num_lookups},
+    ).start()
+    session.log_start_message()
+
+    max_timeline_size = time_window_partitions.MAX_PARTITION_TIMELINE_SIZE
+    rng = random.Random(0)
+    for partitions_def in build_partitions_defs(num_years):
+        name = partitions_def.cron_schedule
+        all_keys = partitions_def.get_partition_keys()
+        keys = [rng.choice(all_keys) for _ in range(num_lookups)]
+        ranges = [PartitionKeyRange(*sorted(rng.sample(all_keys, 2))) for _ in range(num_lookups)]
+        windows = [
+            TimeWindow(
+                partitions_def.start_time_for_partition_key(key_range.start),
+                partitions_def.start_time_for_partition_key(key_range.end),
+            )
+            for key_range in ranges
+        ]
+
+        for timeline_size, label in [(0, "iterators"), (max_timeline_size, "timeline")]:
+            time_window_partitions.MAX_PARTITION_TIMELINE_SIZE = timeline_size
+            _clear_caches()
+
+            with session.logged_execution_time(f"[{name}] ({label}) get_partition_keys"):
+                partitions_def.get_partition_keys()
+
+            with session.logged_execution_time(f"[{name}] ({label}) has_partition_key"):
+                for key in keys:
+                    partitions_def.has_partition_key(key)
+
+            with session.logged_execution_time(
+                f"[{name}] ({label}) time_windows_for_partition_keys"
+            ):
+                for i in range(0, num_lookups, 100):
+                    partitions_def.time_windows_for_partition_keys(frozenset(keys[i : i + 100]))
+
+            with session.logged_execution_time(f"[{name}] ({label}) get_partition_keys_in_range"):
+                for key_range in ranges[: num_lookups // 10]:
+                    partitions_def.get_partition_keys_in_range(key_range)
+
+            with session.logged_execution_time(f"[{name}] ({label}) get_num_partitions_in_window"):
+                for window in windows[: num_lookups // 10]:
+                    partitions_def.get_num_partitions_in_window(window)
+
+    time_window_partitions.MAX_PARTITION_TIMELINE_SIZE = max_timeline_size
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_years, args.num_lookups)
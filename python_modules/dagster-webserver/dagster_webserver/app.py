@@ -6,6 +6,7 @@
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from starlette.applications import Starlette
 
+from dagster_webserver.graphql import GraphQLResponseCacheConfig
 from dagster_webserver.webserver import DagsterWebserver
 
 
@@ -13,6 +14,7 @@ def create_app_from_workspace_process_context(
     workspace_process_context: IWorkspaceProcessContext,
     path_prefix: str = "",
     live_data_poll_rate: Optional[int] = None,
+    response_cache_config: Optional[GraphQLResponseCacheConfig] = None,
     **kwargs,
 ) -> Starlette:
     check.inst_param(
@@ -36,4 +38,5 @@ def create_app_from_workspace_process_context(
         workspace_process_context,
         path_prefix,
         live_data_poll_rate,
+        response_cache_config=response_cache_config,
     ).create_asgi_app(**kwargs)
@@ -26,6 +26,7 @@
 from dagster._utils.log import configure_loggers
 
 from dagster_webserver.app import create_app_from_workspace_process_context
+from dagster_webserver.graphql import DEFAULT_RESPONSE_CACHE_MAX_BYTES, GraphQLResponseCacheConfig
 from dagster_webserver.version import __version__
 
 
@@ -180,6 +181,23 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--graphql-response-cache-ttl",
+    help=(
+        "Cache the results of read-only GraphQL queries for up to this many seconds. Cached results"
+        " are only served while the workspace and the instance's run and event log storage are"
+        " unchanged. Disabled by default."
+    ),
+    type=click.FLOAT,
+    required=False,
+)
+@click.option(
+    "--graphql-response-cache-max-mb",
+    help="The maximum total size of cached GraphQL query results, in megabytes.",
+    type=click.INT,
+    default=DEFAULT_RESPONSE_CACHE_MAX_BYTES // (1024 * 1024),
+    show_default=True,
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -195,6 +213,8 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    graphql_response_cache_ttl: Optional[float],
+    graphql_response_cache_max_mb: int,
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -231,6 +251,12 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                response_cache_config=GraphQLResponseCacheConfig(
+                    ttl_seconds=graphql_response_cache_ttl,
+                    max_bytes=graphql_response_cache_max_mb * 1024 * 1024,
+                )
+                if graphql_response_cache_ttl
+                else None,
             )
 
 
@@ -254,6 +280,7 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: Optional[int] = None,
+    response_cache_config: Optional[GraphQLResponseCacheConfig] = None,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -262,11 +289,16 @@ def host_dagster_ui_with_workspace_process_context(
     check.opt_int_param(port, "port")
     check.str_param(path_prefix, "path_prefix")
     check.opt_int_param(live_data_poll_rate, "live_data_poll_rate")
+    check.opt_inst_param(response_cache_config, "response_cache_config", GraphQLResponseCacheConfig)
 
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        response_cache_config=response_cache_config,
+        lifespan=_lifespan,
     )
 
     if not port:
@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import AsyncIterator, Mapping
+from typing import Any, Optional, Union
 
 import dagster._check as check
 from dagster import AssetObservation
@@ -11,9 +12,18 @@
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
 from dagster._core.workspace.context import BaseWorkspaceRequestContext
 from dagster._seven import json
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+# Events from a bulk report are written to storage in batches of this size. The request body is not
+# read further until each batch is written, so clients reporting faster than storage can keep up
+# are slowed down by the server's TCP receive window rather than buffered in memory.
+REPORT_ASSET_EVENTS_BATCH_SIZE = 1000
+
+# The maximum size in bytes of a single line in a bulk report.
+REPORT_ASSET_EVENTS_MAX_LINE_BYTES = 1024 * 1024
+
 
 def _asset_key_from_request(key: str, request: Request, json_body):
     check.invariant(key == "asset_key")  #
@@ -296,6 +306,124 @@ async def handle_report_asset_observation_request(
     return JSONResponse({})
 
 
+async def handle_report_asset_events_request(
+    context: BaseWorkspaceRequestContext,
+    request: Request,
+) -> JSONResponse:
+    # Record a stream of runless asset materializations, observations and check evaluations.
+    # The body is newline delimited JSON, with one event per line. Each line has a "type" of
+    # "materialization", "observation" or "check_evaluation", and the same properties as the json
+    # body of the corresponding single event endpoint. Lines are validated as they are read, and
+    # the response has a result per line: {} if the event was recorded, or {"error": ...}.
+
+    body_content_type = request.headers.get("content-type")
+    if body_content_type not in ("application/x-ndjson", "application/jsonl"):
+        return JSONResponse(
+            {
+                "error": (
+                    f"Unhandled content type {body_content_type}, expect application/x-ndjson"
+                ),
+            },
+            status_code=400,
+        )
+
+    tags = context.get_reporting_user_tags()
+    results: list[dict[str, str]] = []
+    batch: list[Union[AssetMaterialization, AssetObservation, AssetCheckEvaluation]] = []
+
+    async for line in _read_lines(request):
+        if line is None:
+            results.append({"error": f"Line exceeds {REPORT_ASSET_EVENTS_MAX_LINE_BYTES} bytes."})
+            continue
+
+        if not line.strip():
+            continue
+
+        try:
+            event = _asset_event_from_json(json.loads(line), tags)
+        except Exception as exc:
+            results.append({"error": f"Error constructing asset event: {exc}"})
+            continue
+
+        results.append({})
+        batch.append(event)
+        if len(batch) >= REPORT_ASSET_EVENTS_BATCH_SIZE:
+            await run_in_threadpool(context.instance.report_runless_asset_events, batch)
+            batch = []
+
+    if batch:
+        await run_in_threadpool(context.instance.report_runless_asset_events, batch)
+
+    return JSONResponse({"results": results})
+
+
+async def _read_lines(request: Request) -> AsyncIterator[Optional[bytes]]:
+    # yields None in place of lines longer than the maximum line size, without buffering them
+    buffer = b""
+    discarding = False
+    async for chunk in request.stream():
+        buffer += chunk
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if discarding:
+                discarding = False
+                continue
+            yield line if len(line) <= REPORT_ASSET_EVENTS_MAX_LINE_BYTES else None
+
+        if len(buffer) > REPORT_ASSET_EVENTS_MAX_LINE_BYTES:
+            if not discarding:
+                discarding = True
+                yield None
+            buffer = b""
+
+    if buffer and not discarding:
+        yield buffer if len(buffer) <= REPORT_ASSET_EVENTS_MAX_LINE_BYTES else None
+
+
+def _asset_event_from_json(
+    json_line: Any, reporting_user_tags: Mapping[str, str]
+) -> Union[AssetMaterialization, AssetObservation, AssetCheckEvaluation]:
+    if not isinstance(json_line, dict):
+        raise ValueError("Each line must be a JSON object.")
+
+    event_type = json_line.get("type")
+    asset_key = json_line.get("asset_key")
+    if not asset_key:
+        raise ValueError("Missing required property 'asset_key'.")
+
+    if event_type in ("materialization", "observation"):
+        tags = dict(reporting_user_tags)
+        data_version = json_line.get(ReportAssetMatParam.data_version)
+        if data_version is not None:
+            tags[DATA_VERSION_TAG] = data_version
+            tags[DATA_VERSION_IS_USER_PROVIDED_TAG] = "true"
+
+        event_class = AssetMaterialization if event_type == "materialization" else AssetObservation
+        return event_class(
+            asset_key=AssetKey(asset_key),
+            partition=json_line.get(ReportAssetMatParam.partition),
+            metadata=json_line.get(ReportAssetMatParam.metadata),
+            description=json_line.get(ReportAssetMatParam.description),
+            tags=tags,
+        )
+    elif event_type == "check_evaluation":
+        if ReportAssetCheckEvalParam.passed not in json_line:
+            raise ValueError("Missing required property 'passed'.")
+        return AssetCheckEvaluation(
+            check_name=json_line.get(ReportAssetCheckEvalParam.check_name),
+            passed=json_line[ReportAssetCheckEvalParam.passed],
+            asset_key=AssetKey(asset_key),
+            metadata=json_line.get(ReportAssetCheckEvalParam.metadata) or {},
+            severity=AssetCheckSeverity(json_line.get(ReportAssetCheckEvalParam.severity, "ERROR")),
+        )
+
+    raise ValueError(
+        f"Unknown event type {event_type!r}, expected 'materialization', 'observation' or"
+        " 'check_evaluation'."
+    )
+
+
 # note: Enum not used to avoid value type problems X(str, Enum) doesn't work as partition conflicts with keyword
 class ReportAssetMatParam:
     """Class to collect all supported args by report_asset_materialization endpoint
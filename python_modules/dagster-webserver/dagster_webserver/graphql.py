@@ -1,16 +1,31 @@
+import hashlib
+import threading
+import time
 from abc import ABC, abstractmethod
 from asyncio import Task, get_event_loop, run
-from collections.abc import AsyncGenerator, Sequence
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Hashable, Mapping, Sequence
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, cast
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
 import dagster._check as check
 from dagster._serdes import pack_value
 from dagster._seven import json
+from dagster._utils import Counter, traced_counter
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster_graphql.implementation.utils import ErrorCapture
 from graphene import Schema
-from graphql import GraphQLError, GraphQLFormattedError
+from graphql import (
+    DocumentNode,
+    GraphQLError,
+    GraphQLFormattedError,
+    OperationType,
+    execute,
+    get_operation_ast,
+    parse,
+    validate,
+)
 from graphql.execution import ExecutionResult
 from starlette import status
 from starlette.applications import Starlette
@@ -43,15 +58,214 @@ class GraphQLWS(str, Enum):
     STOP = "stop"
 
 
+DEFAULT_DOCUMENT_CACHE_SIZE = 512
+
+# https://github.com/apollographql/apollo-link-persisted-queries#protocol
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_FOUND_CODE = "PERSISTED_QUERY_NOT_FOUND"
+
+
+def hash_graphql_query(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class DocumentCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class GraphQLDocumentCache:
+    """LRU cache of parsed and validated GraphQL documents, keyed by the sha256 hash of the query
+    text. The same hash identifies a query in automatic persisted query requests, so a client can
+    send the hash alone for any query that is still in the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = check.int_param(max_size, "max_size")
+        self._documents: OrderedDict[str, DocumentNode] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, query_hash: str) -> Optional[DocumentNode]:
+        with self._lock:
+            document = self._documents.get(query_hash)
+            if document is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._documents.move_to_end(query_hash)
+            return document
+
+    def set(self, query_hash: str, document: DocumentNode) -> None:
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._documents[query_hash] = document
+            self._documents.move_to_end(query_hash)
+            while len(self._documents) > self._max_size:
+                self._documents.popitem(last=False)
+
+    def stats(self) -> DocumentCacheStats:
+        with self._lock:
+            return DocumentCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._documents),
+                max_size=self._max_size,
+            )
+
+
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class GraphQLResponseCacheConfig(NamedTuple):
+    """Configuration for caching the results of read-only GraphQL queries.
+
+    Args:
+        ttl_seconds (float): How long a result may be served from the cache. Results are also keyed
+            by the server's response cache watermark, so this bounds staleness for changes that the
+            watermark does not capture.
+        max_bytes (int): The maximum total size of the cached results, measured as JSON.
+        operation_ttl_seconds (Mapping[str, float]): TTLs for specific operations by name, which
+            override `ttl_seconds`. A TTL of 0 disables caching for the operation.
+    """
+
+    ttl_seconds: float
+    max_bytes: int = DEFAULT_RESPONSE_CACHE_MAX_BYTES
+    operation_ttl_seconds: Mapping[str, float] = {}
+
+
+class ResponseCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    bypasses: int
+    size: int
+    bytes: int
+    max_bytes: int
+
+
+class _ResponseCacheEntry(NamedTuple):
+    expires_at: float
+    size: int
+    result: ExecutionResult
+
+
+class GraphQLResponseCache:
+    """LRU cache of GraphQL query results, bounded by the total size of the results and expiring
+    each result after the TTL of its operation.
+    """
+
+    def __init__(self, config: GraphQLResponseCacheConfig):
+        self._config = check.inst_param(config, "config", GraphQLResponseCacheConfig)
+        self._entries: OrderedDict[Hashable, _ResponseCacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._bypasses = 0
+
+    def get_ttl_seconds(self, operation_name: Optional[str]) -> float:
+        if operation_name is None:
+            return self._config.ttl_seconds
+        return self._config.operation_ttl_seconds.get(operation_name, self._config.ttl_seconds)
+
+    def get(self, key: Hashable) -> Optional[ExecutionResult]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry.result
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self._bypasses += 1
+
+    def set(self, key: Hashable, result: ExecutionResult, ttl_seconds: float) -> None:
+        size = len(json.dumps(result.data))
+        if size > self._config.max_bytes:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _ResponseCacheEntry(
+                expires_at=now + ttl_seconds, size=size, result=result
+            )
+            self._bytes += size
+
+            # evict expired results at the head of the queue before falling back to LRU order
+            while self._entries:
+                oldest_key, oldest = next(iter(self._entries.items()))
+                if oldest.expires_at > now and self._bytes <= self._config.max_bytes:
+                    break
+                self._remove(oldest_key)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                bypasses=self._bypasses,
+                size=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self._config.max_bytes,
+            )
+
+
 TRequestContext = TypeVar("TRequestContext")
 
 
 class GraphQLServer(ABC, Generic[TRequestContext]):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(
+        self,
+        app_path_prefix: str = "",
+        document_cache_size: int = DEFAULT_DOCUMENT_CACHE_SIZE,
+        response_cache_config: Optional[GraphQLResponseCacheConfig] = None,
+    ):
         self._app_path_prefix = app_path_prefix
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
+        self._document_cache = GraphQLDocumentCache(document_cache_size)
+        self._response_cache = (
+            GraphQLResponseCache(response_cache_config) if response_cache_config else None
+        )
+
+    @property
+    def document_cache_stats(self) -> DocumentCacheStats:
+        return self._document_cache.stats()
+
+    @property
+    def response_cache_stats(self) -> Optional[ResponseCacheStats]:
+        return self._response_cache.stats() if self._response_cache else None
+
+    def get_response_cache_watermark(self, request_context: TRequestContext) -> Optional[Hashable]:
+        """Returns a value that changes whenever the data behind cached query results may have
+        changed, which is included in the response cache key. Servers that enable the response
+        cache override this, and should also include anything else results depend on, like the
+        permissions of the viewer. Returning None skips the response cache for the request.
+        """
+        return None
 
     @abstractmethod
     def build_graphql_schema(self) -> Schema: ...
@@ -129,12 +343,40 @@ async def graphql_http_endpoint(self, request: Request):
         query = data.get("query")
         variables: Union[Optional[str], dict[str, Any]] = data.get("variables")
         operation_name = data.get("operationName")
+        extensions: Union[Optional[str], dict[str, Any]] = data.get("extensions")
 
-        if query is None:
+        if isinstance(extensions, str):
+            try:
+                extensions = cast(dict[str, Any], json.loads(extensions))
+            except json.JSONDecodeError:
+                return PlainTextResponse(
+                    "Malformed GraphQL extensions. Passed as string but not valid"
+                    f" JSON:\n{extensions}",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+
+        persisted_query = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+        if persisted_query is not None:
+            query_hash = (
+                persisted_query.get("sha256Hash") if isinstance(persisted_query, dict) else None
+            )
+            if not isinstance(query_hash, str):
+                return PlainTextResponse(
+                    "Malformed persisted query: expected a sha256Hash",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            if query is not None and hash_graphql_query(query) != query_hash:
+                return PlainTextResponse(
+                    "Persisted query sha256Hash does not match the query",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+        elif query is None:
             return PlainTextResponse(
                 "No GraphQL query found in the request",
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
+        else:
+            query_hash = None
 
         if isinstance(variables, str):
             try:
@@ -146,6 +388,9 @@ async def graphql_http_endpoint(self, request: Request):
                     status_code=status.HTTP_400_BAD_REQUEST,
                 )
 
+        # like an HTTP cache, skip cached results when the client asks to revalidate
+        bypass_response_cache = "no-cache" in request.headers.get("Cache-Control", "")
+
         captured_errors: list[Exception] = []
         with ErrorCapture.watch(captured_errors.append):
             result = await self.execute_graphql_request(
@@ -153,6 +398,8 @@ async def graphql_http_endpoint(self, request: Request):
                 query=query,
                 variables=variables,
                 operation_name=operation_name,
+                query_hash=query_hash,
+                bypass_response_cache=bypass_response_cache,
             )
 
         response_data: dict[str, Any] = {"data": result.data}
@@ -229,26 +476,32 @@ async def graphql_ws_endpoint(self, websocket: WebSocket):
     async def execute_graphql_request(
         self,
         request: Request,
-        query: str,
+        query: Optional[str],
         variables: Optional[dict[str, Any]],
         operation_name: Optional[str],
+        query_hash: Optional[str] = None,
+        bypass_response_cache: bool = False,
     ) -> ExecutionResult:
         # run each query in a separate thread, as much of the schema is sync/blocking
-        # use execute_async to allow async resolvers to facilitate dataloader pattern
+        # execute asynchronously to allow async resolvers to facilitate dataloader pattern
         return await run_in_threadpool(
             self.graphql_execution_thread,
             request=request,
             query=query,
             variables=variables,
             operation_name=operation_name,
+            query_hash=query_hash,
+            bypass_response_cache=bypass_response_cache,
         )
 
     def graphql_execution_thread(
         self,
         request: Request,
-        query: str,
+        query: Optional[str],
         variables: Optional[dict[str, Any]],
         operation_name: Optional[str],
+        query_hash: Optional[str] = None,
+        bypass_response_cache: bool = False,
     ) -> ExecutionResult:
         request_context = self.make_request_context(request)
         return run(
@@ -257,23 +510,141 @@ def graphql_execution_thread(
                 query=query,
                 variables=variables,
                 operation_name=operation_name,
+                query_hash=query_hash,
+                bypass_response_cache=bypass_response_cache,
             )
         )
 
     async def gen_graphql_response(
         self,
         request_context: TRequestContext,
-        query: str,
+        query: Optional[str],
         variables: Optional[dict[str, Any]],
         operation_name: Optional[str],
+        query_hash: Optional[str] = None,
+        bypass_response_cache: bool = False,
     ) -> ExecutionResult:
-        return await self._graphql_schema.execute_async(
-            query,
-            variables=variables,
+        if query_hash is None:
+            query_hash = hash_graphql_query(check.not_none(query))
+
+        try:
+            document = self.get_graphql_document(query, query_hash)
+        except GraphQLError as error:
+            return ExecutionResult(data=None, errors=[error])
+
+        if isinstance(document, list):
+            return ExecutionResult(data=None, errors=document)
+
+        response_cache_key, ttl_seconds = self._get_response_cache_key(
+            request_context, document, query_hash, variables, operation_name
+        )
+        if response_cache_key is not None:
+            assert self._response_cache
+            if bypass_response_cache:
+                self._response_cache.record_bypass()
+                _increment_traced_counter("graphql_response_cache_bypass")
+            else:
+                cached_result = self._response_cache.get(response_cache_key)
+                _increment_traced_counter(
+                    "graphql_response_cache_hit"
+                    if cached_result is not None
+                    else "graphql_response_cache_miss"
+                )
+                if cached_result is not None:
+                    return cached_result
+
+        result = await self._execute_graphql_document(
+            request_context, document, variables, operation_name
+        )
+
+        if response_cache_key is not None and not result.errors:
+            assert self._response_cache
+            self._response_cache.set(response_cache_key, result, ttl_seconds)
+
+        return result
+
+    async def _execute_graphql_document(
+        self,
+        request_context: TRequestContext,
+        document: DocumentNode,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> ExecutionResult:
+        result = execute(
+            self._graphql_schema.graphql_schema,
+            document,
+            context_value=request_context,
+            variable_values=variables,
             operation_name=operation_name,
-            context=request_context,
             middleware=self._graphql_middleware,
         )
+        if isawaitable(result):
+            return await result
+        return result
+
+    def _get_response_cache_key(
+        self,
+        request_context: TRequestContext,
+        document: DocumentNode,
+        query_hash: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> tuple[Optional[Hashable], float]:
+        if self._response_cache is None:
+            return None, 0
+
+        # only queries are read-only
+        operation = get_operation_ast(document, operation_name)
+        if operation is None or operation.operation != OperationType.QUERY:
+            return None, 0
+
+        ttl_seconds = self._response_cache.get_ttl_seconds(
+            operation.name.value if operation.name else None
+        )
+        if ttl_seconds <= 0:
+            return None, 0
+
+        watermark = self.get_response_cache_watermark(request_context)
+        if watermark is None:
+            return None, 0
+
+        return (
+            query_hash,
+            operation_name,
+            json.dumps(variables, sort_keys=True),
+            watermark,
+        ), ttl_seconds
+
+    def get_graphql_document(
+        self, query: Optional[str], query_hash: Optional[str] = None
+    ) -> Union[DocumentNode, list[GraphQLError]]:
+        """Parses and validates a query against the schema, reusing the document from a previous
+        request for the same query if it is still cached. Raises a GraphQLError if the query cannot
+        be parsed, or if only the hash of a query that is not cached is provided.
+        """
+        if query_hash is None:
+            query_hash = hash_graphql_query(check.not_none(query))
+
+        document = self._document_cache.get(query_hash)
+        _increment_traced_counter(
+            "graphql_document_cache_hit" if document is not None else "graphql_document_cache_miss"
+        )
+        if document is not None:
+            return document
+
+        if query is None:
+            raise GraphQLError(
+                PERSISTED_QUERY_NOT_FOUND,
+                extensions={"code": PERSISTED_QUERY_NOT_FOUND_CODE},
+            )
+
+        document = parse(query)
+        validation_errors = validate(self._graphql_schema.graphql_schema, document)
+        if validation_errors:
+            return validation_errors
+
+        self._document_cache.set(query_hash, document)
+        return document
 
     async def execute_graphql_subscription(
         self,
@@ -332,6 +703,9 @@ def _determine_status_code(
                 # if thrown from a field, has an original error
                 if error.original_error:
                     server_error = True
+                elif _is_persisted_query_not_found(error):
+                    # not an error, the client retries with the full query to persist it
+                    continue
                 else:
                     # syntax error, invalid query, etc
                     user_error = True
@@ -348,6 +722,16 @@ def _determine_status_code(
         return status.HTTP_200_OK
 
 
+def _increment_traced_counter(key: str) -> None:
+    counter = traced_counter.get()
+    if isinstance(counter, Counter):
+        counter.increment(key)
+
+
+def _is_persisted_query_not_found(error: GraphQLError) -> bool:
+    return bool(error.extensions) and error.extensions.get("code") == PERSISTED_QUERY_NOT_FOUND_CODE
+
+
 async def _handle_async_results(results: AsyncGenerator, operation_id: str, websocket: WebSocket):
     try:
         async for result in results:
@@ -2,6 +2,7 @@
 import io
 import mimetypes
 import uuid
+from collections.abc import Hashable
 from os import path, walk
 from typing import Generic, Optional, TypeVar
 
@@ -36,10 +37,11 @@
 
 from dagster_webserver.external_assets import (
     handle_report_asset_check_request,
+    handle_report_asset_events_request,
     handle_report_asset_materialization_request,
     handle_report_asset_observation_request,
 )
-from dagster_webserver.graphql import GraphQLServer
+from dagster_webserver.graphql import GraphQLResponseCacheConfig, GraphQLServer
 from dagster_webserver.version import __version__
 
 mimetypes.init()
@@ -60,11 +62,12 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: Optional[int] = None,
         uses_app_path_prefix: bool = True,
+        response_cache_config: Optional[GraphQLResponseCacheConfig] = None,
     ):
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
-        super().__init__(app_path_prefix)
+        super().__init__(app_path_prefix, response_cache_config=response_cache_config)
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
@@ -78,6 +81,29 @@ def relative_path(self, rel: str) -> str:
     def make_request_context(self, conn: HTTPConnection) -> BaseWorkspaceRequestContext:
         return self._process_context.create_request_context(conn)
 
+    def get_response_cache_watermark(
+        self, request_context: BaseWorkspaceRequestContext
+    ) -> Optional[Hashable]:
+        # the workspace version does not change when code locations are reloaded, so include the
+        # version of each location as well
+        location_versions = tuple(
+            (
+                status.location_name,
+                status.load_status.value,
+                status.version_key,
+                status.update_timestamp,
+            )
+            for status in request_context.get_code_location_statuses()
+        )
+        instance = request_context.instance
+        try:
+            max_event_record_id = instance.event_log_storage.get_maximum_record_id()
+            run_watermark = instance.run_storage.get_run_watermark()
+        except NotImplementedError:
+            return None
+
+        return (request_context.version, location_versions, max_event_record_id, run_watermark)
+
     def build_middleware(self) -> list[Middleware]:
         return [Middleware(DagsterTracedCounterMiddleware)]
 
@@ -114,6 +140,13 @@ async def webserver_info_endpoint(self, _request: Request):
             }
         )
 
+    async def graphql_document_cache_info_endpoint(self, _request: Request):
+        return JSONResponse(self.document_cache_stats._asdict())
+
+    async def graphql_response_cache_info_endpoint(self, _request: Request):
+        stats = self.response_cache_stats
+        return JSONResponse({"enabled": stats is not None, **(stats._asdict() if stats else {})})
+
     async def download_debug_file_endpoint(self, request: Request):
         run_id = request.path_params["run_id"]
         context = self.make_request_context(request)
@@ -199,6 +232,10 @@ async def report_asset_observation_endpoint(self, request: Request) -> JSONRespo
         context = self.make_request_context(request)
         return await handle_report_asset_observation_request(context, request)
 
+    async def report_asset_events_endpoint(self, request: Request) -> JSONResponse:
+        context = self.make_request_context(request)
+        return await handle_report_asset_events_request(context, request)
+
     def index_html_endpoint(self, request: Request):
         """Serves root html."""
         index_path = self.relative_path("webapp/build/index.html")
@@ -289,6 +326,14 @@ def build_routes(self):
             [
                 Route("/server_info", self.webserver_info_endpoint),
                 Route("/dagit_info", self.webserver_info_endpoint),
+                Route(
+                    "/graphql_document_cache_info",
+                    self.graphql_document_cache_info_endpoint,
+                ),
+                Route(
+                    "/graphql_response_cache_info",
+                    self.graphql_response_cache_info_endpoint,
+                ),
                 Route(
                     "/graphql",
                     self.graphql_http_endpoint,
@@ -335,6 +380,11 @@ def build_routes(self):
                     self.report_asset_observation_endpoint,
                     methods=["POST"],
                 ),
+                Route(
+                    "/report_asset_events",
+                    self.report_asset_events_endpoint,
+                    methods=["POST"],
+                ),
                 Route("/{path:path}", self.index_html_endpoint),
                 Route("/", self.index_html_endpoint),
             ]
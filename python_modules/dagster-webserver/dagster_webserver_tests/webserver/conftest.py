@@ -1,6 +1,7 @@
 import pytest
 from dagster import DagsterInstance, __version__
 from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
+from dagster_webserver.graphql import GraphQLResponseCacheConfig
 from dagster_webserver.webserver import DagsterWebserver
 from starlette.testclient import TestClient
 
@@ -20,3 +21,17 @@ def test_client(instance):
     )
     app = DagsterWebserver(process_context).create_asgi_app(debug=True)
     return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def cached_test_client(instance):
+    process_context = get_workspace_process_context_from_kwargs(
+        instance=instance,
+        version=__version__,
+        read_only=False,
+        kwargs={"empty_workspace": True},  # pyright: ignore[reportArgumentType]
+    )
+    app = DagsterWebserver(
+        process_context, response_cache_config=GraphQLResponseCacheConfig(ttl_seconds=60)
+    ).create_asgi_app(debug=True)
+    return TestClient(app)
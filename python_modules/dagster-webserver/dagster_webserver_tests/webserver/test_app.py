@@ -1,4 +1,5 @@
 import gc
+from unittest import mock
 
 import objgraph
 import pytest
@@ -12,8 +13,14 @@
 from dagster._seven import json
 from dagster._utils.error import SerializableErrorInfo
 from dagster_graphql.version import __version__ as dagster_graphql_version
-from dagster_webserver.graphql import GraphQLWS
+from dagster_webserver.graphql import (
+    GraphQLResponseCache,
+    GraphQLResponseCacheConfig,
+    GraphQLWS,
+    hash_graphql_query,
+)
 from dagster_webserver.version import __version__ as dagster_webserver_version
+from graphql import ExecutionResult
 from starlette.testclient import TestClient
 
 EVENT_LOG_SUBSCRIPTION = """
@@ -191,6 +198,189 @@ def test_graphql_post(test_client: TestClient):
     assert response.status_code == 400, response.text
 
 
+def test_graphql_document_cache(test_client: TestClient):
+    query = "query DocumentCacheQuery { __typename }"
+    before = test_client.get("/graphql_document_cache_info").json()
+
+    response = test_client.post("/graphql", json={"query": query})
+    assert response.status_code == 200, response.text
+    assert json.loads(response.headers["x-dagster-call-counts"]) == {
+        "graphql_document_cache_miss": 1
+    }
+
+    response = test_client.post("/graphql", json={"query": query})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"__typename": "Query"}}
+    assert json.loads(response.headers["x-dagster-call-counts"]) == {
+        "graphql_document_cache_hit": 1
+    }
+
+    after = test_client.get("/graphql_document_cache_info").json()
+    assert after["hits"] == before["hits"] + 1
+    assert after["misses"] == before["misses"] + 1
+    assert after["size"] == before["size"] + 1
+
+    # invalid queries are not cached
+    test_client.post("/graphql", json={"query": "{__invalid}"})
+    response = test_client.post("/graphql", json={"query": "{__invalid}"})
+    assert response.status_code == 400, response.text
+    assert json.loads(response.headers["x-dagster-call-counts"]) == {
+        "graphql_document_cache_miss": 1
+    }
+
+
+def test_graphql_persisted_query(test_client: TestClient):
+    query = "query PersistedQuery { __typename }"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": hash_graphql_query(query)}}
+
+    # unknown hash
+    response = test_client.post("/graphql", json={"extensions": extensions})
+    assert response.status_code == 200, response.text
+    error = response.json()["errors"][0]
+    assert error["message"] == "PersistedQueryNotFound"
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    # register the query with its hash
+    response = test_client.post("/graphql", json={"query": query, "extensions": extensions})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+    # hash only
+    response = test_client.post("/graphql", json={"extensions": extensions})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+    response = test_client.get("/graphql", params={"extensions": json.dumps(extensions)})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+    # mismatched hash
+    response = test_client.post(
+        "/graphql", json={"query": "{__typename}", "extensions": extensions}
+    )
+    assert response.status_code == 400, response.text
+
+    # malformed extensions
+    response = test_client.post("/graphql", json={"extensions": {"persistedQuery": {}}})
+    assert response.status_code == 400, response.text
+
+    response = test_client.get("/graphql", params={"extensions": "{"})
+    assert response.status_code == 400, response.text
+
+
+RUNS_QUERY = """
+query RunsQuery {
+    runsOrError {
+        ... on Runs {
+            results {
+                runId
+            }
+        }
+    }
+}
+"""
+
+
+def _call_counts(response) -> dict:
+    return json.loads(response.headers["x-dagster-call-counts"])
+
+
+def test_graphql_response_cache(instance, cached_test_client: TestClient):
+    before = cached_test_client.get("/graphql_response_cache_info").json()
+    assert before["enabled"]
+
+    response = cached_test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+    assert _call_counts(response)["graphql_response_cache_miss"] == 1
+    run_ids = [run["runId"] for run in response.json()["data"]["runsOrError"]["results"]]
+
+    response = cached_test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+    assert _call_counts(response) == {
+        "graphql_document_cache_hit": 1,
+        "graphql_response_cache_hit": 1,
+    }
+    assert [run["runId"] for run in response.json()["data"]["runsOrError"]["results"]] == run_ids
+
+    # adding a run moves the storage watermarks
+    run_id = _add_run(instance)
+    response = cached_test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+    assert _call_counts(response)["graphql_response_cache_miss"] == 1
+    assert [run["runId"] for run in response.json()["data"]["runsOrError"]["results"]] == [
+        run_id,
+        *run_ids,
+    ]
+
+    # clients can skip the cache
+    response = cached_test_client.post(
+        "/graphql", json={"query": RUNS_QUERY}, headers={"Cache-Control": "no-cache"}
+    )
+    assert response.status_code == 200, response.text
+    assert _call_counts(response)["graphql_response_cache_bypass"] == 1
+
+    # variables are part of the key
+    response = cached_test_client.post(
+        "/graphql", json={"query": RUN_QUERY, "variables": {"runId": run_id}}
+    )
+    assert response.json()["data"]["pipelineRunOrError"] == {"__typename": "Run", "id": run_id}
+    response = cached_test_client.post(
+        "/graphql", json={"query": RUN_QUERY, "variables": {"runId": "missing"}}
+    )
+    assert _call_counts(response)["graphql_response_cache_miss"] == 1
+    assert response.json()["data"]["pipelineRunOrError"] == {"__typename": "RunNotFoundError"}
+
+    # results with errors are not cached
+    for _ in range(2):
+        response = cached_test_client.post("/graphql", json={"query": "{test{alwaysException}}"})
+        assert response.status_code == 500, response.text
+        assert _call_counts(response)["graphql_response_cache_miss"] == 1
+
+    after = cached_test_client.get("/graphql_response_cache_info").json()
+    assert after["hits"] == before["hits"] + 1
+    assert after["bypasses"] == before["bypasses"] + 1
+
+
+def test_graphql_response_cache_disabled(test_client: TestClient):
+    assert test_client.get("/graphql_response_cache_info").json() == {"enabled": False}
+
+    response = test_client.post("/graphql", json={"query": RUNS_QUERY})
+    assert response.status_code == 200, response.text
+    assert "graphql_response_cache_miss" not in _call_counts(response)
+
+
+def test_graphql_response_cache_eviction():
+    result = ExecutionResult(data={"value": "x" * 10})
+    result_size = len(json.dumps(result.data))
+    cache = GraphQLResponseCache(
+        GraphQLResponseCacheConfig(
+            ttl_seconds=10, max_bytes=result_size * 2, operation_ttl_seconds={"Uncached": 0}
+        )
+    )
+    assert cache.get_ttl_seconds("Query") == 10
+    assert cache.get_ttl_seconds("Uncached") == 0
+
+    with mock.patch("dagster_webserver.graphql.time.monotonic", return_value=0):
+        cache.set("a", result, 10)
+        cache.set("b", result, 5)
+        assert cache.get("a") is result
+
+        # least recently used
+        cache.set("c", result, 10)
+        assert cache.get("b") is None
+        assert cache.stats().bytes == result_size * 2
+
+    with mock.patch("dagster_webserver.graphql.time.monotonic", return_value=10):
+        assert cache.get("a") is None
+        assert cache.get("c") is None
+
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.size == 0
+    assert stats.bytes == 0
+
+
 def test_graphql_error(test_client: TestClient):
     response = test_client.post(
         "/graphql",
@@ -1,4 +1,5 @@
 import inspect
+from unittest import mock
 
 from dagster import DagsterInstance
 from dagster._core.definitions.asset_check_evaluation import AssetCheckEvaluation
@@ -336,3 +337,106 @@ def test_report_asset_observation_apis_consistent(
             ), "need to add validation that sample payload content was written successfully"
 
     # expect test to cover PipesContext.report_asset_observation once added
+
+
+def _ndjson(*lines) -> str:
+    return "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines)
+
+
+def test_report_asset_events_endpoint(instance: DagsterInstance, test_client: TestClient):
+    body = _ndjson(
+        {"type": "materialization", "asset_key": "bulk_asset", "partition": "a"},
+        {"type": "observation", "asset_key": ["bulk", "asset"], "data_version": "v1"},
+        "",
+        {"type": "check_evaluation", "asset_key": "bulk_asset", "check_name": "c", "passed": True},
+        {"type": "materialization", "asset_key": "bulk_asset", "partition": "b"},
+        "not json",
+        {"type": "materialization"},
+        {"type": "check_evaluation", "asset_key": "bulk_asset", "check_name": "c"},
+        {"type": "unknown", "asset_key": "bulk_asset"},
+        {"type": "observation", "asset_key": "bulk_asset", "metadata": "im_just_a_string"},
+    )
+    response = test_client.post(
+        "/report_asset_events",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.text
+    results = response.json()["results"]
+    assert results[:3] == [{}, {}, {}]
+    assert results[3] == {}
+    assert len(results) == 9
+    for result in results[4:]:
+        assert result["error"].startswith("Error constructing asset event")
+    assert "Missing required property 'asset_key'" in results[5]["error"]
+    assert "Missing required property 'passed'" in results[6]["error"]
+    assert "Unknown event type 'unknown'" in results[7]["error"]
+
+    records = instance.fetch_materializations(AssetKey("bulk_asset"), limit=10).records
+    assert [record.partition_key for record in records] == ["b", "a"]
+
+    obs_records = instance.fetch_observations(AssetKey(["bulk", "asset"]), limit=1).records
+    assert obs_records
+    obs = obs_records[0].asset_observation
+    assert obs and obs.tags and obs.tags[DATA_VERSION_TAG] == "v1"
+
+    evaluation = _assert_stored_check_eval(instance, "bulk_asset", "c")
+    assert evaluation.passed
+
+    response = test_client.post(
+        "/report_asset_events", content=body, headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+
+
+def test_report_asset_events_batches(instance: DagsterInstance, test_client: TestClient):
+    num_events = 25
+    body = _ndjson(
+        *(
+            {"type": "materialization", "asset_key": "batched_asset", "partition": str(i)}
+            for i in range(num_events)
+        )
+    )
+    with (
+        mock.patch("dagster_webserver.external_assets.REPORT_ASSET_EVENTS_BATCH_SIZE", 10),
+        mock.patch.object(
+            instance,
+            "report_runless_asset_events",
+            wraps=instance.report_runless_asset_events,
+        ) as report_runless_asset_events,
+    ):
+        response = test_client.post(
+            "/report_asset_events",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    assert response.status_code == 200, response.text
+    assert response.json()["results"] == [{}] * num_events
+    assert [len(call.args[0]) for call in report_runless_asset_events.call_args_list] == [
+        10,
+        10,
+        5,
+    ]
+
+    records = instance.fetch_materializations(AssetKey("batched_asset"), limit=100).records
+    assert len(records) == num_events
+
+
+def test_report_asset_events_line_too_long(test_client: TestClient):
+    body = _ndjson(
+        {"type": "materialization", "asset_key": "long_line_asset"},
+        {"type": "materialization", "asset_key": "long_line_asset", "description": "x" * 200},
+        {"type": "materialization", "asset_key": "long_line_asset"},
+    )
+    with mock.patch("dagster_webserver.external_assets.REPORT_ASSET_EVENTS_MAX_LINE_BYTES", 100):
+        response = test_client.post(
+            "/report_asset_events",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    assert response.status_code == 200, response.text
+    assert response.json()["results"] == [
+        {},
+        {"error": "Line exceeds 100 bytes."},
+        {},
+    ]
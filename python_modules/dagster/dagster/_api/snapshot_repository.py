@@ -25,7 +25,10 @@ def sync_get_streaming_external_repositories_data_grpc(
                 remote_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                # servers which predate shared job snapshots ignore this and send each job's
+                # snapshot in full
+                share_job_snapshots=True,
             )
         )
 
@@ -61,7 +64,10 @@ async def gen_streaming_external_repositories_data_grpc(
                 remote_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                # servers which predate shared job snapshots ignore this and send each job's
+                # snapshot in full
+                share_job_snapshots=True,
             )
         ]
 
@@ -1,38 +1,49 @@
+import importlib
+from collections.abc import Mapping
+from typing import Optional
+
 import click
 
-from dagster._cli.api import api_cli
-from dagster._cli.asset import asset_cli
-from dagster._cli.code_server import code_server_cli
-from dagster._cli.debug import debug_cli
-from dagster._cli.definitions import definitions_cli
-from dagster._cli.dev import dev_command
-from dagster._cli.instance import instance_cli
-from dagster._cli.job import job_cli
-from dagster._cli.project import project_cli
-from dagster._cli.run import run_cli
-from dagster._cli.schedule import schedule_cli
-from dagster._cli.sensor import sensor_cli
 from dagster.version import __version__
 
+# Maps each command to the module and attribute that define it. Commands are imported only when
+# invoked, so that e.g. `dagster api execute_step` in a step worker process does not import the
+# modules backing every other command.
+_COMMANDS: Mapping[str, tuple[str, str]] = {
+    "api": ("dagster._cli.api", "api_cli"),
+    "job": ("dagster._cli.job", "job_cli"),
+    "run": ("dagster._cli.run", "run_cli"),
+    "instance": ("dagster._cli.instance", "instance_cli"),
+    "schedule": ("dagster._cli.schedule", "schedule_cli"),
+    "sensor": ("dagster._cli.sensor", "sensor_cli"),
+    "asset": ("dagster._cli.asset", "asset_cli"),
+    "debug": ("dagster._cli.debug", "debug_cli"),
+    "project": ("dagster._cli.project", "project_cli"),
+    "dev": ("dagster._cli.dev", "dev_command"),
+    "code-server": ("dagster._cli.code_server", "code_server_cli"),
+    "definitions": ("dagster._cli.definitions", "definitions_cli"),
+}
+
+
+class LazyCommandGroup(click.Group):
+    def __init__(self, *args, lazy_commands: Mapping[str, tuple[str, str]], **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self._lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self._lazy_commands and cmd_name not in self.commands:
+            module_name, attr = self._lazy_commands[cmd_name]
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-def create_dagster_cli():
-    commands = {
-        "api": api_cli,
-        "job": job_cli,
-        "run": run_cli,
-        "instance": instance_cli,
-        "schedule": schedule_cli,
-        "sensor": sensor_cli,
-        "asset": asset_cli,
-        "debug": debug_cli,
-        "project": project_cli,
-        "dev": dev_command,
-        "code-server": code_server_cli,
-        "definitions": definitions_cli,
-    }
 
+def create_dagster_cli():
     @click.group(
-        commands=commands,
+        cls=LazyCommandGroup,
+        lazy_commands=_COMMANDS,
         context_settings={"max_content_width": 120, "help_option_names": ["-h", "--help"]},
     )
     @click.version_option(__version__, "--version", "-v")
@@ -20,7 +20,11 @@
 from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.errors import DagsterExecutionInterruptedError
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import (
+    create_execution_plan,
+    execute_plan_iterator,
+    load_job_definition_in_worker,
+)
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.retries import RetryState
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
@@ -29,6 +33,7 @@
     start_run_metrics_thread,
     stop_run_metrics_thread,
 )
+from dagster._core.execution.run_tracing import run_tracing_scope
 from dagster._core.execution.stats import RunStepKeyStatsSnapshot
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.origin import (
@@ -424,12 +429,18 @@ def execute_step_command(input_json: Optional[str], compressed_input_json: Optio
 
             buff = []
 
-            for event in _execute_step_command_body(
-                args,
-                instance,
-                dagster_run,
-            ):
-                buff.append(serialize_value(event))
+            single_step_key = (
+                args.step_keys_to_execute[0]
+                if args.step_keys_to_execute and len(args.step_keys_to_execute) == 1
+                else None
+            )
+            with run_tracing_scope(instance, dagster_run, single_step_key):
+                for event in _execute_step_command_body(
+                    args,
+                    instance,
+                    dagster_run,
+                ):
+                    buff.append(serialize_value(event))
 
             if args.print_serialized_events:
                 for line in buff:
@@ -504,6 +515,8 @@ def _execute_step_command_body(
             )
         )
 
+        yield load_job_definition_in_worker(recon_job, instance, dagster_run, single_step_key)
+
         execution_plan = create_execution_plan(
             recon_job,
             run_config=dagster_run.run_config,
@@ -5,6 +5,7 @@
 import dagster._check as check
 from dagster._cli.utils import get_instance_for_cli
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.migration import reencode_event_log_data
 from dagster._core.storage.migration.bigint_migration import run_bigint_migration
 
 
@@ -88,6 +89,22 @@ def reindex_command():
         instance.reindex(click.echo)
 
 
+@instance_cli.command(
+    name="reencode-events",
+    help=(
+        "Rewrite the stored events of the instance in the encoding that new events are written in,"
+        " e.g. to compress existing events after setting DAGSTER_EVENT_LOG_COMPRESSION."
+    ),
+)
+def reencode_events_command():
+    with get_instance_for_cli() as instance:
+        if instance.is_ephemeral:
+            click.echo("$DAGSTER_HOME is not set; ephemeral instances do not store events.")
+            return
+
+        reencode_event_log_data(instance, click.echo)
+
+
 @instance_cli.group(name="concurrency")
 def concurrency_cli():
     """Commands for working with the instance-wide op concurrency (Experimental)."""
@@ -1,4 +1,5 @@
-from typing import Any
+import json
+from typing import Any, Optional
 
 import click
 from tqdm import tqdm
@@ -140,6 +141,71 @@ def run_migrate_command(from_label: str, **kwargs: Any) -> None:
             raise click.ClickException("Exiting without migrating.")
 
 
+@run_cli.command(
+    name="trace",
+    help=(
+        "Summarize the spans recorded for a run that was executed with the"
+        " `dagster/run_tracing` tag, and optionally export them as a trace file."
+    ),
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the spans of the run to this file.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["chrome", "otlp"]),
+    default="chrome",
+    show_default=True,
+    help="The format of the output file: Chrome trace events, or OTLP/JSON traces.",
+)
+@click.option(
+    "--top", type=int, default=10, show_default=True, help="The number of span names to list."
+)
+@click.argument("run_id")
+def run_trace_command(run_id: str, output: Optional[str], output_format: str, top: int) -> None:
+    from dagster._core.execution.run_tracing import (
+        get_run_trace_events,
+        summarize_trace_events,
+        to_chrome_trace,
+        to_otlp_trace,
+    )
+
+    with get_instance_for_cli() as instance:
+        if not instance.has_run(run_id):
+            raise click.ClickException(f"No run found with id {run_id}.")
+
+        trace_events = get_run_trace_events(instance, run_id)
+
+    if not trace_events:
+        raise click.ClickException(
+            f"No spans were recorded for run {run_id}. Add the `dagster/run_tracing` tag to a run"
+            " to record spans while it executes."
+        )
+
+    pids = {trace_event["pid"] for trace_event in trace_events}
+    click.echo(f"Recorded {len(trace_events)} spans in {len(pids)} processes for run {run_id}.")
+    click.echo(f"{'Span':<24} {'Count':>8} {'Total (ms)':>12} {'Mean (ms)':>12} {'Max (ms)':>12}")
+    for summary in summarize_trace_events(trace_events)[:top]:
+        click.echo(
+            f"{summary.name:<24} {summary.count:>8} {summary.total_ms:>12.1f}"
+            f" {summary.mean_ms:>12.2f} {summary.max_ms:>12.1f}"
+        )
+
+    if output:
+        trace = (
+            to_chrome_trace(trace_events, run_id)
+            if output_format == "chrome"
+            else to_otlp_trace(trace_events, run_id)
+        )
+        with open(output, "w", encoding="utf8") as f:
+            json.dump(trace, f)
+        click.echo(f"Wrote {output_format} trace to {output}.")
+
+
 def is_valid_repo_label(label: str) -> bool:
     parts = label.split("@")
     return len(parts) == 2 and len(parts[0]) > 0 and len(parts[1]) > 0
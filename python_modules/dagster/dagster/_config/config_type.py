@@ -77,8 +77,9 @@ def __init__(
             else None
         )
 
-        # memoized snap representation
+        # memoized snap representations
         self._snap: Optional[ConfigTypeSnap] = None
+        self._schema_snapshot: Optional[ConfigSchemaSnapshot] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -112,9 +113,13 @@ def type_iterator(self) -> Iterator["ConfigType"]:
     def get_schema_snapshot(self) -> "ConfigSchemaSnapshot":
         from dagster._config.snap import ConfigSchemaSnapshot
 
-        return ConfigSchemaSnapshot(
-            all_config_snaps_by_key={ct.key: ct.get_snapshot() for ct in self.type_iterator()}
-        )
+        # Memoized so that validation plans compiled from the snapshot are reused across calls
+        if self._schema_snapshot is None:
+            self._schema_snapshot = ConfigSchemaSnapshot(
+                all_config_snaps_by_key={ct.key: ct.get_snapshot() for ct in self.type_iterator()}
+            )
+
+        return self._schema_snapshot
 
 
 @whitelist_for_serdes
@@ -1,6 +1,7 @@
 import sys
-from collections.abc import Mapping
-from typing import Any, Optional, cast
+import weakref
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple, Optional, cast
 
 import dagster._check as check
 from dagster._config.config_type import ConfigType, ConfigTypeKind
@@ -10,246 +11,290 @@
     create_failed_post_processing_error,
 )
 from dagster._config.evaluate_value_result import EvaluateValueResult
-from dagster._config.stack import EvaluationStack
+from dagster._config.field import Field
+from dagster._config.stack import (
+    EvaluationPath,
+    EvaluationStackListItemEntry,
+    EvaluationStackMapValueEntry,
+    EvaluationStackPathEntry,
+    evaluation_stack_from_path,
+)
 from dagster._config.traversal_context import TraversalContext, TraversalType
 from dagster._utils import ensure_single_item
 from dagster._utils.error import serializable_error_info_from_exc_info
 
 
 def post_process_config(config_type: ConfigType, config_value: Any) -> EvaluateValueResult[Any]:
-    ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
-        stack=EvaluationStack(entries=[]),
-        traversal_type=TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
+    return _process_config(
+        check.inst_param(config_type, "config_type", ConfigType),
+        config_value,
+        TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS,
     )
-    return _recursively_process_config(ctx, config_value)
 
 
 def resolve_defaults(config_type: ConfigType, config_value: Any) -> EvaluateValueResult[Any]:
-    ctx = TraversalContext.from_config_type(
-        config_type=check.inst_param(config_type, "config_type", ConfigType),
-        stack=EvaluationStack(entries=[]),
-        traversal_type=TraversalType.RESOLVE_DEFAULTS,
+    return _process_config(
+        check.inst_param(config_type, "config_type", ConfigType),
+        config_value,
+        TraversalType.RESOLVE_DEFAULTS,
     )
 
-    return _recursively_process_config(ctx, config_value)
 
+class _FieldProcessingPlan(NamedTuple):
+    name: str
+    field_def: Field
+    alias: Optional[str]
+    default_provided: bool
 
-def _recursively_process_config(
-    context: TraversalContext, config_value: Any
+
+# Flattened field lists for each shape and selector type, computed the first time the type is
+# processed. Config types are immutable once constructed (and shapes are interned by key), so the
+# plans remain valid for the lifetime of the type.
+_field_plans_by_config_type: "weakref.WeakKeyDictionary[ConfigType, Sequence[_FieldProcessingPlan]]" = weakref.WeakKeyDictionary()
+
+
+def _get_field_plans(config_type: ConfigType) -> Sequence[_FieldProcessingPlan]:
+    plans = _field_plans_by_config_type.get(config_type)
+    if plans is None:
+        field_aliases: Mapping[str, str] = getattr(config_type, "field_aliases", None) or {}
+        plans = [
+            _FieldProcessingPlan(
+                name=name,
+                field_def=field_def,
+                alias=field_aliases.get(name),
+                default_provided=field_def.default_provided,
+            )
+            for name, field_def in config_type.fields.items()  # type: ignore
+        ]
+        _field_plans_by_config_type[config_type] = plans
+    return plans
+
+
+class _ProcessingState:
+    __slots__ = ["errors", "root_config_type", "traversal_type"]
+
+    def __init__(self, root_config_type: ConfigType, traversal_type: TraversalType):
+        self.root_config_type = root_config_type
+        self.traversal_type = traversal_type
+        self.errors: list[EvaluationError] = []
+
+    @property
+    def do_post_process(self) -> bool:
+        return self.traversal_type == TraversalType.RESOLVE_DEFAULTS_AND_POSTPROCESS
+
+    def get_context(self, config_type: ConfigType, path: EvaluationPath) -> TraversalContext:
+        config_schema_snapshot = self.root_config_type.get_schema_snapshot()
+        return TraversalContext(
+            config_schema_snapshot=config_schema_snapshot,
+            config_type_snap=config_schema_snapshot.get_config_snap(config_type.key),
+            config_type=config_type,
+            stack=evaluation_stack_from_path(path),
+            traversal_type=self.traversal_type,
+        )
+
+
+def _process_config(
+    config_type: ConfigType, config_value: Any, traversal_type: TraversalType
 ) -> EvaluateValueResult[Any]:
-    evr = _recursively_resolve_defaults(context, config_value)
+    state = _ProcessingState(config_type, traversal_type)
+    value = _recursively_process_config(state, config_type, config_value, None)
+    if state.errors:
+        return EvaluateValueResult.for_errors(state.errors)
+    return EvaluateValueResult.for_value(value)
 
-    if evr.success:
-        if not context.do_post_process:
-            return evr
-        return _post_process(context, evr.value)
-    else:
-        return evr
+
+def _recursively_process_config(
+    state: _ProcessingState, config_type: ConfigType, config_value: Any, path: EvaluationPath
+) -> Any:
+    """Resolves defaults for `config_value` and, if requested, post-processes it. Errors are
+    appended to the state, in which case the returned value is meaningless.
+    """
+    num_errors = len(state.errors)
+    value = _recursively_resolve_defaults(state, config_type, config_value, path)
+
+    # Skip the call entirely for the (vast majority of) types that don't post-process
+    if (
+        not state.do_post_process
+        or len(state.errors) > num_errors
+        or type(config_type).post_process is ConfigType.post_process
+    ):
+        return value
+
+    return _post_process(state, config_type, value, path)
 
 
 def _recursively_resolve_defaults(
-    context: TraversalContext, config_value: Any
-) -> EvaluateValueResult[Any]:
-    kind = context.config_type.kind
+    state: _ProcessingState, config_type: ConfigType, config_value: Any, path: EvaluationPath
+) -> Any:
+    kind = config_type.kind
 
     if kind == ConfigTypeKind.SCALAR:
-        return EvaluateValueResult.for_value(config_value)
+        return config_value
     elif kind == ConfigTypeKind.ENUM:
-        return EvaluateValueResult.for_value(config_value)
+        return config_value
     elif kind == ConfigTypeKind.SELECTOR:
-        return _recurse_in_to_selector(context, config_value)
+        return _recurse_in_to_selector(state, config_type, config_value, path)
     elif ConfigTypeKind.is_shape(kind):
-        return _recurse_in_to_shape(context, config_value)
+        return _recurse_in_to_shape(state, config_type, config_value, path)
     elif kind == ConfigTypeKind.ARRAY:
-        return _recurse_in_to_array(context, config_value)
+        return _recurse_in_to_array(state, config_type, config_value, path)
     elif kind == ConfigTypeKind.MAP:
-        return _recurse_in_to_map(context, config_value)
+        return _recurse_in_to_map(state, config_type, config_value, path)
     elif kind == ConfigTypeKind.NONEABLE:
         if config_value is None:
-            return EvaluateValueResult.for_value(None)
+            return None
         else:
-            return _recursively_process_config(context.for_nullable_inner_type(), config_value)
+            return _recursively_process_config(
+                state,
+                config_type.inner_type,  # type: ignore
+                config_value,
+                path,
+            )
     elif kind == ConfigTypeKind.ANY:
-        return EvaluateValueResult.for_value(config_value)
-    elif context.config_type.kind == ConfigTypeKind.SCALAR_UNION:
-        return _recurse_in_to_scalar_union(context, config_value)
+        return config_value
+    elif kind == ConfigTypeKind.SCALAR_UNION:
+        return _recursively_process_config(
+            state,
+            (
+                config_type.non_scalar_type  # type: ignore
+                if isinstance(config_value, (dict, list))
+                else config_type.scalar_type  # type: ignore
+            ),
+            config_value,
+            path,
+        )
     else:
-        check.failed(f"Unsupported type {context.config_type.key}")
+        check.failed(f"Unsupported type {config_type.key}")
 
 
-def _post_process(context: TraversalContext, config_value: Any) -> EvaluateValueResult[Any]:
+def _post_process(
+    state: _ProcessingState, config_type: ConfigType, config_value: Any, path: EvaluationPath
+) -> Any:
     try:
-        new_value = context.config_type.post_process(config_value)
-        return EvaluateValueResult.for_value(new_value)
+        return config_type.post_process(config_value)
     except PostProcessingError:
         error_data = serializable_error_info_from_exc_info(sys.exc_info())
-        return EvaluateValueResult.for_error(
-            create_failed_post_processing_error(context, config_value, error_data)
-        )
-
-
-def _recurse_in_to_scalar_union(
-    context: TraversalContext, config_value: Any
-) -> EvaluateValueResult[Any]:
-    if isinstance(config_value, (dict, list)):
-        return _recursively_process_config(
-            context.for_new_config_type(context.config_type.non_scalar_type),  # type: ignore
-            config_value,
-        )
-    else:
-        return _recursively_process_config(
-            context.for_new_config_type(context.config_type.scalar_type),  # type: ignore
-            config_value,
+        state.errors.append(
+            create_failed_post_processing_error(
+                state.get_context(config_type, path), config_value, error_data
+            )
         )
+        return config_value
 
 
 def _recurse_in_to_selector(
-    context: TraversalContext, config_value: Mapping[str, Any]
-) -> EvaluateValueResult[Any]:
-    check.invariant(
-        context.config_type.kind == ConfigTypeKind.SELECTOR,
-        "Non-selector not caught in validation",
-    )
+    state: _ProcessingState,
+    config_type: ConfigType,
+    config_value: Mapping[str, Any],
+    path: EvaluationPath,
+) -> Any:
+    fields = config_type.fields  # type: ignore
 
     if config_value:
         check.invariant(config_value and len(config_value) == 1)
         field_name, incoming_field_value = ensure_single_item(config_value)
     else:
-        field_name, field_def = ensure_single_item(context.config_type.fields)  # type: ignore
+        field_name, field_def = ensure_single_item(fields)
         incoming_field_value = field_def.default_value if field_def.default_provided else None
 
-    field_def = context.config_type.fields[field_name]  # type: ignore
-
-    field_evr = _recursively_process_config(
-        context.for_field(field_def, field_name),
-        (
-            {}
-            if incoming_field_value is None
-            and ConfigTypeKind.has_fields(field_def.config_type.kind)
-            else incoming_field_value
-        ),
-    )
-    if field_evr.success:
-        return EvaluateValueResult.for_value({field_name: field_evr.value})
-
-    return field_evr
+    field_def = fields[field_name]
+
+    return {
+        field_name: _recursively_process_config(
+            state,
+            field_def.config_type,
+            (
+                {}
+                if incoming_field_value is None
+                and ConfigTypeKind.has_fields(field_def.config_type.kind)
+                else incoming_field_value
+            ),
+            (path, EvaluationStackPathEntry, field_name),
+        )
+    }
 
 
 def _recurse_in_to_shape(
-    context: TraversalContext, config_value: Optional[Mapping[str, object]]
-) -> EvaluateValueResult[Any]:
-    check.invariant(ConfigTypeKind.is_shape(context.config_type.kind), "Unexpected non shape type")
-    config_value = check.opt_mapping_param(config_value, "config_value", key_type=str)
-
-    fields = context.config_type.fields  # type: ignore
-
-    field_aliases: dict[str, str] = check.opt_dict_param(
-        getattr(context.config_type, "field_aliases", None),
-        "field_aliases",
-        key_type=str,
-        value_type=str,
-    )
-
-    incoming_fields = config_value.keys()
+    state: _ProcessingState,
+    config_type: ConfigType,
+    config_value: Optional[Mapping[str, object]],
+    path: EvaluationPath,
+) -> Any:
+    if config_value is None:
+        config_value = {}
 
     processed_fields = {}
 
-    for expected_field, field_def in fields.items():
-        if expected_field in incoming_fields:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field),
-                config_value[expected_field],
-            )
-        elif expected_field in field_aliases and field_aliases[expected_field] in incoming_fields:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field),
-                config_value[field_aliases[expected_field]],
-            )
-
-        elif field_def.default_provided:
-            processed_fields[expected_field] = _recursively_process_config(
-                context.for_field(field_def, expected_field), field_def.default_value
-            )
-
-        elif field_def.is_required:
+    for field in _get_field_plans(config_type):
+        name = field.name
+        if name in config_value:
+            field_value = config_value[name]
+        elif field.alias is not None and field.alias in config_value:
+            field_value = config_value[field.alias]
+        elif field.default_provided:
+            field_value = field.field_def.default_value
+        elif field.field_def.is_required:
             check.failed("Missing required composite member not caught in validation")
+        else:
+            continue
+
+        processed_fields[name] = _recursively_process_config(
+            state,
+            field.field_def.config_type,
+            field_value,
+            (path, EvaluationStackPathEntry, name),
+        )
 
     # For permissive composite fields, we skip applying defaults because these fields are unknown
     # to us
-    if context.config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE:
-        defined_fields = fields.keys()
-        extra_fields = [field for field in incoming_fields if field not in defined_fields]
-        for extra_field in extra_fields:
-            processed_fields[extra_field] = EvaluateValueResult.for_value(config_value[extra_field])
-
-    errors: list[EvaluationError] = []
-    for result in processed_fields.values():
-        if not result.success:
-            errors.extend(check.not_none(result.errors))
-
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
-
-    return EvaluateValueResult.for_value(
-        {key: result.value for key, result in processed_fields.items()}
-    )
+    if config_type.kind == ConfigTypeKind.PERMISSIVE_SHAPE:
+        defined_fields = config_type.fields.keys()  # type: ignore
+        processed_fields.update(
+            (extra_field, extra_value)
+            for extra_field, extra_value in config_value.items()
+            if extra_field not in defined_fields
+        )
 
+    return processed_fields
 
-def _recurse_in_to_array(context: TraversalContext, config_value: Any) -> EvaluateValueResult[Any]:
-    check.invariant(context.config_type.kind == ConfigTypeKind.ARRAY, "Unexpected non array type")
 
+def _recurse_in_to_array(
+    state: _ProcessingState, config_type: ConfigType, config_value: Any, path: EvaluationPath
+) -> Any:
     if not config_value:
-        return EvaluateValueResult.for_value([])
+        return []
 
-    if context.config_type.inner_type.kind != ConfigTypeKind.NONEABLE:  # type: ignore
+    inner_type = config_type.inner_type  # type: ignore
+    if inner_type.kind != ConfigTypeKind.NONEABLE:
         if any(cv is None for cv in config_value):
             check.failed("Null array member not caught in validation")
 
-    results = [
-        _recursively_process_config(context.for_array(idx), item)
+    return [
+        _recursively_process_config(
+            state, inner_type, item, (path, EvaluationStackListItemEntry, idx)
+        )
         for idx, item in enumerate(config_value)
     ]
 
-    errors: list[EvaluationError] = []
-    for result in results:
-        if not result.success:
-            errors.extend(check.not_none(result.errors))
-
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
-
-    return EvaluateValueResult.for_value([result.value for result in results])
-
-
-def _recurse_in_to_map(context: TraversalContext, config_value: Any) -> EvaluateValueResult[Any]:
-    check.invariant(
-        context.config_type.kind == ConfigTypeKind.MAP,
-        "Unexpected non map type",
-    )
 
+def _recurse_in_to_map(
+    state: _ProcessingState, config_type: ConfigType, config_value: Any, path: EvaluationPath
+) -> Any:
     if not config_value:
-        return EvaluateValueResult.for_value({})
+        return {}
 
     config_value = cast(dict[object, object], config_value)
 
+    inner_type = config_type.inner_type  # type: ignore
     if any(ck is None for ck in config_value.keys()):
         check.failed("Null map key not caught in validation")
-    if context.config_type.inner_type.kind != ConfigTypeKind.NONEABLE:  # type: ignore
+    if inner_type.kind != ConfigTypeKind.NONEABLE:
         if any(cv is None for cv in config_value.values()):
             check.failed("Null map member not caught in validation")
 
-    results = {
-        key: _recursively_process_config(context.for_map(key), item)
+    return {
+        key: _recursively_process_config(
+            state, inner_type, item, (path, EvaluationStackMapValueEntry, key)
+        )
         for key, item in config_value.items()
     }
-
-    errors: list[EvaluationError] = []
-    for result in results.values():
-        if not result.success:
-            errors.extend(check.not_none(result.errors))
-
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
-
-    return EvaluateValueResult.for_value({key: result.value for key, result in results.items()})
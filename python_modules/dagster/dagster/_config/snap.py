@@ -1,5 +1,6 @@
 from collections.abc import Mapping, Sequence
-from typing import Any, Optional, cast
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import dagster._check as check
 from dagster._config.config_type import ConfigScalarKind, ConfigType, ConfigTypeKind
@@ -7,6 +8,9 @@
 from dagster._record import IHaveNew, record, record_custom
 from dagster._serdes import whitelist_for_serdes
 
+if TYPE_CHECKING:
+    from dagster._config.validate import ConfigTypeValidationPlan
+
 
 def get_recursive_type_keys(
     config_type_snap: "ConfigTypeSnap", config_schema_snapshot: "ConfigSchemaSnapshot"
@@ -248,6 +252,13 @@ def has_config_snap(self, key: str) -> bool:
         check.str_param(key, "key")
         return key in self.all_config_snaps_by_key
 
+    @cached_property
+    def validation_plans(self) -> dict[str, "ConfigTypeValidationPlan"]:
+        """Validation plans compiled from this snapshot, by config type key. Populated lazily by
+        `dagster._config.validate` the first time each type is used to validate a value.
+        """
+        return {}
+
 
 def minimal_config_for_type_snap(
     config_schema_snap: ConfigSchemaSnapshot, config_type_snap: ConfigTypeSnap
@@ -1,5 +1,7 @@
 from collections.abc import Sequence
-from typing import NamedTuple
+from typing import Any, NamedTuple, Optional
+
+from typing_extensions import TypeAlias
 
 import dagster._check as check
 
@@ -73,6 +75,21 @@ def __new__(cls, map_key: object):
         return super().__new__(cls, map_key)
 
 
+# A lightweight stand-in for an EvaluationStack used while traversing config values. It is either
+# None (the root) or a `(parent, entry_class, entry_arg)` tuple, so descending into a child value
+# only allocates a tuple. The EvaluationStack itself is only built if an error must be reported.
+EvaluationPath: TypeAlias = Optional[tuple[Any, type[EvaluationStackEntry], Any]]
+
+
+def evaluation_stack_from_path(path: EvaluationPath) -> EvaluationStack:
+    entries = []
+    while path is not None:
+        path, entry_class, entry_arg = path
+        entries.append(entry_class(entry_arg))
+    entries.reverse()
+    return EvaluationStack(entries=entries)
+
+
 def get_friendly_path_msg(stack: EvaluationStack) -> str:
     return get_friendly_path_info(stack)[0]
 
@@ -1,4 +1,4 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping
 from typing import Any, Optional, TypeVar, cast
 
 import dagster._check as check
@@ -25,9 +25,17 @@
 )
 from dagster._config.evaluate_value_result import EvaluateValueResult
 from dagster._config.field import resolve_to_config_type
+from dagster._config.field_utils import EnvVar, IntEnvVar
 from dagster._config.post_process import post_process_config
 from dagster._config.snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
-from dagster._config.stack import EvaluationStack
+from dagster._config.stack import (
+    EvaluationPath,
+    EvaluationStackListItemEntry,
+    EvaluationStackMapKeyEntry,
+    EvaluationStackMapValueEntry,
+    EvaluationStackPathEntry,
+    evaluation_stack_from_path,
+)
 from dagster._config.traversal_context import ValidationContext
 from dagster._utils import ensure_single_item
 
@@ -39,19 +47,7 @@
 def is_config_scalar_valid(config_type_snap: ConfigTypeSnap, config_value: object) -> bool:
     check.inst_param(config_type_snap, "config_type_snap", ConfigTypeSnap)
     check.param_invariant(config_type_snap.kind == ConfigTypeKind.SCALAR, "config_type_snap")
-    if config_type_snap.scalar_kind == ConfigScalarKind.INT:
-        return not isinstance(config_value, bool) and isinstance(config_value, int)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.STRING:
-        return isinstance(config_value, str)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.BOOL:
-        return isinstance(config_value, bool)
-    elif config_type_snap.scalar_kind == ConfigScalarKind.FLOAT:
-        return isinstance(config_value, VALID_FLOAT_TYPES)
-    elif config_type_snap.scalar_kind is None:
-        # historical snapshot without scalar kind. do no validation
-        return True
-    else:
-        check.failed(f"Not a supported scalar {config_type_snap}")
+    return _is_scalar_kind_valid(config_type_snap.scalar_kind, config_value)
 
 
 def validate_config(config_schema: object, config_value: T) -> EvaluateValueResult[T]:
@@ -69,138 +65,221 @@ def validate_config_from_snap(
 ) -> EvaluateValueResult[T]:
     check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
     check.str_param(config_type_key, "config_type_key")
-    return _validate_config(
-        ValidationContext(
-            config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=config_schema_snapshot.get_config_snap(config_type_key),
-            stack=EvaluationStack(entries=[]),
-        ),
-        config_value,
+
+    errors: list[EvaluationError] = []
+    value = _validate_config(
+        get_validation_plan(config_schema_snapshot, config_type_key), config_value, None, errors
     )
+    if errors:
+        return EvaluateValueResult.for_errors(errors)
+    return EvaluateValueResult.for_value(cast(T, value))
+
+
+class ConfigTypeValidationPlan:
+    """A flattened view of a `ConfigTypeSnap` holding everything needed to validate a value
+    against it: field lookups, required fields, aliases and enum values are computed once, so that
+    validating a value does not walk or search the schema snapshot.
 
+    Plans are compiled lazily, the first time a type is used, and are cached on the schema
+    snapshot (see `get_validation_plan`).
+    """
 
-def _validate_config(context: ValidationContext, config_value: object) -> EvaluateValueResult[Any]:
-    from dagster._config.field_utils import EnvVar, IntEnvVar
+    __slots__ = [
+        "config_schema_snapshot",
+        "config_type_snap",
+        "defined_field_names",
+        "enum_values",
+        "field_aliases",
+        "fields",
+        "fields_by_name",
+        "kind",
+        "required_fields",
+        "scalar_kind",
+        "type_param_keys",
+    ]
+
+    def __init__(
+        self, config_schema_snapshot: ConfigSchemaSnapshot, config_type_snap: ConfigTypeSnap
+    ):
+        self.config_schema_snapshot = config_schema_snapshot
+        self.config_type_snap = config_type_snap
+        self.kind = config_type_snap.kind
+        self.scalar_kind = config_type_snap.scalar_kind
+        self.type_param_keys = config_type_snap.type_param_keys or []
+
+        field_snaps = config_type_snap.fields or []
+        self.field_aliases: Mapping[str, str] = config_type_snap.field_aliases or {}
+        self.fields = [
+            _FieldValidationPlan(config_schema_snapshot, field_snap, self.field_aliases)
+            for field_snap in field_snaps
+        ]
+        self.fields_by_name = {field.name: field for field in self.fields}
+        self.defined_field_names = set(self.fields_by_name).union(self.field_aliases.values())
+        self.required_fields = [field for field in self.fields if field.field_snap.is_required]
+        self.enum_values = {enum_value.value for enum_value in (config_type_snap.enum_values or [])}
+
+    def get_type_param_plan(self, index: int) -> "ConfigTypeValidationPlan":
+        return get_validation_plan(self.config_schema_snapshot, self.type_param_keys[index])
+
+    def get_context(self, path: EvaluationPath) -> ValidationContext:
+        return ValidationContext(
+            config_schema_snapshot=self.config_schema_snapshot,
+            config_type_snap=self.config_type_snap,
+            stack=evaluation_stack_from_path(path),
+        )
+
+
+class _FieldValidationPlan:
+    __slots__ = ["alias", "field_snap", "has_fields", "name", "type_key"]
+
+    def __init__(
+        self,
+        config_schema_snapshot: ConfigSchemaSnapshot,
+        field_snap: ConfigFieldSnap,
+        field_aliases: Mapping[str, str],
+    ):
+        self.field_snap = field_snap
+        self.name = check.not_none(field_snap.name)
+        self.alias = field_aliases.get(self.name)
+        self.type_key = field_snap.type_key
+        self.has_fields = ConfigTypeKind.has_fields(
+            config_schema_snapshot.get_config_snap(field_snap.type_key).kind
+        )
 
-    check.inst_param(context, "context", ValidationContext)
+    def get_plan(self, config_schema_snapshot: ConfigSchemaSnapshot) -> ConfigTypeValidationPlan:
+        return get_validation_plan(config_schema_snapshot, self.type_key)
 
-    kind = context.config_type_snap.kind
+
+def get_validation_plan(
+    config_schema_snapshot: ConfigSchemaSnapshot, config_type_key: str
+) -> ConfigTypeValidationPlan:
+    plans = config_schema_snapshot.validation_plans
+    plan = plans.get(config_type_key)
+    if plan is None:
+        plan = ConfigTypeValidationPlan(
+            config_schema_snapshot, config_schema_snapshot.get_config_snap(config_type_key)
+        )
+        plans[config_type_key] = plan
+    return plan
+
+
+def _validate_config(
+    plan: ConfigTypeValidationPlan,
+    config_value: object,
+    path: EvaluationPath,
+    errors: list[EvaluationError],
+) -> object:
+    """Validates `config_value` against `plan`, appending any errors to `errors`. Returns the
+    validated value, which is only meaningful if no errors were appended.
+    """
+    kind = plan.kind
 
     if kind == ConfigTypeKind.NONEABLE:
         return (
-            EvaluateValueResult.for_value(config_value)
+            config_value
             if config_value is None
-            else _validate_config(context.for_nullable_inner_type(), config_value)
+            else _validate_config(plan.get_type_param_plan(0), config_value, path, errors)
         )
 
     if kind == ConfigTypeKind.ANY:
-        return EvaluateValueResult.for_value(config_value)  # yolo
+        return config_value  # yolo
 
     if config_value is None:
-        return EvaluateValueResult.for_error(create_none_not_allowed_error(context))
+        errors.append(create_none_not_allowed_error(plan.get_context(path)))
+        return config_value
 
     if kind == ConfigTypeKind.SCALAR:
-        if not is_config_scalar_valid(context.config_type_snap, config_value):
-            return EvaluateValueResult.for_error(create_scalar_error(context, config_value))
+        if not _is_scalar_kind_valid(plan.scalar_kind, config_value):
+            errors.append(create_scalar_error(plan.get_context(path), config_value))
         # If user passes an EnvVar or IntEnvVar to a non-structured run config dictionary, throw explicit error
-        if context.config_type_snap.scalar_kind == ConfigScalarKind.STRING and isinstance(
+        elif plan.scalar_kind == ConfigScalarKind.STRING and isinstance(
             config_value, (EnvVar, IntEnvVar)
         ):
-            return EvaluateValueResult.for_error(
-                create_pydantic_env_var_error(context, config_value)
-            )
-        return EvaluateValueResult.for_value(config_value)
+            errors.append(create_pydantic_env_var_error(plan.get_context(path), config_value))
+        return config_value
     elif kind == ConfigTypeKind.SELECTOR:
-        return validate_selector_config(context, config_value)
+        return _validate_selector_config(plan, config_value, path, errors)
     elif kind == ConfigTypeKind.STRICT_SHAPE:
-        return validate_shape_config(context, config_value)
+        return _validate_shape_config(
+            plan, config_value, path, errors, check_for_extra_incoming_fields=True
+        )
     elif kind == ConfigTypeKind.PERMISSIVE_SHAPE:
-        return validate_permissive_shape_config(context, config_value)
+        return _validate_shape_config(
+            plan, config_value, path, errors, check_for_extra_incoming_fields=False
+        )
     elif kind == ConfigTypeKind.MAP:
-        return validate_map_config(context, config_value)
+        return _validate_map_config(plan, config_value, path, errors)
     elif kind == ConfigTypeKind.ARRAY:
-        return validate_array_config(context, config_value)
+        return _validate_array_config(plan, config_value, path, errors)
     elif kind == ConfigTypeKind.ENUM:
-        return validate_enum_config(context, config_value)
+        return _validate_enum_config(plan, config_value, path, errors)
     elif kind == ConfigTypeKind.SCALAR_UNION:
-        return _validate_scalar_union_config(context, config_value)
-    else:
-        check.failed(f"Unsupported ConfigTypeKind {kind}")
-
-
-def _validate_scalar_union_config(
-    context: ValidationContext, config_value: T
-) -> EvaluateValueResult[T]:
-    check.inst_param(context, "context", ValidationContext)
-    check.param_invariant(context.config_type_snap.kind == ConfigTypeKind.SCALAR_UNION, "context")
-    check.not_none_param(config_value, "config_value")
-
-    if isinstance(config_value, (dict, list)):
         return _validate_config(
-            context.for_new_config_type_key(context.config_type_snap.non_scalar_type_key),
-            cast(T, config_value),
-        )
-    else:
-        return _validate_config(
-            context.for_new_config_type_key(context.config_type_snap.scalar_type_key),
+            plan.get_type_param_plan(1 if isinstance(config_value, (dict, list)) else 0),
             config_value,
+            path,
+            errors,
         )
+    else:
+        check.failed(f"Unsupported ConfigTypeKind {kind}")
 
 
-def _validate_empty_selector_config(
-    context: ValidationContext,
-) -> EvaluateValueResult[Mapping[str, object]]:
-    fields = check.not_none(context.config_type_snap.fields)
-    if len(fields) > 1:
-        return EvaluateValueResult.for_error(
-            create_selector_multiple_fields_no_field_selected_error(context)
-        )
-
-    defined_field_snap = fields[0]
-
-    if defined_field_snap.is_required:
-        return EvaluateValueResult.for_error(create_selector_unspecified_value_error(context))
-
-    return EvaluateValueResult.for_value(cast(Mapping[str, object], {}))
+def _is_scalar_kind_valid(scalar_kind: Optional[ConfigScalarKind], config_value: object) -> bool:
+    if scalar_kind == ConfigScalarKind.INT:
+        return not isinstance(config_value, bool) and isinstance(config_value, int)
+    elif scalar_kind == ConfigScalarKind.STRING:
+        return isinstance(config_value, str)
+    elif scalar_kind == ConfigScalarKind.BOOL:
+        return isinstance(config_value, bool)
+    elif scalar_kind == ConfigScalarKind.FLOAT:
+        return isinstance(config_value, VALID_FLOAT_TYPES)
+    elif scalar_kind is None:
+        # historical snapshot without scalar kind. do no validation
+        return True
+    else:
+        check.failed(f"Not a supported scalar {scalar_kind}")
 
 
-def validate_selector_config(
-    context: ValidationContext,
+def _validate_selector_config(
+    plan: ConfigTypeValidationPlan,
     config_value: object,
-) -> EvaluateValueResult[Mapping[str, object]]:
-    check.inst_param(context, "context", ValidationContext)
-    check.param_invariant(context.config_type_snap.kind == ConfigTypeKind.SELECTOR, "selector_type")
-    check.not_none_param(config_value, "config_value")
-
+    path: EvaluationPath,
+    errors: list[EvaluationError],
+) -> object:
     # Special case the empty dictionary, meaning no values provided for the
     # value of the selector. # E.g. {'logging': {}}
     # If there is a single field defined on the selector and if it is optional
     # it passes validation. (e.g. a single logger "console")
     if config_value == {}:
-        return _validate_empty_selector_config(context)
+        if len(plan.fields) > 1:
+            errors.append(
+                create_selector_multiple_fields_no_field_selected_error(plan.get_context(path))
+            )
+        elif plan.fields[0].field_snap.is_required:
+            errors.append(create_selector_unspecified_value_error(plan.get_context(path)))
+        return {}
 
     # Now we ensure that the used-provided config has only a single entry
     # and then continue the validation pass
 
     if not isinstance(config_value, dict):
-        return EvaluateValueResult.for_error(create_selector_type_error(context, config_value))
-    config_value = cast(Mapping[str, object], config_value)
+        errors.append(create_selector_type_error(plan.get_context(path), config_value))
+        return config_value
 
     if len(config_value) > 1:
-        return EvaluateValueResult.for_error(
-            create_selector_multiple_fields_error(context, config_value)
-        )
+        errors.append(create_selector_multiple_fields_error(plan.get_context(path), config_value))
+        return config_value
 
     field_name, field_value = ensure_single_item(config_value)
 
-    if not context.config_type_snap.has_field(field_name):
-        return EvaluateValueResult.for_error(create_field_not_defined_error(context, field_name))
+    field = plan.fields_by_name.get(field_name)
+    if field is None:
+        errors.append(create_field_not_defined_error(plan.get_context(path), field_name))
+        return config_value
 
-    field_snap = context.config_type_snap.get_field(field_name)
-
-    child_evaluate_value_result = _validate_config(
-        context.for_field_snap(field_snap),
-        (
+    return {
+        field_name: _validate_config(
+            field.get_plan(plan.config_schema_snapshot),
             # This is a very particular special case where we want someone
             # to be able to select a selector key *without* a value
             #
@@ -210,223 +289,127 @@ def validate_selector_config(
             #
             # And we want the default values of the child elements of filesystem:
             # to "fill in"
-            {}
-            if field_value is None
-            and ConfigTypeKind.has_fields(
-                context.config_schema_snapshot.get_config_snap(field_snap.type_key).kind
-            )
-            else field_value
-        ),
-    )
-
-    if child_evaluate_value_result.success:
-        return EvaluateValueResult.for_value({field_name: child_evaluate_value_result.value})
-    else:
-        return child_evaluate_value_result
+            {} if field_value is None and field.has_fields else field_value,
+            (path, EvaluationStackPathEntry, field_name),
+            errors,
+        )
+    }
 
 
 def _validate_shape_config(
-    context: ValidationContext, config_value: object, check_for_extra_incoming_fields: bool
-) -> EvaluateValueResult[Mapping[str, object]]:
-    check.inst_param(context, "context", ValidationContext)
-    check.not_none_param(config_value, "config_value")
-    check.bool_param(check_for_extra_incoming_fields, "check_for_extra_incoming_fields")
-
-    field_aliases = check.opt_dict_param(
-        cast(dict[str, str], context.config_type_snap.field_aliases),
-        "field_aliases",
-        key_type=str,
-        value_type=str,
-    )
-
+    plan: ConfigTypeValidationPlan,
+    config_value: object,
+    path: EvaluationPath,
+    errors: list[EvaluationError],
+    check_for_extra_incoming_fields: bool,
+) -> object:
     if not isinstance(config_value, dict):
-        return EvaluateValueResult.for_error(create_dict_type_mismatch_error(context, config_value))
-    config_value = cast(dict[str, object], config_value)
+        errors.append(create_dict_type_mismatch_error(plan.get_context(path), config_value))
+        return config_value
 
-    field_snaps = check.not_none(context.config_type_snap.fields)
-    defined_field_names = {cast(str, fs.name) for fs in field_snaps}
-    defined_field_names = defined_field_names.union(set(field_aliases.values()))
-
-    incoming_field_names = set(config_value.keys())
-
-    errors: list[EvaluationError] = []
+    if check_for_extra_incoming_fields and not plan.defined_field_names.issuperset(config_value):
+        extra_fields = list(set(config_value.keys()) - plan.defined_field_names)
+        if len(extra_fields) == 1:
+            errors.append(create_field_not_defined_error(plan.get_context(path), extra_fields[0]))
+        else:
+            errors.append(create_fields_not_defined_error(plan.get_context(path), extra_fields))
 
-    if check_for_extra_incoming_fields:
-        _append_if_error(
-            errors,
-            _check_for_extra_incoming_fields(
-                context,
-                defined_field_names,
-                incoming_field_names,
-            ),
+    missing_fields = [
+        field.name
+        for field in plan.required_fields
+        if field.name not in config_value
+        and (field.alias is None or field.alias not in config_value)
+    ]
+    if len(missing_fields) == 1:
+        errors.append(
+            create_missing_required_field_error(plan.get_context(path), missing_fields[0])
         )
-
-    _append_if_error(
-        errors,
-        _compute_missing_fields_error(context, field_snaps, incoming_field_names, field_aliases),
-    )
+    elif missing_fields:
+        errors.append(create_missing_required_fields_error(plan.get_context(path), missing_fields))
 
     # dict is well-formed. now recursively validate all incoming fields
-
-    field_errors = []
-    field_snaps = check.not_none(context.config_type_snap.fields)
-    for field_snap in field_snaps:
-        name = check.not_none(field_snap.name)
-        aliased_name = field_aliases.get(name)
+    for field in plan.fields:
+        name = field.name
+        aliased_name = field.alias
         if aliased_name is not None and aliased_name in config_value and name in config_value:
-            field_errors.append(
+            field_plan = field.get_plan(plan.config_schema_snapshot)
+            errors.append(
                 create_field_substitution_collision_error(
-                    context.for_field_snap(field_snap), name=name, aliased_name=aliased_name
+                    field_plan.get_context((path, EvaluationStackPathEntry, name)),
+                    name=name,
+                    aliased_name=aliased_name,
                 )
             )
         elif name in config_value:
-            field_evr = _validate_config(context.for_field_snap(field_snap), config_value[name])
-
-            if field_evr.errors:
-                field_errors += field_evr.errors
+            _validate_config(
+                field.get_plan(plan.config_schema_snapshot),
+                config_value[name],
+                (path, EvaluationStackPathEntry, name),
+                errors,
+            )
         elif aliased_name is not None and aliased_name in config_value:
-            field_evr = _validate_config(
-                context.for_field_snap(field_snap), config_value[aliased_name]
+            _validate_config(
+                field.get_plan(plan.config_schema_snapshot),
+                config_value[aliased_name],
+                (path, EvaluationStackPathEntry, name),
+                errors,
             )
 
-            if field_evr.errors:
-                field_errors += field_evr.errors
-
-    if field_errors:
-        errors += field_errors
-
-    if errors:
-        return EvaluateValueResult.for_errors(errors)
-    else:
-        return EvaluateValueResult.for_value(config_value)
-
-
-def validate_permissive_shape_config(
-    context: ValidationContext, config_value: object
-) -> EvaluateValueResult[Mapping[str, object]]:
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.PERMISSIVE_SHAPE)
-    check.not_none_param(config_value, "config_value")
-
-    return _validate_shape_config(context, config_value, check_for_extra_incoming_fields=False)
+    return config_value
 
 
-def validate_map_config(
-    context: ValidationContext, config_value: object
-) -> EvaluateValueResult[Mapping[object, object]]:
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.MAP)
-    check.not_none_param(config_value, "config_value")
-
+def _validate_map_config(
+    plan: ConfigTypeValidationPlan,
+    config_value: object,
+    path: EvaluationPath,
+    errors: list[EvaluationError],
+) -> object:
     if not isinstance(config_value, dict):
-        return EvaluateValueResult.for_error(create_map_error(context, config_value))
-    config_value = cast(dict[object, object], config_value)
-
-    evaluation_results = [
-        _validate_config(context.for_map_key(key), key) for key in config_value.keys()
-    ] + [
-        _validate_config(context.for_map_value(key), config_item)
-        for key, config_item in config_value.items()
-    ]
+        errors.append(create_map_error(plan.get_context(path), config_value))
+        return config_value
 
-    errors = []
-    for result in evaluation_results:
-        if not result.success:
-            errors += cast(list, result.errors)
+    key_plan = plan.get_type_param_plan(0)
+    for key in config_value.keys():
+        _validate_config(key_plan, key, (path, EvaluationStackMapKeyEntry, key), errors)
 
-    return EvaluateValueResult(not bool(errors), config_value, errors)
+    value_plan = plan.get_type_param_plan(1)
+    for key, config_item in config_value.items():
+        _validate_config(value_plan, config_item, (path, EvaluationStackMapValueEntry, key), errors)
 
+    return config_value
 
-def validate_shape_config(
-    context: ValidationContext, config_value: object
-) -> EvaluateValueResult[Mapping[str, object]]:
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.STRICT_SHAPE)
-    check.not_none_param(config_value, "config_value")
-
-    return _validate_shape_config(context, config_value, check_for_extra_incoming_fields=True)
-
-
-def _append_if_error(errors: list[EvaluationError], maybe_error: Optional[EvaluationError]) -> None:
-    if maybe_error:
-        errors.append(maybe_error)
-
-
-def _check_for_extra_incoming_fields(
-    context: ValidationContext, defined_field_names: set[str], incoming_field_names: set[str]
-) -> Optional[EvaluationError]:
-    extra_fields = list(incoming_field_names - defined_field_names)
-
-    if extra_fields:
-        if len(extra_fields) == 1:
-            return create_field_not_defined_error(context, extra_fields[0])
-        else:
-            return create_fields_not_defined_error(context, extra_fields)
-    return None
-
-
-def _compute_missing_fields_error(
-    context: ValidationContext,
-    field_snaps: Sequence[ConfigFieldSnap],
-    incoming_fields: set[str],
-    field_aliases: Mapping[str, str],
-) -> Optional[EvaluationError]:
-    missing_fields: list[str] = []
-
-    for field_snap in field_snaps:
-        field_alias = field_aliases.get(cast(str, field_snap.name))
-        if field_snap.is_required and field_snap.name not in incoming_fields:
-            if field_alias is None or field_alias not in incoming_fields:
-                missing_fields.append(cast(str, field_snap.name))
-
-    if missing_fields:
-        if len(missing_fields) == 1:
-            return create_missing_required_field_error(context, missing_fields[0])
-        else:
-            return create_missing_required_fields_error(context, missing_fields)
-    return None
-
-
-def validate_array_config(
-    context: ValidationContext, config_value: object
-) -> EvaluateValueResult[Sequence[object]]:
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.ARRAY)
-    check.not_none_param(config_value, "config_value")
 
+def _validate_array_config(
+    plan: ConfigTypeValidationPlan,
+    config_value: object,
+    path: EvaluationPath,
+    errors: list[EvaluationError],
+) -> object:
     if not isinstance(config_value, list):
-        return EvaluateValueResult.for_error(create_array_error(context, config_value))
+        errors.append(create_array_error(plan.get_context(path), config_value))
+        return config_value
 
-    evaluation_results = [
-        _validate_config(context.for_array(index), config_item)
-        for index, config_item in enumerate(cast(list[object], config_value))
+    inner_plan = plan.get_type_param_plan(0)
+    return [
+        _validate_config(
+            inner_plan, config_item, (path, EvaluationStackListItemEntry, index), errors
+        )
+        for index, config_item in enumerate(config_value)
     ]
 
-    values: list[object] = []
-    errors: list[EvaluationError] = []
-    for result in evaluation_results:
-        if result.success:
-            values.append(result.value)
-        else:
-            errors.extend(check.not_none(result.errors))
-
-    return EvaluateValueResult(not bool(errors), values, errors)
-
-
-def validate_enum_config(
-    context: ValidationContext, config_value: object
-) -> EvaluateValueResult[str]:
-    check.inst_param(context, "context", ValidationContext)
-    check.invariant(context.config_type_snap.kind == ConfigTypeKind.ENUM)
-    check.not_none_param(config_value, "config_value")
 
+def _validate_enum_config(
+    plan: ConfigTypeValidationPlan,
+    config_value: object,
+    path: EvaluationPath,
+    errors: list[EvaluationError],
+) -> object:
     if not isinstance(config_value, str):
-        return EvaluateValueResult.for_error(create_enum_type_mismatch_error(context, config_value))
-
-    if not context.config_type_snap.has_enum_value(config_value):
-        return EvaluateValueResult.for_error(create_enum_value_missing_error(context, config_value))
+        errors.append(create_enum_type_mismatch_error(plan.get_context(path), config_value))
+    elif config_value not in plan.enum_values:
+        errors.append(create_enum_value_missing_error(plan.get_context(path), config_value))
 
-    return EvaluateValueResult.for_value(config_value)
+    return config_value
 
 
 def process_config(
@@ -1,4 +1,5 @@
 import functools
+import threading
 from collections.abc import Awaitable, Iterable
 from datetime import datetime, timedelta
 from typing import (  # noqa: UP035
@@ -128,7 +129,9 @@ def __init__(
 
         self._temporal_context = temporal_context
         self._instance = instance
-        self._loaders = {}
+        # data loaders are bound to the event loop they are first used in, so each thread which
+        # evaluates against this view gets its own set
+        self._thread_local = threading.local()
         self._asset_graph = asset_graph
 
         self._queryer = CachingInstanceQueryer(
@@ -144,7 +147,10 @@ def instance(self) -> "DagsterInstance":
 
     @property
     def loaders(self) -> dict[type, DataLoader]:
-        return self._loaders
+        loaders = getattr(self._thread_local, "loaders", None)
+        if loaders is None:
+            loaders = self._thread_local.loaders = {}
+        return loaders
 
     @property
     def effective_dt(self) -> datetime:
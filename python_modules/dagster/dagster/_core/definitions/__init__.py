@@ -1,206 +1,381 @@
-from dagster._core.definitions.asset_check_result import (
-    AssetCheckEvaluation as AssetCheckEvaluation,
-    AssetCheckResult as AssetCheckResult,
-    AssetCheckSeverity as AssetCheckSeverity,
-)
-from dagster._core.definitions.composition import PendingNodeInvocation as PendingNodeInvocation
-from dagster._core.definitions.config import ConfigMapping as ConfigMapping
-from dagster._core.definitions.dependency import (
-    DependencyDefinition as DependencyDefinition,
-    MultiDependencyDefinition as MultiDependencyDefinition,
-    Node as Node,
-    NodeHandle as NodeHandle,
-    NodeInput as NodeInput,
-    NodeInvocation as NodeInvocation,
-    NodeOutput as NodeOutput,
-)
-from dagster._core.definitions.dynamic_partitions_request import (
-    AddDynamicPartitionsRequest as AddDynamicPartitionsRequest,
-    DeleteDynamicPartitionsRequest as DeleteDynamicPartitionsRequest,
-)
-from dagster._core.definitions.events import (
-    AssetKey as AssetKey,
-    AssetMaterialization as AssetMaterialization,
-    AssetObservation as AssetObservation,
-    DynamicOutput as DynamicOutput,
-    ExpectationResult as ExpectationResult,
-    Failure as Failure,
-    HookExecutionResult as HookExecutionResult,
-    Output as Output,
-    RetryRequested as RetryRequested,
-    TypeCheck as TypeCheck,
-)
-from dagster._core.definitions.executor_definition import (
-    ExecutorDefinition as ExecutorDefinition,
-    ExecutorRequirement as ExecutorRequirement,
-    executor as executor,
-    in_process_executor as in_process_executor,
-    multi_or_in_process_executor as multi_or_in_process_executor,
-    multiple_process_executor_requirements as multiple_process_executor_requirements,
-    multiprocess_executor as multiprocess_executor,
-)
-from dagster._core.definitions.hook_definition import HookDefinition as HookDefinition
-from dagster._core.definitions.input import (
-    GraphIn as GraphIn,
-    In as In,
-    InputDefinition as InputDefinition,
-    InputMapping as InputMapping,
-)
-from dagster._core.definitions.job_base import IJob as IJob
-from dagster._core.definitions.logger_definition import (
-    LoggerDefinition as LoggerDefinition,
-    build_init_logger_context as build_init_logger_context,
-    logger as logger,
-)
-from dagster._core.definitions.metadata import (
-    BoolMetadataValue as BoolMetadataValue,
-    DagsterAssetMetadataValue as DagsterAssetMetadataValue,
-    DagsterJobMetadataValue as DagsterJobMetadataValue,
-    DagsterRunMetadataValue as DagsterRunMetadataValue,
-    FloatMetadataValue as FloatMetadataValue,
-    IntMetadataValue as IntMetadataValue,
-    JsonMetadataValue as JsonMetadataValue,
-    MarkdownMetadataValue as MarkdownMetadataValue,
-    MetadataEntry as MetadataEntry,
-    MetadataValue as MetadataValue,
-    PathMetadataValue as PathMetadataValue,
-    PythonArtifactMetadataValue as PythonArtifactMetadataValue,
-    TableColumn as TableColumn,
-    TableColumnConstraints as TableColumnConstraints,
-    TableColumnLineageMetadataValue as TableColumnLineageMetadataValue,
-    TableConstraints as TableConstraints,
-    TableMetadataValue as TableMetadataValue,
-    TableRecord as TableRecord,
-    TableSchema as TableSchema,
-    TableSchemaMetadataValue as TableSchemaMetadataValue,
-    TextMetadataValue as TextMetadataValue,
-    UrlMetadataValue as UrlMetadataValue,
-)
-from dagster._core.definitions.node_container import (
-    create_execution_structure as create_execution_structure,
-)
-from dagster._core.definitions.node_definition import NodeDefinition as NodeDefinition
-from dagster._core.definitions.output import (
-    DynamicOut as DynamicOut,
-    DynamicOutputDefinition as DynamicOutputDefinition,
-    GraphOut as GraphOut,
-    Out as Out,
-    OutputDefinition as OutputDefinition,
-    OutputMapping as OutputMapping,
-)
-from dagster._core.definitions.reconstruct import (
-    ReconstructableJob as ReconstructableJob,
-    build_reconstructable_job as build_reconstructable_job,
-    reconstructable as reconstructable,
-)
-from dagster._core.definitions.repository_definition import (
-    RepositoryData as RepositoryData,
-    RepositoryDefinition as RepositoryDefinition,
-)
-from dagster._core.definitions.resolved_asset_deps import (
-    ResolvedAssetDependencies as ResolvedAssetDependencies,
-)
-from dagster._core.definitions.resource_definition import (
-    ResourceDefinition as ResourceDefinition,
-    make_values_resource as make_values_resource,
-    resource as resource,
-)
-from dagster._core.definitions.run_config_schema import (
-    RunConfigSchema as RunConfigSchema,
-    create_run_config_schema as create_run_config_schema,
-)
-from dagster._core.definitions.run_request import (
-    InstigatorType as InstigatorType,
-    RunRequest as RunRequest,
-    SensorResult as SensorResult,
-    SkipReason as SkipReason,
-)
-from dagster._core.definitions.schedule_definition import (
-    DefaultScheduleStatus as DefaultScheduleStatus,
-    ScheduleDefinition as ScheduleDefinition,
-    ScheduleEvaluationContext as ScheduleEvaluationContext,
-)
-from dagster._core.definitions.sensor_definition import (
-    DefaultSensorStatus as DefaultSensorStatus,
-    SensorDefinition as SensorDefinition,
-    SensorEvaluationContext as SensorEvaluationContext,
-)
+import importlib
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Final
 
-# ruff: isort: split
-from dagster._core.definitions.asset_in import AssetIn as AssetIn
-from dagster._core.definitions.asset_out import AssetOut as AssetOut
-from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
-from dagster._core.definitions.assets import AssetsDefinition as AssetsDefinition
-from dagster._core.definitions.decorators import (
-    asset as asset,
-    asset_sensor as asset_sensor,
-    config_mapping as config_mapping,
-    failure_hook as failure_hook,
-    graph as graph,
-    hook_decorator as hook_decorator,
-    job as job,
-    multi_asset as multi_asset,
-    op as op,
-    repository as repository,
-    schedule as schedule,
-    sensor as sensor,
-    success_hook as success_hook,
-)
-from dagster._core.definitions.graph_definition import GraphDefinition as GraphDefinition
-from dagster._core.definitions.job_definition import JobDefinition as JobDefinition
-from dagster._core.definitions.materialize import (
-    materialize as materialize,
-    materialize_to_memory as materialize_to_memory,
-)
-from dagster._core.definitions.module_loaders.load_assets_from_modules import (
-    load_assets_from_current_module as load_assets_from_current_module,
-    load_assets_from_modules as load_assets_from_modules,
-    load_assets_from_package_module as load_assets_from_package_module,
-    load_assets_from_package_name as load_assets_from_package_name,
-)
-from dagster._core.definitions.op_definition import OpDefinition as OpDefinition
-from dagster._core.definitions.partition import (
-    DynamicPartitionsDefinition as DynamicPartitionsDefinition,
-    Partition as Partition,
-    PartitionedConfig as PartitionedConfig,
-    PartitionsDefinition as PartitionsDefinition,
-    StaticPartitionsDefinition as StaticPartitionsDefinition,
-    dynamic_partitioned_config as dynamic_partitioned_config,
-    static_partitioned_config as static_partitioned_config,
-)
-from dagster._core.definitions.partition_key_range import PartitionKeyRange as PartitionKeyRange
-from dagster._core.definitions.partition_mapping import (
-    AllPartitionMapping as AllPartitionMapping,
-    DimensionPartitionMapping as DimensionPartitionMapping,
-    IdentityPartitionMapping as IdentityPartitionMapping,
-    LastPartitionMapping as LastPartitionMapping,
-    MultiPartitionMapping as MultiPartitionMapping,
-    MultiToSingleDimensionPartitionMapping as MultiToSingleDimensionPartitionMapping,
-    PartitionMapping as PartitionMapping,
-)
-from dagster._core.definitions.partitioned_schedule import (
-    build_schedule_from_partitioned_job as build_schedule_from_partitioned_job,
-)
-from dagster._core.definitions.run_status_sensor_definition import (
-    RunFailureSensorContext as RunFailureSensorContext,
-    RunStatusSensorContext as RunStatusSensorContext,
-    RunStatusSensorDefinition as RunStatusSensorDefinition,
-    run_failure_sensor as run_failure_sensor,
-    run_status_sensor as run_status_sensor,
-)
-from dagster._core.definitions.source_asset import SourceAsset as SourceAsset
-from dagster._core.definitions.time_window_partition_mapping import (
-    TimeWindowPartitionMapping as TimeWindowPartitionMapping,
-)
-from dagster._core.definitions.time_window_partitions import (
-    DailyPartitionsDefinition as DailyPartitionsDefinition,
-    HourlyPartitionsDefinition as HourlyPartitionsDefinition,
-    MonthlyPartitionsDefinition as MonthlyPartitionsDefinition,
-    TimeWindow as TimeWindow,
-    TimeWindowPartitionsDefinition as TimeWindowPartitionsDefinition,
-    WeeklyPartitionsDefinition as WeeklyPartitionsDefinition,
-    daily_partitioned_config as daily_partitioned_config,
-    hourly_partitioned_config as hourly_partitioned_config,
-    monthly_partitioned_config as monthly_partitioned_config,
-    weekly_partitioned_config as weekly_partitioned_config,
-)
+# Importing any `dagster._core.definitions` submodule first runs this `__init__`, so the symbols
+# re-exported here are imported on first access rather than up front. Otherwise importing a single
+# definitions module would import all of them. Every symbol imported below must also be added to
+# `_EXPORTS`.
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.asset_check_result import (
+        AssetCheckEvaluation as AssetCheckEvaluation,
+        AssetCheckResult as AssetCheckResult,
+        AssetCheckSeverity as AssetCheckSeverity,
+    )
+    from dagster._core.definitions.composition import PendingNodeInvocation as PendingNodeInvocation
+    from dagster._core.definitions.config import ConfigMapping as ConfigMapping
+    from dagster._core.definitions.dependency import (
+        DependencyDefinition as DependencyDefinition,
+        MultiDependencyDefinition as MultiDependencyDefinition,
+        Node as Node,
+        NodeHandle as NodeHandle,
+        NodeInput as NodeInput,
+        NodeInvocation as NodeInvocation,
+        NodeOutput as NodeOutput,
+    )
+    from dagster._core.definitions.dynamic_partitions_request import (
+        AddDynamicPartitionsRequest as AddDynamicPartitionsRequest,
+        DeleteDynamicPartitionsRequest as DeleteDynamicPartitionsRequest,
+    )
+    from dagster._core.definitions.events import (
+        AssetKey as AssetKey,
+        AssetMaterialization as AssetMaterialization,
+        AssetObservation as AssetObservation,
+        DynamicOutput as DynamicOutput,
+        ExpectationResult as ExpectationResult,
+        Failure as Failure,
+        HookExecutionResult as HookExecutionResult,
+        Output as Output,
+        RetryRequested as RetryRequested,
+        TypeCheck as TypeCheck,
+    )
+    from dagster._core.definitions.executor_definition import (
+        ExecutorDefinition as ExecutorDefinition,
+        ExecutorRequirement as ExecutorRequirement,
+        executor as executor,
+        in_process_executor as in_process_executor,
+        multi_or_in_process_executor as multi_or_in_process_executor,
+        multiple_process_executor_requirements as multiple_process_executor_requirements,
+        multiprocess_executor as multiprocess_executor,
+    )
+    from dagster._core.definitions.hook_definition import HookDefinition as HookDefinition
+    from dagster._core.definitions.input import (
+        GraphIn as GraphIn,
+        In as In,
+        InputDefinition as InputDefinition,
+        InputMapping as InputMapping,
+    )
+    from dagster._core.definitions.job_base import IJob as IJob
+    from dagster._core.definitions.logger_definition import (
+        LoggerDefinition as LoggerDefinition,
+        build_init_logger_context as build_init_logger_context,
+        logger as logger,
+    )
+    from dagster._core.definitions.metadata import (
+        BoolMetadataValue as BoolMetadataValue,
+        DagsterAssetMetadataValue as DagsterAssetMetadataValue,
+        DagsterJobMetadataValue as DagsterJobMetadataValue,
+        DagsterRunMetadataValue as DagsterRunMetadataValue,
+        FloatMetadataValue as FloatMetadataValue,
+        IntMetadataValue as IntMetadataValue,
+        JsonMetadataValue as JsonMetadataValue,
+        MarkdownMetadataValue as MarkdownMetadataValue,
+        MetadataEntry as MetadataEntry,
+        MetadataValue as MetadataValue,
+        PathMetadataValue as PathMetadataValue,
+        PythonArtifactMetadataValue as PythonArtifactMetadataValue,
+        TableColumn as TableColumn,
+        TableColumnConstraints as TableColumnConstraints,
+        TableColumnLineageMetadataValue as TableColumnLineageMetadataValue,
+        TableConstraints as TableConstraints,
+        TableMetadataValue as TableMetadataValue,
+        TableRecord as TableRecord,
+        TableSchema as TableSchema,
+        TableSchemaMetadataValue as TableSchemaMetadataValue,
+        TextMetadataValue as TextMetadataValue,
+        UrlMetadataValue as UrlMetadataValue,
+    )
+    from dagster._core.definitions.node_container import (
+        create_execution_structure as create_execution_structure,
+    )
+    from dagster._core.definitions.node_definition import NodeDefinition as NodeDefinition
+    from dagster._core.definitions.output import (
+        DynamicOut as DynamicOut,
+        DynamicOutputDefinition as DynamicOutputDefinition,
+        GraphOut as GraphOut,
+        Out as Out,
+        OutputDefinition as OutputDefinition,
+        OutputMapping as OutputMapping,
+    )
+    from dagster._core.definitions.reconstruct import (
+        ReconstructableJob as ReconstructableJob,
+        build_reconstructable_job as build_reconstructable_job,
+        reconstructable as reconstructable,
+    )
+    from dagster._core.definitions.repository_definition import (
+        RepositoryData as RepositoryData,
+        RepositoryDefinition as RepositoryDefinition,
+    )
+    from dagster._core.definitions.resolved_asset_deps import (
+        ResolvedAssetDependencies as ResolvedAssetDependencies,
+    )
+    from dagster._core.definitions.resource_definition import (
+        ResourceDefinition as ResourceDefinition,
+        make_values_resource as make_values_resource,
+        resource as resource,
+    )
+    from dagster._core.definitions.run_config_schema import (
+        RunConfigSchema as RunConfigSchema,
+        create_run_config_schema as create_run_config_schema,
+    )
+    from dagster._core.definitions.run_request import (
+        InstigatorType as InstigatorType,
+        RunRequest as RunRequest,
+        SensorResult as SensorResult,
+        SkipReason as SkipReason,
+    )
+    from dagster._core.definitions.schedule_definition import (
+        DefaultScheduleStatus as DefaultScheduleStatus,
+        ScheduleDefinition as ScheduleDefinition,
+        ScheduleEvaluationContext as ScheduleEvaluationContext,
+    )
+    from dagster._core.definitions.sensor_definition import (
+        DefaultSensorStatus as DefaultSensorStatus,
+        SensorDefinition as SensorDefinition,
+        SensorEvaluationContext as SensorEvaluationContext,
+    )
+
+    # ruff: isort: split
+    from dagster._core.definitions.asset_in import AssetIn as AssetIn
+    from dagster._core.definitions.asset_out import AssetOut as AssetOut
+    from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
+    from dagster._core.definitions.assets import AssetsDefinition as AssetsDefinition
+    from dagster._core.definitions.decorators import (
+        asset as asset,
+        asset_sensor as asset_sensor,
+        config_mapping as config_mapping,
+        failure_hook as failure_hook,
+        graph as graph,
+        hook_decorator as hook_decorator,
+        job as job,
+        multi_asset as multi_asset,
+        op as op,
+        repository as repository,
+        schedule as schedule,
+        sensor as sensor,
+        success_hook as success_hook,
+    )
+    from dagster._core.definitions.graph_definition import GraphDefinition as GraphDefinition
+    from dagster._core.definitions.job_definition import JobDefinition as JobDefinition
+
+    # `materialize` is not re-exported, as the `materialize` submodule would shadow it here once
+    # imported
+    from dagster._core.definitions.materialize import materialize_to_memory as materialize_to_memory
+    from dagster._core.definitions.module_loaders.load_assets_from_modules import (
+        load_assets_from_current_module as load_assets_from_current_module,
+        load_assets_from_modules as load_assets_from_modules,
+        load_assets_from_package_module as load_assets_from_package_module,
+        load_assets_from_package_name as load_assets_from_package_name,
+    )
+    from dagster._core.definitions.op_definition import OpDefinition as OpDefinition
+    from dagster._core.definitions.partition import (
+        DynamicPartitionsDefinition as DynamicPartitionsDefinition,
+        Partition as Partition,
+        PartitionedConfig as PartitionedConfig,
+        PartitionsDefinition as PartitionsDefinition,
+        StaticPartitionsDefinition as StaticPartitionsDefinition,
+        dynamic_partitioned_config as dynamic_partitioned_config,
+        static_partitioned_config as static_partitioned_config,
+    )
+    from dagster._core.definitions.partition_key_range import PartitionKeyRange as PartitionKeyRange
+    from dagster._core.definitions.partition_mapping import (
+        AllPartitionMapping as AllPartitionMapping,
+        DimensionPartitionMapping as DimensionPartitionMapping,
+        IdentityPartitionMapping as IdentityPartitionMapping,
+        LastPartitionMapping as LastPartitionMapping,
+        MultiPartitionMapping as MultiPartitionMapping,
+        MultiToSingleDimensionPartitionMapping as MultiToSingleDimensionPartitionMapping,
+        PartitionMapping as PartitionMapping,
+    )
+    from dagster._core.definitions.partitioned_schedule import (
+        build_schedule_from_partitioned_job as build_schedule_from_partitioned_job,
+    )
+    from dagster._core.definitions.run_status_sensor_definition import (
+        RunFailureSensorContext as RunFailureSensorContext,
+        RunStatusSensorContext as RunStatusSensorContext,
+        RunStatusSensorDefinition as RunStatusSensorDefinition,
+        run_failure_sensor as run_failure_sensor,
+        run_status_sensor as run_status_sensor,
+    )
+    from dagster._core.definitions.source_asset import SourceAsset as SourceAsset
+    from dagster._core.definitions.time_window_partition_mapping import (
+        TimeWindowPartitionMapping as TimeWindowPartitionMapping,
+    )
+    from dagster._core.definitions.time_window_partitions import (
+        DailyPartitionsDefinition as DailyPartitionsDefinition,
+        HourlyPartitionsDefinition as HourlyPartitionsDefinition,
+        MonthlyPartitionsDefinition as MonthlyPartitionsDefinition,
+        TimeWindow as TimeWindow,
+        TimeWindowPartitionsDefinition as TimeWindowPartitionsDefinition,
+        WeeklyPartitionsDefinition as WeeklyPartitionsDefinition,
+        daily_partitioned_config as daily_partitioned_config,
+        hourly_partitioned_config as hourly_partitioned_config,
+        monthly_partitioned_config as monthly_partitioned_config,
+        weekly_partitioned_config as weekly_partitioned_config,
+    )
+
+# Maps each re-exported symbol to the module in which it is defined.
+_EXPORTS: Final[Mapping[str, str]] = {
+    "AssetCheckEvaluation": "dagster._core.definitions.asset_check_result",
+    "AssetCheckResult": "dagster._core.definitions.asset_check_result",
+    "AssetCheckSeverity": "dagster._core.definitions.asset_check_result",
+    "PendingNodeInvocation": "dagster._core.definitions.composition",
+    "ConfigMapping": "dagster._core.definitions.config",
+    "DependencyDefinition": "dagster._core.definitions.dependency",
+    "MultiDependencyDefinition": "dagster._core.definitions.dependency",
+    "Node": "dagster._core.definitions.dependency",
+    "NodeHandle": "dagster._core.definitions.dependency",
+    "NodeInput": "dagster._core.definitions.dependency",
+    "NodeInvocation": "dagster._core.definitions.dependency",
+    "NodeOutput": "dagster._core.definitions.dependency",
+    "AddDynamicPartitionsRequest": "dagster._core.definitions.dynamic_partitions_request",
+    "DeleteDynamicPartitionsRequest": "dagster._core.definitions.dynamic_partitions_request",
+    "AssetKey": "dagster._core.definitions.events",
+    "AssetMaterialization": "dagster._core.definitions.events",
+    "AssetObservation": "dagster._core.definitions.events",
+    "DynamicOutput": "dagster._core.definitions.events",
+    "ExpectationResult": "dagster._core.definitions.events",
+    "Failure": "dagster._core.definitions.events",
+    "HookExecutionResult": "dagster._core.definitions.events",
+    "Output": "dagster._core.definitions.events",
+    "RetryRequested": "dagster._core.definitions.events",
+    "TypeCheck": "dagster._core.definitions.events",
+    "ExecutorDefinition": "dagster._core.definitions.executor_definition",
+    "ExecutorRequirement": "dagster._core.definitions.executor_definition",
+    "executor": "dagster._core.definitions.executor_definition",
+    "in_process_executor": "dagster._core.definitions.executor_definition",
+    "multi_or_in_process_executor": "dagster._core.definitions.executor_definition",
+    "multiple_process_executor_requirements": "dagster._core.definitions.executor_definition",
+    "multiprocess_executor": "dagster._core.definitions.executor_definition",
+    "HookDefinition": "dagster._core.definitions.hook_definition",
+    "GraphIn": "dagster._core.definitions.input",
+    "In": "dagster._core.definitions.input",
+    "InputDefinition": "dagster._core.definitions.input",
+    "InputMapping": "dagster._core.definitions.input",
+    "IJob": "dagster._core.definitions.job_base",
+    "LoggerDefinition": "dagster._core.definitions.logger_definition",
+    "build_init_logger_context": "dagster._core.definitions.logger_definition",
+    "logger": "dagster._core.definitions.logger_definition",
+    "BoolMetadataValue": "dagster._core.definitions.metadata",
+    "DagsterAssetMetadataValue": "dagster._core.definitions.metadata",
+    "DagsterJobMetadataValue": "dagster._core.definitions.metadata",
+    "DagsterRunMetadataValue": "dagster._core.definitions.metadata",
+    "FloatMetadataValue": "dagster._core.definitions.metadata",
+    "IntMetadataValue": "dagster._core.definitions.metadata",
+    "JsonMetadataValue": "dagster._core.definitions.metadata",
+    "MarkdownMetadataValue": "dagster._core.definitions.metadata",
+    "MetadataEntry": "dagster._core.definitions.metadata",
+    "MetadataValue": "dagster._core.definitions.metadata",
+    "PathMetadataValue": "dagster._core.definitions.metadata",
+    "PythonArtifactMetadataValue": "dagster._core.definitions.metadata",
+    "TableColumn": "dagster._core.definitions.metadata",
+    "TableColumnConstraints": "dagster._core.definitions.metadata",
+    "TableColumnLineageMetadataValue": "dagster._core.definitions.metadata",
+    "TableConstraints": "dagster._core.definitions.metadata",
+    "TableMetadataValue": "dagster._core.definitions.metadata",
+    "TableRecord": "dagster._core.definitions.metadata",
+    "TableSchema": "dagster._core.definitions.metadata",
+    "TableSchemaMetadataValue": "dagster._core.definitions.metadata",
+    "TextMetadataValue": "dagster._core.definitions.metadata",
+    "UrlMetadataValue": "dagster._core.definitions.metadata",
+    "create_execution_structure": "dagster._core.definitions.node_container",
+    "NodeDefinition": "dagster._core.definitions.node_definition",
+    "DynamicOut": "dagster._core.definitions.output",
+    "DynamicOutputDefinition": "dagster._core.definitions.output",
+    "GraphOut": "dagster._core.definitions.output",
+    "Out": "dagster._core.definitions.output",
+    "OutputDefinition": "dagster._core.definitions.output",
+    "OutputMapping": "dagster._core.definitions.output",
+    "ReconstructableJob": "dagster._core.definitions.reconstruct",
+    "build_reconstructable_job": "dagster._core.definitions.reconstruct",
+    "reconstructable": "dagster._core.definitions.reconstruct",
+    "RepositoryData": "dagster._core.definitions.repository_definition",
+    "RepositoryDefinition": "dagster._core.definitions.repository_definition",
+    "ResolvedAssetDependencies": "dagster._core.definitions.resolved_asset_deps",
+    "ResourceDefinition": "dagster._core.definitions.resource_definition",
+    "make_values_resource": "dagster._core.definitions.resource_definition",
+    "resource": "dagster._core.definitions.resource_definition",
+    "RunConfigSchema": "dagster._core.definitions.run_config_schema",
+    "create_run_config_schema": "dagster._core.definitions.run_config_schema",
+    "InstigatorType": "dagster._core.definitions.run_request",
+    "RunRequest": "dagster._core.definitions.run_request",
+    "SensorResult": "dagster._core.definitions.run_request",
+    "SkipReason": "dagster._core.definitions.run_request",
+    "DefaultScheduleStatus": "dagster._core.definitions.schedule_definition",
+    "ScheduleDefinition": "dagster._core.definitions.schedule_definition",
+    "ScheduleEvaluationContext": "dagster._core.definitions.schedule_definition",
+    "DefaultSensorStatus": "dagster._core.definitions.sensor_definition",
+    "SensorDefinition": "dagster._core.definitions.sensor_definition",
+    "SensorEvaluationContext": "dagster._core.definitions.sensor_definition",
+    "AssetIn": "dagster._core.definitions.asset_in",
+    "AssetOut": "dagster._core.definitions.asset_out",
+    "AssetSelection": "dagster._core.definitions.asset_selection",
+    "AssetsDefinition": "dagster._core.definitions.assets",
+    "asset": "dagster._core.definitions.decorators",
+    "asset_sensor": "dagster._core.definitions.decorators",
+    "config_mapping": "dagster._core.definitions.decorators",
+    "failure_hook": "dagster._core.definitions.decorators",
+    "graph": "dagster._core.definitions.decorators",
+    "hook_decorator": "dagster._core.definitions.decorators",
+    "job": "dagster._core.definitions.decorators",
+    "multi_asset": "dagster._core.definitions.decorators",
+    "op": "dagster._core.definitions.decorators",
+    "repository": "dagster._core.definitions.decorators",
+    "schedule": "dagster._core.definitions.decorators",
+    "sensor": "dagster._core.definitions.decorators",
+    "success_hook": "dagster._core.definitions.decorators",
+    "GraphDefinition": "dagster._core.definitions.graph_definition",
+    "JobDefinition": "dagster._core.definitions.job_definition",
+    "materialize_to_memory": "dagster._core.definitions.materialize",
+    "load_assets_from_current_module": "dagster._core.definitions.module_loaders.load_assets_from_modules",
+    "load_assets_from_modules": "dagster._core.definitions.module_loaders.load_assets_from_modules",
+    "load_assets_from_package_module": "dagster._core.definitions.module_loaders.load_assets_from_modules",
+    "load_assets_from_package_name": "dagster._core.definitions.module_loaders.load_assets_from_modules",
+    "OpDefinition": "dagster._core.definitions.op_definition",
+    "DynamicPartitionsDefinition": "dagster._core.definitions.partition",
+    "Partition": "dagster._core.definitions.partition",
+    "PartitionedConfig": "dagster._core.definitions.partition",
+    "PartitionsDefinition": "dagster._core.definitions.partition",
+    "StaticPartitionsDefinition": "dagster._core.definitions.partition",
+    "dynamic_partitioned_config": "dagster._core.definitions.partition",
+    "static_partitioned_config": "dagster._core.definitions.partition",
+    "PartitionKeyRange": "dagster._core.definitions.partition_key_range",
+    "AllPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "DimensionPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "IdentityPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "LastPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "MultiPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "MultiToSingleDimensionPartitionMapping": "dagster._core.definitions.partition_mapping",
+    "PartitionMapping": "dagster._core.definitions.partition_mapping",
+    "build_schedule_from_partitioned_job": "dagster._core.definitions.partitioned_schedule",
+    "RunFailureSensorContext": "dagster._core.definitions.run_status_sensor_definition",
+    "RunStatusSensorContext": "dagster._core.definitions.run_status_sensor_definition",
+    "RunStatusSensorDefinition": "dagster._core.definitions.run_status_sensor_definition",
+    "run_failure_sensor": "dagster._core.definitions.run_status_sensor_definition",
+    "run_status_sensor": "dagster._core.definitions.run_status_sensor_definition",
+    "SourceAsset": "dagster._core.definitions.source_asset",
+    "TimeWindowPartitionMapping": "dagster._core.definitions.time_window_partition_mapping",
+    "DailyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "HourlyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "MonthlyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "TimeWindow": "dagster._core.definitions.time_window_partitions",
+    "TimeWindowPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "WeeklyPartitionsDefinition": "dagster._core.definitions.time_window_partitions",
+    "daily_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "hourly_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "monthly_partitioned_config": "dagster._core.definitions.time_window_partitions",
+    "weekly_partitioned_config": "dagster._core.definitions.time_window_partitions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> Sequence[str]:
+    return sorted({*globals(), *_EXPORTS.keys()})
@@ -148,6 +148,48 @@ def __hash__(self) -> int:
         return hash(id(self))
 
 
+@whitelist_for_serdes
+class AutomationConditionCursorRef(NamedTuple):
+    """Points to an AutomationConditionCursor which is stored in its own row of the daemon cursor
+    storage, rather than inline in the AssetDaemonCursor.
+
+    Attributes:
+        key (EntityKey): The entity that the cursor belongs to.
+        slot (int): Each entity has two storage rows, which are written alternately so that the
+            row referenced by the last committed cursor is never overwritten by a tick which has
+            not yet been committed.
+        cursor_hash (str): A hash of the serialized cursor, used to avoid rewriting unchanged
+            cursors.
+    """
+
+    key: EntityKey
+    slot: int
+    cursor_hash: str
+
+
+@whitelist_for_serdes
+class AssetDaemonCursorManifest(NamedTuple):
+    """An AssetDaemonCursor whose per-entity condition cursors are stored separately, so that only
+    the cursors which change on a given tick need to be written, and only the cursors which are
+    needed on a given tick need to be read.
+
+    Attributes:
+        cursor (AssetDaemonCursor): The cursor, without any previous condition cursors.
+        storage_key_prefix (str): The prefix of the daemon cursor storage keys under which the
+            condition cursors are stored.
+        condition_cursor_refs (Sequence[AutomationConditionCursorRef]): References to the stored
+            condition cursor of each entity.
+    """
+
+    cursor: AssetDaemonCursor
+    storage_key_prefix: str
+    condition_cursor_refs: Sequence[AutomationConditionCursorRef]
+
+    @property
+    def condition_cursor_refs_by_key(self) -> Mapping[EntityKey, AutomationConditionCursorRef]:
+        return {ref.key: ref for ref in self.condition_cursor_refs}
+
+
 # BACKCOMPAT
 
 
@@ -37,6 +37,9 @@ def _evaluate(sensor_def: "AutomationConditionSensorDefinition", context: Sensor
     cursor = asset_daemon_cursor_from_instigator_serialized_cursor(
         context.cursor,
         asset_graph,
+        # condition cursors may have been stored separately if this sensor was previously
+        # evaluated by the asset daemon
+        instance=context.instance,
     )
 
     evaluation_context = AutomationTickEvaluationContext(
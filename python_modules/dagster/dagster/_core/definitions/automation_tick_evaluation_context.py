@@ -70,6 +70,8 @@ def __init__(
             cursor=cursor,
             evaluation_time=evaluation_time,
             logger=logger,
+            incremental=instance.auto_materialize_incremental_evaluation,
+            num_evaluation_workers=instance.auto_materialize_num_evaluation_workers,
         )
         self._materialize_run_tags = materialize_run_tags
         self._observe_run_tags = observe_run_tags
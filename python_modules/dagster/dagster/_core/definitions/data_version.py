@@ -355,6 +355,10 @@ def dedupe_key(self) -> int:
 # self-dependent assets.
 SKIP_PARTITION_DATA_VERSION_SELF_DEPENDENCY_THRESHOLD = 100
 
+# Maximum number of partition keys or storage ids in a single query when fetching the latest data
+# version records for many partitions of an asset at once.
+DATA_VERSION_RECORD_BATCH_SIZE = 1000
+
 
 class CachingStaleStatusResolver:
     """Used to resolve data version information. Avoids redundant database
@@ -379,6 +383,10 @@ def __init__(
         self._instance = instance
         self._instance_queryer = instance_queryer
         self._loading_context = loading_context
+        # latest data version records for asset partitions, fetched in bulk for partition subsets
+        self._prefetched_data_version_records: dict[
+            AssetKeyPartitionKey, Optional[EventLogRecord]
+        ] = {}
         if isinstance(asset_graph, BaseAssetGraph):
             self._asset_graph = asset_graph
             self._asset_graph_load_fn = None
@@ -412,6 +420,112 @@ def get_current_data_version(
 
         return self._get_current_data_version(key=AssetKeyPartitionKey(key, partition_key))
 
+    def get_status_by_partition(
+        self, key: "AssetKey", partition_keys: Sequence[str]
+    ) -> Sequence[StaleStatus]:
+        """Returns the stale status of each of the given partitions of an asset. The latest data
+        version records of the partitions and of their upstream partitions are fetched in bulk.
+        """
+        self._prefetch_stale_status_records(key, partition_keys)
+        return [self.get_status(key, partition_key) for partition_key in partition_keys]
+
+    def get_stale_root_causes_by_partition(
+        self, key: "AssetKey", partition_keys: Sequence[str]
+    ) -> Sequence[Sequence[StaleCause]]:
+        self._prefetch_stale_status_records(key, partition_keys)
+        return [self.get_stale_root_causes(key, partition_key) for partition_key in partition_keys]
+
+    def get_current_data_version_by_partition(
+        self, key: "AssetKey", partition_keys: Sequence[str]
+    ) -> Sequence[DataVersion]:
+        self._prefetch_data_version_records(key, partition_keys)
+        return [
+            self.get_current_data_version(key, partition_key) for partition_key in partition_keys
+        ]
+
+    def _prefetch_stale_status_records(
+        self, key: "AssetKey", partition_keys: Sequence[str]
+    ) -> None:
+        from dagster._core.definitions.events import AssetKeyPartitionKey
+
+        self._prefetch_data_version_records(key, partition_keys)
+        if self.asset_graph.get(key).is_external:
+            return
+
+        dep_partition_keys_by_asset_key: dict[AssetKey, set[str]] = {}
+        for partition_key in partition_keys:
+            asset_partition = AssetKeyPartitionKey(key, partition_key)
+            if self._get_current_data_version(key=asset_partition) == NULL_DATA_VERSION:
+                continue
+            for dep_key in self._get_partition_dependencies(key=asset_partition):
+                if dep_key.partition_key is not None:
+                    dep_partition_keys_by_asset_key.setdefault(dep_key.asset_key, set()).add(
+                        dep_key.partition_key
+                    )
+
+        for dep_asset_key, dep_partition_keys in dep_partition_keys_by_asset_key.items():
+            self._prefetch_data_version_records(dep_asset_key, sorted(dep_partition_keys))
+
+    def _prefetch_data_version_records(
+        self, key: "AssetKey", partition_keys: Sequence[str]
+    ) -> None:
+        """Fetches the latest materialization (or observation, for observable assets) record of
+        each of the given partitions with one query per event type for the latest storage ids, and
+        one query per batch of storage ids for the records themselves.
+        """
+        from dagster._core.definitions.events import AssetKeyPartitionKey
+        from dagster._core.event_api import AssetRecordsFilter
+        from dagster._core.events import DagsterEventType
+
+        partition_keys_to_fetch = {
+            partition_key
+            for partition_key in partition_keys
+            if AssetKeyPartitionKey(key, partition_key) not in self._prefetched_data_version_records
+        }
+        if not partition_keys_to_fetch:
+            return
+
+        event_types = [DagsterEventType.ASSET_MATERIALIZATION]
+        if self.asset_graph.get(key).is_observable:
+            event_types.append(DagsterEventType.ASSET_OBSERVATION)
+
+        latest_records: dict[str, EventLogRecord] = {}
+        for event_type in event_types:
+            storage_ids_by_partition = self._instance.get_latest_storage_id_by_partition(
+                key,
+                event_type,
+                partitions=(
+                    partition_keys_to_fetch
+                    if len(partition_keys_to_fetch) <= DATA_VERSION_RECORD_BATCH_SIZE
+                    else None
+                ),
+            )
+            storage_ids = sorted(
+                storage_id
+                for partition_key, storage_id in storage_ids_by_partition.items()
+                if partition_key in partition_keys_to_fetch
+            )
+            fetch_records = (
+                self._instance.fetch_materializations
+                if event_type == DagsterEventType.ASSET_MATERIALIZATION
+                else self._instance.fetch_observations
+            )
+            for i in range(0, len(storage_ids), DATA_VERSION_RECORD_BATCH_SIZE):
+                batch = storage_ids[i : i + DATA_VERSION_RECORD_BATCH_SIZE]
+                for record in fetch_records(
+                    AssetRecordsFilter(asset_key=key, storage_ids=batch), limit=len(batch)
+                ).records:
+                    partition_key = check.not_none(record.partition_key)
+                    # on ties, materializations take precedence over observations
+                    current = latest_records.get(partition_key)
+                    if current is None or record.timestamp > current.timestamp:
+                        latest_records[partition_key] = record
+
+        for partition_key in partition_keys_to_fetch:
+            self._prefetched_data_version_records[AssetKeyPartitionKey(key, partition_key)] = (
+                latest_records.get(partition_key)
+            )
+
     @cached_method
     def _get_status(self, key: "AssetKeyPartitionKey") -> StaleStatus:
         # The status loader does not support querying for the stale status of a
@@ -455,12 +569,25 @@ def _is_dep_updated(self, provenance: DataProvenance, dep_key: "AssetKeyPartitio
             return provenance.input_data_versions[dep_key.asset_key] != current_data_version
         else:
             cursor = provenance.input_storage_ids[dep_key.asset_key]
-            updated_record = self._instance.get_latest_data_version_record(
-                dep_key.asset_key,
-                dep_asset.is_external,
-                dep_key.partition_key,
-                after_cursor=cursor,
-            )
+            if (
+                dep_key in self._prefetched_data_version_records
+                and not dep_asset.is_external
+                and not dep_asset.is_observable
+            ):
+                # the prefetched record is the latest materialization of the dep partition
+                latest_record = self._prefetched_data_version_records[dep_key]
+                updated_record = (
+                    latest_record
+                    if latest_record and (cursor is None or latest_record.storage_id > cursor)
+                    else None
+                )
+            else:
+                updated_record = self._instance.get_latest_data_version_record(
+                    dep_key.asset_key,
+                    dep_asset.is_external,
+                    dep_key.partition_key,
+                    after_cursor=cursor,
+                )
             if updated_record:
                 previous_record = self._instance.get_latest_data_version_record(
                     dep_key.asset_key,
@@ -666,6 +793,8 @@ def _get_latest_data_version_event(
     def _get_latest_data_version_record(
         self, key: "AssetKeyPartitionKey"
     ) -> Optional["EventLogRecord"]:
+        if key in self._prefetched_data_version_records:
+            return self._prefetched_data_version_records[key]
         return self.instance_queryer.get_latest_materialization_or_observation_record(
             asset_partition=key
         )
@@ -28,8 +28,10 @@
 from dagster._core.definitions.partition import AllPartitionsSubset
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
 from dagster._record import copy, record
-from dagster._serdes.serdes import is_whitelisted_for_serdes_object
+from dagster._serdes.errors import SerializationError
+from dagster._serdes.serdes import is_whitelisted_for_serdes_object, serialize_value
 from dagster._time import get_current_timestamp
+from dagster._utils.cached_method import cached_method
 from dagster._utils.security import non_secure_md5_hash_str
 from dagster._utils.warnings import disable_dagster_warnings
 
@@ -84,10 +86,25 @@ def my_asset(): ...
     def requires_cursor(self) -> bool:
         return True
 
+    @property
+    def is_stateless(self) -> bool:
+        """Whether the result of evaluating this condition depends only on the entity and candidate
+        subset that it is evaluated over. Results of stateless conditions may be reused wherever an
+        identical condition is evaluated over the same subset within a single tick.
+        """
+        return not self.requires_cursor and all(child.is_stateless for child in self.children)
+
     @property
     def children(self) -> Sequence["AutomationCondition"]:
         return []
 
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        """Whether the result of this condition may differ between evaluations at the given times
+        solely due to the passage of time, i.e. if nothing else about the asset graph has changed.
+        Entities whose conditions return False may be skipped on incremental evaluations.
+        """
+        return True
+
     @property
     def description(self) -> str:
         """Human-readable description of when this condition is true."""
@@ -141,6 +158,18 @@ def get_unique_id(
         ]
         return non_secure_md5_hash_str("".join([node_unique_id, *child_unique_ids]).encode())
 
+    @cached_method
+    def get_structural_hash(self) -> Optional[str]:
+        """Returns a hash of the full structure of this condition, including its parameters and any
+        operands. Unlike the unique id, this does not depend on the position of the condition within
+        a broader condition tree. Returns None if the condition cannot be serialized.
+        """
+        try:
+            serialized = serialize_value(self)
+        except SerializationError:
+            return None
+        return non_secure_md5_hash_str(serialized.encode("utf-8"))
+
     def __hash__(self) -> int:
         return hash(self.get_unique_id())
 
@@ -668,6 +697,9 @@ class BuiltinAutomationCondition(AutomationCondition[T_EntityKey]):
     def get_label(self) -> Optional[str]:
         return self.label
 
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return any(child.may_change_over_time(start, end) for child in self.children)
+
     @public
     def with_label(self, label: Optional[str]) -> Self:
         """Returns a copy of this AutomationCondition with a human-readable label."""
@@ -720,6 +752,10 @@ def __init__(
         # used to enable the evaluator class to modify the evaluation in some edge cases
         self._serializable_subset_override: Optional[SerializableEntitySubset] = None
 
+        # set by the evaluator when evaluating incrementally
+        self._definition_hash: Optional[str] = None
+        self._is_stable = False
+
     @property
     def key(self) -> T_EntityKey:
         return self._true_subset.key
@@ -740,6 +776,10 @@ def end_timestamp(self) -> float:
     def child_results(self) -> Sequence["AutomationResult"]:
         return self._child_results
 
+    @property
+    def candidate_subset(self) -> EntitySubset[T_EntityKey]:
+        return self._context.candidate_subset
+
     @property
     def condition(self) -> AutomationCondition:
         return self._context.condition
@@ -795,12 +835,44 @@ def serializable_evaluation(self) -> AutomationConditionEvaluation:
             ],
         )
 
+    def with_context(self, context: "AutomationContext") -> "AutomationResult[T_EntityKey]":
+        """Returns a copy of this result for an equivalent condition evaluated over the same
+        candidate subset in a different position of the condition tree. Child results are rebound to
+        child contexts of the new context, in the order in which they were evaluated.
+        """
+        child_results = [
+            child_result.with_context(
+                context.for_child_condition(
+                    child_condition=child_result.condition,
+                    child_index=i,
+                    candidate_subset=child_result.candidate_subset,
+                )
+            )
+            for i, child_result in enumerate(self._child_results)
+        ]
+        return AutomationResult(
+            context,
+            self._true_subset,
+            child_results=child_results,
+            subsets_with_metadata=self._subsets_with_metadata,
+            structured_cursor=self._extra_state,
+        )
+
     def set_internal_serializable_subset_override(self, override: SerializableEntitySubset) -> None:
         """Internal method for handling edge cases in which the serializable evaluation must be
         updated after evaluation completes.
         """
         self._serializable_subset_override = override
 
+    def set_internal_incremental_state(
+        self, definition_hash: Optional[str], is_stable: bool
+    ) -> None:
+        """Internal method for recording the state used to determine if this entity can be skipped
+        on subsequent incremental evaluations.
+        """
+        self._definition_hash = definition_hash
+        self._is_stable = is_stable
+
     def get_child_node_cursors(self) -> Mapping[str, AutomationConditionNodeCursor]:
         node_cursors = {self.condition_unique_id: self.node_cursor} if self.node_cursor else {}
         for child_result in self._child_results:
@@ -814,6 +886,8 @@ def get_new_cursor(self) -> AutomationConditionCursor:
             last_event_id=self._context.max_storage_id,
             node_cursors_by_unique_id=self.get_child_node_cursors(),
             result_value_hash=self.value_hash,
+            definition_hash=self._definition_hash,
+            is_stable=self._is_stable,
         )
 
     def get_serializable_subset(self) -> SerializableEntitySubset:
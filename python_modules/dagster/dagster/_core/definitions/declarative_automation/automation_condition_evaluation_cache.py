@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+
+from dagster._core.definitions.asset_key import EntityKey
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationResult,
+    _compute_subset_value_str,
+)
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_context import (
+        AutomationContext,
+    )
+
+EvaluationCacheKey = tuple[str, EntityKey, str]
+
+
+@dataclass
+class AutomationConditionEvaluationStats:
+    """Statistics about the evaluations of a single stateless condition within a tick."""
+
+    condition_name: str
+    num_hits: int = 0
+    num_misses: int = 0
+    evaluation_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        num_lookups = self.num_hits + self.num_misses
+        return self.num_hits / num_lookups if num_lookups else 0.0
+
+
+class AutomationConditionEvaluationCache:
+    """Memoizes the results of stateless conditions within a single tick. Results are keyed by the
+    structural hash of the condition, the evaluated entity, and the candidate subset, so identical
+    sub-conditions which are evaluated over the same entity from different condition trees (e.g. the
+    operands of `AnyDepsCondition` for siblings which share a parent) are only computed once.
+
+    The cache may be shared between entities which are evaluated concurrently on separate threads,
+    each with their own event loop, so in-flight results are tracked as thread-safe futures.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: dict[EvaluationCacheKey, Future[AutomationResult]] = {}
+        self._stats_by_structural_hash: dict[str, AutomationConditionEvaluationStats] = {}
+
+    @property
+    def stats_by_structural_hash(self) -> Mapping[str, AutomationConditionEvaluationStats]:
+        return self._stats_by_structural_hash
+
+    def get_cache_key(self, context: "AutomationContext") -> Optional[EvaluationCacheKey]:
+        # legacy evaluations track storage ids per root entity, so they are never reused
+        if context._legacy_context is not None or not context.condition.is_stateless:  # noqa: SLF001
+            return None
+        structural_hash = context.condition.get_structural_hash()
+        if structural_hash is None:
+            return None
+        return (
+            structural_hash,
+            context.key,
+            _compute_subset_value_str(context.candidate_subset.convert_to_serializable_subset()),
+        )
+
+    async def evaluate(
+        self,
+        cache_key: EvaluationCacheKey,
+        context: "AutomationContext",
+        evaluate_fn: Callable[[], Awaitable[AutomationResult]],
+    ) -> AutomationResult:
+        structural_hash = cache_key[0]
+        with self._lock:
+            stats = self._stats_by_structural_hash.get(structural_hash)
+            if stats is None:
+                stats = AutomationConditionEvaluationStats(
+                    condition_name=context.condition.get_label() or context.condition.name
+                )
+                self._stats_by_structural_hash[structural_hash] = stats
+
+            existing_future = self._futures.get(cache_key)
+            if existing_future is not None:
+                stats.num_hits += 1
+            else:
+                stats.num_misses += 1
+                future = self._futures[cache_key] = Future()
+
+        if existing_future is not None:
+            # the result may still be in flight for a concurrently-evaluated entity
+            result = await asyncio.wrap_future(existing_future)
+            return result.with_context(context)
+
+        start = time.perf_counter()
+        try:
+            result = await evaluate_fn()
+        except BaseException as e:
+            # ensure that concurrent evaluations waiting on this result do not hang
+            future.set_exception(e)
+            raise
+        finally:
+            evaluation_seconds = time.perf_counter() - start
+            with self._lock:
+                stats.evaluation_seconds += evaluation_seconds
+        future.set_result(result)
+        return result
@@ -1,10 +1,14 @@
 import asyncio
 import datetime
 import logging
+import threading
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
+from collections.abc import Coroutine, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Optional, TypeVar  # noqa: UP035
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
@@ -15,7 +19,13 @@
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_evaluation_cache import (
+    AutomationConditionEvaluationCache,
+)
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.dirty_entity_resolver import (
+    DirtyEntityResolver,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.instance import DagsterInstance
 from dagster._time import get_current_datetime
@@ -23,6 +33,8 @@
 if TYPE_CHECKING:
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
+T = TypeVar("T")
+
 
 class AutomationConditionEvaluator:
     def __init__(
@@ -36,6 +48,8 @@ def __init__(
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        incremental: bool = False,
+        num_evaluation_workers: int = 1,
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
@@ -67,6 +81,19 @@ def __init__(
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
 
         self.request_subsets_by_key: dict[EntityKey, EntitySubset] = {}
+        self.evaluation_cache = AutomationConditionEvaluationCache()
+
+        # when evaluating incrementally, entities whose inputs have not changed since a stable
+        # previous evaluation are skipped, keeping their previous cursors
+        self.dirty_entity_resolver = DirtyEntityResolver(self) if incremental else None
+        self.clean_entity_keys: set[EntityKey] = set()
+
+        # when using multiple workers, the entities within each topological level are evaluated
+        # concurrently on separate threads, and their results are committed in a fixed order once
+        # the level is complete
+        self.num_evaluation_workers = check.int_param(
+            num_evaluation_workers, "num_evaluation_workers"
+        )
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -104,57 +131,182 @@ def prefetch(self) -> None:
         self.logger.info("Done prefetching asset records.")
 
     def evaluate(self) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        if self.num_evaluation_workers > 1:
+            return self.evaluate_with_workers()
         return asyncio.run(self.async_evaluate())
 
     async def async_evaluate(
         self,
     ) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         self.prefetch()
-        num_conditions = len(self.entity_keys)
         num_evaluated = 0
 
         async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
-            self.logger.debug(
-                f"Evaluating {entity_key.to_user_string()} ({num_evaluated+offset}/{num_conditions})"
-            )
-
-            try:
-                await self.evaluate_entity(entity_key)
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for {entity_key.to_user_string()}"
-                ) from e
-
-            result = self.current_results_by_key[entity_key]
-            num_requested = result.true_subset.size
-            if result.true_subset.is_partitioned:
-                requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
-            else:
-                requested_str = "(no partition)"
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-            log_fn(
-                f"{entity_key.to_user_string()} evaluation result: {num_requested} "
-                f"requested ({requested_str}) "
-                f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
-            )
+            self._log_evaluation_start(entity_key, num_evaluated + offset)
+            computed = await self._compute_entity_result(entity_key)
+            if computed is not None:
+                self._commit_entity_result(*computed)
 
-        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
+        for topo_level in self._get_topo_levels():
             coroutines = [
                 _evaluate_entity_async(entity_key, offset)
                 for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
             ]
             await asyncio.gather(*coroutines)
             num_evaluated += len(coroutines)
 
+        return self._get_evaluation_results()
+
+    def evaluate_with_workers(
+        self,
+    ) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        """Evaluates the entities within each topological level concurrently on a pool of worker
+        threads. Condition evaluation spends much of its time waiting on storage queries, which
+        release the GIL, so this allows the queries for separate entities to overlap.
+
+        Each level is split into one partition per worker, and the entities within a partition
+        are evaluated concurrently on that worker's event loop so that their storage queries can
+        still be batched together. Workers only compute results. Results are committed on the
+        calling thread in topological order once all entities in a level have been evaluated, so
+        the results and cursors do not depend on the number of workers.
+        """
+        self.prefetch()
+        num_evaluated = 0
+
+        async def _evaluate_partition_async(
+            partition: Sequence[tuple[int, EntityKey]],
+        ) -> Sequence[Optional[tuple[AutomationResult, bool]]]:
+            async def _evaluate_entity_async(entity_key: EntityKey, position: int):
+                self._log_evaluation_start(entity_key, position)
+                return await self._compute_entity_result(entity_key)
+
+            return await asyncio.gather(
+                *(
+                    _evaluate_entity_async(entity_key, num_evaluated + offset)
+                    for offset, entity_key in partition
+                )
+            )
+
+        with self._worker_pool() as submit:
+            for topo_level in self._get_topo_levels():
+                partitions = [
+                    list(enumerate(topo_level))[i :: self.num_evaluation_workers]
+                    for i in range(min(self.num_evaluation_workers, len(topo_level)))
+                ]
+                futures = [submit(_evaluate_partition_async(partition)) for partition in partitions]
+                computed_by_key = {
+                    entity_key: computed
+                    for partition, future in zip(partitions, futures)
+                    for (_, entity_key), computed in zip(partition, future.result())
+                }
+                for entity_key in topo_level:
+                    computed = computed_by_key[entity_key]
+                    if computed is not None:
+                        self._commit_entity_result(*computed)
+                num_evaluated += len(topo_level)
+
+        return self._get_evaluation_results()
+
+    @contextmanager
+    def _worker_pool(self) -> Iterator[Callable[[Coroutine[Any, Any, T]], Future[T]]]:
+        """Yields a function which runs a coroutine to completion on a pool of worker threads."""
+        # each worker thread reuses a single event loop for its whole lifetime, as the data loaders
+        # of the asset graph view are bound to the loop in which they are first used
+        thread_local = threading.local()
+        loops: list[asyncio.AbstractEventLoop] = []
+        loops_lock = threading.Lock()
+
+        def _run_in_worker(coroutine: Coroutine[Any, Any, T]) -> T:
+            loop = getattr(thread_local, "loop", None)
+            if loop is None:
+                loop = thread_local.loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                with loops_lock:
+                    loops.append(loop)
+            return loop.run_until_complete(coroutine)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.num_evaluation_workers,
+                thread_name_prefix="automation_condition_evaluation_worker",
+            ) as executor:
+                yield lambda coroutine: executor.submit(_run_in_worker, coroutine)
+        finally:
+            for loop in loops:
+                loop.close()
+
+    def _get_topo_levels(self) -> Sequence[Sequence[EntityKey]]:
+        return [
+            [entity_key for entity_key in topo_level if entity_key in self.entity_keys]
+            for topo_level in self.asset_graph.toposorted_entity_keys_by_level
+        ]
+
+    def _log_evaluation_start(self, entity_key: EntityKey, position: int) -> None:
+        self.logger.debug(
+            f"Evaluating {entity_key.to_user_string()} ({position}/{len(self.entity_keys)})"
+        )
+
+    def _get_evaluation_results(
+        self,
+    ) -> tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        self._log_evaluation_cache_stats()
+        if self.dirty_entity_resolver is not None:
+            num_clean = len(self.clean_entity_keys)
+            self.logger.info(
+                f"Evaluated {len(self.entity_keys) - num_clean} dirty entities, skipped {num_clean} "
+                "clean entities."
+            )
         return list(self.current_results_by_key.values()), [
             v for v in self.request_subsets_by_key.values() if not v.is_empty
         ]
 
+    async def _compute_entity_result(
+        self, entity_key: EntityKey
+    ) -> Optional[tuple[AutomationResult, bool]]:
+        """Evaluates the condition of the given entity without recording its result. Returns None
+        if the entity is clean and was skipped, otherwise the result and whether the inputs of the
+        entity changed since its previous evaluation.
+        """
+        has_input_changes = True
+        if self.dirty_entity_resolver is not None:
+            has_input_changes = await self.dirty_entity_resolver.has_input_changes(entity_key)
+            if not has_input_changes and self.dirty_entity_resolver.is_stable(entity_key):
+                self.logger.debug(f"Skipping clean entity {entity_key.to_user_string()}")
+                self.clean_entity_keys.add(entity_key)
+                return None
+
+        try:
+            result = await AutomationContext.create(key=entity_key, evaluator=self).evaluate_async()
+        except Exception as e:
+            raise Exception(
+                f"Error while evaluating conditions for {entity_key.to_user_string()}"
+            ) from e
+        return result, has_input_changes
+
+    def _commit_entity_result(self, result: AutomationResult, has_input_changes: bool) -> None:
+        self._record_result(result)
+        if self.dirty_entity_resolver is not None:
+            self._set_incremental_state(result, has_input_changes)
+
+        num_requested = result.true_subset.size
+        if result.true_subset.is_partitioned:
+            requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
+        else:
+            requested_str = "(no partition)"
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
+        log_fn(
+            f"{result.key.to_user_string()} evaluation result: {num_requested} "
+            f"requested ({requested_str}) "
+            f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+        )
+
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
+        self._record_result(result)
 
+    def _record_result(self, result: AutomationResult) -> None:
+        key = result.key
         # update dictionaries to keep track of this result
         self.current_results_by_key[key] = result
         self._add_request_subset(result.true_subset)
@@ -164,6 +316,32 @@ async def evaluate_entity(self, key: EntityKey) -> None:
             # handle cases where an entity must be materialized with others
             self._handle_execution_set(result)
 
+    def _set_incremental_state(self, result: AutomationResult, has_input_changes: bool) -> None:
+        dirty_entity_resolver = check.not_none(self.dirty_entity_resolver)
+        previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
+        # if nothing changed since the previous evaluation and the result is identical, it will
+        # remain identical until the inputs change
+        is_stable = (
+            not has_input_changes
+            and previous_cursor is not None
+            and previous_cursor.result_value_hash == result.value_hash
+            and result.true_subset.is_empty
+        )
+        result.set_internal_incremental_state(
+            definition_hash=dirty_entity_resolver.get_definition_hash(key=result.key),
+            is_stable=is_stable,
+        )
+
+    def _log_evaluation_cache_stats(self) -> None:
+        for stats in self.evaluation_cache.stats_by_structural_hash.values():
+            if stats.num_hits == 0:
+                continue
+            self.logger.debug(
+                f"Reused {stats.num_hits}/{stats.num_hits + stats.num_misses} evaluations of "
+                f"{stats.condition_name} ({format(stats.evaluation_seconds, '.3f')} seconds "
+                "spent evaluating)"
+            )
+
     def _add_request_subset(self, subset: EntitySubset) -> None:
         """Adds the provided subset to the dictionary tracking what we will request on this tick."""
         if subset.key not in self.request_subsets_by_key:
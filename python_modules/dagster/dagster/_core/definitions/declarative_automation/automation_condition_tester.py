@@ -11,6 +11,9 @@
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.definitions.declarative_automation.automation_condition import AutomationResult
+from dagster._core.definitions.declarative_automation.automation_condition_evaluation_cache import (
+    AutomationConditionEvaluationStats,
+)
 from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
     AutomationConditionEvaluator,
 )
@@ -25,6 +28,7 @@ def __init__(
         cursor: AssetDaemonCursor,
         results: Iterable[AutomationResult],
         requested_subsets: Iterable[EntitySubset],
+        evaluation_stats: Optional[Mapping[str, AutomationConditionEvaluationStats]] = None,
     ):
         self._requested_subsets = requested_subsets
         self._requested_asset_partitions = set().union(
@@ -36,6 +40,8 @@ def __init__(
         )
         self.cursor = cursor
         self.results = list(results)
+        # hit rate and timing of reused stateless conditions, keyed by structural hash
+        self.evaluation_stats = evaluation_stats or {}
 
     @cached_property
     def _requested_partitions_by_asset_key(self) -> Mapping[AssetKey, AbstractSet[Optional[str]]]:
@@ -145,5 +151,8 @@ def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
     )
 
     return EvaluateAutomationConditionsResult(
-        cursor=cursor, requested_subsets=requested_subsets, results=results
+        cursor=cursor,
+        requested_subsets=requested_subsets,
+        results=results,
+        evaluation_stats=evaluator.evaluation_cache.stats_by_structural_hash,
     )
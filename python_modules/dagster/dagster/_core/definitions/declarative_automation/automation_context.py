@@ -13,6 +13,9 @@
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_evaluation_cache import (
+    AutomationConditionEvaluationCache,
+)
 from dagster._core.definitions.declarative_automation.legacy.legacy_context import (
     LegacyRuleEvaluationContext,
 )
@@ -60,6 +63,7 @@ class AutomationContext(Generic[T_EntityKey]):
 
     _cursor: Optional[AutomationConditionCursor]
     _legacy_context: Optional[LegacyRuleEvaluationContext]
+    _evaluation_cache: Optional[AutomationConditionEvaluationCache]
 
     _root_log: logging.Logger
 
@@ -83,6 +87,7 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             _legacy_context=LegacyRuleEvaluationContext.create(key, evaluator)
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
+            _evaluation_cache=evaluator.evaluation_cache,
             _root_log=evaluator.logger,
         )
 
@@ -109,10 +114,19 @@ def for_child_condition(
             )
             if self._legacy_context
             else None,
+            _evaluation_cache=self._evaluation_cache,
             _root_log=self._root_log,
         )
 
     async def evaluate_async(self) -> AutomationResult[T_EntityKey]:
+        cache_key = self._evaluation_cache.get_cache_key(self) if self._evaluation_cache else None
+        if self._evaluation_cache is None or cache_key is None:
+            return await self._evaluate_condition_async()
+        return await self._evaluation_cache.evaluate(
+            cache_key, self, self._evaluate_condition_async
+        )
+
+    async def _evaluate_condition_async(self) -> AutomationResult[T_EntityKey]:
         if inspect.iscoroutinefunction(self.condition.evaluate):
             return await self.condition.evaluate(self)
         return self.condition.evaluate(self)
@@ -0,0 +1,205 @@
+import datetime
+from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
+
+from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey, EntityKey
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+)
+from dagster._core.definitions.time_window_partitions import get_time_partitions_def
+from dagster._time import datetime_from_timestamp
+from dagster._utils.cached_method import cached_method
+from dagster._utils.security import non_secure_md5_hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+        AutomationConditionEvaluator,
+    )
+
+
+class DirtyEntityResolver:
+    """Determines which entities must be evaluated on an incremental tick.
+
+    An entity's inputs are the entity itself, its parents, and the asset checks of both. An entity
+    is clean, and may reuse its previous result and cursor, if its previous evaluation was stable
+    and none of its inputs have changed since then. Inputs are considered to have changed if:
+
+    - any of them have new materializations, observations, planned runs or check evaluations
+    - any of them have been wiped
+    - any of them have an in-progress run or backfill
+    - a time partition or cron boundary was crossed
+    - the definitions of the entity or its inputs changed
+    - any parent will be requested on this tick
+    """
+
+    def __init__(self, evaluator: "AutomationConditionEvaluator"):
+        self._evaluator = evaluator
+
+    @property
+    def _asset_graph(self):
+        return self._evaluator.asset_graph
+
+    @property
+    def _asset_graph_view(self):
+        return self._evaluator.asset_graph_view
+
+    @cached_method
+    def _get_input_keys(self, *, key: EntityKey) -> AbstractSet[EntityKey]:
+        node = self._asset_graph.get(key)
+        input_keys = {key, *node.parent_entity_keys}
+        for input_key in list(input_keys):
+            if isinstance(input_key, AssetKey) and self._asset_graph.has(input_key):
+                input_keys |= self._asset_graph.get(input_key).check_keys
+        return {input_key for input_key in input_keys if self._asset_graph.has(input_key)}
+
+    @cached_method
+    def _get_partitions_identifier(self, *, key: EntityKey) -> Optional[str]:
+        partitions_def = self._asset_graph.get(key).partitions_def
+        if partitions_def is None:
+            return None
+        # includes the current set of dynamic partitions, if any
+        return partitions_def.get_serializable_unique_identifier(
+            dynamic_partitions_store=self._evaluator.instance_queryer
+        )
+
+    @cached_method
+    def get_definition_hash(self, *, key: EntityKey) -> Optional[str]:
+        """Returns a hash of all definitions that the evaluation of the given entity depends on, or
+        None if the entity must always be evaluated.
+        """
+        node = self._asset_graph.get(key)
+        condition = node.automation_condition or self._evaluator.default_condition
+        if condition is None or condition.has_rule_condition:
+            return None
+        structural_hash = condition.get_structural_hash()
+        if structural_hash is None:
+            return None
+
+        parts = [structural_hash, str(node.code_version) if isinstance(key, AssetKey) else ""]
+        for input_key in sorted(self._get_input_keys(key=key), key=lambda k: k.to_user_string()):
+            parts.append(input_key.to_user_string())
+            parts.append(str(self._get_partitions_identifier(key=input_key)))
+            if input_key != key and input_key in node.parent_entity_keys:
+                parts.append(repr(self._asset_graph.get_partition_mapping(key, input_key)))
+        return non_secure_md5_hash_str("".join(parts).encode("utf-8"))
+
+    @cached_method
+    def _get_latest_storage_id(self, *, key: AssetKey) -> Optional[int]:
+        record = self._evaluator.instance_queryer.get_asset_record(key)
+        if record is None:
+            return None
+        entry = record.asset_entry
+        storage_ids = [
+            entry.last_materialization_record.storage_id
+            if entry.last_materialization_record
+            else None,
+            entry.last_observation_record.storage_id if entry.last_observation_record else None,
+            entry.last_planned_materialization_storage_id,
+        ]
+        return max(
+            (storage_id for storage_id in storage_ids if storage_id is not None), default=None
+        )
+
+    @cached_method
+    def _get_last_wipe_timestamp(self, *, key: AssetKey) -> Optional[float]:
+        record = self._evaluator.instance_queryer.get_asset_record(key)
+        asset_details = record.asset_entry.asset_details if record else None
+        return asset_details.last_wipe_timestamp if asset_details else None
+
+    @cached_method
+    async def _get_last_check_evaluation_timestamp(self, *, key: AssetCheckKey) -> Optional[float]:
+        from dagster._core.storage.event_log.base import AssetCheckSummaryRecord
+
+        summary = await AssetCheckSummaryRecord.gen(self._asset_graph_view, key)
+        execution_record = summary.last_check_execution_record if summary else None
+        if execution_record is None:
+            return None
+        return (
+            execution_record.event.timestamp
+            if execution_record.event
+            else execution_record.create_timestamp
+        )
+
+    @cached_method
+    async def _is_in_progress(self, *, key: EntityKey) -> bool:
+        if not (await self._asset_graph_view.compute_run_in_progress_subset(key=key)).is_empty:
+            return True
+        return not (
+            await self._asset_graph_view.compute_backfill_in_progress_subset(key=key)
+        ).is_empty
+
+    def _crossed_partition_boundary(
+        self, key: EntityKey, previous_dt: datetime.datetime, current_dt: datetime.datetime
+    ) -> bool:
+        time_partitions_def = get_time_partitions_def(self._asset_graph.get(key).partitions_def)
+        if time_partitions_def is None:
+            return False
+        return time_partitions_def.get_last_partition_window(
+            current_time=previous_dt
+        ) != time_partitions_def.get_last_partition_window(current_time=current_dt)
+
+    async def _has_input_changed(
+        self, key: EntityKey, input_key: EntityKey, cursor: AutomationConditionCursor
+    ) -> bool:
+        previous_dt = datetime_from_timestamp(cursor.effective_timestamp)
+        if self._crossed_partition_boundary(
+            input_key, previous_dt, self._evaluator.evaluation_time
+        ):
+            return True
+        if await self._is_in_progress(key=input_key):
+            return True
+
+        requested_subset = self._evaluator.request_subsets_by_key.get(input_key)
+        if input_key != key and requested_subset is not None and not requested_subset.is_empty:
+            return True
+
+        if isinstance(input_key, AssetCheckKey):
+            evaluation_timestamp = await self._get_last_check_evaluation_timestamp(key=input_key)
+            return (
+                evaluation_timestamp is not None
+                and evaluation_timestamp > cursor.effective_timestamp
+            )
+
+        latest_storage_id = self._get_latest_storage_id(key=input_key)
+        if latest_storage_id is not None and (
+            cursor.last_event_id is None or latest_storage_id > cursor.last_event_id
+        ):
+            return True
+        wipe_timestamp = self._get_last_wipe_timestamp(key=input_key)
+        return wipe_timestamp is not None and wipe_timestamp > cursor.effective_timestamp
+
+    async def has_input_changes(self, key: EntityKey) -> bool:
+        """Returns True if any of the inputs of the given entity may have changed since its previous
+        evaluation.
+        """
+        cursor = self._evaluator.cursor.get_previous_condition_cursor(key)
+        definition_hash = self.get_definition_hash(key=key)
+        if cursor is None or definition_hash is None or cursor.definition_hash != definition_hash:
+            return True
+
+        # entities which must be executed together are tracked as a unit by the evaluator
+        if (
+            isinstance(key, AssetKey)
+            and len(self._asset_graph.get(key).execution_set_entity_keys) > 1
+        ):
+            return True
+
+        condition = (
+            self._asset_graph.get(key).automation_condition or self._evaluator.default_condition
+        )
+        previous_dt = datetime_from_timestamp(cursor.effective_timestamp)
+        if condition is None or condition.may_change_over_time(
+            previous_dt, self._evaluator.evaluation_time
+        ):
+            return True
+
+        for input_key in self._get_input_keys(key=key):
+            if await self._has_input_changed(key, input_key, cursor):
+                return True
+        return False
+
+    def is_stable(self, key: EntityKey) -> bool:
+        """Returns True if the previous evaluation of the given entity was stable, meaning that it
+        will produce an identical result as long as its inputs do not change.
+        """
+        cursor = self._evaluator.cursor.get_previous_condition_cursor(key)
+        return cursor is not None and cursor.is_stable and cursor.previous_requested_subset.is_empty
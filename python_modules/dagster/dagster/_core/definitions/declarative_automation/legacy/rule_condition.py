@@ -1,3 +1,4 @@
+import datetime
 from typing import TYPE_CHECKING, Optional
 
 from dagster._core.definitions.asset_key import AssetKey
@@ -33,6 +34,9 @@ def get_node_unique_id(self, *, parent_unique_id: Optional[str], index: Optional
     def description(self) -> str:
         return self.rule.description
 
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return True
+
     def evaluate(self, context: "AutomationContext[AssetKey]") -> AutomationResult[AssetKey]:
         context.log.debug(f"Evaluating rule: {self.rule.to_snapshot()}")
         # Allow for access to legacy context in legacy rule evaluation
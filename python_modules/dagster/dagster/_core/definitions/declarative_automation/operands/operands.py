@@ -102,6 +102,11 @@ async def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes
 @record
 class WillBeRequestedCondition(SubsetAutomationCondition):
+    @property
+    def is_stateless(self) -> bool:
+        # depends on the requests made for other entities earlier in the tick
+        return False
+
     @property
     def description(self) -> str:
         return "Will be requested this tick"
@@ -132,6 +137,11 @@ def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes
 @record
 class NewlyRequestedCondition(SubsetAutomationCondition):
+    @property
+    def is_stateless(self) -> bool:
+        # depends on the cursor of the root entity
+        return False
+
     @property
     def name(self) -> str:
         return "newly_requested"
@@ -143,6 +153,11 @@ def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes
 @record
 class LatestRunExecutedWithRootTargetCondition(SubsetAutomationCondition):
+    @property
+    def is_stateless(self) -> bool:
+        # depends on the root entity
+        return False
+
     @property
     def name(self) -> str:
         return "executed_with_root_target"
@@ -156,6 +171,11 @@ async def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes
 @record
 class NewlyUpdatedCondition(SubsetAutomationCondition):
+    @property
+    def is_stateless(self) -> bool:
+        # depends on the cursor of the root entity
+        return False
+
     @property
     def name(self) -> str:
         return "newly_updated"
@@ -175,6 +195,11 @@ class CronTickPassedCondition(SubsetAutomationCondition):
     cron_schedule: str
     cron_timezone: str
 
+    @property
+    def is_stateless(self) -> bool:
+        # depends on the cursor of the root entity
+        return False
+
     @property
     def name(self) -> str:
         return f"cron_tick_passed(cron_schedule={self.cron_schedule}, cron_timezone={self.cron_timezone})"
@@ -187,6 +212,9 @@ def _get_previous_cron_tick(self, effective_dt: datetime.datetime) -> datetime.d
         )
         return next(previous_ticks)
 
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return self._get_previous_cron_tick(end) > start
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset:
         previous_cron_tick = self._get_previous_cron_tick(context.evaluation_time)
         if (
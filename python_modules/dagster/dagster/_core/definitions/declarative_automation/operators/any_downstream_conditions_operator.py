@@ -1,3 +1,4 @@
+import datetime
 from collections.abc import Mapping, Sequence
 from typing import AbstractSet  # noqa: UP035
 
@@ -61,6 +62,14 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def is_stateless(self) -> bool:
+        # the expanded conditions depend on the evaluation hierarchy
+        return False
+
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return True
+
     def _get_ignored_conditions(
         self, context: AutomationContext[AssetKey]
     ) -> AbstractSet[AutomationCondition]:
@@ -244,6 +244,10 @@ def name(self) -> str:
     def children(self) -> Sequence[AutomationCondition[T_EntityKey]]:
         return [self.operand]
 
+    @property
+    def is_stateless(self) -> bool:
+        return self.operand.is_stateless
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
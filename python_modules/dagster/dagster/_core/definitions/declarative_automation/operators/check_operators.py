@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 from abc import abstractmethod
 from typing import AbstractSet  # noqa: UP035
 
@@ -38,6 +39,13 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def is_stateless(self) -> bool:
+        return self.operand.is_stateless
+
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return self.operand.may_change_over_time(start, end)
+
     def _get_check_keys(
         self, key: AssetKey, asset_graph: BaseAssetGraph[BaseAssetNode]
     ) -> AbstractSet[AssetCheckKey]:
@@ -1,3 +1,4 @@
+import datetime
 from abc import abstractmethod
 from typing import TYPE_CHECKING, AbstractSet, Any, Generic, Optional, Union  # noqa: UP035
 
@@ -31,6 +32,13 @@ class EntityMatchesCondition(
     def name(self) -> str:
         return self.key.to_user_string()
 
+    @property
+    def is_stateless(self) -> bool:
+        return self.operand.is_stateless
+
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return self.operand.may_change_over_time(start, end)
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
@@ -107,6 +115,13 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def is_stateless(self) -> bool:
+        return self.operand.is_stateless
+
+    def may_change_over_time(self, start: datetime.datetime, end: datetime.datetime) -> bool:
+        return self.operand.may_change_over_time(start, end)
+
     @public
     def allow(self, selection: "AssetSelection") -> "DepsAutomationCondition":
         """Returns a copy of this condition that will only consider dependencies within the provided
@@ -175,6 +175,11 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        definition_hash: A hash of the definitions which the evaluation depended on, recorded on
+            incremental evaluations.
+        is_stable: True if the evaluation was incremental, none of its inputs had changed since the
+            previous evaluation, and the result was identical to the previous result. Stable
+            entities may be skipped until their inputs change.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -184,6 +189,9 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
 
+    definition_hash: Optional[str] = None
+    is_stable: bool = False
+
     @staticmethod
     def backcompat_from_evaluation_state(
         evaluation_state: "AutomationConditionEvaluationState",
@@ -1,20 +1,57 @@
-from dagster._core.definitions.decorators.asset_decorator import (
-    asset as asset,
-    multi_asset as multi_asset,
-)
-from dagster._core.definitions.decorators.config_mapping_decorator import (
-    config_mapping as config_mapping,
-)
-from dagster._core.definitions.decorators.graph_decorator import graph as graph
-from dagster._core.definitions.decorators.hook_decorator import (
-    failure_hook as failure_hook,
-    success_hook as success_hook,
-)
-from dagster._core.definitions.decorators.job_decorator import job as job
-from dagster._core.definitions.decorators.op_decorator import op as op
-from dagster._core.definitions.decorators.repository_decorator import repository as repository
-from dagster._core.definitions.decorators.schedule_decorator import schedule as schedule
-from dagster._core.definitions.decorators.sensor_decorator import (
-    asset_sensor as asset_sensor,
-    sensor as sensor,
-)
+import importlib
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+# As in `dagster._core.definitions`, the decorators re-exported here are imported on first access,
+# so that importing one decorator module does not import all of them. Every symbol imported below
+# must also be added to `_EXPORTS`.
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.decorators.asset_decorator import (
+        asset as asset,
+        multi_asset as multi_asset,
+    )
+    from dagster._core.definitions.decorators.config_mapping_decorator import (
+        config_mapping as config_mapping,
+    )
+    from dagster._core.definitions.decorators.graph_decorator import graph as graph
+    from dagster._core.definitions.decorators.hook_decorator import (
+        failure_hook as failure_hook,
+        success_hook as success_hook,
+    )
+    from dagster._core.definitions.decorators.job_decorator import job as job
+    from dagster._core.definitions.decorators.op_decorator import op as op
+    from dagster._core.definitions.decorators.repository_decorator import repository as repository
+    from dagster._core.definitions.decorators.schedule_decorator import schedule as schedule
+    from dagster._core.definitions.decorators.sensor_decorator import (
+        asset_sensor as asset_sensor,
+        sensor as sensor,
+    )
+
+# Maps each re-exported symbol to the module in which it is defined.
+_EXPORTS: Final[Mapping[str, str]] = {
+    "asset": "dagster._core.definitions.decorators.asset_decorator",
+    "multi_asset": "dagster._core.definitions.decorators.asset_decorator",
+    "config_mapping": "dagster._core.definitions.decorators.config_mapping_decorator",
+    "graph": "dagster._core.definitions.decorators.graph_decorator",
+    "failure_hook": "dagster._core.definitions.decorators.hook_decorator",
+    "success_hook": "dagster._core.definitions.decorators.hook_decorator",
+    "job": "dagster._core.definitions.decorators.job_decorator",
+    "op": "dagster._core.definitions.decorators.op_decorator",
+    "repository": "dagster._core.definitions.decorators.repository_decorator",
+    "schedule": "dagster._core.definitions.decorators.schedule_decorator",
+    "asset_sensor": "dagster._core.definitions.decorators.sensor_decorator",
+    "sensor": "dagster._core.definitions.decorators.sensor_decorator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> Sequence[str]:
+    return sorted({*globals(), *_EXPORTS.keys()})
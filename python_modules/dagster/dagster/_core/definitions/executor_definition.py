@@ -338,6 +338,7 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        preload_definitions=bool(start_cfg.get("preload_definitions")),
     )
 
 
@@ -375,6 +376,17 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                                     " `dagster` module is preloaded."
                                 ),
                             ),
+                            "preload_definitions": Field(
+                                bool,
+                                default_value=False,
+                                description=(
+                                    "Load the definitions of the job in the forkserver before any"
+                                    " step is executed, so that each subprocess starts with them"
+                                    " already loaded instead of reconstructing them from user code."
+                                    " If loading the definitions in the forkserver fails,"
+                                    " subprocesses reconstruct them as usual."
+                                ),
+                            ),
                         },
                         description=(
                             "Configure the multiprocess executor to start subprocesses "
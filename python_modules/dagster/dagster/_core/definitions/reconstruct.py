@@ -52,6 +52,11 @@
     from dagster._core.definitions.source_asset import SourceAsset
 
 
+# Repository definitions that were loaded ahead of time in this process, e.g. in the forkserver
+# process of the multiprocess executor, keyed by the repository they were reconstructed from
+_preloaded_repository_defs: dict["ReconstructableRepository", "RepositoryDefinition"] = {}
+
+
 def get_ephemeral_repository_name(job_name: str) -> str:
     check.str_param(job_name, "job_name")
     return f"__repository__{job_name}"
@@ -108,8 +113,28 @@ def with_repository_load_data(
         return self._replace(repository_load_data=metadata)
 
     def get_definition(self) -> "RepositoryDefinition":
+        preloaded_repository_def = _preloaded_repository_defs.get(self)
+        if preloaded_repository_def is not None:
+            return preloaded_repository_def
         return reconstruct_repository_def_from_pointer(self.pointer, self.repository_load_data)
 
+    def is_preloaded(self) -> bool:
+        """Whether the definition of this repository was loaded ahead of time in this process,
+        or inherited from the process that this process was forked from.
+        """
+        return self in _preloaded_repository_defs
+
+    def preload_definition(self) -> "RepositoryDefinition":
+        """Loads the definition of this repository and keeps it for the lifetime of the process, so
+        that later calls to `get_definition` in this process, and in processes forked from it, do
+        not reconstruct it again.
+        """
+        repository_def = reconstruct_repository_def_from_pointer(
+            self.pointer, self.repository_load_data
+        )
+        _preloaded_repository_defs[self] = repository_def
+        return repository_def
+
     def get_reconstructable_job(self, name: str) -> "ReconstructableJob":
         return ReconstructableJob(self, name)
 
@@ -43,6 +43,7 @@
 from dagster._utils.cached_method import cached_method
 
 if TYPE_CHECKING:
+    from dagster._core.remote_representation.code_location import CodeLocation
     from dagster._core.remote_representation.external_data import AssetCheckNodeSnap, AssetNodeSnap
 
 
@@ -565,6 +566,57 @@ def build(cls, repo: RemoteRepository):
         )
 
 
+@record
+class CodeLocationAssetGraphFragment:
+    """The asset nodes and asset checks that a single code location contributes to a
+    RemoteWorkspaceAssetGraph. Fragments are cached on each CodeLocationEntry, so that reloading a
+    code location only requires building the fragment for that location.
+    """
+
+    asset_infos_by_key: Mapping[AssetKey, Sequence[RepositoryScopedAssetInfo]]
+    asset_check_nodes_by_key: Mapping[AssetCheckKey, RemoteAssetCheckNode]
+
+    @classmethod
+    def build(cls, code_location: Optional["CodeLocation"]) -> "CodeLocationAssetGraphFragment":
+        repos = code_location.get_repositories().values() if code_location else []
+
+        asset_infos_by_key: dict[AssetKey, list[RepositoryScopedAssetInfo]] = defaultdict(list)
+        asset_checks_by_key: dict[AssetCheckKey, RemoteAssetCheckNode] = {}
+        for repo in repos:
+            for key, asset_node in repo.asset_graph.remote_asset_nodes_by_key.items():
+                asset_infos_by_key[key].append(
+                    RepositoryScopedAssetInfo(
+                        asset_node=asset_node,
+                        targeting_sensor_names=sorted(
+                            s.name for s in repo.get_sensors_targeting(asset_node.key)
+                        ),
+                        targeting_schedule_names=sorted(
+                            s.name for s in repo.get_schedules_targeting(asset_node.key)
+                        ),
+                    )
+                )
+            # NOTE: matches previous behavior of completely ignoring asset check collisions
+            asset_checks_by_key.update(repo.asset_graph.remote_asset_check_nodes_by_key)
+
+        return cls(
+            asset_infos_by_key=dict(asset_infos_by_key),
+            asset_check_nodes_by_key=asset_checks_by_key,
+        )
+
+
+# Cached properties of the graph that are derived only from the dependencies between assets, or
+# between assets and checks, and so can be reused by a graph with the same dependencies.
+_ASSET_DEP_CACHED_PROPERTIES = (
+    "asset_dep_graph",
+    "toposorted_asset_keys",
+    "toposorted_asset_keys_by_level",
+)
+_ENTITY_DEP_CACHED_PROPERTIES = (
+    "entity_dep_graph",
+    "toposorted_entity_keys_by_level",
+)
+
+
 class RemoteWorkspaceAssetGraph(RemoteAssetGraph[RemoteWorkspaceAssetNode]):
     def __init__(
         self,
@@ -625,36 +677,18 @@ def split_entity_keys_by_repository(
 
     @classmethod
     def build(cls, workspace: WorkspaceSnapshot):
-        # Combine repository scoped asset graphs with additional context to form the global graph
-
-        code_locations = (
-            location_entry.code_location
+        # Combine the asset graph fragments of each code location to form the global graph
+        fragments = [
+            location_entry.asset_graph_fragment
             for location_entry in workspace.code_location_entries.values()
-            if location_entry.code_location
-        )
-        repos = (
-            repo
-            for code_location in code_locations
-            for repo in code_location.get_repositories().values()
-        )
+        ]
 
         asset_infos_by_key: dict[AssetKey, list[RepositoryScopedAssetInfo]] = defaultdict(list)
         asset_checks_by_key: dict[AssetCheckKey, RemoteAssetCheckNode] = {}
-        for repo in repos:
-            for key, asset_node in repo.asset_graph.remote_asset_nodes_by_key.items():
-                asset_infos_by_key[key].append(
-                    RepositoryScopedAssetInfo(
-                        asset_node=asset_node,
-                        targeting_sensor_names=sorted(
-                            s.name for s in repo.get_sensors_targeting(asset_node.key)
-                        ),
-                        targeting_schedule_names=sorted(
-                            s.name for s in repo.get_schedules_targeting(asset_node.key)
-                        ),
-                    )
-                )
-            # NOTE: matches previous behavior of completely ignoring asset check collisions
-            asset_checks_by_key.update(repo.asset_graph.remote_asset_check_nodes_by_key)
+        for fragment in fragments:
+            for key, asset_infos in fragment.asset_infos_by_key.items():
+                asset_infos_by_key[key].extend(asset_infos)
+            asset_checks_by_key.update(fragment.asset_check_nodes_by_key)
 
         asset_nodes_by_key = {}
         nodes_with_multiple = []
@@ -673,6 +707,106 @@ def build(cls, workspace: WorkspaceSnapshot):
             remote_asset_check_nodes_by_key=asset_checks_by_key,
         )
 
+    def with_replaced_fragment(
+        self,
+        previous_fragment: CodeLocationAssetGraphFragment,
+        fragment: CodeLocationAssetGraphFragment,
+        fragments: Sequence[CodeLocationAssetGraphFragment],
+    ) -> "RemoteWorkspaceAssetGraph":
+        """Returns the graph that results from replacing one code location's fragment of this graph
+        with a new fragment, where `fragments` are the fragments of every code location in the new
+        workspace. Only the nodes for keys in the previous or new fragment are rebuilt, and the
+        dependency graphs and toposorts of this graph are reused if none of the dependencies
+        between assets and checks changed.
+        """
+        changed_asset_keys = {
+            *previous_fragment.asset_infos_by_key.keys(),
+            *fragment.asset_infos_by_key.keys(),
+        }
+        changed_check_keys = {
+            *previous_fragment.asset_check_nodes_by_key.keys(),
+            *fragment.asset_check_nodes_by_key.keys(),
+        }
+
+        asset_nodes_by_key = dict(self.remote_asset_nodes_by_key)
+        nodes_with_multiple = []
+        for key in changed_asset_keys:
+            asset_infos = [
+                asset_info
+                for other_fragment in fragments
+                for asset_info in other_fragment.asset_infos_by_key.get(key, [])
+            ]
+            if not asset_infos:
+                del asset_nodes_by_key[key]
+                continue
+
+            node = RemoteWorkspaceAssetNode(repo_scoped_asset_infos=asset_infos)
+            asset_nodes_by_key[key] = node
+            if len(asset_infos) > 1:
+                nodes_with_multiple.append(node)
+
+        asset_checks_by_key = dict(self.remote_asset_check_nodes_by_key)
+        for key in changed_check_keys:
+            # as in `build`, the last code location that defines a check wins
+            check_node = next(
+                (
+                    other_fragment.asset_check_nodes_by_key[key]
+                    for other_fragment in reversed(fragments)
+                    if key in other_fragment.asset_check_nodes_by_key
+                ),
+                None,
+            )
+            if check_node is None:
+                del asset_checks_by_key[key]
+            else:
+                asset_checks_by_key[key] = check_node
+
+        _warn_on_duplicate_nodes(nodes_with_multiple)
+
+        asset_graph = RemoteWorkspaceAssetGraph(
+            remote_asset_nodes_by_key=asset_nodes_by_key,
+            remote_asset_check_nodes_by_key=asset_checks_by_key,
+        )
+
+        if self._has_same_asset_deps(asset_graph, changed_asset_keys):
+            reused_properties = list(_ASSET_DEP_CACHED_PROPERTIES)
+            if self._has_same_check_deps(asset_graph, changed_asset_keys, changed_check_keys):
+                reused_properties.extend(_ENTITY_DEP_CACHED_PROPERTIES)
+            for name in reused_properties:
+                if name in self.__dict__:
+                    asset_graph.__dict__[name] = self.__dict__[name]
+
+        return asset_graph
+
+    def _has_same_asset_deps(
+        self, other: "RemoteWorkspaceAssetGraph", changed_asset_keys: AbstractSet[AssetKey]
+    ) -> bool:
+        if self.remote_asset_nodes_by_key.keys() != other.remote_asset_nodes_by_key.keys():
+            return False
+        return all(
+            self.get(key).parent_keys == other.get(key).parent_keys
+            and self.get(key).child_keys == other.get(key).child_keys
+            for key in changed_asset_keys
+        )
+
+    def _has_same_check_deps(
+        self,
+        other: "RemoteWorkspaceAssetGraph",
+        changed_asset_keys: AbstractSet[AssetKey],
+        changed_check_keys: AbstractSet[AssetCheckKey],
+    ) -> bool:
+        if (
+            self.remote_asset_check_nodes_by_key.keys()
+            != other.remote_asset_check_nodes_by_key.keys()
+        ):
+            return False
+        return all(
+            self.get(key).check_keys == other.get(key).check_keys for key in changed_asset_keys
+        ) and all(
+            self.get(key).parent_entity_keys == other.get(key).parent_entity_keys
+            for key in changed_check_keys
+        )
+
 
 def _warn_on_duplicate_nodes(
     nodes_with_multiple: Sequence[RemoteWorkspaceAssetNode],
@@ -1,7 +1,10 @@
+import bisect
 import functools
 import hashlib
 import json
 import re
+import threading
+from array import array
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, timedelta
 from enum import Enum
@@ -216,6 +219,152 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+# Beyond this many ticks (e.g. decades of hourly partitions or minutely partitions), timelines stop
+# growing and lookups fall back to iterating over the cron schedule.
+MAX_PARTITION_TIMELINE_SIZE = 100_000
+
+
+class PartitionTimeline:
+    """The cron ticks of a TimeWindowPartitionsDefinition, starting at the first tick at or after
+    its start, along with the partition key of the window starting at each tick.
+
+    Ticks are computed lazily and only once, so that time windows, partition keys and partition
+    counts can be found with a binary search over the tick timestamps instead of by iterating over
+    the cron schedule. Timelines are shared between definitions that only differ in their end or end
+    offset (see get_partition_timeline).
+    """
+
+    def __init__(self, start_timestamp: float, cron_schedule: str, timezone: str, fmt: str):
+        self._cron_schedule = cron_schedule
+        self._timezone = timezone
+        self._fmt = fmt
+        self._iterator = cron_string_iterator(
+            start_timestamp=start_timestamp,
+            cron_string=cron_schedule,
+            execution_timezone=timezone,
+        )
+        self._start_timestamp = start_timestamp
+        self._ticks: list[datetime] = []
+        self._tick_timestamps = array("d")
+        self._partition_keys: list[str] = []
+        self._indexes_by_partition_key: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _extend(self, has_enough_ticks: Callable[[], bool]) -> bool:
+        if has_enough_ticks():
+            return True
+
+        with self._lock:
+            while not has_enough_ticks():
+                if len(self._ticks) >= MAX_PARTITION_TIMELINE_SIZE:
+                    return False
+
+                tick = next(self._iterator)
+                if tick.timestamp() < self._start_timestamp:
+                    continue
+
+                self._ticks.append(tick)
+                self._tick_timestamps.append(tick.timestamp())
+
+        return True
+
+    def ensure_size(self, num_ticks: int) -> bool:
+        """Computes the first num_ticks ticks, returning False if the timeline can't grow that
+        large.
+        """
+        return self._extend(lambda: len(self._ticks) >= num_ticks)
+
+    def ensure_timestamp(self, timestamp: float) -> bool:
+        """Computes the ticks up to the first one after the given timestamp, returning False if the
+        timeline can't grow that large.
+        """
+        tick_timestamps = self._tick_timestamps
+        if len(tick_timestamps) >= 2:
+            # avoid computing ticks up to the size limit if it would be exceeded anyway
+            average_interval = (tick_timestamps[-1] - tick_timestamps[0]) / (
+                len(tick_timestamps) - 1
+            )
+            remaining_ticks = (timestamp - tick_timestamps[-1]) / average_interval
+            if remaining_ticks > MAX_PARTITION_TIMELINE_SIZE - len(tick_timestamps):
+                return False
+
+        return self._extend(lambda: len(tick_timestamps) > 0 and tick_timestamps[-1] > timestamp)
+
+    def index_at_or_after(self, timestamp: float) -> Optional[int]:
+        """Returns the index of the first tick at or after the given timestamp, or None if the
+        timestamp is before the start of the timeline or the timeline can't grow to include it.
+        """
+        if timestamp < self._start_timestamp or not self.ensure_timestamp(timestamp):
+            return None
+
+        return bisect.bisect_left(self._tick_timestamps, timestamp)
+
+    def num_ticks_at_or_before(
+        self, timestamp: float, max_num_ticks: Optional[int] = None
+    ) -> Optional[int]:
+        """Returns the number of ticks at or before the given timestamp, only considering the first
+        max_num_ticks ticks if provided. Returns None if the timeline can't grow large enough.
+        """
+        if max_num_ticks is None:
+            if not self.ensure_timestamp(timestamp):
+                return None
+            return bisect.bisect_right(self._tick_timestamps, timestamp)
+
+        if not self.ensure_size(max_num_ticks):
+            return None
+        return bisect.bisect_right(self._tick_timestamps, timestamp, 0, max_num_ticks)
+
+    def index_at_or_before(self, timestamp: float) -> Optional[int]:
+        """Returns the index of the last tick at or before the given timestamp, or None if the
+        timestamp is before the first tick or the timeline can't grow to include it.
+        """
+        if not self.ensure_timestamp(timestamp) or timestamp < self._tick_timestamps[0]:
+            return None
+
+        return bisect.bisect_right(self._tick_timestamps, timestamp) - 1
+
+    def get_tick(self, index: int) -> datetime:
+        return self._ticks[index]
+
+    def get_time_window(self, index: int) -> TimeWindow:
+        """Returns the time window starting at the tick with the given index. The ticks up to
+        index + 1 must have been computed.
+        """
+        return TimeWindow(self._ticks[index], self._ticks[index + 1])
+
+    def get_partition_keys(self, start_index: int, end_index: int) -> Sequence[str]:
+        """Returns the partition keys of the windows starting at the ticks between the given
+        indexes. The ticks up to end_index must have been computed.
+        """
+        partition_keys = self._partition_keys
+        if len(partition_keys) < end_index:
+            with self._lock:
+                partition_keys.extend(
+                    dst_safe_strftime(tick, self._timezone, self._fmt, self._cron_schedule)
+                    for tick in self._ticks[len(partition_keys) : end_index]
+                )
+
+        return partition_keys[start_index:end_index]
+
+    def get_partition_key(self, index: int) -> str:
+        return self.get_partition_keys(index, index + 1)[0]
+
+    def get_cached_index_for_partition_key(self, partition_key: str) -> Optional[int]:
+        return self._indexes_by_partition_key.get(partition_key)
+
+    def cache_index_for_partition_key(self, partition_key: str, index: int) -> None:
+        # only the keys of actual windows are cached, which bounds the size of the cache
+        if self.get_partition_key(index) == partition_key:
+            self._indexes_by_partition_key[partition_key] = index
+
+
+@functools.lru_cache(maxsize=128)
+def get_partition_timeline(
+    start_timestamp: float, cron_schedule: str, timezone: str, fmt: str
+) -> PartitionTimeline:
+    return PartitionTimeline(start_timestamp, cron_schedule, timezone, fmt)
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -383,6 +532,12 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
             minutes_in_window = (time_window.end.timestamp() - time_window.start.timestamp()) / 60
             return int(minutes_in_window // fixed_minute_interval)
 
+        timeline = self._partition_timeline
+        start_index = timeline.index_at_or_after(time_window.start.timestamp())
+        end_index = timeline.index_at_or_after(time_window.end.timestamp())
+        if start_index is not None and end_index is not None:
+            return max(end_index - start_index, 0)
+
         return len(self.get_partition_keys_in_time_window(time_window))
 
     def get_num_partitions(
@@ -447,6 +602,10 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        num_partitions = self._get_num_partitions_in_timeline(current_timestamp)
+        if num_partitions is not None:
+            return self._partition_timeline.get_partition_keys(0, num_partitions)
+
         partitions_past_current_time = 0
         partition_keys: list[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -472,6 +631,29 @@ def get_partition_keys(
 
         return partition_keys
 
+    def _get_num_partitions_in_timeline(self, current_timestamp: float) -> Optional[int]:
+        """Returns the number of partitions that exist at the given time, or None if they don't fit
+        in the partition timeline.
+        """
+        timeline = self._partition_timeline
+        num_ticks_before_current_time = timeline.num_ticks_at_or_before(current_timestamp)
+        if num_ticks_before_current_time is None:
+            return None
+
+        # the windows that end before the current time, followed by end_offset windows that don't
+        num_partitions = max(num_ticks_before_current_time - 1, 0) + max(self.end_offset, 0)
+        if self.end:
+            num_ticks_before_end = timeline.num_ticks_at_or_before(
+                self.end.timestamp(), max_num_ticks=num_partitions + 1
+            )
+            if num_ticks_before_end is None:
+                return None
+            num_partitions = min(num_partitions, max(num_ticks_before_end - 1, 0))
+        elif not timeline.ensure_size(num_partitions + 1):
+            return None
+
+        return max(num_partitions + min(self.end_offset, 0), 0)
+
     def __str__(self) -> str:
         schedule_str = (
             self.schedule_type.value.capitalize() if self.schedule_type else self.cron_schedule
@@ -500,9 +682,30 @@ def __hash__(self):
 
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
+        index = self._get_partition_key_index(partition_key)
+        if index is not None:
+            return self._partition_timeline.get_time_window(index)
+
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
 
+    def _get_partition_key_index(self, partition_key: str) -> Optional[int]:
+        """Returns the index in the partition timeline of the time window for the given partition
+        key, or None if the time window is outside of the timeline.
+        """
+        timeline = self._partition_timeline
+        index = timeline.get_cached_index_for_partition_key(partition_key)
+        if index is not None:
+            return index
+
+        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        index = timeline.index_at_or_after(partition_key_dt.timestamp())
+        if index is None or not timeline.ensure_size(index + 2):
+            return None
+
+        timeline.cache_index_for_partition_key(partition_key, index)
+        return index
+
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
         self,
@@ -512,6 +715,38 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        partition_key_indexes = [self._get_partition_key_index(pk) for pk in partition_keys]
+        if None not in partition_key_indexes:
+            timeline = self._partition_timeline
+            partition_key_time_windows = [
+                timeline.get_time_window(index)
+                for index in sorted(cast(list[int], partition_key_indexes))
+            ]
+        else:
+            partition_key_time_windows = self._time_windows_for_partition_keys_outside_timeline(
+                partition_keys
+            )
+
+        if validate:
+            start_time_window = self.get_first_partition_window()
+            end_time_window = self.get_last_partition_window()
+
+            if start_time_window is None or end_time_window is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            start_timestamp = start_time_window.start.timestamp()
+            end_timestamp = end_time_window.end.timestamp()
+
+            partition_key_time_windows = [
+                tw
+                for tw in partition_key_time_windows
+                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+            ]
+        return partition_key_time_windows
+
+    def _time_windows_for_partition_keys_outside_timeline(
+        self, partition_keys: frozenset[str]
+    ) -> list[TimeWindow]:
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -537,31 +772,15 @@ def time_windows_for_partition_keys(
                 )
                 partition_key_time_windows.append(next(cur_windows_iterator))
 
-        if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
-
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
-
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
-
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
-        partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         if self.is_basic_hourly or self.is_basic_daily:
-            return partition_key_dt
+            return dst_safe_strptime(partition_key, self.timezone, self.fmt)
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
+        return self.time_window_for_partition_key(partition_key).start
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
@@ -701,6 +920,12 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        timeline = self._partition_timeline
+        start_index = timeline.index_at_or_after(time_window.start.timestamp())
+        end_index = timeline.index_at_or_after(time_window.end.timestamp())
+        if start_index is not None and end_index is not None:
+            return timeline.get_partition_keys(start_index, max(start_index, end_index))
+
         result: list[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start.timestamp()):
@@ -895,8 +1120,24 @@ def get_cron_schedule(
             day_offset=day_offset,
         )
 
+    @property
+    def _partition_timeline(self) -> PartitionTimeline:
+        return get_partition_timeline(
+            self.start_ts.timestamp, self.cron_schedule, self.timezone, self.fmt
+        )
+
     def _iterate_time_windows(self, start_timestamp: float) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that start after the given start time."""
+        timeline = self._partition_timeline
+        index = timeline.index_at_or_after(start_timestamp)
+        if index is not None:
+            while timeline.ensure_size(index + 2):
+                yield timeline.get_time_window(index)
+                index += 1
+
+            # the timeline can't grow any further, so continue from its last tick
+            start_timestamp = timeline.get_tick(index).timestamp()
+
         iterator = cron_string_iterator(
             start_timestamp=start_timestamp,
             cron_string=self.cron_schedule,
@@ -913,6 +1154,16 @@ def _iterate_time_windows(self, start_timestamp: float) -> Iterable[TimeWindow]:
 
     def _reverse_iterate_time_windows(self, end_timestamp: float) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that end before the given end time."""
+        timeline = self._partition_timeline
+        index = timeline.index_at_or_before(end_timestamp)
+        if index is not None:
+            while index > 0:
+                yield timeline.get_time_window(index - 1)
+                index -= 1
+
+            # continue with the windows before the start of the timeline
+            end_timestamp = timeline.get_tick(0).timestamp()
+
         iterator = reverse_cron_string_iterator(
             end_timestamp=end_timestamp,
             cron_string=self.cron_schedule,
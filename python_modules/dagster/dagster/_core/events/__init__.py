@@ -1733,6 +1733,16 @@ def multiprocess(
             }
         )
 
+    @staticmethod
+    def definitions_loaded(load_time_ms: float, preloaded: bool) -> "EngineEventData":
+        return EngineEventData(
+            metadata={
+                "pid": MetadataValue.text(str(os.getpid())),
+                "load_time_ms": MetadataValue.float(load_time_ms),
+                "preloaded": MetadataValue.bool(preloaded),
+            }
+        )
+
     @staticmethod
     def interrupted(steps_interrupted: Sequence[str]) -> "EngineEventData":
         return EngineEventData(
@@ -24,6 +24,7 @@
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
+from dagster._core.execution.run_tracing import run_tracing_scope, trace_span
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.selector import parse_step_selection
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
@@ -32,6 +33,7 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 from dagster._utils.merger import merge_dicts
+from dagster._utils.timing import format_duration, time_execution_scope
 
 ## Brief guide to the execution APIs
 # | function name               | operates over      | sync  | supports    | creates new DagsterRun  |
@@ -226,26 +228,27 @@ def execute_run(
             asset_check_selection=dagster_run.asset_check_selection,
         )
 
-    execution_plan = _get_execution_plan_from_run(job, dagster_run, instance)
-    if isinstance(job, ReconstructableJob):
-        job = job.with_repository_load_data(execution_plan.repository_load_data)
+    with run_tracing_scope(instance, dagster_run):
+        execution_plan = _get_execution_plan_from_run(job, dagster_run, instance)
+        if isinstance(job, ReconstructableJob):
+            job = job.with_repository_load_data(execution_plan.repository_load_data)
 
-    _execute_run_iterable = ExecuteRunWithPlanIterable(
-        execution_plan=execution_plan,
-        iterator=job_execution_iterator,
-        execution_context_manager=PlanOrchestrationContextManager(
-            context_event_generator=orchestration_context_event_generator,
-            job=job,
+        _execute_run_iterable = ExecuteRunWithPlanIterable(
             execution_plan=execution_plan,
-            dagster_run=dagster_run,
-            instance=instance,
-            run_config=dagster_run.run_config,
-            raise_on_error=raise_on_error,
-            executor_defs=None,
-            output_capture=None,
-        ),
-    )
-    event_list = list(_execute_run_iterable)
+            iterator=job_execution_iterator,
+            execution_context_manager=PlanOrchestrationContextManager(
+                context_event_generator=orchestration_context_event_generator,
+                job=job,
+                execution_plan=execution_plan,
+                dagster_run=dagster_run,
+                instance=instance,
+                run_config=dagster_run.run_config,
+                raise_on_error=raise_on_error,
+                executor_defs=None,
+                output_capture=None,
+            ),
+        )
+        event_list = list(_execute_run_iterable)
 
     # We need to reload the run object after execution for it to be accurate
     reloaded_dagster_run = check.not_none(instance.get_run_by_id(dagster_run.run_id))
@@ -668,6 +671,28 @@ def _get_execution_plan_from_run(
     )
 
 
+def load_job_definition_in_worker(
+    recon_job: ReconstructableJob,
+    instance: DagsterInstance,
+    dagster_run: DagsterRun,
+    step_key: Optional[str] = None,
+) -> DagsterEvent:
+    """Loads the definition of a job in a run or step worker process ahead of execution, and
+    reports the time it took to load as an engine event.
+    """
+    preloaded = recon_job.repository.is_preloaded()
+    with time_execution_scope() as timer_result, trace_span("load_job_definition"):
+        recon_job.get_definition()
+
+    return instance.report_engine_event(
+        f"Loaded job definition in {format_duration(timer_result.millis)}"
+        + (" (preloaded)." if preloaded else "."),
+        dagster_run,
+        EngineEventData.definitions_loaded(timer_result.millis, preloaded),
+        step_key=step_key,
+    )
+
+
 def create_execution_plan(
     job: Union[IJob, JobDefinition],
     run_config: Optional[Mapping[str, object]] = None,
@@ -699,17 +724,18 @@ def create_execution_plan(
         repository_load_data, "repository_load_data", RepositoryLoadData
     )
 
-    resolved_run_config = ResolvedRunConfig.build(job_def, run_config)
+    with trace_span("create_execution_plan"):
+        resolved_run_config = ResolvedRunConfig.build(job_def, run_config)
 
-    return ExecutionPlan.build(
-        job_def,
-        resolved_run_config,
-        step_keys_to_execute=step_keys_to_execute,
-        known_state=known_state,
-        instance_ref=instance_ref,
-        tags=tags,
-        repository_load_data=repository_load_data,
-    )
+        return ExecutionPlan.build(
+            job_def,
+            resolved_run_config,
+            step_keys_to_execute=step_keys_to_execute,
+            known_state=known_state,
+            instance_ref=instance_ref,
+            tags=tags,
+            repository_load_data=repository_load_data,
+        )
 
 
 def job_execution_iterator(
@@ -1453,6 +1453,15 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
+        # fetch the latest events of all targeted assets and their parents in bulk, rather than
+        # one asset at a time
+        instance_queryer.prefetch_asset_records(
+            {
+                key
+                for asset_key in asset_backfill_data.target_subset.asset_keys
+                for key in {asset_key, *asset_graph.get(asset_key).parent_keys}
+            }
+        )
         parent_materialized_asset_partitions = set().union(
             *(
                 instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
@@ -26,6 +26,7 @@
     step_failure_event_from_exc_info,
 )
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.run_tracing import trace_span
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
@@ -84,11 +85,14 @@ def inner_plan_execution_iterator(
                 )
 
                 # we have already set up the log capture at the process level, just handle the step events
-                for step_event in check.generator(dagster_event_sequence_for_step(step_context)):
-                    dagster_event = check.inst(step_event, DagsterEvent)
-                    step_event_list.append(dagster_event)
-                    yield dagster_event
-                    active_execution.handle_event(dagster_event)
+                with trace_span("execute_step", step_key=step.key):
+                    for step_event in check.generator(
+                        dagster_event_sequence_for_step(step_context)
+                    ):
+                        dagster_event = check.inst(step_event, DagsterEvent)
+                        step_event_list.append(dagster_event)
+                        yield dagster_event
+                        active_execution.handle_event(dagster_event)
 
                 active_execution.verify_complete(job_context, step.key)
 
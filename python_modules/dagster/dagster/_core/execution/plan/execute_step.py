@@ -58,6 +58,7 @@
 from dagster._core.execution.plan.objects import StepSuccessData, TypeCheckData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.plan.utils import op_execution_error_boundary
+from dagster._core.execution.run_tracing import trace_span
 from dagster._core.storage.tags import BACKFILL_ID_TAG
 from dagster._core.types.dagster_type import DagsterType
 from dagster._utils import iterate_with_context
@@ -769,35 +770,38 @@ def _gen_fn():
         else:
             handle_output_gen = output_manager.handle_output(output_context, output.value)
 
-        for elt in iterate_with_context(
-            lambda: op_execution_error_boundary(
-                DagsterExecutionHandleOutputError,
-                msg_fn=lambda: f'Error occurred while handling output "{output_context.name}" of step "{step_context.step.key}":',
-                step_context=step_context,
-                step_key=step_context.step.key,
-                output_name=output_context.name,
-            ),
-            handle_output_gen,
+        with trace_span(
+            "handle_output", step_key=step_context.step.key, output_name=output_context.name
         ):
-            for event in output_context.consume_events():
-                yield event
-
-            manager_metadata = {**manager_metadata, **output_context.consume_logged_metadata()}
-            if isinstance(elt, DagsterEvent):
-                yield elt
-            elif isinstance(elt, AssetMaterialization):
-                manager_materializations.append(elt)
-            elif isinstance(elt, dict):  # should remove this?
-                experimental_warning(
-                    "Yielding metadata from an IOManager's handle_output() function"
-                )
-                manager_metadata = {**manager_metadata, **normalize_metadata(elt)}
-            else:
-                raise DagsterInvariantViolationError(
-                    f"IO manager on output {output_def.name} has returned "
-                    f"value {elt} of type {type(elt).__name__}. The return type can only be "
-                    "one of AssetMaterialization, Dict[str, MetadataValue]."
-                )
+            for elt in iterate_with_context(
+                lambda: op_execution_error_boundary(
+                    DagsterExecutionHandleOutputError,
+                    msg_fn=lambda: f'Error occurred while handling output "{output_context.name}" of step "{step_context.step.key}":',
+                    step_context=step_context,
+                    step_key=step_context.step.key,
+                    output_name=output_context.name,
+                ),
+                handle_output_gen,
+            ):
+                for event in output_context.consume_events():
+                    yield event
+
+                manager_metadata = {**manager_metadata, **output_context.consume_logged_metadata()}
+                if isinstance(elt, DagsterEvent):
+                    yield elt
+                elif isinstance(elt, AssetMaterialization):
+                    manager_materializations.append(elt)
+                elif isinstance(elt, dict):  # should remove this?
+                    experimental_warning(
+                        "Yielding metadata from an IOManager's handle_output() function"
+                    )
+                    manager_metadata = {**manager_metadata, **normalize_metadata(elt)}
+                else:
+                    raise DagsterInvariantViolationError(
+                        f"IO manager on output {output_def.name} has returned "
+                        f"value {elt} of type {type(elt).__name__}. The return type can only be "
+                        "one of AssetMaterialization, Dict[str, MetadataValue]."
+                    )
 
         for event in output_context.consume_events():
             yield event
@@ -19,6 +19,7 @@
     build_resources_for_manager,
     op_execution_error_boundary,
 )
+from dagster._core.execution.run_tracing import trace_span
 from dagster._core.storage.io_manager import IOManager
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._record import IHaveNew, record, record_custom
@@ -618,7 +619,8 @@ def _load_input_with_input_manager(
         step_key=step_context.step.key,
         input_name=context.name,
     ):
-        value = input_manager.load_input(context)
+        with trace_span("load_input", step_key=step_context.step.key, input_name=context.name):
+            value = input_manager.load_input(context)
     # close user code boundary before returning value
     yield from context.consume_events()
 
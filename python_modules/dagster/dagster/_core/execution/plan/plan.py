@@ -1,5 +1,6 @@
+import weakref
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Hashable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union, cast
 
 import dagster._check as check
@@ -86,6 +87,35 @@
     ExecutionStep, UnresolvedCollectExecutionStep, UnresolvedMappedExecutionStep
 ]
 
+# The steps built for each job definition, keyed by the parts of the run config that affect them.
+# Steps are immutable, so plans for the same job share them and only copy the dicts that hold them.
+_PLAN_STEPS_CACHE_SIZE = 8
+_plan_steps_cache: "weakref.WeakKeyDictionary[JobDefinition, dict[Hashable, _PlanSteps]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _PlanSteps(NamedTuple):
+    step_dict: Mapping[StepHandleUnion, IExecutionStep]
+    step_dict_by_key: Mapping[str, IExecutionStep]
+
+
+def _get_plan_steps_cache_key(resolved_run_config: ResolvedRunConfig) -> Hashable:
+    # Steps only depend on the run config through the inputs and outputs configured for each op,
+    # so run configs that only differ in op config, resources or execution share their steps.
+    return (
+        frozenset(resolved_run_config.inputs.keys()),
+        frozenset(
+            (
+                handle,
+                frozenset(op_config.inputs.keys()),
+                frozenset(op_config.outputs.output_names),
+            )
+            for handle, op_config in resolved_run_config.ops.items()
+            if op_config.inputs or op_config.outputs.output_names
+        ),
+    )
+
 
 class _PlanBuilder:
     """This is the state that is built up during the execution plan build process."""
@@ -139,6 +169,72 @@ def build(self) -> "ExecutionPlan":
             self.resolved_run_config,
         )
 
+        plan_steps = self._get_plan_steps()
+
+        # resolving dynamic steps adds them to these dicts, so copy them to keep the cached steps
+        # intact
+        step_dict = dict(plan_steps.step_dict)
+        step_dict_by_key = dict(plan_steps.step_dict_by_key)
+        step_handles_to_execute = list(plan_steps.step_dict.keys())
+
+        executable_map, resolvable_map = _compute_step_maps(
+            step_dict,
+            step_dict_by_key,
+            step_handles_to_execute,
+            self.known_state,
+        )
+
+        executor_name = self.resolved_run_config.execution.execution_engine_name
+
+        # no need to subset if plan already matches request
+        should_subset = self.step_keys_to_execute is not None and self.step_keys_to_execute != [
+            handle.to_key() for handle in step_handles_to_execute
+        ]
+
+        plan = ExecutionPlan(
+            step_dict,
+            executable_map,
+            resolvable_map,
+            step_handles_to_execute,
+            self.known_state,
+            # the subset plan computes this for the steps it executes
+            not should_subset
+            and _compute_artifacts_persisted(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                self.job_def,
+                self.resolved_run_config,
+                executable_map,
+            ),
+            step_dict_by_key=step_dict_by_key,
+            executor_name=executor_name,
+            repository_load_data=self.repository_load_data,
+        )
+
+        if should_subset:
+            plan = plan.build_subset_plan(
+                check.not_none(self.step_keys_to_execute), self.job_def, self.resolved_run_config
+            )
+
+        return plan
+
+    def _get_plan_steps(self) -> _PlanSteps:
+        """Returns the steps for every node in the job, reusing the steps built for a previous plan
+        of the same job definition if the run config does not affect them.
+        """
+        cache_key = _get_plan_steps_cache_key(self.resolved_run_config)
+        cached_plan_steps = _plan_steps_cache.setdefault(self.job_def, {})
+        plan_steps = cached_plan_steps.get(cache_key)
+        if plan_steps is None:
+            plan_steps = self._build_plan_steps()
+            if len(cached_plan_steps) >= _PLAN_STEPS_CACHE_SIZE:
+                del cached_plan_steps[next(iter(cached_plan_steps))]
+            cached_plan_steps[cache_key] = plan_steps
+
+        return plan_steps
+
+    def _build_plan_steps(self) -> _PlanSteps:
         root_inputs: list[
             Union[StepInput, UnresolvedMappedStepInput, UnresolvedCollectStepInput]
         ] = []
@@ -171,48 +267,11 @@ def build(self) -> "ExecutionPlan":
             parent_step_inputs=root_inputs,
         )
 
-        step_dict = {step.handle: step for step in self._steps.values()}
-        step_dict_by_key = {step.key: step for step in self._steps.values()}
-        step_handles_to_execute = [step.handle for step in self._steps.values()]
-
-        executable_map, resolvable_map = _compute_step_maps(
-            step_dict,
-            step_dict_by_key,
-            step_handles_to_execute,
-            self.known_state,
-        )
-
-        executor_name = self.resolved_run_config.execution.execution_engine_name
-
-        plan = ExecutionPlan(
-            step_dict,
-            executable_map,
-            resolvable_map,
-            step_handles_to_execute,
-            self.known_state,
-            _compute_artifacts_persisted(
-                step_dict,
-                step_dict_by_key,
-                step_handles_to_execute,
-                self.job_def,
-                self.resolved_run_config,
-                executable_map,
-            ),
-            executor_name=executor_name,
-            repository_load_data=self.repository_load_data,
+        return _PlanSteps(
+            step_dict={step.handle: step for step in self._steps.values()},
+            step_dict_by_key={step.key: step for step in self._steps.values()},
         )
 
-        if (
-            self.step_keys_to_execute is not None
-            # no need to subset if plan already matches request
-            and self.step_keys_to_execute != plan.step_keys_to_execute
-        ):
-            plan = plan.build_subset_plan(
-                self.step_keys_to_execute, self.job_def, self.resolved_run_config
-            )
-
-        return plan
-
     def _build_from_sorted_nodes(
         self,
         nodes: Sequence[Node],
@@ -1074,6 +1133,7 @@ def _update_from_resolved_dynamic_outputs(
 ) -> None:
     resolved_steps: list[ExecutionStep] = []
     key_sets_to_clear: list[frozenset[str]] = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1084,7 +1144,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1263,7 +1323,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1333,7 +1393,7 @@ def _compute_step_maps(
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
     past_mappings = known_state.dynamic_mappings if known_state else {}
 
     executable_map: dict[str, Union[StepHandle, ResolvedFromDynamicStepHandle]] = {}
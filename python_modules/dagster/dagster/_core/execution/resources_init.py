@@ -26,6 +26,7 @@
 )
 from dagster._core.execution.plan.plan import ExecutionPlan, StepHandleUnion
 from dagster._core.execution.plan.step import ExecutionStep, IExecutionStep
+from dagster._core.execution.run_tracing import trace_span
 from dagster._core.instance import DagsterInstance
 from dagster._core.log_manager import DagsterLogManager
 from dagster._core.storage.dagster_run import DagsterRun
@@ -143,41 +144,44 @@ def _core_resource_initialization_event_generator(
                 resource_keys_to_init,
             )
 
-        resource_dependencies = resolve_resource_dependencies(resource_defs)
-        for level in toposort(resource_dependencies):
-            for resource_name in level:
-                resource_def = resource_defs[resource_name]
-                if resource_name not in resource_keys_to_init:
-                    continue
+        with trace_span("resources_init", resources=", ".join(sorted(resource_keys_to_init))):
+            resource_dependencies = resolve_resource_dependencies(resource_defs)
+            for level in toposort(resource_dependencies):
+                for resource_name in level:
+                    resource_def = resource_defs[resource_name]
+                    if resource_name not in resource_keys_to_init:
+                        continue
 
-                resource_fn = cast(Callable[[InitResourceContext], Any], resource_def.resource_fn)
-                resources = ScopedResourcesBuilder(resource_instances).build(
-                    resource_def.get_required_resource_keys(resource_defs)
-                )
-                resource_context = InitResourceContext(
-                    resource_def=resource_def,
-                    resource_config=resource_configs[resource_name].config,
-                    dagster_run=dagster_run,
-                    # Add tags with information about the resource
-                    log_manager=resource_log_manager.with_tags(
-                        resource_name=resource_name,
-                        resource_fn_name=str(resource_fn.__name__),
-                    ),
-                    resources=resources,
-                    instance=instance,
-                    all_resource_defs=resource_defs,
-                )
-                manager = single_resource_generation_manager(
-                    resource_context, resource_name, resource_def
-                )
-                for event in manager.generate_setup_events():
-                    if event:
-                        yield event
-                initialized_resource = check.inst(manager.get_object(), InitializedResource)
-                resource_instances[resource_name] = initialized_resource.resource
-                resource_init_times[resource_name] = initialized_resource.duration
-                contains_generator = contains_generator or initialized_resource.is_generator
-                resource_managers.append(manager)
+                    resource_fn = cast(
+                        Callable[[InitResourceContext], Any], resource_def.resource_fn
+                    )
+                    resources = ScopedResourcesBuilder(resource_instances).build(
+                        resource_def.get_required_resource_keys(resource_defs)
+                    )
+                    resource_context = InitResourceContext(
+                        resource_def=resource_def,
+                        resource_config=resource_configs[resource_name].config,
+                        dagster_run=dagster_run,
+                        # Add tags with information about the resource
+                        log_manager=resource_log_manager.with_tags(
+                            resource_name=resource_name,
+                            resource_fn_name=str(resource_fn.__name__),
+                        ),
+                        resources=resources,
+                        instance=instance,
+                        all_resource_defs=resource_defs,
+                    )
+                    manager = single_resource_generation_manager(
+                        resource_context, resource_name, resource_def
+                    )
+                    for event in manager.generate_setup_events():
+                        if event:
+                            yield event
+                    initialized_resource = check.inst(manager.get_object(), InitializedResource)
+                    resource_instances[resource_name] = initialized_resource.resource
+                    resource_init_times[resource_name] = initialized_resource.duration
+                    contains_generator = contains_generator or initialized_resource.is_generator
+                    resource_managers.append(manager)
 
         if emit_persistent_events and resource_keys_to_init:
             yield DagsterEvent.resource_init_success(
@@ -0,0 +1,246 @@
+"""Opt-in tracing of the internal hot paths of run execution.
+
+When a run has the `dagster/run_tracing` tag, each process that executes part of the run records
+named spans around event storage writes, IO manager calls, execution plan building, resource
+initialization, step execution and step process startup. Spans are kept in a bounded in-memory
+ring buffer, and are written to the event log of the run as engine events in the Chrome trace event
+format when the process finishes executing the run.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from dagster._core.storage.tags import RUN_TRACING_TAG
+from dagster._utils.tags import get_boolean_tag_value
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+    from dagster._core.storage.dagster_run import DagsterRun
+
+DEFAULT_MAX_TRACE_SPANS = 10000
+
+# key of the engine event metadata entry that holds the recorded spans as Chrome trace events
+TRACE_EVENTS_METADATA_KEY = "trace_events"
+
+# spans are split across engine events to keep each event log entry reasonably small
+_TRACE_EVENTS_PER_ENGINE_EVENT = 1000
+
+
+def get_max_trace_spans() -> int:
+    return int(os.getenv("DAGSTER_RUN_TRACING_MAX_SPANS", str(DEFAULT_MAX_TRACE_SPANS)))
+
+
+def is_run_tracing_enabled(dagster_run: "DagsterRun") -> bool:
+    return get_boolean_tag_value(dagster_run.tags.get(RUN_TRACING_TAG))
+
+
+class RunTracer:
+    """Records the spans of a process in a ring buffer that keeps the most recent `max_spans`
+    spans.
+    """
+
+    def __init__(self, max_spans: int):
+        self._pid = os.getpid()
+        self._spans: deque[tuple[str, int, int, int, Mapping[str, str]]] = deque(maxlen=max_spans)
+        self._span_count = 0
+
+    @property
+    def span_count(self) -> int:
+        """The number of spans recorded, including spans that were dropped from the buffer."""
+        return self._span_count
+
+    @contextmanager
+    def span(self, name: str, attributes: Mapping[str, str]) -> Iterator[None]:
+        start_ns = time.time_ns()
+        try:
+            yield
+        finally:
+            self._spans.append((name, start_ns, time.time_ns(), threading.get_ident(), attributes))
+            self._span_count += 1
+
+    def get_trace_events(self) -> Sequence[Mapping[str, Any]]:
+        """Returns the buffered spans as complete events of the Chrome trace event format."""
+        return [
+            {
+                "name": name,
+                "cat": "dagster",
+                "ph": "X",
+                "ts": start_ns / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self._pid,
+                "tid": tid,
+                "args": dict(attributes),
+            }
+            for name, start_ns, end_ns, tid, attributes in list(self._spans)
+        ]
+
+
+_active_tracer: Optional[RunTracer] = None
+_null_context = nullcontext()
+
+
+def trace_span(name: str, **attributes: str) -> AbstractContextManager[None]:
+    """Records a span around the body of the context manager if a run is being traced in this
+    process. Does nothing otherwise.
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return _null_context
+    return tracer.span(name, attributes)
+
+
+@contextmanager
+def run_tracing_scope(
+    instance: "DagsterInstance", dagster_run: "DagsterRun", step_key: Optional[str] = None
+) -> Iterator[None]:
+    """Records spans in this process while the scope is open, if tracing is enabled for the run.
+    The spans are written to the event log of the run when the scope closes.
+    """
+    global _active_tracer  # noqa: PLW0603
+
+    if _active_tracer is not None or not is_run_tracing_enabled(dagster_run):
+        yield
+        return
+
+    tracer = RunTracer(get_max_trace_spans())
+    _active_tracer = tracer
+    try:
+        yield
+    finally:
+        _active_tracer = None
+        _report_trace_events(instance, dagster_run, tracer, step_key)
+
+
+def _report_trace_events(
+    instance: "DagsterInstance",
+    dagster_run: "DagsterRun",
+    tracer: RunTracer,
+    step_key: Optional[str],
+) -> None:
+    from dagster._core.definitions.metadata import MetadataValue
+    from dagster._core.events import EngineEventData
+
+    trace_events = tracer.get_trace_events()
+    dropped_count = tracer.span_count - len(trace_events)
+    for i in range(0, len(trace_events), _TRACE_EVENTS_PER_ENGINE_EVENT):
+        chunk = trace_events[i : i + _TRACE_EVENTS_PER_ENGINE_EVENT]
+        instance.report_engine_event(
+            f"Recorded {len(chunk)} trace spans in process (pid: {os.getpid()})"
+            + (
+                f", {dropped_count} earlier spans were dropped."
+                if dropped_count and i == 0
+                else "."
+            ),
+            dagster_run,
+            EngineEventData(metadata={TRACE_EVENTS_METADATA_KEY: MetadataValue.json(chunk)}),
+            step_key=step_key,
+        )
+
+
+def get_run_trace_events(instance: "DagsterInstance", run_id: str) -> Sequence[Mapping[str, Any]]:
+    """Returns the spans recorded by every process that executed the run, as Chrome trace events."""
+    from dagster._core.events import DagsterEventType
+
+    trace_events = []
+    for record in instance.get_records_for_run(
+        run_id, of_type=DagsterEventType.ENGINE_EVENT
+    ).records:
+        dagster_event = record.event_log_entry.dagster_event
+        if not dagster_event:
+            continue
+        metadata_value = dagster_event.engine_event_data.metadata.get(TRACE_EVENTS_METADATA_KEY)
+        if metadata_value is not None:
+            trace_events.extend(metadata_value.value)
+
+    return sorted(trace_events, key=lambda trace_event: trace_event["ts"])
+
+
+def to_chrome_trace(trace_events: Sequence[Mapping[str, Any]], run_id: str) -> Mapping[str, Any]:
+    return {
+        "traceEvents": list(trace_events),
+        "displayTimeUnit": "ms",
+        "otherData": {"run_id": run_id},
+    }
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> Sequence[Mapping[str, Any]]:
+    return [{"key": key, "value": {"stringValue": str(value)}} for key, value in attributes.items()]
+
+
+def to_otlp_trace(trace_events: Sequence[Mapping[str, Any]], run_id: str) -> Mapping[str, Any]:
+    """Converts Chrome trace events to the OTLP/JSON encoding of OpenTelemetry traces, with the
+    run id as the trace id and a resource for each process.
+    """
+    trace_id = run_id.replace("-", "")
+    spans_by_pid: dict[int, list[Mapping[str, Any]]] = {}
+    for i, trace_event in enumerate(trace_events):
+        start_ns = int(trace_event["ts"] * 1000)
+        spans_by_pid.setdefault(trace_event["pid"], []).append(
+            {
+                "traceId": trace_id,
+                "spanId": f"{i + 1:016x}",
+                "name": trace_event["name"],
+                # SPAN_KIND_INTERNAL
+                "kind": 1,
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(start_ns + int(trace_event["dur"] * 1000)),
+                "attributes": _otlp_attributes(
+                    {"thread.id": trace_event["tid"], **trace_event.get("args", {})}
+                ),
+            }
+        )
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes(
+                        {"service.name": "dagster", "process.pid": pid, "dagster.run_id": run_id}
+                    )
+                },
+                "scopeSpans": [{"scope": {"name": "dagster"}, "spans": spans}],
+            }
+            for pid, spans in spans_by_pid.items()
+        ]
+    }
+
+
+class TraceSpanSummary(NamedTuple):
+    name: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count
+
+
+def summarize_trace_events(trace_events: Sequence[Mapping[str, Any]]) -> Sequence[TraceSpanSummary]:
+    """Aggregates the durations of the spans with each name, sorted by decreasing total duration.
+
+    Spans can be nested, e.g. event storage writes happen within step execution, so the total
+    durations of different names can overlap.
+    """
+    durations_by_name: dict[str, list[float]] = {}
+    for trace_event in trace_events:
+        durations_by_name.setdefault(trace_event["name"], []).append(trace_event["dur"] / 1000)
+
+    return sorted(
+        (
+            TraceSpanSummary(
+                name=name,
+                count=len(durations),
+                total_ms=sum(durations),
+                max_ms=max(durations),
+            )
+            for name, durations in durations_by_name.items()
+        ),
+        key=lambda summary: summary.total_ms,
+        reverse=True,
+    )
@@ -14,6 +14,7 @@
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._core.execution.run_tracing import trace_span
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -153,7 +154,8 @@ def execute_child_process_command(
         process = multiprocessing_ctx.Process(  # type: ignore
             target=_execute_command_in_child_process, args=(event_queue, command)
         )
-        process.start()
+        with trace_span("child_process_start"):
+            process.start()
         yield process
 
         completed_properly = False
@@ -0,0 +1,35 @@
+"""Preloaded by the forkserver process of the multiprocess executor when its `preload_definitions`
+option is set.
+
+Importing this module in the forkserver process loads the definitions of the job that is being
+executed, so that each step process forked from it starts with the definitions already loaded
+rather than reconstructing them from user code.
+"""
+
+import logging
+import os
+
+from dagster._core.executor.multiprocess import PRELOAD_JOB_PATH_ENV_VAR
+
+
+def preload_job_definition(path: str) -> None:
+    from dagster._core.definitions.reconstruct import ReconstructableJob
+    from dagster._serdes import deserialize_value
+
+    with open(path, encoding="utf8") as f:
+        recon_job = deserialize_value(f.read(), ReconstructableJob)
+
+    recon_job.repository.preload_definition()
+    # also resolve the job itself, e.g. build its asset job, before step processes are forked
+    recon_job.get_definition()
+
+
+_preload_job_path = os.getenv(PRELOAD_JOB_PATH_ENV_VAR)
+if _preload_job_path:
+    try:
+        preload_job_definition(_preload_job_path)
+    except Exception:
+        # step processes fall back to reconstructing the definitions themselves
+        logging.getLogger("dagster").warning(
+            "Failed to preload job definitions in the forkserver process.", exc_info=True
+        )
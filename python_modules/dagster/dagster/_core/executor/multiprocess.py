@@ -1,9 +1,10 @@
 import multiprocessing
 import os
 import sys
+import tempfile
 import threading
 from collections.abc import Iterator, Mapping, Sequence
-from contextlib import ExitStack
+from contextlib import ExitStack, contextmanager
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
 from typing import TYPE_CHECKING, Any, Optional
@@ -18,7 +19,11 @@
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import (
+    create_execution_plan,
+    execute_plan_iterator,
+    load_job_definition_in_worker,
+)
 from dagster._core.execution.context.system import IStepContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.plan.active import ActiveExecution
@@ -27,6 +32,7 @@
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.plan.step import ExecutionStep
 from dagster._core.execution.retries import RetryMode
+from dagster._core.execution.run_tracing import run_tracing_scope
 from dagster._core.executor.base import Executor
 from dagster._core.executor.child_process_executor import (
     ChildProcessCommand,
@@ -36,7 +42,9 @@
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
+from dagster._serdes import serialize_value
 from dagster._utils import get_run_crash_explanation, start_termination_thread
+from dagster._utils.env import environ
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
 
@@ -46,6 +54,9 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+# read by dagster._core.executor.forkserver_preload in the forkserver process
+PRELOAD_JOB_PATH_ENV_VAR = "DAGSTER_FORKSERVER_PRELOAD_JOB_PATH"
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -73,39 +84,46 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
-            try:
-                log_manager = create_context_free_log_manager(instance, self.dagster_run)
-
-                yield DagsterEvent.step_worker_started(
-                    log_manager,
-                    self.dagster_run.job_name,
-                    message=f'Executing step "{self.step_key}" in subprocess.',
-                    metadata={
-                        "pid": MetadataValue.text(str(os.getpid())),
-                    },
-                    step_key=self.step_key,
-                )
-                execution_plan = create_execution_plan(
-                    job=recon_job,
-                    run_config=self.run_config,
-                    step_keys_to_execute=[self.step_key],
-                    known_state=self.known_state,
-                    repository_load_data=self.repository_load_data,
-                )
-                yield from execute_plan_iterator(
-                    execution_plan,
-                    recon_job,
-                    self.dagster_run,
-                    run_config=self.run_config,
-                    retry_mode=self.retry_mode.for_inner_plan(),
-                    instance=instance,
-                )
-            finally:
-                # set events to stop the termination thread on exit
-                done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+            with run_tracing_scope(instance, self.dagster_run, self.step_key):
+                done_event = threading.Event()
+                start_termination_thread(self.term_event, done_event)
+                try:
+                    log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+                    yield DagsterEvent.step_worker_started(
+                        log_manager,
+                        self.dagster_run.job_name,
+                        message=f'Executing step "{self.step_key}" in subprocess.',
+                        metadata={
+                            "pid": MetadataValue.text(str(os.getpid())),
+                        },
+                        step_key=self.step_key,
+                    )
+                    if self.repository_load_data is not None:
+                        recon_job = recon_job.with_repository_load_data(self.repository_load_data)
+                    yield load_job_definition_in_worker(
+                        recon_job, instance, self.dagster_run, self.step_key
+                    )
+
+                    execution_plan = create_execution_plan(
+                        job=recon_job,
+                        run_config=self.run_config,
+                        step_keys_to_execute=[self.step_key],
+                        known_state=self.known_state,
+                        repository_load_data=self.repository_load_data,
+                    )
+                    yield from execute_plan_iterator(
+                        execution_plan,
+                        recon_job,
+                        self.dagster_run,
+                        run_config=self.run_config,
+                        retry_mode=self.retry_mode.for_inner_plan(),
+                        instance=instance,
+                    )
+                finally:
+                    # set events to stop the termination thread on exit
+                    done_event.set()  # waiting on term_event so set done first
+                    self.term_event.set()
 
 
 class MultiprocessExecutor(Executor):
@@ -116,6 +134,7 @@ def __init__(
         tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        preload_definitions: bool = False,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -141,6 +160,7 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._preload_definitions = check.bool_param(preload_definitions, "preload_definitions")
 
     @property
     def retries(self) -> RetryMode:
@@ -174,6 +194,9 @@ def execute(
             if "dagster._core.executor.multiprocess" not in preload:
                 preload = ["dagster._core.executor.multiprocess", *preload]
 
+            if self._preload_definitions:
+                preload = [*preload, "dagster._core.executor.forkserver_preload"]
+
             multiproc_ctx.set_forkserver_preload(list(preload))
 
         limit = self._max_concurrent
@@ -191,6 +214,15 @@ def execute(
         with ExitStack() as stack:
             timer_result = stack.enter_context(time_execution_scope())
 
+            if self._start_method == "forkserver" and self._preload_definitions:
+                stack.enter_context(
+                    _start_forkserver_with_preloaded_job(
+                        job.with_repository_load_data(execution_plan.repository_load_data)
+                        if execution_plan.repository_load_data is not None
+                        else job
+                    )
+                )
+
             instance_concurrency_context = stack.enter_context(
                 InstanceConcurrencyContext(plan_context.instance, plan_context.dagster_run)
             )
@@ -402,3 +434,25 @@ def execute_step_out_of_process(
             processes[step.key] = ret
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+@contextmanager
+def _start_forkserver_with_preloaded_job(recon_job: ReconstructableJob) -> Iterator[None]:
+    """Starts the forkserver process, which will load the definitions of the job before it forks any
+    step process. Has no effect if the forkserver process of this process is already running.
+    """
+    from multiprocessing import forkserver
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # the job is passed in a file rather than the environment since its repository load data
+        # can exceed the size limit of an environment variable
+        path = os.path.join(temp_dir, "job.json")
+        with open(path, "w", encoding="utf8") as f:
+            f.write(serialize_value(recon_job))
+
+        with environ({PRELOAD_JOB_PATH_ENV_VAR: path}):
+            forkserver.ensure_running()
+
+        # the forkserver process reads the file before it accepts the first request to fork a
+        # step process, so the file must exist until then
+        yield
@@ -6,7 +6,7 @@
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from enum import Enum
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -46,6 +46,7 @@
     DagsterRunConflict,
 )
 from dagster._core.execution.retries import auto_reexecution_should_retry_run
+from dagster._core.execution.run_tracing import trace_span
 from dagster._core.instance.config import (
     DAGSTER_CONFIG_YAML_FILENAME,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
@@ -171,14 +172,17 @@
         EventLogRecord,
         EventRecordsFilter,
         EventRecordsResult,
+        LatestAssetPartitionEvents,
         PlannedMaterializationInfo,
     )
     from dagster._core.storage.partition_status_cache import (
         AssetPartitionStatus,
         AssetStatusCacheValue,
     )
+    from dagster._core.storage.prepared_queries import QueryLatencyStats
     from dagster._core.storage.root import LocalArtifactStorage
     from dagster._core.storage.runs import RunStorage
+    from dagster._core.storage.runs.base import RunsFeedEntry
     from dagster._core.storage.schedules import ScheduleStorage
     from dagster._core.storage.sql import AlembicVersion
     from dagster._core.workspace.context import BaseWorkspaceRequestContext
@@ -949,6 +953,18 @@ def auto_materialize_respect_materialization_data_versions(self) -> bool:
             "respect_materialization_data_versions", False
         )
 
+    @property
+    def auto_materialize_incremental_evaluation(self) -> bool:
+        return self.get_settings("auto_materialize").get("incremental_evaluation", False)
+
+    @property
+    def auto_materialize_use_entity_cursor_storage(self) -> bool:
+        return self.get_settings("auto_materialize").get("use_entity_cursor_storage", False)
+
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> int:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers", 1)
+
     @property
     def auto_materialize_max_tick_retries(self) -> int:
         return self.get_settings("auto_materialize").get("max_tick_retries", 3)
@@ -1864,6 +1880,12 @@ def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartiti
         """Get run partition data for a given partitioned job."""
         return self._run_storage.get_run_partition_data(runs_filter)
 
+    def get_run_storage_query_latency_stats(self) -> Mapping[str, "QueryLatencyStats"]:
+        """Get the latency recorded for each named query executed by the run storage in this
+        process, keyed by query name.
+        """
+        return self._run_storage.get_query_latency_stats()
+
     def wipe(self) -> None:
         self._run_storage.wipe()
         self._event_storage.wipe()
@@ -2302,6 +2324,18 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    @traced
+    def get_latest_asset_partition_events(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: "DagsterEventType",
+    ) -> Mapping[AssetKey, "LatestAssetPartitionEvents"]:
+        """Fetch the latest event of the given type for each partition of each of the given assets.
+
+        Returns a mapping from each asset key to its latest events, which may be empty.
+        """
+        return self._event_storage.get_latest_asset_partition_events(asset_keys, event_type)
+
     @traced
     def get_latest_planned_materialization_info(
         self,
@@ -2447,23 +2481,7 @@ def handle_new_event(
             else:
                 return
 
-        if len(events) == 1:
-            self._event_storage.store_event(events[0])
-        else:
-            try:
-                self._event_storage.store_event_batch(events)
-
-            # Fall back to storing events one by one if writing a batch fails. We catch a generic
-            # Exception because that is the parent class of the actually received error,
-            # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
-            # it living in a cloud package.
-            except Exception as e:
-                sys.stderr.write(f"Exception while storing event batch: {e}\n")
-                sys.stderr.write(
-                    "Falling back to storing multiple single-event storage requests...\n"
-                )
-                for event in events:
-                    self._event_storage.store_event(event)
+        self._store_events(events)
 
         for event in events:
             run_id = event.run_id
@@ -2493,6 +2511,29 @@ def handle_new_event(
             for sub in self._subscribers[run_id]:
                 sub(event)
 
+    def _store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        with trace_span("store_event", events=str(len(events))):
+            self._store_events_inner(events)
+
+    def _store_events_inner(self, events: Sequence["EventLogEntry"]) -> None:
+        if len(events) == 1:
+            self._event_storage.store_event(events[0])
+        else:
+            try:
+                self._event_storage.store_event_batch(events)
+
+            # Fall back to storing events one by one if writing a batch fails. We catch a generic
+            # Exception because that is the parent class of the actually received error,
+            # dagster_cloud_cli.core.errors.GraphQLStorageError, which we cannot import here due to
+            # it living in a cloud package.
+            except Exception as e:
+                sys.stderr.write(f"Exception while storing event batch: {e}\n")
+                sys.stderr.write(
+                    "Falling back to storing multiple single-event storage requests...\n"
+                )
+                for event in events:
+                    self._event_storage.store_event(event)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
@@ -3155,6 +3196,29 @@ def add_backfill(self, partition_backfill: "PartitionBackfill") -> None:
     def update_backfill(self, partition_backfill: "PartitionBackfill") -> None:
         self._run_storage.update_backfill(partition_backfill)
 
+    def iter_runs_feed_entries(
+        self,
+        runs_filter: Optional["RunsFilter"],
+        backfills_filter: Optional["BulkActionsFilter"],
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+        max_creation_timestamp: Optional[float] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator["RunsFeedEntry"]:
+        """Iterate over the runs and backfills matching the given filters, newest first, reading
+        them from run storage a page at a time.
+        """
+        from dagster._core.storage.runs.base import RUNS_FEED_PAGE_SIZE
+
+        return self._run_storage.iter_runs_feed_entries(
+            runs_filter,
+            backfills_filter,
+            run_cursor=run_cursor,
+            backfill_cursor=backfill_cursor,
+            max_creation_timestamp=max_creation_timestamp,
+            page_size=page_size or RUNS_FEED_PAGE_SIZE,
+        )
+
     @property
     def should_start_background_run_thread(self) -> bool:
         """Gate on an experimental feature to start a thread that monitors for if the run should be canceled."""
@@ -3262,6 +3326,58 @@ def report_runless_asset_event(
         asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
     ):
         """Record an event log entry related to assets that does not belong to a Dagster run."""
+        return self.report_dagster_event(
+            run_id=RUNLESS_RUN_ID,
+            dagster_event=self._runless_asset_dagster_event(asset_event),
+        )
+
+    def report_runless_asset_events(
+        self,
+        asset_events: Sequence[
+            Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"]
+        ],
+    ) -> None:
+        """Record event log entries related to assets that do not belong to a Dagster run.
+        Consecutive materializations and observations are written to storage in a single batch.
+        """
+        from dagster._core.events import BATCH_WRITABLE_EVENTS
+        from dagster._core.events.log import EventLogEntry
+
+        entries = [
+            EventLogEntry(
+                user_message="",
+                level=logging.INFO,
+                job_name=RUNLESS_JOB_NAME,
+                run_id=RUNLESS_RUN_ID,
+                error_info=None,
+                timestamp=get_current_timestamp(),
+                step_key=None,
+                dagster_event=self._runless_asset_dagster_event(asset_event),
+            )
+            for asset_event in asset_events
+        ]
+
+        # preserve the order of events in storage, batching runs of batch writable events
+        batch: list[EventLogEntry] = []
+        for entry in entries:
+            if entry.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS:
+                batch.append(entry)
+                continue
+            if batch:
+                self._store_events(batch)
+                batch = []
+            self._event_storage.store_event(entry)
+        if batch:
+            self._store_events(batch)
+
+        for entry in entries:
+            for sub in self._subscribers[RUNLESS_RUN_ID]:
+                sub(entry)
+
+    def _runless_asset_dagster_event(
+        self,
+        asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
+    ) -> "DagsterEvent":
         from dagster._core.events import (
             AssetMaterialization,
             AssetObservationData,
@@ -3285,13 +3401,10 @@ def report_runless_asset_event(
                 " AssetMaterialization, AssetObservation or AssetCheckEvaluation"
             )
 
-        return self.report_dagster_event(
-            run_id=RUNLESS_RUN_ID,
-            dagster_event=DagsterEvent(
-                event_type_value=event_type_value,
-                event_specific_data=data_payload,
-                job_name=RUNLESS_JOB_NAME,
-            ),
+        return DagsterEvent(
+            event_type_value=event_type_value,
+            event_specific_data=data_payload,
+            job_name=RUNLESS_JOB_NAME,
         )
 
     def get_asset_check_support(self) -> "AssetCheckInstanceSupport":
@@ -413,6 +413,30 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "minimum_interval_seconds": Field(IntSource, is_required=False),
                 "run_tags": Field(dict, is_required=False),
                 "respect_materialization_data_versions": Field(BoolSource, is_required=False),
+                "incremental_evaluation": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Skip evaluating entities whose inputs have not changed since their"
+                        " previous evaluation"
+                    ),
+                ),
+                "use_entity_cursor_storage": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Store the cursor of each entity in its own row, so that only changed"
+                        " cursors are written on each tick"
+                    ),
+                ),
+                "num_evaluation_workers": Field(
+                    IntSource,
+                    is_required=False,
+                    description=(
+                        "Number of threads to use for evaluating the conditions of assets and"
+                        " checks within the same topological level in parallel"
+                    ),
+                ),
                 "max_tick_retries": Field(
                     IntSource,
                     default_value=3,
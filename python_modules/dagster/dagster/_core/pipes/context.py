@@ -50,10 +50,12 @@
     has_one_dimension_time_window_partitioning,
 )
 from dagster._core.errors import DagsterInvariantViolationError, DagsterPipesExecutionError
-from dagster._core.events import EngineEventData
+from dagster._core.events import DagsterEventBatchMetadata, EngineEventData, generate_event_batch_id
 from dagster._core.execution.context.asset_execution_context import AssetExecutionContext
 from dagster._core.execution.context.invocation import BaseDirectExecutionContext
 from dagster._core.execution.context.op_execution_context import OpExecutionContext
+from dagster._core.log_manager import LOG_RECORD_EVENT_BATCH_METADATA_ATTR
+from dagster._core.utils import coerce_valid_log_level
 from dagster._utils.error import (
     ExceptionInfo,
     SerializableErrorInfo,
@@ -234,6 +236,58 @@ def handle_message(self, message: PipesMessage) -> None:
         else:
             raise DagsterPipesExecutionError(f"Unknown message method: {message['method']}")
 
+    def handle_message_batch(self, messages: Sequence[PipesMessage]) -> None:
+        """Process a batch of messages in the order they were received.
+
+        Consecutive log messages with the same level are coalesced into a single log entry, and
+        each run of log entries is written to the event log as one batch.
+        """
+        log_messages: list[PipesMessage] = []
+        for message in messages:
+            if message["method"] == "log" and not self._received_closed_msg:
+                log_messages.append(message)
+            else:
+                self._handle_log_batch(log_messages)
+                log_messages = []
+                self.handle_message(message)
+        self._handle_log_batch(log_messages)
+
+    def _handle_log_batch(self, messages: Sequence[PipesMessage]) -> None:
+        if not messages:
+            return
+        elif len(messages) == 1:
+            self._handle_log(**messages[0]["params"])  # type: ignore
+            return
+
+        coalesced: list[tuple[int, list[str]]] = []
+        for message in messages:
+            params = cast(Mapping[str, Any], message["params"])
+            text = check.str_param(params["message"], "message")
+            level = coerce_valid_log_level(params.get("level", "info"))
+            if coalesced and coalesced[-1][0] == level:
+                coalesced[-1][1].append(text)
+            else:
+                coalesced.append((level, [text]))
+
+        # Only records that pass the level filter reach the event log, so the end of the batch
+        # must be marked on the last of those for the buffered records to be flushed.
+        entries = [
+            (level, "\n".join(texts))
+            for level, texts in coalesced
+            if self._context.log.isEnabledFor(level)
+        ]
+        batch_id = generate_event_batch_id()
+        for i, (level, text) in enumerate(entries):
+            self._context.log.log(
+                level,
+                text,
+                extra={
+                    LOG_RECORD_EVENT_BATCH_METADATA_ATTR: DagsterEventBatchMetadata(
+                        batch_id, i == len(entries) - 1
+                    )
+                },
+            )
+
     def _handle_opened(self, opened_payload: PipesOpenedData) -> None:
         self._received_opened_msg = True
         self._context.log.info("[pipes] external process successfully opened dagster pipes.")
@@ -17,6 +17,7 @@
     PipesDefaultContextLoader,
     PipesDefaultMessageWriter,
     PipesExtras,
+    PipesMessage,
     PipesOpenedData,
     PipesParams,
 )
@@ -33,7 +34,7 @@
     PipesSession,
     build_external_execution_context_data,
 )
-from dagster._utils import tail_file
+from dagster._utils import tail_file_batches
 
 TCursor = TypeVar("TCursor")
 
@@ -189,9 +190,8 @@ def read_messages(
 
     def _reader_thread(self, handler: "PipesMessageHandler", is_resource_complete: Event) -> None:
         try:
-            for line in tail_file(self._path, lambda: is_resource_complete.is_set()):
-                message = json.loads(line)
-                handler.handle_message(message)
+            for lines in tail_file_batches(self._path, lambda: is_resource_complete.is_set()):
+                handler.handle_message_batch(_decode_message_batch(lines))
         except:
             handler.report_pipes_framework_exception(
                 f"{self.__class__.__name__} reader thread",
@@ -412,13 +412,9 @@ def _messages_thread(
                         result = self.download_messages(cursor, params)
                         if result is not None:
                             cursor, chunk = result
-                            for line in chunk.split("\n"):
-                                try:
-                                    message = json.loads(line)
-                                    if PIPES_PROTOCOL_VERSION_FIELD in message.keys():
-                                        handler.handle_message(message)
-                                except json.JSONDecodeError:
-                                    pass
+                            handler.handle_message_batch(
+                                _decode_message_batch(chunk.split("\n"), skip_invalid=True)
+                            )
 
                 time.sleep(DEFAULT_SLEEP_INTERVAL)
 
@@ -666,6 +662,43 @@ def _reader_thread(
                 time.sleep(self.interval)
 
 
+def _decode_message_batch(
+    lines: Sequence[str], skip_invalid: bool = False
+) -> Sequence[PipesMessage]:
+    """Decode a batch of newline-delimited pipes messages.
+
+    The whole batch is decoded with a single `json.loads` call. If that fails, lines are decoded
+    one at a time so that the offending line is either skipped (`skip_invalid`) or raises.
+    """
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return []
+
+    try:
+        messages = json.loads("[" + ",".join(lines) + "]")
+        # a line holding several comma-separated values would still decode, but misaligned
+        if len(messages) != len(lines):
+            raise json.JSONDecodeError("Unexpected number of messages", "", 0)
+    except json.JSONDecodeError:
+        if not skip_invalid:
+            messages = [json.loads(line) for line in lines]
+        else:
+            messages = []
+            for line in lines:
+                try:
+                    messages.append(json.loads(line))
+                except json.JSONDecodeError:
+                    pass
+
+    if skip_invalid:
+        return [
+            message
+            for message in messages
+            if isinstance(message, dict) and PIPES_PROTOCOL_VERSION_FIELD in message
+        ]
+    return messages
+
+
 def _join_thread(thread: Thread, thread_name: str) -> None:
     thread.join(timeout=THREAD_WAIT_TIMEOUT)
     if thread.is_alive():
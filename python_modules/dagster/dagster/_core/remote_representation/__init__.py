@@ -6,56 +6,120 @@
 that have been persisted. e.g. HistoricalPipeline
 """
 
-from dagster._core.remote_representation.external import (
-    RemoteExecutionPlan as RemoteExecutionPlan,
-    RemoteJob as RemoteJob,
-    RemotePartitionSet as RemotePartitionSet,
-    RemoteRepository as RemoteRepository,
-    RemoteSchedule as RemoteSchedule,
-    RemoteSensor as RemoteSensor,
-)
-from dagster._core.remote_representation.external_data import (
-    ExecutionParamsErrorSnap as ExecutionParamsErrorSnap,
-    ExecutionParamsSnap as ExecutionParamsSnap,
-    JobDataSnap as JobDataSnap,
-    JobRefSnap as JobRefSnap,
-    PartitionConfigSnap as PartitionConfigSnap,
-    PartitionExecutionErrorSnap as PartitionExecutionErrorSnap,
-    PartitionNamesSnap as PartitionNamesSnap,
-    PartitionSetExecutionParamSnap as PartitionSetExecutionParamSnap,
-    PartitionSetSnap as PartitionSetSnap,
-    PartitionTagsSnap as PartitionTagsSnap,
-    PresetSnap as PresetSnap,
-    RemoteJobSubsetResult as RemoteJobSubsetResult,
-    RepositoryErrorSnap as RepositoryErrorSnap,
-    RepositorySnap as RepositorySnap,
-    ScheduleExecutionErrorSnap as ScheduleExecutionErrorSnap,
-    ScheduleSnap as ScheduleSnap,
-    SensorExecutionErrorSnap as SensorExecutionErrorSnap,
-    SensorSnap as SensorSnap,
-    TargetSnap as TargetSnap,
-)
-from dagster._core.remote_representation.handle import (
-    JobHandle as JobHandle,
-    RepositoryHandle as RepositoryHandle,
-)
-from dagster._core.remote_representation.historical import HistoricalJob as HistoricalJob
-from dagster._core.remote_representation.origin import (
-    IN_PROCESS_NAME as IN_PROCESS_NAME,
-    CodeLocationOrigin as CodeLocationOrigin,
-    GrpcServerCodeLocationOrigin as GrpcServerCodeLocationOrigin,
-    InProcessCodeLocationOrigin as InProcessCodeLocationOrigin,
-    ManagedGrpcPythonEnvCodeLocationOrigin as ManagedGrpcPythonEnvCodeLocationOrigin,
-    RemoteInstigatorOrigin as RemoteInstigatorOrigin,
-    RemoteJobOrigin as RemoteJobOrigin,
-    RemoteRepositoryOrigin as RemoteRepositoryOrigin,
-)
-
-# ruff: isort: split
-from dagster._core.remote_representation.code_location import (
-    CodeLocation as CodeLocation,
-    GrpcServerCodeLocation as GrpcServerCodeLocation,
-    InProcessCodeLocation as InProcessCodeLocation,
-)
-from dagster._core.remote_representation.job_index import JobIndex as JobIndex
-from dagster._core.remote_representation.represented import RepresentedJob as RepresentedJob
+import importlib
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Final
+
+# As in `dagster._core.definitions`, the symbols re-exported here are imported on first access, so
+# that importing one module of this subpackage does not import all of them. Every symbol imported
+# below must also be added to `_EXPORTS`.
+
+if TYPE_CHECKING:
+    from dagster._core.remote_representation.code_location import (
+        CodeLocation as CodeLocation,
+        GrpcServerCodeLocation as GrpcServerCodeLocation,
+        InProcessCodeLocation as InProcessCodeLocation,
+    )
+    from dagster._core.remote_representation.external import (
+        RemoteExecutionPlan as RemoteExecutionPlan,
+        RemoteJob as RemoteJob,
+        RemotePartitionSet as RemotePartitionSet,
+        RemoteRepository as RemoteRepository,
+        RemoteSchedule as RemoteSchedule,
+        RemoteSensor as RemoteSensor,
+    )
+    from dagster._core.remote_representation.external_data import (
+        ExecutionParamsErrorSnap as ExecutionParamsErrorSnap,
+        ExecutionParamsSnap as ExecutionParamsSnap,
+        JobDataSnap as JobDataSnap,
+        JobRefSnap as JobRefSnap,
+        PartitionConfigSnap as PartitionConfigSnap,
+        PartitionExecutionErrorSnap as PartitionExecutionErrorSnap,
+        PartitionNamesSnap as PartitionNamesSnap,
+        PartitionSetExecutionParamSnap as PartitionSetExecutionParamSnap,
+        PartitionSetSnap as PartitionSetSnap,
+        PartitionTagsSnap as PartitionTagsSnap,
+        PresetSnap as PresetSnap,
+        RemoteJobSubsetResult as RemoteJobSubsetResult,
+        RepositoryErrorSnap as RepositoryErrorSnap,
+        RepositorySnap as RepositorySnap,
+        ScheduleExecutionErrorSnap as ScheduleExecutionErrorSnap,
+        ScheduleSnap as ScheduleSnap,
+        SensorExecutionErrorSnap as SensorExecutionErrorSnap,
+        SensorSnap as SensorSnap,
+        TargetSnap as TargetSnap,
+    )
+    from dagster._core.remote_representation.handle import (
+        JobHandle as JobHandle,
+        RepositoryHandle as RepositoryHandle,
+    )
+    from dagster._core.remote_representation.historical import HistoricalJob as HistoricalJob
+    from dagster._core.remote_representation.job_index import JobIndex as JobIndex
+    from dagster._core.remote_representation.origin import (
+        IN_PROCESS_NAME as IN_PROCESS_NAME,
+        CodeLocationOrigin as CodeLocationOrigin,
+        GrpcServerCodeLocationOrigin as GrpcServerCodeLocationOrigin,
+        InProcessCodeLocationOrigin as InProcessCodeLocationOrigin,
+        ManagedGrpcPythonEnvCodeLocationOrigin as ManagedGrpcPythonEnvCodeLocationOrigin,
+        RemoteInstigatorOrigin as RemoteInstigatorOrigin,
+        RemoteJobOrigin as RemoteJobOrigin,
+        RemoteRepositoryOrigin as RemoteRepositoryOrigin,
+    )
+    from dagster._core.remote_representation.represented import RepresentedJob as RepresentedJob
+
+# Maps each re-exported symbol to the module in which it is defined.
+_EXPORTS: Final[Mapping[str, str]] = {
+    "RemoteExecutionPlan": "dagster._core.remote_representation.external",
+    "RemoteJob": "dagster._core.remote_representation.external",
+    "RemotePartitionSet": "dagster._core.remote_representation.external",
+    "RemoteRepository": "dagster._core.remote_representation.external",
+    "RemoteSchedule": "dagster._core.remote_representation.external",
+    "RemoteSensor": "dagster._core.remote_representation.external",
+    "ExecutionParamsErrorSnap": "dagster._core.remote_representation.external_data",
+    "ExecutionParamsSnap": "dagster._core.remote_representation.external_data",
+    "JobDataSnap": "dagster._core.remote_representation.external_data",
+    "JobRefSnap": "dagster._core.remote_representation.external_data",
+    "PartitionConfigSnap": "dagster._core.remote_representation.external_data",
+    "PartitionExecutionErrorSnap": "dagster._core.remote_representation.external_data",
+    "PartitionNamesSnap": "dagster._core.remote_representation.external_data",
+    "PartitionSetExecutionParamSnap": "dagster._core.remote_representation.external_data",
+    "PartitionSetSnap": "dagster._core.remote_representation.external_data",
+    "PartitionTagsSnap": "dagster._core.remote_representation.external_data",
+    "PresetSnap": "dagster._core.remote_representation.external_data",
+    "RemoteJobSubsetResult": "dagster._core.remote_representation.external_data",
+    "RepositoryErrorSnap": "dagster._core.remote_representation.external_data",
+    "RepositorySnap": "dagster._core.remote_representation.external_data",
+    "ScheduleExecutionErrorSnap": "dagster._core.remote_representation.external_data",
+    "ScheduleSnap": "dagster._core.remote_representation.external_data",
+    "SensorExecutionErrorSnap": "dagster._core.remote_representation.external_data",
+    "SensorSnap": "dagster._core.remote_representation.external_data",
+    "TargetSnap": "dagster._core.remote_representation.external_data",
+    "JobHandle": "dagster._core.remote_representation.handle",
+    "RepositoryHandle": "dagster._core.remote_representation.handle",
+    "HistoricalJob": "dagster._core.remote_representation.historical",
+    "IN_PROCESS_NAME": "dagster._core.remote_representation.origin",
+    "CodeLocationOrigin": "dagster._core.remote_representation.origin",
+    "GrpcServerCodeLocationOrigin": "dagster._core.remote_representation.origin",
+    "InProcessCodeLocationOrigin": "dagster._core.remote_representation.origin",
+    "ManagedGrpcPythonEnvCodeLocationOrigin": "dagster._core.remote_representation.origin",
+    "RemoteInstigatorOrigin": "dagster._core.remote_representation.origin",
+    "RemoteJobOrigin": "dagster._core.remote_representation.origin",
+    "RemoteRepositoryOrigin": "dagster._core.remote_representation.origin",
+    "CodeLocation": "dagster._core.remote_representation.code_location",
+    "GrpcServerCodeLocation": "dagster._core.remote_representation.code_location",
+    "InProcessCodeLocation": "dagster._core.remote_representation.code_location",
+    "JobIndex": "dagster._core.remote_representation.job_index",
+    "RepresentedJob": "dagster._core.remote_representation.represented",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> Sequence[str]:
+    return sorted({*globals(), *_EXPORTS.keys()})
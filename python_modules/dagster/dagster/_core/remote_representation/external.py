@@ -107,6 +107,15 @@ def __init__(
             }
             self._deferred_snapshots: bool = False
             self._ref_to_data_fn = None
+        elif repository_snap.job_snap_table is not None:
+            # job data snapshots are assembled from the shared table when each job is first loaded
+            job_snap_table = repository_snap.job_snap_table
+            self._job_map = {
+                job_name: job_snap_table.get_job_ref(job_name)
+                for job_name in job_snap_table.job_names
+            }
+            self._deferred_snapshots = True
+            self._ref_to_data_fn = lambda job_ref: job_snap_table.get_job_data(job_ref.name)
         elif repository_snap.job_refs is not None:
             self._job_map = {r.name: r for r in repository_snap.job_refs}
             self._deferred_snapshots = True
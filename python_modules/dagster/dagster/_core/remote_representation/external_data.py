@@ -4,13 +4,16 @@
 for that.
 """
 
+import base64
 import inspect
 import json
 import os
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from enum import Enum
+from functools import cached_property
 from typing import Any, Final, NamedTuple, Optional, Union, cast
 
 from typing_extensions import Self, TypeAlias
@@ -24,7 +27,12 @@
     ConfigurableResourceFactoryResourceDefinition,
 )
 from dagster._config.pythonic_config.resource import coerce_to_resource, is_coercible_to_resource
-from dagster._config.snap import ConfigFieldSnap, ConfigSchemaSnapshot, snap_from_config_type
+from dagster._config.snap import (
+    ConfigFieldSnap,
+    ConfigSchemaSnapshot,
+    ConfigTypeSnap,
+    snap_from_config_type,
+)
 from dagster._core.definitions import (
     AssetSelection,
     JobDefinition,
@@ -85,17 +93,20 @@
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.origin import RepositoryPythonOrigin
 from dagster._core.snap import JobSnap
+from dagster._core.snap.dagster_types import DagsterTypeNamespaceSnapshot, DagsterTypeSnap
 from dagster._core.snap.mode import ResourceDefSnap, build_resource_def_snap
+from dagster._core.snap.node import GraphDefSnap, NodeDefsSnapshot, OpDefSnap
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.storage.tags import COMPUTE_KIND_TAG
 from dagster._core.utils import is_valid_email
-from dagster._record import IHaveNew, record, record_custom
-from dagster._serdes import whitelist_for_serdes
+from dagster._record import IHaveNew, copy, record, record_custom
+from dagster._serdes import deserialize_value, serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import (
     FieldSerializer,
     get_prefix_for_a_serialized,
     is_whitelisted_for_serdes_object,
 )
+from dagster._serdes.utils import hash_str
 from dagster._time import datetime_from_timestamp
 from dagster._utils.error import SerializableErrorInfo
 from dagster._utils.warnings import suppress_dagster_warnings
@@ -120,6 +131,7 @@
         "job_datas": "external_pipeline_datas",
         "job_refs": "external_job_refs",
     },
+    skip_when_none_fields={"job_snap_table"},
 )
 @record_custom
 class RepositorySnap(IHaveNew):
@@ -130,6 +142,7 @@ class RepositorySnap(IHaveNew):
     asset_nodes: Sequence["AssetNodeSnap"]
     job_datas: Optional[Sequence["JobDataSnap"]]
     job_refs: Optional[Sequence["JobRefSnap"]]
+    job_snap_table: Optional["JobSnapTable"]
     resources: Optional[Sequence["ResourceSnap"]]
     asset_check_nodes: Optional[Sequence["AssetCheckNodeSnap"]]
     metadata: Optional[MetadataMapping]
@@ -148,6 +161,7 @@ def __new__(
         asset_check_nodes: Optional[Sequence["AssetCheckNodeSnap"]] = None,
         metadata: Optional[MetadataMapping] = None,
         utilized_env_vars: Optional[Mapping[str, Sequence["EnvVarConsumer"]]] = None,
+        job_snap_table: Optional["JobSnapTable"] = None,
     ):
         return super().__new__(
             cls,
@@ -162,6 +176,7 @@ def __new__(
             asset_check_nodes=asset_check_nodes,
             metadata=metadata or {},
             utilized_env_vars=utilized_env_vars,
+            job_snap_table=job_snap_table,
         )
 
     @classmethod
@@ -169,16 +184,22 @@ def from_def(
         cls,
         repository_def: RepositoryDefinition,
         defer_snapshots: bool = False,
+        share_job_snapshots: bool = False,
     ) -> Self:
         check.inst_param(repository_def, "repository_def", RepositoryDefinition)
 
         jobs = repository_def.get_all_jobs()
+        job_snap_table = None
         if defer_snapshots:
             job_datas = None
             job_refs = sorted(
                 [JobRefSnap.from_job_def(job) for job in jobs],
                 key=lambda pd: pd.name,
             )
+        elif share_job_snapshots:
+            job_datas = None
+            job_refs = None
+            job_snap_table = JobSnapTable.from_job_defs(jobs)
         else:
             job_datas = sorted(
                 list(
@@ -254,6 +275,7 @@ def from_def(
             asset_nodes=asset_node_snaps,
             job_datas=job_datas,
             job_refs=job_refs,
+            job_snap_table=job_snap_table,
             resources=sorted(
                 [
                     ResourceSnap.from_def(
@@ -282,9 +304,14 @@ def from_def(
         )
 
     def has_job_data(self):
-        return self.job_datas is not None
+        return self.job_datas is not None or self.job_snap_table is not None
 
     def get_job_datas(self) -> Sequence["JobDataSnap"]:
+        if self.job_snap_table is not None:
+            return [
+                self.job_snap_table.get_job_data(job_name)
+                for job_name in self.job_snap_table.job_names
+            ]
         if self.job_datas is None:
             check.failed("Snapshots were deferred, external_pipeline_data not loaded")
         return self.job_datas
@@ -296,6 +323,8 @@ def get_job_refs(self) -> Sequence["JobRefSnap"]:
 
     def get_job_snap(self, name):
         check.str_param(name, "name")
+        if self.job_snap_table is not None:
+            return self.get_job_data(name).job
         if self.job_datas is None:
             check.failed("Snapshots were deferred, external_pipeline_data not loaded")
 
@@ -307,6 +336,10 @@ def get_job_snap(self, name):
 
     def get_job_data(self, name):
         check.str_param(name, "name")
+        if self.job_snap_table is not None:
+            if not self.job_snap_table.has_job(name):
+                check.failed("Could not find external pipeline data named " + name)
+            return self.job_snap_table.get_job_data(name)
         if self.job_datas is None:
             check.failed("Snapshots were deferred, external_pipeline_data not loaded")
 
@@ -467,6 +500,181 @@ def from_job_def(cls, job_def: JobDefinition) -> Self:
         )
 
 
+@whitelist_for_serdes
+@record
+class SharedJobSnap:
+    """A JobSnap whose config type, Dagster type and node definition snapshots are stored in a
+    JobSnapTable, and referenced by their component ids.
+    """
+
+    snapshot_id: str
+    # the job snapshot, with empty config schema, Dagster type and node definition snapshots
+    job_snap: JobSnap
+    config_type_ids: Sequence[str]
+    dagster_type_ids: Sequence[str]
+    op_def_ids: Sequence[str]
+    graph_def_ids: Sequence[str]
+
+
+@whitelist_for_serdes
+@record
+class SharedJobDataSnap:
+    name: str
+    job: SharedJobSnap
+    active_presets: Sequence["PresetSnap"]
+    parent_job: Optional[SharedJobSnap]
+
+
+@whitelist_for_serdes
+@record
+class JobSnapTable:
+    """The job snapshots of a repository, with the config type, Dagster type and node definition
+    snapshots that are shared between its jobs stored once each.
+
+    Each component is stored compressed, keyed by a hash of its serialized form. Components are
+    decompressed and deserialized the first time that a job which uses them is loaded, and job data
+    snapshots are only assembled when they are requested.
+    """
+
+    job_datas: Sequence[SharedJobDataSnap]
+    compressed_components_by_id: Mapping[str, str]
+
+    @classmethod
+    def from_job_defs(cls, job_defs: Sequence[JobDefinition]) -> "JobSnapTable":
+        compressed_components_by_id: dict[str, str] = {}
+
+        def _component_id(snap: Any) -> str:
+            serialized = serialize_value(snap)
+            component_id = hash_str(serialized)
+            if component_id not in compressed_components_by_id:
+                compressed_components_by_id[component_id] = base64.b64encode(
+                    zlib.compress(serialized.encode())
+                ).decode()
+            return component_id
+
+        def _share(job_snap: JobSnap, snapshot_id: str) -> SharedJobSnap:
+            return SharedJobSnap(
+                snapshot_id=snapshot_id,
+                job_snap=copy(
+                    job_snap,
+                    config_schema_snapshot=ConfigSchemaSnapshot(all_config_snaps_by_key={}),
+                    dagster_type_namespace_snapshot=DagsterTypeNamespaceSnapshot({}),
+                    node_defs_snapshot=NodeDefsSnapshot(op_def_snaps=[], graph_def_snaps=[]),
+                ),
+                config_type_ids=[
+                    _component_id(snap)
+                    for snap in job_snap.config_schema_snapshot.all_config_snaps_by_key.values()
+                ],
+                dagster_type_ids=[
+                    _component_id(snap)
+                    for snap in job_snap.dagster_type_namespace_snapshot.all_dagster_type_snaps_by_key.values()
+                ],
+                op_def_ids=[
+                    _component_id(snap) for snap in job_snap.node_defs_snapshot.op_def_snaps
+                ],
+                graph_def_ids=[
+                    _component_id(snap) for snap in job_snap.node_defs_snapshot.graph_def_snaps
+                ],
+            )
+
+        job_datas = []
+        for job_def in sorted(job_defs, key=lambda job_def: job_def.name):
+            parent_job_snap = job_def.get_parent_job_snapshot()
+            job_datas.append(
+                SharedJobDataSnap(
+                    name=job_def.name,
+                    job=_share(job_def.get_job_snapshot(), job_def.get_job_snapshot_id()),
+                    active_presets=active_presets_from_job_def(job_def),
+                    parent_job=_share(parent_job_snap, parent_job_snap.snapshot_id)
+                    if parent_job_snap
+                    else None,
+                )
+            )
+
+        return cls(job_datas=job_datas, compressed_components_by_id=compressed_components_by_id)
+
+    @cached_property
+    def _job_datas_by_name(self) -> Mapping[str, SharedJobDataSnap]:
+        return {job_data.name: job_data for job_data in self.job_datas}
+
+    @cached_property
+    def _components_by_id(self) -> dict[str, Any]:
+        return {}
+
+    @cached_property
+    def _loaded_job_datas(self) -> dict[str, JobDataSnap]:
+        return {}
+
+    @property
+    def job_names(self) -> Sequence[str]:
+        return [job_data.name for job_data in self.job_datas]
+
+    def has_job(self, job_name: str) -> bool:
+        return job_name in self._job_datas_by_name
+
+    def get_job_ref(self, job_name: str) -> "JobRefSnap":
+        job_data = self._job_datas_by_name[job_name]
+        return JobRefSnap(
+            name=job_data.name,
+            snapshot_id=job_data.job.snapshot_id,
+            active_presets=job_data.active_presets,
+            parent_snapshot_id=job_data.parent_job.snapshot_id if job_data.parent_job else None,
+        )
+
+    def get_job_data(self, job_name: str) -> JobDataSnap:
+        # loading is idempotent, so concurrent loads of the same job or component are harmless
+        if job_name not in self._loaded_job_datas:
+            job_data = self._job_datas_by_name[job_name]
+            self._loaded_job_datas[job_name] = JobDataSnap(
+                name=job_data.name,
+                job=self._load_job_snap(job_data.job),
+                active_presets=job_data.active_presets,
+                parent_job=self._load_job_snap(job_data.parent_job)
+                if job_data.parent_job
+                else None,
+            )
+        return self._loaded_job_datas[job_name]
+
+    def _load_component(self, component_id: str, as_type: Any) -> Any:
+        if component_id not in self._components_by_id:
+            self._components_by_id[component_id] = deserialize_value(
+                zlib.decompress(
+                    base64.b64decode(self.compressed_components_by_id[component_id])
+                ).decode(),
+                as_type,
+            )
+        return self._components_by_id[component_id]
+
+    def _load_job_snap(self, shared_job_snap: SharedJobSnap) -> JobSnap:
+        config_type_snaps = [
+            self._load_component(component_id, ConfigTypeSnap)
+            for component_id in shared_job_snap.config_type_ids
+        ]
+        dagster_type_snaps = [
+            self._load_component(component_id, DagsterTypeSnap)
+            for component_id in shared_job_snap.dagster_type_ids
+        ]
+        return copy(
+            shared_job_snap.job_snap,
+            config_schema_snapshot=ConfigSchemaSnapshot(
+                all_config_snaps_by_key={snap.key: snap for snap in config_type_snaps}
+            ),
+            dagster_type_namespace_snapshot=DagsterTypeNamespaceSnapshot(
+                {snap.key: snap for snap in dagster_type_snaps}
+            ),
+            node_defs_snapshot=NodeDefsSnapshot(
+                op_def_snaps=[
+                    self._load_component(component_id, OpDefSnap)
+                    for component_id in shared_job_snap.op_def_ids
+                ],
+                graph_def_snaps=[
+                    self._load_component(component_id, GraphDefSnap)
+                    for component_id in shared_job_snap.graph_def_ids
+                ],
+            ),
+        )
+
+
 @whitelist_for_serdes(
     storage_name="ExternalScheduleData",
     storage_field_names={"job_name": "pipeline_name", "op_selection": "solid_selection"},
@@ -0,0 +1,74 @@
+"""add indexes for paginating the runs feed
+
+Revision ID: 3c1d9e2a7f40
+Revises: 6b7fb194ff9c
+Create Date: 2026-10-19 14:02:11.318204
+
+"""
+
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+
+# revision identifiers, used by Alembic.
+revision = "3c1d9e2a7f40"
+down_revision = "6b7fb194ff9c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if has_table("runs"):
+        if not has_index("runs", "idx_runs_feed"):
+            op.create_index(
+                "idx_runs_feed",
+                "runs",
+                ["backfill_id", "create_timestamp", "id"],
+                unique=False,
+                postgresql_concurrently=True,
+                mysql_length={"backfill_id": 255},
+            )
+        if not has_index("runs", "idx_runs_by_create_timestamp"):
+            op.create_index(
+                "idx_runs_by_create_timestamp",
+                "runs",
+                ["create_timestamp", "id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+    if has_table("bulk_actions"):
+        if not has_index("bulk_actions", "idx_bulk_actions_by_timestamp"):
+            op.create_index(
+                "idx_bulk_actions_by_timestamp",
+                "bulk_actions",
+                ["timestamp", "id"],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+    if has_table("backfill_tags"):
+        if not has_index("backfill_tags", "idx_backfill_tags_key_value"):
+            op.create_index(
+                "idx_backfill_tags_key_value",
+                "backfill_tags",
+                ["key", "value", "backfill_id"],
+                unique=False,
+                postgresql_concurrently=True,
+                mysql_length={"key": 64, "value": 64, "backfill_id": 255},
+            )
+
+
+def downgrade():
+    if has_table("runs"):
+        if has_index("runs", "idx_runs_feed"):
+            op.drop_index("idx_runs_feed", "runs", postgresql_concurrently=True)
+        if has_index("runs", "idx_runs_by_create_timestamp"):
+            op.drop_index("idx_runs_by_create_timestamp", "runs", postgresql_concurrently=True)
+    if has_table("bulk_actions"):
+        if has_index("bulk_actions", "idx_bulk_actions_by_timestamp"):
+            op.drop_index(
+                "idx_bulk_actions_by_timestamp", "bulk_actions", postgresql_concurrently=True
+            )
+    if has_table("backfill_tags"):
+        if has_index("backfill_tags", "idx_backfill_tags_key_value"):
+            op.drop_index(
+                "idx_backfill_tags_key_value", "backfill_tags", postgresql_concurrently=True
+            )
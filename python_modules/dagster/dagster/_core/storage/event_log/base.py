@@ -185,6 +185,37 @@ class PlannedMaterializationInfo(NamedTuple):
     run_id: str
 
 
+class LatestAssetPartitionEvents(NamedTuple):
+    """Internal representation of the latest event of a given type for each partition of an asset,
+    stored as parallel columns rather than as a record per partition. Columns are ordered by
+    storage id.
+
+    Users should not invoke this class directly.
+    """
+
+    asset_key: AssetKey
+    partition_keys: Sequence[str]
+    storage_ids: Sequence[int]
+    timestamps: Sequence[float]
+    run_ids: Sequence[str]
+    data_versions: Sequence[Optional[str]]
+
+    @staticmethod
+    def empty(asset_key: AssetKey) -> "LatestAssetPartitionEvents":
+        return LatestAssetPartitionEvents(
+            asset_key=asset_key,
+            partition_keys=[],
+            storage_ids=[],
+            timestamps=[],
+            run_ids=[],
+            data_versions=[],
+        )
+
+    @property
+    def storage_id_by_partition(self) -> Mapping[str, int]:
+        return dict(zip(self.partition_keys, self.storage_ids))
+
+
 class EventLogStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance]):
     """Abstract base class for storing structured event logs from pipeline runs.
 
@@ -476,6 +507,45 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_asset_partition_events(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, LatestAssetPartitionEvents]:
+        """Fetch the latest event of the given type for each partition of each of the given assets.
+
+        Returns a mapping from each asset key to its latest events, which may be empty.
+        """
+        latest_events_by_key = {}
+        for asset_key in asset_keys:
+            storage_id_by_partition = self.get_latest_storage_id_by_partition(asset_key, event_type)
+            records_filter = AssetRecordsFilter(
+                asset_key=asset_key, storage_ids=list(storage_id_by_partition.values())
+            )
+            if event_type == DagsterEventType.ASSET_OBSERVATION:
+                fetch_fn = self.fetch_observations
+            else:
+                fetch_fn = self.fetch_materializations
+            records = (
+                fetch_fn(records_filter, limit=len(storage_id_by_partition), ascending=True).records
+                if storage_id_by_partition
+                else []
+            )
+            latest_events_by_key[asset_key] = LatestAssetPartitionEvents(
+                asset_key=asset_key,
+                partition_keys=[check.not_none(record.partition_key) for record in records],
+                storage_ids=[record.storage_id for record in records],
+                timestamps=[record.timestamp for record in records],
+                run_ids=[record.run_id for record in records],
+                data_versions=[
+                    record.asset_event.tags.get(DATA_VERSION_TAG)
+                    if record.asset_event and record.asset_event.tags
+                    else None
+                    for record in records
+                ],
+            )
+        return latest_events_by_key
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
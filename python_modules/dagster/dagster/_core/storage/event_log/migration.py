@@ -1,3 +1,4 @@
+from functools import partial
 from typing import NamedTuple
 
 import sqlalchemy as db
@@ -6,6 +7,11 @@
 from dagster._core.assets import AssetDetails
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._serdes.compression import (
+    compress_serialized_value,
+    decompress_serialized_value,
+    is_compressed_value,
+)
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import datetime_from_timestamp
 
@@ -36,6 +42,68 @@ def migrate_event_log_data(instance=None):
             event_log_storage.update_event_log_record(record.storage_id, record.event_log_entry)
 
 
+def reencode_event_log_data(instance, print_fn=None, batch_size=1000):
+    """Utility method to rewrite the events stored in the event log in the encoding that new events
+    are written in, e.g. to compress existing events after setting DAGSTER_EVENT_LOG_COMPRESSION.
+    Events are read and rewritten in batches, so the instance can be used while this runs.
+    """
+    from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+    from dagster._core.storage.event_log.sql_event_log import (
+        SqlEventLogStorage,
+        should_compress_events,
+    )
+
+    event_log_storage = instance.event_log_storage
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    compress = should_compress_events()
+
+    shard_connections = [event_log_storage.index_connection]
+    if event_log_storage.is_run_sharded:
+        shard_connections.extend(
+            partial(event_log_storage.run_connection, run_id) for run_id in instance.get_run_ids()
+        )
+
+    if print_fn:
+        print_fn(f"{'Compressing' if compress else 'Decompressing'} stored events.")
+        shard_connections = tqdm(shard_connections)
+
+    num_reencoded = 0
+    for shard_connection in shard_connections:
+        cursor = -1
+        while True:
+            with shard_connection() as conn:
+                rows = conn.execute(
+                    db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                    .where(SqlEventLogStorageTable.c.id > cursor)
+                    .order_by(SqlEventLogStorageTable.c.id.asc())
+                    .limit(batch_size)
+                ).fetchall()
+                for record_id, event in rows:
+                    if is_compressed_value(event) == compress:
+                        continue
+                    conn.execute(
+                        SqlEventLogStorageTable.update()
+                        .where(SqlEventLogStorageTable.c.id == record_id)
+                        .values(
+                            event=(
+                                compress_serialized_value(event)
+                                if compress
+                                else decompress_serialized_value(event)
+                            )
+                        )
+                    )
+                    num_reencoded += 1
+
+            if len(rows) < batch_size:
+                break
+            cursor = rows[-1][0]
+
+    if print_fn:
+        print_fn(f"Rewrote {num_reencoded} events.")
+
+
 def migrate_asset_key_data(event_log_storage, print_fn=None):
     """Utility method to build an asset key index from the data in existing event log records.
     Takes in event_log_storage, and a print_fn to keep track of progress.
@@ -71,6 +71,7 @@
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
+    LatestAssetPartitionEvents,
     PlannedMaterializationInfo,
 )
 from dagster._core.storage.event_log.migration import (
@@ -97,6 +98,7 @@
     db_subquery,
 )
 from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes.compression import compress_serialized_value
 from dagster._serdes.errors import DeserializationError
 from dagster._serdes.serdes import deserialize_values
 from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
@@ -136,6 +138,13 @@ def enforce_max_records_limit(limit: int):
         )
 
 
+def should_compress_events() -> bool:
+    # Opt in to storing new events in the compressed format produced by `compress_serialized_value`.
+    # Compressed and uncompressed events can be read interchangeably, so this can be switched on or
+    # off at any time.
+    return str(os.getenv("DAGSTER_EVENT_LOG_COMPRESSION")).lower() in ("1", "true", "t")
+
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -198,6 +207,12 @@ def prepare_insert_event_batch(self, events: Sequence[EventLogEntry]) -> Any:
             [self._event_to_row(event) for event in events]
         )
 
+    def _serialize_event(self, event: EventLogEntry) -> str:
+        serialized = serialize_value(event)
+        if should_compress_events():
+            return compress_serialized_value(serialized)
+        return serialized
+
     def _event_to_row(self, event: EventLogEntry) -> dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
@@ -215,7 +230,7 @@ def _event_to_row(self, event: EventLogEntry) -> dict[str, Any]:
 
         return {
             "run_id": event.run_id,
-            "event": serialize_value(event),
+            "event": self._serialize_event(event),
             "dagster_event_type": dagster_event_type,
             "timestamp": self._event_insert_timestamp(event),
             "step_key": step_key,
@@ -793,7 +808,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=self._serialize_event(event),
                     dagster_event_type=dagster_event_type,
                     timestamp=self._event_insert_timestamp(event),
                     step_key=event.step_key,
@@ -1918,6 +1933,94 @@ def get_latest_storage_id_by_partition(
             latest_materialization_storage_id_by_partition[cast(str, row[0])] = cast(int, row[1])
         return latest_materialization_storage_id_by_partition
 
+    def get_latest_asset_partition_events(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, LatestAssetPartitionEvents]:
+        """Fetch the latest event of the given type for each partition of each of the given assets,
+        along with its data version, in a single query.
+
+        Returns a mapping from each asset key to its latest events, which may be empty.
+        """
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        if not asset_keys:
+            return {}
+
+        latest_event_ids_query = db_select(
+            [
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.partition,
+                db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+            ]
+        ).where(
+            db.and_(
+                SqlEventLogStorageTable.c.asset_key.in_(
+                    [asset_key.to_string() for asset_key in asset_keys]
+                ),
+                SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+            )
+        )
+        latest_event_ids_subquery = db_subquery(
+            self._add_assets_wipe_filter_to_query(
+                latest_event_ids_query, self._get_assets_details(asset_keys), asset_keys
+            ).group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition),
+            "latest_event_ids_subquery",
+        )
+        latest_events_query = (
+            db_select(
+                [
+                    latest_event_ids_subquery.c.asset_key,
+                    latest_event_ids_subquery.c.partition,
+                    latest_event_ids_subquery.c.id,
+                    SqlEventLogStorageTable.c.timestamp,
+                    SqlEventLogStorageTable.c.run_id,
+                    AssetEventTagsTable.c.value,
+                ]
+            )
+            .select_from(
+                latest_event_ids_subquery.join(
+                    SqlEventLogStorageTable,
+                    SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+                ).outerjoin(
+                    AssetEventTagsTable,
+                    db.and_(
+                        AssetEventTagsTable.c.event_id == latest_event_ids_subquery.c.id,
+                        AssetEventTagsTable.c.key == DATA_VERSION_TAG,
+                    ),
+                )
+            )
+            .order_by(latest_event_ids_subquery.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(latest_events_query).fetchall()
+
+        rows_by_asset_key_str = defaultdict(list)
+        for row in rows:
+            rows_by_asset_key_str[row[0]].append(row)
+
+        latest_events_by_key = {}
+        for asset_key in asset_keys:
+            asset_rows = rows_by_asset_key_str.get(asset_key.to_string())
+            if not asset_rows:
+                latest_events_by_key[asset_key] = LatestAssetPartitionEvents.empty(asset_key)
+                continue
+            _, partition_keys, storage_ids, timestamps, run_ids, data_versions = zip(*asset_rows)
+            latest_events_by_key[asset_key] = LatestAssetPartitionEvents(
+                asset_key=asset_key,
+                partition_keys=list(partition_keys),
+                storage_ids=list(storage_ids),
+                timestamps=[
+                    utc_datetime_from_naive(timestamp).timestamp() for timestamp in timestamps
+                ],
+                run_ids=list(run_ids),
+                data_versions=list(data_versions),
+            )
+        return latest_events_by_key
+
     def get_latest_tags_by_partition(
         self,
         asset_key: AssetKey,
@@ -6,7 +6,7 @@
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from functools import cached_property
@@ -15,7 +15,7 @@
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
 from sqlalchemy.engine import Connection, Engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
 from tqdm import tqdm
 from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
 from watchdog.observers import Observer
@@ -30,6 +30,7 @@
 from dagster._core.events import (
     ASSET_CHECK_EVENTS,
     ASSET_EVENTS,
+    BATCH_WRITABLE_EVENTS,
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
     DagsterEventType,
 )
@@ -64,6 +65,19 @@
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
 INDEX_SHARD_NAME = "index"
 
+# Engines are kept open for the most recently used shards, each holding at most one idle pooled
+# connection. Engines for less recently used shards are disposed.
+MAX_CACHED_SHARD_ENGINES = 32
+SHARD_ENGINE_MAX_OVERFLOW = 4
+
+
+def _configure_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+    # WAL journaling lets readers in other threads and processes (e.g. the webserver) proceed while
+    # a run is writing to its shard
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL;")
+    cursor.close()
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
@@ -106,12 +120,19 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
 
-        # Ensure that multiple threads (like the event log watcher) interact safely with each other
-        self._db_lock = threading.Lock()
+        # Engines are cached per shard, and each shard has its own lock so that writes to different
+        # run shards and to the index shard don't block each other
+        self._engines: OrderedDict[str, Engine] = OrderedDict()
+        self._engines_pid = os.getpid()
+        self._engines_lock = threading.Lock()
+        self._shard_locks: dict[str, threading.RLock] = {}
+
+        # The connection for each shard that the current thread holds, so that nested calls (like
+        # storing the asset events of a batch) reuse its transaction
+        self._local = threading.local()
 
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
-            conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
-            engine = create_engine(conn_string, poolclass=NullPool)
+            engine = self._get_engine(INDEX_SHARD_NAME)
             self._initdb(engine, for_index_shard=True)
             self.reindex_events()
             self.reindex_assets()
@@ -156,10 +177,8 @@ def get_all_run_ids(self) -> Sequence[str]:
         ]
 
     def has_table(self, table_name: str) -> bool:
-        conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
-        engine = create_engine(conn_string, poolclass=NullPool)
-        with engine.connect() as conn:
-            return bool(engine.dialect.has_table(conn, table_name))
+        with self.index_connection() as conn:
+            return bool(conn.dialect.has_table(conn, table_name))
 
     def path_for_shard(self, run_id: str) -> str:
         return os.path.join(self._base_dir, f"{run_id}.db")
@@ -220,13 +239,59 @@ def _initdb(self, engine: Engine, for_index_shard=False) -> None:
                     time.sleep(0.2)
                     retry_limit -= 1
 
+    def _get_engine(self, shard: str) -> Engine:
+        with self._engines_lock:
+            if self._engines_pid != os.getpid():
+                # pooled connections must not be shared with the parent of a forked process
+                for engine in self._engines.values():
+                    engine.dispose(close=False)
+                self._engines.clear()
+                self._engines_pid = os.getpid()
+
+            engine = self._engines.get(shard)
+            if engine is not None:
+                self._engines.move_to_end(shard)
+                return engine
+
+            engine = create_engine(
+                self.conn_string_for_shard(shard),
+                poolclass=QueuePool,
+                pool_size=1,
+                max_overflow=SHARD_ENGINE_MAX_OVERFLOW,
+                connect_args={"check_same_thread": False},
+            )
+            db.event.listen(engine, "connect", _configure_sqlite_connection)
+            self._engines[shard] = engine
+            if len(self._engines) > MAX_CACHED_SHARD_ENGINES:
+                _, evicted = self._engines.popitem(last=False)
+                evicted.dispose()
+            return engine
+
+    def _dispose_engines(self) -> None:
+        with self._engines_lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+
+    def _get_shard_lock(self, shard: str) -> threading.RLock:
+        with self._engines_lock:
+            if shard not in self._shard_locks:
+                self._shard_locks[shard] = threading.RLock()
+            return self._shard_locks[shard]
+
     @contextmanager
     def _connect(self, shard: str) -> Iterator[Connection]:
-        with self._db_lock:
-            check.str_param(shard, "shard")
+        check.str_param(shard, "shard")
+
+        active_connections = getattr(self._local, "connections", None)
+        if active_connections is None:
+            active_connections = self._local.connections = {}
+        if shard in active_connections:
+            yield active_connections[shard]
+            return
 
-            conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
+        with self._get_shard_lock(shard):
+            engine = self._get_engine(shard)
 
             if shard not in self._initialized_dbs:
                 self._initdb(engine)
@@ -234,8 +299,11 @@ def _connect(self, shard: str) -> Iterator[Connection]:
 
             with engine.connect() as conn:
                 with conn.begin():
-                    yield conn
-            engine.dispose()
+                    active_connections[shard] = conn
+                    try:
+                        yield conn
+                    finally:
+                        del active_connections[shard]
 
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
@@ -264,21 +332,20 @@ def store_event(self, event: EventLogEntry) -> None:
                 " observations in index database",
             )
 
-            event_id = None
-
-            # mirror the event in the cross-run index database
+            # mirror the event in the cross-run index database, updating the asset key and asset
+            # event tags in the same transaction
             with self.index_connection() as conn:
                 result = conn.execute(insert_event_statement)
                 event_id = result.inserted_primary_key[0]
 
-            self.store_asset_event(event, event_id)
+                self.store_asset_event(event, event_id)
 
-            if event_id is None:
-                raise DagsterInvariantViolationError(
-                    "Cannot store asset event tags for null event id."
-                )
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
 
-            self.store_asset_event_tags([event], [event_id])
+                self.store_asset_event_tags([event], [event_id])
 
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, None)
@@ -288,6 +355,42 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write a batch of asset events with a single transaction on each run
+        shard and a single transaction on the index shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        check.invariant(
+            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
+            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
+        )
+
+        events_by_run_id: dict[str, list[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                conn.execute(self.prepare_insert_event_batch(run_events))
+
+        # mirror the events in the cross-run index database
+        with self.index_connection() as conn:
+            event_ids = []
+            for event in events:
+                result = conn.execute(self.prepare_insert_event(event))
+                event_id = result.inserted_primary_key[0]
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                self.store_asset_event(event, event_id)
+                event_ids.append(event_id)
+
+            self.store_asset_event_tags(events, event_ids)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -437,6 +540,7 @@ def fetch_run_status_changes(
 
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
+        self._dispose_engines()
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
             + glob.glob(os.path.join(self._base_dir, "*.db-wal"))
@@ -489,6 +593,7 @@ def dispose(self) -> None:
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        self._dispose_engines()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -519,8 +624,10 @@ def __init__(
         self._run_id = check.str_param(run_id, "run_id")
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
+        # writes from pooled connections land in the write-ahead log until it is checkpointed
+        self._wal_path = f"{self._log_path}-wal"
         self._cursor = cursor
-        super().__init__(patterns=[self._log_path], **kwargs)
+        super().__init__(patterns=[self._log_path, self._wal_path], **kwargs)
 
     def _process_log(self) -> None:
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -543,5 +650,5 @@ def _process_log(self) -> None:
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
         self._process_log()
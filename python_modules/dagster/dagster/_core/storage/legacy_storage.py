@@ -1,4 +1,5 @@
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime
 from typing import TYPE_CHECKING, AbstractSet, Optional, Union  # noqa: UP035
 
 from dagster import _check as check
@@ -23,9 +24,10 @@
     EventLogStorage,
     EventRecordsFilter,
     EventRecordsResult,
+    LatestAssetPartitionEvents,
     PlannedMaterializationInfo,
 )
-from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.runs.base import RUNS_FEED_PAGE_SIZE, RunsFeedEntry, RunStorage
 from dagster._core.storage.schedules.base import ScheduleStorage
 from dagster._core.storage.sql import AlembicVersion
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
@@ -66,6 +68,7 @@
         TagBucket,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+    from dagster._core.storage.prepared_queries import QueryLatencyStats
     from dagster._daemon.types import DaemonHeartbeat
 
 
@@ -220,6 +223,9 @@ def get_run_ids(
     def get_runs_count(self, filters: Optional["RunsFilter"] = None) -> int:
         return self._storage.run_storage.get_runs_count(filters)
 
+    def get_run_watermark(self) -> Optional[tuple[int, datetime]]:
+        return self._storage.run_storage.get_run_watermark()
+
     def get_run_group(self, run_id: str) -> Optional[tuple[str, Iterable["DagsterRun"]]]:
         return self._storage.run_storage.get_run_group(run_id)
 
@@ -305,6 +311,9 @@ def dispose(self) -> None:
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         return self._storage.run_storage.optimize_for_webserver(statement_timeout, pool_recycle)
 
+    def get_query_latency_stats(self) -> Mapping[str, "QueryLatencyStats"]:
+        return self._storage.run_storage.get_query_latency_stats()
+
     def add_daemon_heartbeat(self, daemon_heartbeat: "DaemonHeartbeat") -> None:
         return self._storage.run_storage.add_daemon_heartbeat(daemon_heartbeat)
 
@@ -337,6 +346,24 @@ def add_backfill(self, partition_backfill: "PartitionBackfill") -> None:
     def update_backfill(self, partition_backfill: "PartitionBackfill") -> None:
         return self._storage.run_storage.update_backfill(partition_backfill)
 
+    def iter_runs_feed_entries(
+        self,
+        runs_filter: Optional["RunsFilter"],
+        backfills_filter: Optional["BulkActionsFilter"],
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+        max_creation_timestamp: Optional[float] = None,
+        page_size: int = RUNS_FEED_PAGE_SIZE,
+    ) -> Iterator[RunsFeedEntry]:
+        return self._storage.run_storage.iter_runs_feed_entries(
+            runs_filter,
+            backfills_filter,
+            run_cursor=run_cursor,
+            backfill_cursor=backfill_cursor,
+            max_creation_timestamp=max_creation_timestamp,
+            page_size=page_size,
+        )
+
     def get_run_partition_data(self, runs_filter: "RunsFilter") -> Sequence["RunPartitionData"]:
         return self._storage.run_storage.get_run_partition_data(runs_filter)
 
@@ -583,6 +610,15 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    def get_latest_asset_partition_events(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        event_type: "DagsterEventType",
+    ) -> Mapping["AssetKey", LatestAssetPartitionEvents]:
+        return self._storage.event_log_storage.get_latest_asset_partition_events(
+            asset_keys, event_type
+        )
+
     def get_latest_tags_by_partition(
         self,
         asset_key: "AssetKey",
@@ -0,0 +1,145 @@
+import bisect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import Callable, NamedTuple
+
+from sqlalchemy.util import LRUCache
+
+from dagster._core.storage.sql import SqlAlchemyQuery
+
+# upper bounds, in seconds, of the buckets that query latencies are counted in
+QUERY_LATENCY_BUCKET_BOUNDS: Sequence[float] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+
+MAX_PREPARED_STATEMENTS = 256
+MAX_COMPILED_STATEMENTS = 512
+
+
+class QueryLatencyStats(NamedTuple):
+    """A snapshot of the latencies recorded for a single named query.
+
+    Attributes:
+        query_name (str): The name of the query.
+        count (int): The number of times the query was executed.
+        total_seconds (float): The total time spent executing the query.
+        max_seconds (float): The latency of the slowest execution of the query.
+        bucket_counts (Sequence[int]): The number of executions whose latency fell into each of the
+            buckets in QUERY_LATENCY_BUCKET_BOUNDS.
+    """
+
+    query_name: str
+    count: int
+    total_seconds: float
+    max_seconds: float
+    bucket_counts: Sequence[int]
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def get_percentile_upper_bound(self, percentile: float) -> float:
+        """Returns the upper bound of the bucket containing the given percentile of latencies."""
+        if not self.count:
+            return 0.0
+        threshold = self.count * percentile / 100
+        num_seen = 0
+        for bound, bucket_count in zip(QUERY_LATENCY_BUCKET_BOUNDS, self.bucket_counts):
+            num_seen += bucket_count
+            if num_seen >= threshold:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+
+class _QueryLatencyHistogram:
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bucket_counts = [0] * len(QUERY_LATENCY_BUCKET_BOUNDS)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.bucket_counts[bisect.bisect_left(QUERY_LATENCY_BUCKET_BOUNDS, seconds)] += 1
+
+
+class PreparedQueryCache:
+    """Caches the statements for queries with a fixed shape, along with their compiled forms, and
+    records the latency of each named query.
+
+    Statements are built with bind parameters, and are cached by a key describing the shape of the
+    query (e.g. which filters are applied), so the same statement is executed with different
+    parameter values instead of being rebuilt and recompiled on every call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statements: OrderedDict[Hashable, SqlAlchemyQuery] = OrderedDict()
+        self._histograms: dict[str, _QueryLatencyHistogram] = {}
+        # passed to sqlalchemy as the `compiled_cache` execution option. this outlives individual
+        # engines and connections, which may be created per call
+        self.compiled_cache = LRUCache(MAX_COMPILED_STATEMENTS)
+
+    def get_statement(
+        self, shape_key: Hashable, build_fn: Callable[[], SqlAlchemyQuery]
+    ) -> SqlAlchemyQuery:
+        with self._lock:
+            statement = self._statements.get(shape_key)
+            if statement is not None:
+                self._statements.move_to_end(shape_key)
+                return statement
+
+        statement = build_fn()
+        with self._lock:
+            self._statements[shape_key] = statement
+            if len(self._statements) > MAX_PREPARED_STATEMENTS:
+                self._statements.popitem(last=False)
+        return statement
+
+    @contextmanager
+    def record_latency(self, query_name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                histogram = self._histograms.get(query_name)
+                if histogram is None:
+                    histogram = self._histograms[query_name] = _QueryLatencyHistogram()
+                histogram.observe(elapsed)
+
+    def get_latency_stats(self) -> Mapping[str, QueryLatencyStats]:
+        with self._lock:
+            return {
+                query_name: QueryLatencyStats(
+                    query_name=query_name,
+                    count=histogram.count,
+                    total_seconds=histogram.total_seconds,
+                    max_seconds=histogram.max_seconds,
+                    bucket_counts=list(histogram.bucket_counts),
+                )
+                for query_name, histogram in self._histograms.items()
+            }
+
+    def reset_latency_stats(self) -> None:
+        with self._lock:
+            self._histograms.clear()
@@ -1,8 +1,10 @@
+import heapq
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Optional, Union
 
-from typing_extensions import TypedDict
+from typing_extensions import TypeAlias, TypedDict
 
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
@@ -20,10 +22,14 @@
 )
 from dagster._core.storage.sql import AlembicVersion
 from dagster._daemon.types import DaemonHeartbeat
+from dagster._record import copy
+from dagster._time import datetime_from_timestamp
 from dagster._utils import PrintFn
+from dagster._utils.warnings import disable_dagster_warnings
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation.origin import RemoteJobOrigin
+    from dagster._core.storage.prepared_queries import QueryLatencyStats
 
 
 class RunGroupInfo(TypedDict):
@@ -31,6 +37,18 @@ class RunGroupInfo(TypedDict):
     runs: Sequence[DagsterRun]
 
 
+# an entry in the runs feed, which interleaves single runs and backfills
+RunsFeedEntry: TypeAlias = Union[RunRecord, PartitionBackfill]
+
+RUNS_FEED_PAGE_SIZE = 100
+
+
+def get_runs_feed_entry_timestamp(entry: RunsFeedEntry) -> float:
+    if isinstance(entry, RunRecord):
+        return entry.create_timestamp.timestamp()
+    return entry.backfill_timestamp
+
+
 class RunStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance], DaemonCursorStorage):
     """Abstract base class for storing pipeline run history.
 
@@ -120,6 +138,13 @@ def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
             int: The number of runs that match the given filters.
         """
 
+    def get_run_watermark(self) -> Optional[tuple[int, datetime]]:
+        """Get the greatest run id and run update timestamp in storage, which change whenever a run
+        is added or updated. Used to invalidate caches of data derived from runs. Only supported for
+        sql storage.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def get_run_group(self, run_id: str) -> Optional[tuple[str, Sequence[DagsterRun]]]:
         """Get the run group to which a given run belongs.
@@ -339,6 +364,12 @@ def dispose(self) -> None:
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
         """Allows for optimizing database connection / use in the context of a long lived webserver process."""
 
+    def get_query_latency_stats(self) -> Mapping[str, "QueryLatencyStats"]:
+        """Get the latency recorded for each named query executed by this storage in this
+        process, keyed by query name.
+        """
+        return {}
+
     # Daemon Heartbeat Storage
     #
     # Holds heartbeats from the Dagster Daemon so that other system components can alert when it's not
@@ -404,6 +435,85 @@ def add_backfill(self, partition_backfill: PartitionBackfill):
     def update_backfill(self, partition_backfill: PartitionBackfill):
         """Update a partition backfill in run storage."""
 
+    def iter_runs_feed_entries(
+        self,
+        runs_filter: Optional[RunsFilter],
+        backfills_filter: Optional[BulkActionsFilter],
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+        max_creation_timestamp: Optional[float] = None,
+        page_size: int = RUNS_FEED_PAGE_SIZE,
+    ) -> Iterator[RunsFeedEntry]:
+        """Iterate over the run records and backfills matching the given filters, newest first.
+        Entries are read from storage a page at a time as the iterator is consumed.
+
+        Args:
+            runs_filter (Optional[RunsFilter]): The filter by which to filter runs. If None, no runs
+                are included.
+            backfills_filter (Optional[BulkActionsFilter]): The filter by which to filter backfills.
+                If None, no backfills are included.
+            run_cursor (Optional[str]): If set, only runs older than this run_id are included.
+            backfill_cursor (Optional[str]): If set, only backfills older than this backfill id are
+                included.
+            max_creation_timestamp (Optional[float]): If set, runs (or backfills) are limited to
+                those created at or before this timestamp while there is no run (or backfill)
+                cursor, so that entries created after a feed was first paginated are not included
+                in its later pages.
+            page_size (int): The number of runs and backfills to read from storage at a time.
+
+        Returns:
+            Iterator[RunsFeedEntry]: The run records and backfills, ordered by creation time.
+        """
+        # the created_before filters are exclusive
+        created_before = (
+            datetime_from_timestamp(max_creation_timestamp) + timedelta(microseconds=1)
+            if max_creation_timestamp is not None
+            else None
+        )
+
+        def _iter_runs() -> Iterator[RunRecord]:
+            if runs_filter is None:
+                return
+            filters = runs_filter
+            if run_cursor is None and created_before is not None:
+                with disable_dagster_warnings():
+                    filters = copy(
+                        runs_filter,
+                        created_before=min(runs_filter.created_before, created_before)
+                        if runs_filter.created_before
+                        else created_before,
+                    )
+            cursor = run_cursor
+            while True:
+                records = self.get_run_records(filters=filters, limit=page_size, cursor=cursor)
+                yield from records
+                if len(records) < page_size:
+                    return
+                cursor = records[-1].dagster_run.run_id
+
+        def _iter_backfills() -> Iterator[PartitionBackfill]:
+            if backfills_filter is None:
+                return
+            filters = backfills_filter
+            if backfill_cursor is None and created_before is not None:
+                filters = copy(
+                    backfills_filter,
+                    created_before=min(backfills_filter.created_before, created_before)
+                    if backfills_filter.created_before
+                    else created_before,
+                )
+            cursor = backfill_cursor
+            while True:
+                backfills = self.get_backfills(filters=filters, limit=page_size, cursor=cursor)
+                yield from backfills
+                if len(backfills) < page_size:
+                    return
+                cursor = backfills[-1].backfill_id
+
+        return heapq.merge(
+            _iter_runs(), _iter_backfills(), key=get_runs_feed_entry_timestamp, reverse=True
+        )
+
     def alembic_version(self) -> Optional[AlembicVersion]:
         return None
 
@@ -207,3 +207,25 @@
     BackfillTagsTable.c.backfill_id,
     BackfillTagsTable.c.id,
 )
+db.Index(
+    "idx_runs_feed",
+    RunsTable.c.backfill_id,
+    RunsTable.c.create_timestamp,
+    RunsTable.c.id,
+    mysql_length={
+        "backfill_id": 255,
+    },
+)
+db.Index("idx_runs_by_create_timestamp", RunsTable.c.create_timestamp, RunsTable.c.id)
+db.Index("idx_bulk_actions_by_timestamp", BulkActionsTable.c.timestamp, BulkActionsTable.c.id)
+db.Index(
+    "idx_backfill_tags_key_value",
+    BackfillTagsTable.c.key,
+    BackfillTagsTable.c.value,
+    BackfillTagsTable.c.backfill_id,
+    mysql_length={
+        "key": 64,
+        "value": 64,
+        "backfill_id": 255,
+    },
+)
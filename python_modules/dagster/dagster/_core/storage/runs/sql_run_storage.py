@@ -1,11 +1,14 @@
+import heapq
 import logging
 import uuid
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Callable, ContextManager, NamedTuple, Optional, Union, cast  # noqa: UP035
 
 import sqlalchemy as db
@@ -37,7 +40,13 @@
     RunsFilter,
     TagBucket,
 )
-from dagster._core.storage.runs.base import RunStorage
+from dagster._core.storage.prepared_queries import PreparedQueryCache, QueryLatencyStats
+from dagster._core.storage.runs.base import (
+    RUNS_FEED_PAGE_SIZE,
+    RunsFeedEntry,
+    RunStorage,
+    get_runs_feed_entry_timestamp,
+)
 from dagster._core.storage.runs.migration import (
     BACKFILL_JOB_NAME_AND_TAGS,
     OPTIONAL_DATA_MIGRATIONS,
@@ -99,16 +108,50 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
-    def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
-        with self.connect() as conn:
-            return db_fetch_mappings(conn, query)
+    @cached_property
+    def _prepared_queries(self) -> PreparedQueryCache:
+        return PreparedQueryCache()
+
+    @contextmanager
+    def _query_connection(
+        self, params: Optional[Mapping[str, Any]], query_name: Optional[str]
+    ) -> Iterator[Connection]:
+        # prepared statements, which are executed with bind parameter values, share a compiled
+        # statement cache across connections. the latency of named queries is recorded, including
+        # the time to check out a connection
+        with self._prepared_queries.record_latency(query_name) if query_name else nullcontext():
+            with self.connect() as conn:
+                if params is None:
+                    yield conn
+                else:
+                    yield conn.execution_options(
+                        compiled_cache=self._prepared_queries.compiled_cache
+                    )
 
-    def fetchone(self, query: SqlAlchemyQuery) -> Optional[Any]:
-        with self.connect() as conn:
+    def fetchall(
+        self,
+        query: SqlAlchemyQuery,
+        params: Optional[Mapping[str, Any]] = None,
+        query_name: Optional[str] = None,
+    ) -> Sequence[Any]:
+        with self._query_connection(params, query_name) as conn:
+            return db_fetch_mappings(conn, query, params)
+
+    def fetchone(
+        self,
+        query: SqlAlchemyQuery,
+        params: Optional[Mapping[str, Any]] = None,
+        query_name: Optional[str] = None,
+    ) -> Optional[Any]:
+        with self._query_connection(params, query_name) as conn:
+            result = conn.execute(query, params) if params is not None else conn.execute(query)
             if db.__version__.startswith("2."):
-                return conn.execute(query).mappings().first()
+                return result.mappings().first()
             else:
-                return conn.execute(query).fetchone()
+                return result.fetchone()
+
+    def get_query_latency_stats(self) -> Mapping[str, QueryLatencyStats]:
+        return self._prepared_queries.get_latency_stats()
 
     def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
         check.inst_param(dagster_run, "dagster_run", DagsterRun)
@@ -227,14 +270,16 @@ def _add_cursor_limit_to_query(
     ) -> SqlAlchemyQuery:
         """Helper function to deal with cursor/limit pagination args."""
         if cursor:
-            cursor_query = db_select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor)
+            cursor_query = db_select([RunsTable.c.id]).where(
+                RunsTable.c.run_id == db.bindparam("cursor", cursor)
+            )
             if ascending:
                 query = query.where(RunsTable.c.id > db_scalar_subquery(cursor_query))
             else:
                 query = query.where(RunsTable.c.id < db_scalar_subquery(cursor_query))
 
         if limit:
-            query = query.limit(limit)
+            query = query.limit(db.bindparam("limit", limit, type_=db.Integer))
 
         sorting_column = getattr(RunsTable.c, order_by) if order_by else RunsTable.c.id
         direction = db.asc if ascending else db.desc
@@ -250,39 +295,52 @@ def _add_filters_to_table(self, table: db.Table, filters: RunsFilter) -> db.Tabl
 
     def _add_filters_to_query(self, query: SqlAlchemyQuery, filters: RunsFilter) -> SqlAlchemyQuery:
         check.inst_param(filters, "filters", RunsFilter)
+        # filter values are named bind parameters, so that the query can be cached by its shape
+        # and re-executed with the values from _get_runs_query_params
+        params = self._get_runs_query_params(filters, cursor=None, limit=None)
 
         if filters.run_ids:
-            query = query.where(RunsTable.c.run_id.in_(filters.run_ids))
+            query = query.where(
+                RunsTable.c.run_id.in_(db.bindparam("run_ids", params["run_ids"], expanding=True))
+            )
 
         if filters.job_name:
-            query = query.where(RunsTable.c.pipeline_name == filters.job_name)
+            query = query.where(
+                RunsTable.c.pipeline_name == db.bindparam("job_name", params["job_name"])
+            )
 
         if filters.statuses:
             query = query.where(
-                RunsTable.c.status.in_([status.value for status in filters.statuses])
+                RunsTable.c.status.in_(db.bindparam("statuses", params["statuses"], expanding=True))
             )
 
         if filters.snapshot_id:
-            query = query.where(RunsTable.c.snapshot_id == filters.snapshot_id)
+            query = query.where(
+                RunsTable.c.snapshot_id == db.bindparam("snapshot_id", params["snapshot_id"])
+            )
 
         if filters.updated_after:
             query = query.where(
-                RunsTable.c.update_timestamp > filters.updated_after.replace(tzinfo=None)
+                RunsTable.c.update_timestamp
+                > db.bindparam("updated_after", params["updated_after"])
             )
 
         if filters.updated_before:
             query = query.where(
-                RunsTable.c.update_timestamp < filters.updated_before.replace(tzinfo=None)
+                RunsTable.c.update_timestamp
+                < db.bindparam("updated_before", params["updated_before"])
             )
 
         if filters.created_after:
             query = query.where(
-                RunsTable.c.create_timestamp > filters.created_after.replace(tzinfo=None)
+                RunsTable.c.create_timestamp
+                > db.bindparam("created_after", params["created_after"])
             )
 
         if filters.created_before:
             query = query.where(
-                RunsTable.c.create_timestamp < filters.created_before.replace(tzinfo=None)
+                RunsTable.c.create_timestamp
+                < db.bindparam("created_before", params["created_before"])
             )
 
         if filters.exclude_subruns:
@@ -323,6 +381,72 @@ def _runs_query(
         base_query = self._add_filters_to_query(base_query, filters)
         return self._add_cursor_limit_to_query(base_query, cursor, limit, order_by, ascending)
 
+    def _get_runs_query_params(
+        self, filters: RunsFilter, cursor: Optional[str], limit: Optional[int]
+    ) -> dict[str, Any]:
+        """Returns the values of the bind parameters in the query built by _runs_query."""
+        params: dict[str, Any] = {}
+        if filters.run_ids:
+            params["run_ids"] = list(filters.run_ids)
+        if filters.job_name:
+            params["job_name"] = filters.job_name
+        if filters.statuses:
+            params["statuses"] = [status.value for status in filters.statuses]
+        if filters.snapshot_id:
+            params["snapshot_id"] = filters.snapshot_id
+        if filters.updated_after:
+            params["updated_after"] = filters.updated_after.replace(tzinfo=None)
+        if filters.updated_before:
+            params["updated_before"] = filters.updated_before.replace(tzinfo=None)
+        if filters.created_after:
+            params["created_after"] = filters.created_after.replace(tzinfo=None)
+        if filters.created_before:
+            params["created_before"] = filters.created_before.replace(tzinfo=None)
+        for i, (key, value) in enumerate((filters.tags or {}).items()):
+            params[f"tag_key_{i}"] = key
+            params[f"tag_value_{i}"] = value if isinstance(value, str) else list(value)
+        if cursor:
+            params["cursor"] = cursor
+        if limit:
+            params["limit"] = limit
+        return params
+
+    def _prepared_runs_query(
+        self,
+        filters: Optional[RunsFilter] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+    ) -> tuple[SqlAlchemyQuery, Mapping[str, Any]]:
+        """Returns the cached statement for the shape of the given runs query, along with the bind
+        parameter values to execute it with.
+        """
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        params = self._get_runs_query_params(filters, cursor, limit)
+        shape_key = (
+            "runs",
+            tuple(columns) if columns is not None else None,
+            order_by,
+            ascending,
+            frozenset(params.keys()),
+            tuple(isinstance(value, str) for value in (filters.tags or {}).values()),
+            self.has_built_index(RUN_BACKFILL_ID) if filters.exclude_subruns else None,
+        )
+        statement = self._prepared_queries.get_statement(
+            shape_key,
+            lambda: self._runs_query(
+                filters=filters,
+                cursor=cursor,
+                limit=limit,
+                columns=columns,
+                order_by=order_by,
+                ascending=ascending,
+            ),
+        )
+        return statement, params
+
     def _apply_tags_table_filters(
         self, table: db.Table, tags: Mapping[str, Union[str, Sequence[str]]]
     ) -> SqlAlchemyQuery:
@@ -334,10 +458,12 @@ def _apply_tags_table_filters(
                 run_tags_alias,
                 db.and_(
                     RunsTable.c.run_id == run_tags_alias.c.run_id,
-                    run_tags_alias.c.key == key,
-                    (run_tags_alias.c.value == value)
+                    run_tags_alias.c.key == db.bindparam(f"tag_key_{i}", key),
+                    (run_tags_alias.c.value == db.bindparam(f"tag_value_{i}", value))
                     if isinstance(value, str)
-                    else run_tags_alias.c.value.in_(value),
+                    else run_tags_alias.c.value.in_(
+                        db.bindparam(f"tag_value_{i}", list(value), expanding=True)
+                    ),
                 ),
             )
 
@@ -351,8 +477,8 @@ def get_runs(
         bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
         ascending: bool = False,
     ) -> Sequence[DagsterRun]:
-        query = self._runs_query(filters, cursor, limit, bucket_by=bucket_by, ascending=ascending)
-        rows = self.fetchall(query)
+        query, params = self._prepared_runs_query(filters, cursor, limit, ascending=ascending)
+        rows = self.fetchall(query, params, query_name="get_runs")
         return self._rows_to_runs(rows)
 
     def get_run_ids(
@@ -361,24 +487,49 @@ def get_run_ids(
         cursor: Optional[str] = None,
         limit: Optional[int] = None,
     ) -> Sequence[str]:
-        query = self._runs_query(filters=filters, cursor=cursor, limit=limit, columns=["run_id"])
-        rows = self.fetchall(query)
+        query, params = self._prepared_runs_query(
+            filters=filters, cursor=cursor, limit=limit, columns=["run_id"]
+        )
+        rows = self.fetchall(query, params, query_name="get_run_ids")
         return [row["run_id"] for row in rows]
 
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
-        subquery = db_subquery(self._runs_query(filters=filters))
-        query = db_select([db.func.count().label("count")]).select_from(subquery)
-        row = self.fetchone(query)
+        runs_query, params = self._prepared_runs_query(filters=filters)
+        query = self._prepared_queries.get_statement(
+            ("runs_count", runs_query),
+            lambda: db_select([db.func.count().label("count")]).select_from(
+                db_subquery(runs_query)
+            ),
+        )
+        row = self.fetchone(query, params, query_name="get_runs_count")
         count = row["count"] if row else 0
         return count
 
+    def get_run_watermark(self) -> Optional[tuple[int, datetime]]:
+        query = self._prepared_queries.get_statement(
+            "run_watermark",
+            lambda: db_select(
+                [
+                    db.func.max(RunsTable.c.id).label("max_id"),
+                    db.func.max(RunsTable.c.update_timestamp).label("max_update_timestamp"),
+                ]
+            ),
+        )
+        row = self.fetchone(query, query_name="get_run_watermark")
+        if not row or row["max_id"] is None:
+            return None
+        return row["max_id"], row["max_update_timestamp"]
+
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         check.str_param(run_id, "run_id")
 
-        query = db_select([RunsTable.c.run_body, RunsTable.c.status]).where(
-            RunsTable.c.run_id == run_id
+        query = self._prepared_queries.get_statement(
+            "run_by_id",
+            lambda: db_select([RunsTable.c.run_body, RunsTable.c.status]).where(
+                RunsTable.c.run_id == db.bindparam("run_id")
+            ),
         )
-        rows = self.fetchall(query)
+        rows = self.fetchall(query, {"run_id": run_id}, query_name="get_run_by_id")
         return self._row_to_run(rows[0]) if rows else None
 
     def get_run_records(
@@ -393,39 +544,35 @@ def get_run_records(
         filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
         check.opt_int_param(limit, "limit")
 
-        columns = ["id", "run_body", "status", "create_timestamp", "update_timestamp"]
-
-        if self.has_run_stats_index_cols():
-            columns += ["start_time", "end_time"]
-        # only fetch columns we use to build RunRecord
-        query = self._runs_query(
+        query, params = self._prepared_runs_query(
             filters=filters,
             limit=limit,
-            columns=columns,
+            columns=self._get_run_record_columns(),
             order_by=order_by,
             ascending=ascending,
             cursor=cursor,
-            bucket_by=bucket_by,
         )
 
-        rows = self.fetchall(query)
-        return [
-            RunRecord(
-                storage_id=check.int_param(row["id"], "id"),
-                dagster_run=self._row_to_run(row),
-                create_timestamp=utc_datetime_from_naive(
-                    check.inst(row["create_timestamp"], datetime)
-                ),
-                update_timestamp=utc_datetime_from_naive(
-                    check.inst(row["update_timestamp"], datetime)
-                ),
-                start_time=(
-                    check.opt_inst(row["start_time"], float) if "start_time" in row else None
-                ),
-                end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
-            )
-            for row in rows
-        ]
+        rows = self.fetchall(query, params, query_name="get_run_records")
+        return [self._row_to_run_record(row) for row in rows]
+
+    def _get_run_record_columns(self) -> Sequence[str]:
+        # only fetch columns we use to build RunRecord
+        columns = ["id", "run_body", "status", "create_timestamp", "update_timestamp"]
+
+        if self.has_run_stats_index_cols():
+            columns += ["start_time", "end_time"]
+        return columns
+
+    def _row_to_run_record(self, row: Mapping[str, Any]) -> RunRecord:
+        return RunRecord(
+            storage_id=check.int_param(row["id"], "id"),
+            dagster_run=self._row_to_run(row),  # type: ignore
+            create_timestamp=utc_datetime_from_naive(check.inst(row["create_timestamp"], datetime)),
+            update_timestamp=utc_datetime_from_naive(check.inst(row["update_timestamp"], datetime)),
+            start_time=(check.opt_inst(row["start_time"], float) if "start_time" in row else None),
+            end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
+        )
 
     def get_run_tags(
         self,
@@ -434,17 +581,29 @@ def get_run_tags(
         limit: Optional[int] = None,
     ) -> Sequence[tuple[str, set[str]]]:
         result = defaultdict(set)
-        query = (
-            db_select([RunTagsTable.c.key, RunTagsTable.c.value])
-            .distinct()
-            .order_by(RunTagsTable.c.key, RunTagsTable.c.value)
-            .where(RunTagsTable.c.key.in_(tag_keys))
-        )
+        params: dict[str, Any] = {"tag_keys": list(tag_keys)}
         if value_prefix:
-            query = query.where(RunTagsTable.c.value.startswith(value_prefix))
+            params["value_prefix"] = value_prefix
         if limit:
-            query = query.limit(limit)
-        rows = self.fetchall(query)
+            params["limit"] = limit
+
+        def _build_query() -> SqlAlchemyQuery:
+            query = (
+                db_select([RunTagsTable.c.key, RunTagsTable.c.value])
+                .distinct()
+                .order_by(RunTagsTable.c.key, RunTagsTable.c.value)
+                .where(RunTagsTable.c.key.in_(db.bindparam("tag_keys", expanding=True)))
+            )
+            if value_prefix:
+                query = query.where(RunTagsTable.c.value.startswith(db.bindparam("value_prefix")))
+            if limit:
+                query = query.limit(db.bindparam("limit", type_=db.Integer))
+            return query
+
+        query = self._prepared_queries.get_statement(
+            ("run_tags", frozenset(params.keys())), _build_query
+        )
+        rows = self.fetchall(query, params, query_name="get_run_tags")
         for r in rows:
             result[r["key"]].add(r["value"])
         return sorted(list([(k, v) for k, v in result.items()]), key=lambda x: x[0])
@@ -707,12 +866,17 @@ def _get_partition_runs(
                 )
             )
         else:
-            query = (
-                self._runs_query()
-                .where(RunsTable.c.partition == partition_name)
-                .where(RunsTable.c.partition_set == partition_set_name)
+            query = self._prepared_queries.get_statement(
+                "partition_runs",
+                lambda: self._runs_query()
+                .where(RunsTable.c.partition == db.bindparam("partition"))
+                .where(RunsTable.c.partition_set == db.bindparam("partition_set")),
+            )
+            rows = self.fetchall(
+                query,
+                {"partition": partition_name, "partition_set": partition_set_name},
+                query_name="get_partition_runs",
             )
-            rows = self.fetchall(query)
             return self._rows_to_runs(rows)
 
     # Tracking data migrations over secondary indexes
@@ -866,7 +1030,9 @@ def _add_backfill_filters_to_table(
         return table
 
     def _backfills_query(self, filters: Optional[BulkActionsFilter] = None):
-        query = db_select([BulkActionsTable.c.body, BulkActionsTable.c.timestamp])
+        query = db_select(
+            [BulkActionsTable.c.id, BulkActionsTable.c.body, BulkActionsTable.c.timestamp]
+        )
         if filters and filters.tags:
             if not self.has_built_index(BACKFILL_JOB_NAME_AND_TAGS):
                 # if the migration was run, we added the query for tags filtering in _add_backfill_filters_to_table
@@ -995,7 +1161,7 @@ def get_backfills(
 
     def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> int:
         check.opt_inst_param(filters, "filters", BulkActionsFilter)
-        if filters and filters.tags:
+        if filters and filters.tags and not self.has_built_index(BACKFILL_JOB_NAME_AND_TAGS):
             # runs can have more tags than the backfill that launched them. Since we filtered tags by
             # querying for runs with those tags, we need to do an additional check that the backfills
             # also have the requested tags. This requires fetching the backfills from the db and filtering them
@@ -1008,12 +1174,157 @@ def get_backfills_count(self, filters: Optional[BulkActionsFilter] = None) -> in
                 self._apply_backfill_tags_filter_to_results(backfill_candidates, filters.tags)
             )
 
-        subquery = db_subquery(self._backfills_query(filters=filters))
+        table = self._add_backfill_filters_to_table(BulkActionsTable, filters)
+        subquery = db_subquery(self._backfills_query(filters=filters).select_from(table))
         query = db_select([db.func.count().label("count")]).select_from(subquery)
         row = self.fetchone(query)
         count = row["count"] if row else 0
         return count
 
+    def iter_runs_feed_entries(
+        self,
+        runs_filter: Optional[RunsFilter],
+        backfills_filter: Optional[BulkActionsFilter],
+        run_cursor: Optional[str] = None,
+        backfill_cursor: Optional[str] = None,
+        max_creation_timestamp: Optional[float] = None,
+        page_size: int = RUNS_FEED_PAGE_SIZE,
+    ) -> Iterator[RunsFeedEntry]:
+        check.opt_inst_param(runs_filter, "runs_filter", RunsFilter)
+        check.opt_inst_param(backfills_filter, "backfills_filter", BulkActionsFilter)
+        check.int_param(page_size, "page_size")
+        max_created = (
+            datetime_from_timestamp(max_creation_timestamp)
+            if max_creation_timestamp is not None
+            else None
+        )
+        # runs and backfills are each paginated by (creation time, id) rather than by offset, so
+        # that every page is read from the indexes on those columns, and the merged feed only holds
+        # one page of each at a time
+        return heapq.merge(
+            self._iter_runs_feed_runs(runs_filter, run_cursor, max_created, page_size)
+            if runs_filter is not None
+            else iter(()),
+            self._iter_runs_feed_backfills(
+                backfills_filter, backfill_cursor, max_created, page_size
+            )
+            if backfills_filter is not None
+            else iter(()),
+            key=get_runs_feed_entry_timestamp,
+            reverse=True,
+        )
+
+    def _iter_runs_feed_runs(
+        self,
+        filters: RunsFilter,
+        cursor: Optional[str],
+        max_created: Optional[datetime],
+        page_size: int,
+    ) -> Iterator[RunRecord]:
+        after_id = None
+        if cursor:
+            row = self.fetchone(db_select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor))
+            if row:
+                after_id = row["id"]
+
+        table = self._add_filters_to_table(RunsTable, filters)
+        query = db_select(
+            [getattr(RunsTable.c, column) for column in self._get_run_record_columns()]
+        ).select_from(table)
+        query = self._add_filters_to_query(query, filters)
+        if after_id is None and max_created is not None:
+            query = query.where(RunsTable.c.create_timestamp <= max_created.replace(tzinfo=None))
+        query = query.order_by(RunsTable.c.create_timestamp.desc(), RunsTable.c.id.desc()).limit(
+            page_size
+        )
+        first_page_query = query
+        # the creation timestamp of the last run is selected in the database rather than bound from
+        # the value read back, so that it is compared in the format it was stored in
+        after_runs = db.alias(RunsTable, "after_runs")
+        after_timestamp = db_scalar_subquery(
+            db_select([after_runs.c.create_timestamp]).where(
+                after_runs.c.id == db.bindparam("feed_id")
+            )
+        )
+        next_page_query = query.where(
+            db.or_(
+                RunsTable.c.create_timestamp < after_timestamp,
+                db.and_(
+                    RunsTable.c.create_timestamp == after_timestamp,
+                    RunsTable.c.id < db.bindparam("feed_id"),
+                ),
+            )
+        )
+
+        while True:
+            if after_id is None:
+                rows = self.fetchall(first_page_query, {}, query_name="runs_feed")
+            else:
+                rows = self.fetchall(next_page_query, {"feed_id": after_id}, query_name="runs_feed")
+            yield from (self._row_to_run_record(row) for row in rows)
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1]["id"]
+
+    def _iter_runs_feed_backfills(
+        self,
+        filters: BulkActionsFilter,
+        cursor: Optional[str],
+        max_created: Optional[datetime],
+        page_size: int,
+    ) -> Iterator[PartitionBackfill]:
+        after_id = None
+        if cursor:
+            row = self.fetchone(
+                db_select([BulkActionsTable.c.id]).where(BulkActionsTable.c.key == cursor)
+            )
+            if row:
+                after_id = row["id"]
+
+        table = self._add_backfill_filters_to_table(BulkActionsTable, filters)
+        query = self._backfills_query(filters=filters).select_from(table)
+        if after_id is None and max_created is not None:
+            query = query.where(BulkActionsTable.c.timestamp <= max_created)
+        query = query.order_by(
+            BulkActionsTable.c.timestamp.desc(), BulkActionsTable.c.id.desc()
+        ).limit(page_size)
+        first_page_query = query
+        after_bulk_actions = db.alias(BulkActionsTable, "after_bulk_actions")
+        after_timestamp = db_scalar_subquery(
+            db_select([after_bulk_actions.c.timestamp]).where(
+                after_bulk_actions.c.id == db.bindparam("feed_id")
+            )
+        )
+        next_page_query = query.where(
+            db.or_(
+                BulkActionsTable.c.timestamp < after_timestamp,
+                db.and_(
+                    BulkActionsTable.c.timestamp == after_timestamp,
+                    BulkActionsTable.c.id < db.bindparam("feed_id"),
+                ),
+            )
+        )
+        # without the backfill tags table, tags are matched against the runs that each backfill
+        # launched, and the backfills themselves need to be checked as well
+        should_filter_tags = bool(filters.tags) and not self.has_built_index(
+            BACKFILL_JOB_NAME_AND_TAGS
+        )
+
+        while True:
+            if after_id is None:
+                rows = self.fetchall(first_page_query, {}, query_name="runs_feed_backfills")
+            else:
+                rows = self.fetchall(
+                    next_page_query, {"feed_id": after_id}, query_name="runs_feed_backfills"
+                )
+            backfills = deserialize_values((row["body"] for row in rows), PartitionBackfill)
+            if should_filter_tags:
+                backfills = self._apply_backfill_tags_filter_to_results(backfills, filters.tags)
+            yield from backfills
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1]["id"]
+
     def get_backfill(self, backfill_id: str) -> Optional[PartitionBackfill]:
         check.str_param(backfill_id, "backfill_id")
         query = db_select([BulkActionsTable.c.body]).where(BulkActionsTable.c.key == backfill_id)
@@ -1093,6 +1404,18 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
                     .where(KeyValueStoreTable.c.key.in_(pairs.keys()))
                     .values(value=db.sql.case(pairs, value=KeyValueStoreTable.c.key))
                 )
+                # some of the keys may not have existed yet
+                existing_keys = {
+                    row[0]
+                    for row in conn.execute(
+                        db_select([KeyValueStoreTable.c.key]).where(
+                            KeyValueStoreTable.c.key.in_(pairs.keys())
+                        )
+                    ).fetchall()
+                }
+                new_values = [value for value in db_values if value["key"] not in existing_keys]
+                if new_values:
+                    conn.execute(KeyValueStoreTable.insert().values(new_values))
 
     # Migrating run history
     def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> None:
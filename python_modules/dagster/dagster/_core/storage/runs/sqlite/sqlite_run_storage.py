@@ -1,12 +1,13 @@
 import os
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Optional
 from urllib.parse import urljoin, urlparse
 
 import sqlalchemy as db
-from sqlalchemy.engine import Connection
-from sqlalchemy.pool import NullPool
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import NullPool, QueuePool
 from typing_extensions import Self
 
 from dagster import (
@@ -42,6 +43,10 @@
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
 MINIMUM_SQLITE_BUCKET_VERSION = [3, 25, 0]
 
+# The engine holds at most one idle pooled connection, so that connections (and the statements
+# compiled for them) are reused across calls instead of being reopened for every query
+RUN_STORAGE_ENGINE_MAX_OVERFLOW = 4
+
 
 class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
     """SQLite-backed run storage.
@@ -70,6 +75,9 @@ def __init__(self, conn_string: str, inst_data: Optional[ConfigurableClassData]
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._engine: Optional[Engine] = None
+        self._engine_pid = os.getpid()
+        self._engine_lock = threading.Lock()
         super().__init__()
 
     @property
@@ -126,13 +134,36 @@ def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] =
 
         return run_storage
 
+    def _get_engine(self) -> Engine:
+        with self._engine_lock:
+            if self._engine is not None and self._engine_pid != os.getpid():
+                # pooled connections must not be shared with the parent of a forked process
+                self._engine.dispose(close=False)
+                self._engine = None
+
+            if self._engine is None:
+                self._engine = create_engine(
+                    self._conn_string,
+                    poolclass=QueuePool,
+                    pool_size=1,
+                    max_overflow=RUN_STORAGE_ENGINE_MAX_OVERFLOW,
+                    connect_args={"check_same_thread": False},
+                )
+                self._engine_pid = os.getpid()
+            return self._engine
+
     @contextmanager
     def connect(self) -> Iterator[Connection]:
-        engine = create_engine(self._conn_string, poolclass=NullPool)
-        with engine.connect() as conn:
+        with self._get_engine().connect() as conn:
             with conn.begin():
                 yield conn
 
+    def dispose(self) -> None:
+        with self._engine_lock:
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+
     def _alembic_upgrade(self, rev: str = "head") -> None:
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
@@ -162,6 +193,7 @@ def _check_for_version_066_migration_and_perform(self) -> None:
             old_runs = old_storage.get_runs()
             for run in old_runs:
                 self.add_run(run)
+            old_storage.dispose()
             os.unlink(path_to_old_db)
 
     def delete_run(self, run_id: str) -> None:
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Optional
 
 import sqlalchemy as db
@@ -30,12 +30,15 @@ def db_subquery(query, name: str = "subquery"):
     return query.alias(name)
 
 
-def db_fetch_mappings(conn, query: Any) -> Sequence[Any]:
+def db_fetch_mappings(
+    conn, query: Any, params: Optional[Mapping[str, Any]] = None
+) -> Sequence[Any]:
     """Utility class that allows compatibility between SqlAlchemy 1.3.x, 1.4.x, and 2.x."""
+    result = conn.execute(query, params) if params is not None else conn.execute(query)
     if not IS_SQLALCHEMY_VERSION_1:
-        return conn.execute(query).mappings().all()
+        return result.mappings().all()
 
-    return conn.execute(query).fetchall()
+    return result.fetchall()
 
 
 def db_scalar_subquery(query):
@@ -44,6 +44,7 @@
 from dagster._core.definitions.graph_definition import GraphDefinition
 from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.node_definition import NodeDefinition
+from dagster._core.definitions.remote_asset_graph import CodeLocationAssetGraphFragment
 from dagster._core.definitions.repository_definition.repository_definition import (
     RepositoryDefinition,
 )
@@ -786,4 +787,7 @@ def mock_workspace_from_repos(repos: Sequence[RepositoryDefinition]) -> Workspac
     mock_location = unittest.mock.MagicMock(spec=CodeLocation)
     mock_location.get_repositories.return_value = remote_repos
     type(mock_entry).code_location = unittest.mock.PropertyMock(return_value=mock_location)
+    type(mock_entry).asset_graph_fragment = unittest.mock.PropertyMock(
+        return_value=CodeLocationAssetGraphFragment.build(mock_location)
+    )
     return WorkspaceSnapshot(code_location_entries={"test": mock_entry})
@@ -2,12 +2,14 @@
 import random
 import re
 import string
+import threading
 import uuid
 import warnings
-from collections import OrderedDict, deque
+from collections import OrderedDict
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 from contextvars import copy_context
+from queue import Empty, Queue
 from typing import (  # noqa: UP035
     AbstractSet,
     Any,
@@ -69,9 +71,44 @@ def coerce_valid_log_level(log_level: Union[str, int]) -> int:
 def toposort(
     data: Mapping[T, AbstractSet[T]], sort_key: Optional[Callable[[T], Any]] = None
 ) -> Sequence[Sequence[T]]:
-    # Workaround a bug in older versions of toposort that choke on frozenset
-    data = {k: set(v) if isinstance(v, frozenset) else v for k, v in data.items()}
-    return [sorted(list(level), key=sort_key) for level in toposort_.toposort(data)]
+    # Equivalent to toposort.toposort, which rescans every remaining item to find each level and so
+    # is quadratic for deep graphs. Instead, track the number of unsorted dependencies of each item
+    # and only visit the dependents of each level.
+    deps: dict[T, set[T]] = {item: {dep for dep in v if dep != item} for item, v in data.items()}
+    for item_deps in list(deps.values()):
+        for dep in item_deps:
+            deps.setdefault(dep, set())
+
+    dependents: dict[T, list[T]] = {item: [] for item in deps}
+    num_unsorted_deps: dict[T, int] = {}
+    for item, item_deps in deps.items():
+        num_unsorted_deps[item] = len(item_deps)
+        for dep in item_deps:
+            dependents[dep].append(item)
+
+    levels: list[list[T]] = []
+    level = [item for item, num_deps in num_unsorted_deps.items() if num_deps == 0]
+    while level:
+        levels.append(sorted(level, key=sort_key))
+        next_level = []
+        for item in level:
+            for dependent in dependents[item]:
+                num_unsorted_deps[dependent] -= 1
+                if num_unsorted_deps[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    if sum(len(level) for level in levels) != len(deps):
+        sorted_items = {item for level in levels for item in level}
+        raise toposort_.CircularDependencyError(
+            {
+                item: item_deps - sorted_items
+                for item, item_deps in deps.items()
+                if item not in sorted_items
+            }
+        )
+
+    return levels
 
 
 def toposort_flatten(data: Mapping[T, AbstractSet[T]]) -> Sequence[T]:
@@ -214,6 +251,7 @@ def imap(
     executor: ThreadPoolExecutor,
     iterable: Iterator[T],
     func: Callable[[T], P],
+    max_pending: Optional[int] = None,
 ) -> Iterator[P]:
     """A version of `concurrent.futures.ThreadpoolExecutor.map` which tails the input iterator in
     a separate thread. This means that the map function can begin processing and yielding results from
@@ -223,32 +261,69 @@ def imap(
         executor: The ThreadPoolExecutor to use for parallel execution.
         iterable: The iterator to apply the function to.
         func: The function to apply to each element of the iterator.
+        max_pending: The maximum number of elements that may be read from the iterator before
+            their results are yielded. Once this limit is reached, the input iterator is not
+            advanced until the consumer catches up. If None, the input iterator is read as fast as
+            possible.
     """
-    work_queue: deque[Future] = deque([])
+    work_queue: Queue[Optional[Future]] = Queue()
+    pending_slots = threading.Semaphore(max_pending) if max_pending else None
+    stopped = threading.Event()
 
     # create a small task which waits on the iterator
     # and enqueues work items as they become available
-    def _apply_func_to_iterator_results(iterable: Iterator) -> None:
-        for arg in iterable:
-            work_queue.append(executor.submit(func, arg))
+    def _apply_func_to_iterator_results(iterable: Iterable) -> None:
+        iterator = iter(iterable)
+        try:
+            while True:
+                # wait for a free slot before reading the next element, so that the input
+                # iterator is never read further ahead than `max_pending` elements
+                if pending_slots:
+                    pending_slots.acquire()
+                if stopped.is_set():
+                    break
+
+                try:
+                    arg = next(iterator)
+                except StopIteration:
+                    break
+
+                work_queue.put(executor.submit(func, arg))
+        finally:
+            work_queue.put(None)
 
     enqueuing_task = executor.submit(
         _apply_func_to_iterator_results,
         iterable,
     )
 
-    while True:
-        if (not enqueuing_task or enqueuing_task.done()) and len(work_queue) == 0:
-            break
-
-        if len(work_queue) > 0:
-            current_work_item = work_queue[0]
-
+    try:
+        while True:
+            # wake up periodically rather than blocking indefinitely, so that interrupts are
+            # handled promptly
             try:
-                yield current_work_item.result(timeout=0.1)
-                work_queue.popleft()
-            except TimeoutError:
-                pass
+                current_work_item = work_queue.get(timeout=0.1)
+            except Empty:
+                continue
+
+            if current_work_item is None:
+                break
+
+            while True:
+                try:
+                    result = current_work_item.result(timeout=0.1)
+                    break
+                except TimeoutError:
+                    pass
+
+            if pending_slots:
+                pending_slots.release()
+            yield result
+    finally:
+        # unblock the enqueuing task if the consumer stops early
+        stopped.set()
+        if pending_slots:
+            pending_slots.release()
 
     # Ensure any exceptions from the enqueuing task processing the iterator are raised,
     # after all work items have been processed.
@@ -7,7 +7,10 @@
 from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
-    from dagster._core.definitions.remote_asset_graph import RemoteWorkspaceAssetGraph
+    from dagster._core.definitions.remote_asset_graph import (
+        CodeLocationAssetGraphFragment,
+        RemoteWorkspaceAssetGraph,
+    )
     from dagster._core.remote_representation import CodeLocation, CodeLocationOrigin
 
 
@@ -29,6 +32,12 @@ class CodeLocationEntry:
     update_timestamp: float
     version_key: str
 
+    @cached_property
+    def asset_graph_fragment(self) -> "CodeLocationAssetGraphFragment":
+        from dagster._core.definitions.remote_asset_graph import CodeLocationAssetGraphFragment
+
+        return CodeLocationAssetGraphFragment.build(self.code_location)
+
 
 @record
 class CodeLocationStatusEntry:
@@ -53,7 +62,25 @@ def asset_graph(self) -> "RemoteWorkspaceAssetGraph":
         return RemoteWorkspaceAssetGraph.build(self)
 
     def with_code_location(self, name: str, entry: CodeLocationEntry) -> "WorkspaceSnapshot":
-        return WorkspaceSnapshot(code_location_entries={**self.code_location_entries, name: entry})
+        snapshot = WorkspaceSnapshot(
+            code_location_entries={**self.code_location_entries, name: entry}
+        )
+
+        # If the asset graph of this snapshot has already been built, rebuild only the parts of it
+        # that come from the replaced code location rather than the whole graph.
+        asset_graph = self.__dict__.get("asset_graph")
+        previous_entry = self.code_location_entries.get(name)
+        if asset_graph is not None and previous_entry is not None:
+            snapshot.__dict__["asset_graph"] = asset_graph.with_replaced_fragment(
+                previous_entry.asset_graph_fragment,
+                entry.asset_graph_fragment,
+                [
+                    location_entry.asset_graph_fragment
+                    for location_entry in snapshot.code_location_entries.values()
+                ],
+            )
+
+        return snapshot
 
 
 def location_status_from_location_entry(
@@ -15,6 +15,8 @@
 import dagster._check as check
 from dagster._core.definitions.asset_daemon_cursor import (
     AssetDaemonCursor,
+    AssetDaemonCursorManifest,
+    AutomationConditionCursorRef,
     LegacyAssetDaemonCursorWrapper,
     backcompat_deserialize_asset_daemon_cursor_str,
 )
@@ -74,12 +76,15 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import get_current_datetime, get_current_timestamp
 from dagster._utils import SingleInstigatorDebugCrashFlags, check_for_debug_crash, return_as_list
+from dagster._utils.security import non_secure_md5_hash_str
 
 _LEGACY_PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 _PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR_NEW"
 _PRE_SENSOR_ASSET_DAEMON_PAUSED_KEY = "ASSET_DAEMON_PAUSED"
 _MIGRATED_CURSOR_TO_SENSORS_KEY = "MIGRATED_CURSOR_TO_SENSORS"
 _MIGRATED_SENSOR_NAMES_KEY = "MIGRATED_SENSOR_NAMES_KEY"
+_CONDITION_CURSOR_KEY_PREFIX = "AUTOMATION_CONDITION_CURSOR"
+_CONDITION_CURSOR_CHUNK_SIZE = 500
 
 
 EVALUATIONS_TTL_DAYS = 30
@@ -185,41 +190,160 @@ def get_current_evaluation_id(
     return cursor.evaluation_id
 
 
+def _compress_instigator_serialized_cursor(version: str, value: Any) -> str:
+    serialized_bytes = serialize_value(value).encode("utf-8")
+    compressed_bytes = zlib.compress(serialized_bytes)
+    encoded_cursor = base64.b64encode(compressed_bytes).decode("utf-8")
+    return version + encoded_cursor
+
+
+def _deserialize_instigator_serialized_cursor(
+    serialized_cursor: str,
+) -> Optional[Any]:
+    # the version is incremented when the cursor format changes
+    version, encoded_bytes = serialized_cursor[0], serialized_cursor[1:]
+    if version == "0":
+        # the entire cursor is stored inline
+        klasses = (LegacyAssetDaemonCursorWrapper, AssetDaemonCursor)
+    elif version == "1":
+        # condition cursors are stored in their own rows of the daemon cursor storage
+        klasses = (AssetDaemonCursorManifest,)
+    else:
+        return None
+
+    decoded_bytes = base64.b64decode(encoded_bytes)
+    decompressed_bytes = zlib.decompress(decoded_bytes)
+    decompressed_str = decompressed_bytes.decode("utf-8")
+
+    return deserialize_value(decompressed_str, klasses)
+
+
 def asset_daemon_cursor_to_instigator_serialized_cursor(cursor: AssetDaemonCursor) -> str:
     """This method compresses the serialized cursor and returns a b64 encoded string to be stored
     as a string value.
     """
-    # increment the version if the cursor format changes
-    VERSION = "0"
+    return _compress_instigator_serialized_cursor("0", cursor)
 
-    serialized_bytes = serialize_value(cursor).encode("utf-8")
-    compressed_bytes = zlib.compress(serialized_bytes)
-    encoded_cursor = base64.b64encode(compressed_bytes).decode("utf-8")
-    return VERSION + encoded_cursor
+
+def _get_condition_cursor_storage_key(
+    storage_key_prefix: str, ref: AutomationConditionCursorRef
+) -> str:
+    entity_id = non_secure_md5_hash_str(serialize_value(ref.key).encode("utf-8"))
+    return f"{storage_key_prefix}/{entity_id}/{ref.slot}"
+
+
+def write_asset_daemon_cursor_to_instigator_serialized_cursor(
+    instance: DagsterInstance,
+    instigator_selector_id: str,
+    cursor: AssetDaemonCursor,
+    previous_serialized_cursor: Optional[str],
+) -> str:
+    """Writes each condition cursor which has changed since the previous cursor to its own row of
+    the daemon cursor storage, and returns a compressed, b64 encoded manifest referencing those rows.
+
+    Condition cursors of entities which are not present on the new cursor (e.g. because they were
+    not loaded for this tick) are carried over from the previous cursor.
+    """
+    previous_manifest = (
+        _deserialize_instigator_serialized_cursor(previous_serialized_cursor)
+        if previous_serialized_cursor
+        else None
+    )
+    previous_refs_by_key = (
+        previous_manifest.condition_cursor_refs_by_key
+        if isinstance(previous_manifest, AssetDaemonCursorManifest)
+        else {}
+    )
+
+    storage_key_prefix = f"{_CONDITION_CURSOR_KEY_PREFIX}/{instigator_selector_id}"
+    refs_by_key = dict(previous_refs_by_key)
+    values_to_write: dict[str, str] = {}
+    for condition_cursor in cursor.previous_condition_cursors_by_key.values():
+        serialized_condition_cursor = serialize_value(condition_cursor)
+        cursor_hash = non_secure_md5_hash_str(serialized_condition_cursor.encode("utf-8"))
+        previous_ref = previous_refs_by_key.get(condition_cursor.key)
+        if previous_ref and previous_ref.cursor_hash == cursor_hash:
+            continue
+        ref = AutomationConditionCursorRef(
+            key=condition_cursor.key,
+            # never overwrite the row referenced by the previous cursor, as this tick may fail
+            # before the new cursor is committed
+            slot=1 - previous_ref.slot if previous_ref else 0,
+            cursor_hash=cursor_hash,
+        )
+        refs_by_key[condition_cursor.key] = ref
+        values_to_write[_get_condition_cursor_storage_key(storage_key_prefix, ref)] = (
+            serialized_condition_cursor
+        )
+
+    items_to_write = list(values_to_write.items())
+    for i in range(0, len(items_to_write), _CONDITION_CURSOR_CHUNK_SIZE):
+        instance.daemon_cursor_storage.set_cursor_values(
+            dict(items_to_write[i : i + _CONDITION_CURSOR_CHUNK_SIZE])
+        )
+
+    return _compress_instigator_serialized_cursor(
+        "1",
+        AssetDaemonCursorManifest(
+            cursor=dataclasses.replace(
+                cursor, previous_evaluation_state=[], previous_condition_cursors=[]
+            ),
+            storage_key_prefix=storage_key_prefix,
+            condition_cursor_refs=list(refs_by_key.values()),
+        ),
+    )
+
+
+def _load_condition_cursors(
+    manifest: AssetDaemonCursorManifest,
+    instance: DagsterInstance,
+    entity_keys: Optional[AbstractSet[EntityKey]],
+) -> AssetDaemonCursor:
+    from dagster._core.definitions.declarative_automation.serialized_objects import (
+        AutomationConditionCursor,
+    )
+
+    storage_keys = [
+        _get_condition_cursor_storage_key(manifest.storage_key_prefix, ref)
+        for ref in manifest.condition_cursor_refs
+        if entity_keys is None or ref.key in entity_keys
+    ]
+    condition_cursors = []
+    for i in range(0, len(storage_keys), _CONDITION_CURSOR_CHUNK_SIZE):
+        values = instance.daemon_cursor_storage.get_cursor_values(
+            set(storage_keys[i : i + _CONDITION_CURSOR_CHUNK_SIZE])
+        )
+        condition_cursors.extend(
+            deserialize_value(value, AutomationConditionCursor) for value in values.values()
+        )
+    return dataclasses.replace(manifest.cursor, previous_condition_cursors=condition_cursors)
 
 
 def asset_daemon_cursor_from_instigator_serialized_cursor(
-    serialized_cursor: Optional[str], asset_graph: Optional[BaseAssetGraph]
+    serialized_cursor: Optional[str],
+    asset_graph: Optional[BaseAssetGraph],
+    instance: Optional[DagsterInstance] = None,
+    entity_keys: Optional[AbstractSet[EntityKey]] = None,
 ) -> AssetDaemonCursor:
     """This method decompresses the serialized cursor and returns a deserialized cursor object,
     converting from the legacy cursor format if necessary.
+
+    If the condition cursors are stored separately, they are loaded from the provided instance,
+    restricted to the given entity keys if provided. If no instance is provided, the returned
+    cursor will not contain any condition cursors.
     """
     if serialized_cursor is None:
         return AssetDaemonCursor.empty()
 
-    version, encoded_bytes = serialized_cursor[0], serialized_cursor[1:]
-    if version != "0":
+    deserialized_cursor = _deserialize_instigator_serialized_cursor(serialized_cursor)
+    if deserialized_cursor is None:
         return AssetDaemonCursor.empty()
-
-    decoded_bytes = base64.b64decode(encoded_bytes)
-    decompressed_bytes = zlib.decompress(decoded_bytes)
-    decompressed_str = decompressed_bytes.decode("utf-8")
-
-    deserialized_cursor = deserialize_value(
-        decompressed_str, (LegacyAssetDaemonCursorWrapper, AssetDaemonCursor)
-    )
-    if isinstance(deserialized_cursor, LegacyAssetDaemonCursorWrapper):
+    elif isinstance(deserialized_cursor, LegacyAssetDaemonCursorWrapper):
         return deserialized_cursor.get_asset_daemon_cursor(asset_graph)
+    elif isinstance(deserialized_cursor, AssetDaemonCursorManifest):
+        if instance is None:
+            return deserialized_cursor.cursor
+        return _load_condition_cursors(deserialized_cursor, instance, entity_keys)
     return deserialized_cursor
 
 
@@ -754,6 +878,12 @@ def _process_auto_materialize_tick_generator(
                         check.not_none(auto_materialize_instigator_state).instigator_data,
                     ).cursor,
                     asset_graph,
+                    instance=instance,
+                    # condition cursors for other entities are carried over when the new cursor
+                    # is written, so only the ones needed for this tick are loaded
+                    entity_keys=auto_materialize_entity_keys
+                    if instance.auto_materialize_use_entity_cursor_storage
+                    else None,
                 )
 
                 instigator_origin_id = sensor.get_remote_origin().get_id()
@@ -994,15 +1124,28 @@ def _evaluate_auto_materialize_tick(
             # Write out the persistent cursor, which ensures that future ticks will move on once
             # they determine that nothing needs to be retried
             if sensor:
-                state = instance.get_instigator_state(
-                    sensor.get_remote_origin_id(), sensor.selector_id
+                state = check.not_none(
+                    instance.get_instigator_state(sensor.get_remote_origin_id(), sensor.selector_id)
                 )
+                if instance.auto_materialize_use_entity_cursor_storage:
+                    serialized_cursor = write_asset_daemon_cursor_to_instigator_serialized_cursor(
+                        instance,
+                        sensor.selector_id,
+                        new_cursor,
+                        state.sensor_instigator_data.cursor
+                        if state.sensor_instigator_data
+                        else None,
+                    )
+                else:
+                    serialized_cursor = asset_daemon_cursor_to_instigator_serialized_cursor(
+                        new_cursor
+                    )
                 instance.update_instigator_state(
-                    check.not_none(state).with_data(
+                    state.with_data(
                         SensorInstigatorData(
                             last_tick_timestamp=tick.timestamp,
                             min_interval=sensor.min_interval_seconds,
-                            cursor=asset_daemon_cursor_to_instigator_serialized_cursor(new_cursor),
+                            cursor=serialized_cursor,
                             sensor_type=sensor.sensor_type,
                         )
                     )
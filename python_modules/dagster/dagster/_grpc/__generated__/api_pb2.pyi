@@ -422,13 +422,16 @@ class ExternalRepositoryRequest(google.protobuf.message.Message):
 
     SERIALIZED_REPOSITORY_PYTHON_ORIGIN_FIELD_NUMBER: builtins.int
     DEFER_SNAPSHOTS_FIELD_NUMBER: builtins.int
+    SHARE_JOB_SNAPSHOTS_FIELD_NUMBER: builtins.int
     serialized_repository_python_origin: builtins.str
     defer_snapshots: builtins.bool
+    share_job_snapshots: builtins.bool
     def __init__(
         self,
         *,
         serialized_repository_python_origin: builtins.str = ...,
         defer_snapshots: builtins.bool = ...,
+        share_job_snapshots: builtins.bool = ...,
     ) -> None: ...
     def ClearField(
         self,
@@ -437,6 +440,8 @@ class ExternalRepositoryRequest(google.protobuf.message.Message):
             b"defer_snapshots",
             "serialized_repository_python_origin",
             b"serialized_repository_python_origin",
+            "share_job_snapshots",
+            b"share_job_snapshots",
         ],
     ) -> None: ...
 
@@ -408,6 +408,7 @@ def external_repository(
         self,
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
+        share_job_snapshots: bool = False,
     ) -> str:
         check.inst_param(
             remote_repository_origin,
@@ -421,6 +422,7 @@ def external_repository(
             # rename this param name
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
+            share_job_snapshots=share_job_snapshots,
         )
 
         return res.serialized_external_repository_data
@@ -447,6 +449,7 @@ def streaming_external_repository(
         self,
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
+        share_job_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
     ) -> Iterator[dict]:
         for res in self._streaming_query(
@@ -455,6 +458,7 @@ def streaming_external_repository(
             # Rename parameter
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
+            share_job_snapshots=share_job_snapshots,
             timeout=timeout,
         ):
             yield {
@@ -466,6 +470,7 @@ async def gen_streaming_external_repository(
         self,
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
+        share_job_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
     ) -> AsyncIterable[dict]:
         async for res in self._gen_streaming_query(
@@ -474,6 +479,7 @@ async def gen_streaming_external_repository(
             # Rename parameter
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
+            share_job_snapshots=share_job_snapshots,
             timeout=timeout,
         ):
             yield {
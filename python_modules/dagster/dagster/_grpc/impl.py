@@ -30,7 +30,12 @@
     user_code_error_boundary,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_run_iterator
+from dagster._core.execution.api import (
+    create_execution_plan,
+    execute_run_iterator,
+    load_job_definition_in_worker,
+)
+from dagster._core.execution.run_tracing import run_tracing_scope
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.remote_representation.external_data import (
@@ -108,52 +113,53 @@ def core_execute_run(
             yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
             raise
 
-    # try to load the pipeline definition early
-    try:
-        # add in cached metadata to load repository more efficiently
-        if dagster_run.has_repository_load_data:
-            execution_plan_snapshot = instance.get_execution_plan_snapshot(
-                check.not_none(dagster_run.execution_plan_snapshot_id)
-            )
-            recon_job = recon_job.with_repository_load_data(
-                execution_plan_snapshot.repository_load_data,
+    with run_tracing_scope(instance, dagster_run):
+        # try to load the pipeline definition early
+        try:
+            # add in cached metadata to load repository more efficiently
+            if dagster_run.has_repository_load_data:
+                execution_plan_snapshot = instance.get_execution_plan_snapshot(
+                    check.not_none(dagster_run.execution_plan_snapshot_id)
+                )
+                recon_job = recon_job.with_repository_load_data(
+                    execution_plan_snapshot.repository_load_data,
+                )
+            yield load_job_definition_in_worker(recon_job, instance, dagster_run)
+        except Exception:
+            yield instance.report_engine_event(
+                "Could not load job definition.",
+                dagster_run,
+                EngineEventData.engine_error(serializable_error_info_from_exc_info(sys.exc_info())),
             )
-        recon_job.get_definition()
-    except Exception:
-        yield instance.report_engine_event(
-            "Could not load job definition.",
-            dagster_run,
-            EngineEventData.engine_error(serializable_error_info_from_exc_info(sys.exc_info())),
-        )
-        yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
-        raise
-
-    # Reload the run to verify that its status didn't change while the pipeline was loaded
-    dagster_run = check.not_none(
-        instance.get_run_by_id(dagster_run.run_id),
-        f"Job run with id '{dagster_run.run_id}' was deleted after the run worker started.",
-    )
+            yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
+            raise
 
-    try:
-        yield from execute_run_iterator(
-            recon_job, dagster_run, instance, resume_from_failure=resume_from_failure
-        )
-    except (KeyboardInterrupt, DagsterExecutionInterruptedError):
-        yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
-        yield instance.report_engine_event(
-            message="Run execution terminated by interrupt",
-            dagster_run=dagster_run,
+        # Reload the run to verify that its status didn't change while the pipeline was loaded
+        dagster_run = check.not_none(
+            instance.get_run_by_id(dagster_run.run_id),
+            f"Job run with id '{dagster_run.run_id}' was deleted after the run worker started.",
         )
-        raise
-    except Exception:
-        yield instance.report_engine_event(
-            "An exception was thrown during execution that is likely a framework error, "
-            "rather than an error in user code.",
-            dagster_run,
-            EngineEventData.engine_error(serializable_error_info_from_exc_info(sys.exc_info())),
-        )
-        yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
-        raise
+
+        try:
+            yield from execute_run_iterator(
+                recon_job, dagster_run, instance, resume_from_failure=resume_from_failure
+            )
+        except (KeyboardInterrupt, DagsterExecutionInterruptedError):
+            yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
+            yield instance.report_engine_event(
+                message="Run execution terminated by interrupt",
+                dagster_run=dagster_run,
+            )
+            raise
+        except Exception:
+            yield instance.report_engine_event(
+                "An exception was thrown during execution that is likely a framework error, "
+                "rather than an error in user code.",
+                dagster_run,
+                EngineEventData.engine_error(serializable_error_info_from_exc_info(sys.exc_info())),
+            )
+            yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
+            raise
 
 
 @contextmanager
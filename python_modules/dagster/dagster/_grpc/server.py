@@ -803,6 +803,7 @@ def _get_serialized_external_repository_data(
                 RepositorySnap.from_def(
                     self._get_repo_for_origin(repository_origin),
                     defer_snapshots=request.defer_snapshots,
+                    share_job_snapshots=request.share_job_snapshots,
                 )
             )
         except Exception:
@@ -0,0 +1,146 @@
+"""A compact text encoding for serialized values, for storing them in text columns.
+
+Values are serialized to JSON as usual, then deflated with a preset dictionary of the JSON fragments
+that occur most often in serialized event log entries, such as object class names and field names,
+and base64 encoded. Encoded values start with a prefix that names the dictionary they were deflated
+with, so that `deserialize_value` can read encoded and plain JSON values interchangeably.
+"""
+
+import base64
+import zlib
+from collections.abc import Mapping
+
+COMPRESSED_VALUE_PREFIX = "@z"
+
+# The dictionaries that values may have been compressed with, by version. Since stored values refer to
+# these by version, a dictionary must never change once it has been released; add a new version instead.
+_PRESET_DICTIONARIES: Mapping[str, bytes] = {
+    "1": "".join(
+        (
+            '{"__class__": "SerializableErrorInfo", ',
+            '"cls_name": ',
+            '"stack": ',
+            '"cause": ',
+            '"context": ',
+            '{"__class__": "StepFailureData", ',
+            '"user_failure_data": ',
+            '"error_source": ',
+            '{"__class__": "AssetObservation", ',
+            '{"__class__": "AssetObservationData", ',
+            '{"__class__": "JobFailureData", ',
+            '{"__class__": "FloatMetadataEntryData", ',
+            '"metadata": ',
+            '"module": ',
+            '"severity": ',
+            '"storage_id": ',
+            '"target_materialization_data": ',
+            '"upstream_output_name": ',
+            '"upstream_step_key": ',
+            '{"__class__": "AssetCheckEvaluation", ',
+            '{"__class__": "AssetCheckEvaluationPlanned", ',
+            '{"__class__": "AssetCheckEvaluationTargetMaterializationData", ',
+            '{"__class__": "LoadedInputData", ',
+            '{"__class__": "PythonArtifactMetadataEntryData", ',
+            '{"__class__": "StepInputData", ',
+            '{"__enum__": "AssetCheckSeverity.ERROR"}',
+            '"asset_lineage": ',
+            '"check_name": ',
+            '"dagster/code_version": ',
+            '"dagster/data_version": ',
+            '"external_stderr_url": ',
+            '"external_stdout_url": ',
+            '"external_url": ',
+            '"input_name": ',
+            '"log_key": ',
+            '"materialization": ',
+            '"partitions_subset": ',
+            '"shell_cmd": ',
+            '"step_keys": ',
+            '"tags": ',
+            '{"__class__": "AssetMaterialization", ',
+            '{"__class__": "AssetMaterializationPlannedData", ',
+            '{"__class__": "ComputeLogsCaptureData", ',
+            '{"__class__": "HandledOutputData", ',
+            '{"__class__": "StepMaterializationData", ',
+            '"duration_ms": ',
+            '"manager_key": ',
+            '"mapping_key": ',
+            '"step_output_handle": ',
+            '"value": ',
+            '"version": ',
+            '{"__class__": "IntMetadataEntryData", ',
+            '{"__class__": "StepOutputData", ',
+            '{"__class__": "StepOutputHandle", ',
+            '{"__class__": "StepSuccessData", ',
+            '"partition": ',
+            '"type_check_data": ',
+            '{"__class__": "TypeCheckData", ',
+            '"output_name": ',
+            '"success": ',
+            '{"__class__": "PathMetadataEntryData", ',
+            '"asset_key": ',
+            '"error": ',
+            '"marker_end": ',
+            '"marker_start": ',
+            '{"__class__": "AssetKey", ',
+            '{"__class__": "EngineEventData", ',
+            '{"__class__": "TextMetadataEntryData", ',
+            '"job_name": ',
+            '"key": ',
+            '"op_name": ',
+            '"resource_fn_name": ',
+            '"resource_name": ',
+            '{"__class__": "StepHandle", ',
+            '"entry_data": ',
+            '{"__class__": "EventMetadataEntry", ',
+            '"metadata_entries": ',
+            '"label": ',
+            '"description": ',
+            '"event_specific_data": ',
+            '"event_type_value": ',
+            '"logging_tags": ',
+            '"pid": ',
+            '"step_handle": ',
+            '"step_kind_value": ',
+            '{"__class__": "DagsterEvent", ',
+            '"parent": ',
+            '{"__class__": "SolidHandle", ',
+            '"name": ',
+            '"dagster_event": ',
+            '"error_info": ',
+            '"level": ',
+            '"user_message": ',
+            '{"__class__": "EventLogEntry", ',
+            '"timestamp": ',
+            '"solid_handle": ',
+            '"run_id": ',
+            '"message": ',
+            '"pipeline_name": ',
+            '"step_key": ',
+        )
+    ).encode(),
+}
+_CURRENT_DICTIONARY_VERSION = "1"
+
+
+def is_compressed_value(val: str) -> bool:
+    return val.startswith(COMPRESSED_VALUE_PREFIX)
+
+
+def compress_serialized_value(serialized: str) -> str:
+    """Encodes the output of `serialize_value` into a shorter string."""
+    compressor = zlib.compressobj(zdict=_PRESET_DICTIONARIES[_CURRENT_DICTIONARY_VERSION])
+    compressed = compressor.compress(serialized.encode("utf-8")) + compressor.flush()
+    return (
+        f"{COMPRESSED_VALUE_PREFIX}{_CURRENT_DICTIONARY_VERSION}:"
+        f"{base64.b64encode(compressed).decode('ascii')}"
+    )
+
+
+def decompress_serialized_value(val: str) -> str:
+    """Decodes a string produced by `compress_serialized_value` back into serialized JSON."""
+    version, _, data = val[len(COMPRESSED_VALUE_PREFIX) :].partition(":")
+    if version not in _PRESET_DICTIONARIES:
+        raise ValueError(f"Unknown compressed value version {version}")
+    decompressor = zlib.decompressobj(zdict=_PRESET_DICTIONARIES[version])
+    return (decompressor.decompress(base64.b64decode(data)) + decompressor.flush()).decode("utf-8")
@@ -48,6 +48,7 @@
     has_generated_new,
     is_record,
 )
+from dagster._serdes.compression import decompress_serialized_value, is_compressed_value
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._utils import is_named_tuple_instance, is_named_tuple_subclass
 from dagster._utils.warnings import disable_dagster_warnings
@@ -231,6 +232,27 @@ def create() -> "WhitelistMap":
 
 _WHITELIST_MAP: Final[WhitelistMap] = WhitelistMap.create()
 
+_public_api_imported = False
+
+
+def _import_public_api() -> None:
+    """Import every symbol of the dagster public API, registering the serdes classes they define.
+
+    Symbols of the public API are imported on first access, so a process can deserialize a value
+    before the module defining its class has been imported. Deserializing against the default
+    whitelist map falls back to this before treating a class as unknown.
+    """
+    global _public_api_imported  # noqa: PLW0603
+    if _public_api_imported:
+        return
+
+    import dagster
+
+    for name in dagster._PUBLIC_API:  # noqa: SLF001
+        getattr(dagster, name)
+    _public_api_imported = True
+
+
 T = TypeVar("T")
 U = TypeVar("U")
 T_Type = TypeVar("T_Type", bound=type[object])
@@ -1117,7 +1139,8 @@ def deserialize_value(
     ] = None,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
 ) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
-    """Deserialize a json encoded string to a Python object.
+    """Deserialize a json encoded string to a Python object. Strings produced by
+    `compress_serialized_value` are decompressed first.
 
     Two steps:
 
@@ -1169,9 +1192,10 @@ def deserialize_values(
     ):
         unpacked_values = []
         for val in vals:
+            json_str = decompress_serialized_value(val) if is_compressed_value(val) else val
             context = UnpackContext()
             unpacked_value = seven.json.loads(
-                val,
+                json_str,
                 object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
             )
             unpacked_value = context.finalize_unpack(unpacked_value)
@@ -1197,6 +1221,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext) -> UnpackedValue:
     if "__class__" in val:
         klass_name = val["__class__"]
+        if klass_name not in whitelist_map.object_deserializers and whitelist_map is _WHITELIST_MAP:
+            _import_public_api()
         if klass_name not in whitelist_map.object_deserializers:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
@@ -1212,6 +1238,8 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
     if "__enum__" in val:
         enum = cast(str, val["__enum__"])
         name, member = enum.split(".")
+        if name not in whitelist_map.enum_serializers and whitelist_map is _WHITELIST_MAP:
+            _import_public_api()
         if name not in whitelist_map.enum_serializers:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
@@ -793,6 +793,33 @@ def tail_file(path_or_fd: Union[str, int], should_stop: Callable[[], bool]) -> I
                 time.sleep(0.01)
 
 
+def tail_file_batches(
+    path_or_fd: Union[str, int], should_stop: Callable[[], bool], chunk_size: int = 1024 * 1024
+) -> Iterator[Sequence[str]]:
+    """Like `tail_file`, but reads the file in chunks of up to `chunk_size` bytes and yields all of
+    the complete lines in each chunk at once. Empty lines are skipped, and a trailing line without
+    a newline is only yielded once `should_stop` returns True.
+    """
+    remainder = b""
+    with open(path_or_fd, "rb") as output_stream:
+        while True:
+            chunk = output_stream.read(chunk_size)
+            if chunk:
+                end = chunk.rfind(b"\n")
+                if end == -1:
+                    remainder += chunk
+                    continue
+                lines = (remainder + chunk[:end]).decode().split("\n")
+                remainder = chunk[end + 1 :]
+                yield [line for line in lines if line]
+            elif should_stop():
+                if remainder:
+                    yield [remainder.decode()]
+                break
+            else:
+                time.sleep(0.01)
+
+
 def is_uuid(value: str) -> bool:
     try:
         uuid.UUID(value)
@@ -40,7 +40,7 @@
 if TYPE_CHECKING:
     from dagster._core.execution.asset_backfill import AssetBackfillData
     from dagster._core.storage.event_log import EventLogRecord
-    from dagster._core.storage.event_log.base import AssetRecord
+    from dagster._core.storage.event_log.base import AssetRecord, LatestAssetPartitionEvents
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 RECORD_BATCH_SIZE = 1000
@@ -77,6 +77,7 @@ def __init__(
         ] = {}
 
         self._dynamic_partitions_cache: dict[str, Sequence[str]] = {}
+        self._latest_asset_partition_events_by_key: dict[AssetKey, LatestAssetPartitionEvents] = {}
 
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
@@ -101,10 +102,32 @@ def evaluation_time(self) -> datetime:
     ####################
 
     def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
-        """For performance, batches together queries for selected assets."""
+        """For performance, batches together queries for selected assets. For partitioned assets,
+        this includes the latest materialization or observation of each partition.
+        """
         from dagster._core.storage.event_log.base import AssetRecord
 
+        asset_keys = list(asset_keys)
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
+        self._prefetch_latest_asset_partition_events(asset_keys)
+
+    def _prefetch_latest_asset_partition_events(self, asset_keys: Iterable[AssetKey]) -> None:
+        asset_keys_by_event_type: dict[DagsterEventType, list[AssetKey]] = defaultdict(list)
+        for asset_key in asset_keys:
+            if (
+                asset_key not in self._latest_asset_partition_events_by_key
+                and self.asset_graph.has(asset_key)
+                and self.asset_graph.get(asset_key).is_partitioned
+            ):
+                asset_keys_by_event_type[self._event_type_for_key(asset_key)].append(asset_key)
+
+        for event_type, event_type_asset_keys in asset_keys_by_event_type.items():
+            for i in range(0, len(event_type_asset_keys), RECORD_BATCH_SIZE):
+                self._latest_asset_partition_events_by_key.update(
+                    self.instance.get_latest_asset_partition_events(
+                        event_type_asset_keys[i : i + RECORD_BATCH_SIZE], event_type
+                    )
+                )
 
     ####################
     # ASSET STATUS CACHE
@@ -324,12 +347,13 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.get(asset_key).is_partitioned:
+            # usually populated in bulk by prefetch_asset_records
+            self._prefetch_latest_asset_partition_events([asset_key])
+            latest_events = self._latest_asset_partition_events_by_key[asset_key]
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in latest_events.storage_id_by_partition.items()
                 }
             )
         return latest_storage_ids
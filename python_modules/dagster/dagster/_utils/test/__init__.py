@@ -353,7 +353,7 @@ def get_all_direct_subclasses_of_marker(marker_interface_cls: type) -> list[type
 
     return [
         symbol
-        for symbol in dagster.__dict__.values()
+        for symbol in (getattr(dagster, name) for name in dagster._PUBLIC_API)  # noqa: SLF001
         if isinstance(symbol, type)
         and issubclass(symbol, marker_interface_cls)
         and marker_interface_cls
@@ -203,6 +203,38 @@ def _ref_to_data(ref: JobRefSnap):
             expected += 1
 
 
+def test_share_job_snapshots(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(
+            code_location.origin,
+            "bar_repo",
+        )
+
+        repository_snap = deserialize_value(
+            code_location.client.external_repository(repo_origin), RepositorySnap
+        )
+        shared_repository_snap = deserialize_value(
+            code_location.client.external_repository(repo_origin, share_job_snapshots=True),
+            RepositorySnap,
+        )
+        assert shared_repository_snap.job_datas is None
+        assert shared_repository_snap.job_refs is None
+        assert shared_repository_snap.job_snap_table
+
+        repo = RemoteRepository(
+            shared_repository_snap,
+            RepositoryHandle.from_location(repository_name="bar_repo", code_location=code_location),
+            instance=instance,
+        )
+        jobs = repo.get_all_jobs()
+        assert len(jobs) == 7
+        for job in jobs:
+            job_data_snap = repository_snap.get_job_data(job.name)
+            assert job.computed_job_snapshot_id == job_data_snap.job.snapshot_id
+            assert job.job_snapshot == job_data_snap.job
+            assert job.job_snapshot.snapshot_id == job_data_snap.job.snapshot_id
+
+
 def test_job_data_snap_layout():
     # defend against assumptions made in
 
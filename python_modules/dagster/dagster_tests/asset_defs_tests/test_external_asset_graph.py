@@ -364,3 +364,72 @@ def test_dup_node_detection(instance):
         _ = _make_context(
             instance, ["dup_observation_defs_a", "dup_observation_defs_b"]
         ).asset_graph
+
+
+def _assert_same_graph(asset_graph, expected_asset_graph) -> None:
+    assert asset_graph.get_all_asset_keys() == expected_asset_graph.get_all_asset_keys()
+    assert set(asset_graph.asset_check_keys) == set(expected_asset_graph.asset_check_keys)
+    for key in expected_asset_graph.get_all_asset_keys():
+        node = asset_graph.get(key)
+        expected_node = expected_asset_graph.get(key)
+        assert node.parent_keys == expected_node.parent_keys
+        assert node.child_keys == expected_node.child_keys
+        assert node.check_keys == expected_node.check_keys
+        assert [info.handle for info in node.repo_scoped_asset_infos] == [
+            info.handle for info in expected_node.repo_scoped_asset_infos
+        ]
+    assert asset_graph.toposorted_asset_keys == expected_asset_graph.toposorted_asset_keys
+    assert (
+        asset_graph.toposorted_entity_keys_by_level
+        == expected_asset_graph.toposorted_entity_keys_by_level
+    )
+
+
+def test_with_code_location_rebuilds_replaced_location(instance) -> None:
+    snapshot = WorkspaceSnapshot(
+        code_location_entries={
+            "upstream": _make_location_entry("defs1", instance),
+            "downstream": _make_location_entry("downstream_defs", instance),
+        }
+    )
+    asset_graph = snapshot.asset_graph
+    assert asset_graph.toposorted_asset_keys == [AssetKey("asset1"), AssetKey("downstream")]
+
+    new_snapshot = snapshot.with_code_location(
+        "downstream", _make_location_entry("downstream_defs_no_source", instance)
+    )
+    new_asset_graph = new_snapshot.__dict__["asset_graph"]
+    assert new_asset_graph is not asset_graph
+    assert "asset_dep_graph" not in new_asset_graph.__dict__
+    assert not new_asset_graph.has(AssetKey("downstream"))
+    assert new_asset_graph.get(AssetKey("asset1")).child_keys == {
+        AssetKey("downstream_non_arg_dep")
+    }
+    _assert_same_graph(
+        new_asset_graph,
+        WorkspaceSnapshot(code_location_entries=new_snapshot.code_location_entries).asset_graph,
+    )
+
+
+def test_with_code_location_reuses_unchanged_deps(instance) -> None:
+    snapshot = WorkspaceSnapshot(
+        code_location_entries={
+            "upstream": _make_location_entry("defs1", instance),
+            "downstream": _make_location_entry("downstream_defs", instance),
+        }
+    )
+    asset_graph = snapshot.asset_graph
+    toposorted_asset_keys = asset_graph.toposorted_asset_keys
+
+    new_snapshot = snapshot.with_code_location(
+        "downstream", _make_location_entry("downstream_defs", instance)
+    )
+    new_asset_graph = new_snapshot.asset_graph
+    assert new_asset_graph.get(AssetKey("downstream")) is not asset_graph.get(
+        AssetKey("downstream")
+    )
+    assert new_asset_graph.toposorted_asset_keys is toposorted_asset_keys
+    _assert_same_graph(
+        new_asset_graph,
+        WorkspaceSnapshot(code_location_entries=new_snapshot.code_location_entries).asset_graph,
+    )
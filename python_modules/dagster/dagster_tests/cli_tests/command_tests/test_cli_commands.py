@@ -1,3 +1,4 @@
+import json
 import os
 import string
 import sys
@@ -17,6 +18,7 @@
     in_process_executor,
     job,
     op,
+    reconstructable,
     repository,
 )
 from dagster._cli import ENV_PREFIX, cli
@@ -25,13 +27,16 @@
     run_delete_command,
     run_list_command,
     run_migrate_command,
+    run_trace_command,
     run_wipe_command,
 )
 from dagster._cli.workspace.cli_target import ClickArgMapping
 from dagster._core.definitions.decorators.sensor_decorator import sensor
 from dagster._core.definitions.partition import PartitionedConfig, StaticPartitionsDefinition
 from dagster._core.definitions.sensor_definition import RunRequest
+from dagster._core.execution.api import execute_job
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.tags import RUN_TRACING_TAG
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._grpc.server import GrpcServerProcess
@@ -818,6 +823,31 @@ def test_run_delete_incorrect_delete_message():
         assert result.exit_code == 1
 
 
+def test_run_trace():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(define_foo_job), instance=instance, tags={RUN_TRACING_TAG: "true"}
+        ) as job_result:
+            run_id = job_result.run_id
+        untraced_run_id = foo_job.execute_in_process(instance=instance).run_id
+
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "trace.json")
+            result = runner.invoke(
+                run_trace_command, args=[run_id, "--output", output_path, "--format", "otlp"]
+            )
+            assert result.exit_code == 0, result.output
+            assert f"spans in 3 processes for run {run_id}" in result.output
+            assert "execute_step" in result.output
+            with open(output_path, encoding="utf8") as f:
+                assert len(json.load(f)["resourceSpans"]) == 3
+
+        result = runner.invoke(run_trace_command, args=[untraced_run_id])
+        assert result.exit_code == 1
+        assert "No spans were recorded" in result.output
+
+
 def test_run_list_limit():
     with instance_for_test():
         runner = CliRunner()
@@ -681,3 +681,36 @@ def test_post_process_error():
     error = error_result.errors[0]  # pyright: ignore[reportOptionalSubscript]
     assert error.reason == DagsterEvaluationErrorReason.FAILED_POST_PROCESSING
     assert len(error.stack.entries) == 1
+
+
+def test_validation_plans_cached_on_schema_snapshot():
+    config_type = resolve_to_config_type(
+        Shape({"foo": Field([{"bar": Int}]), "baz": Field(String)})
+    )
+    schema_snapshot = config_type.get_schema_snapshot()
+    assert config_type.get_schema_snapshot() is schema_snapshot
+
+    assert eval_config_value_from_dagster_type(config_type, {"foo": [], "baz": "qux"}).success
+    plans = dict(schema_snapshot.validation_plans)
+    assert config_type.key in plans
+
+    assert eval_config_value_from_dagster_type(
+        config_type, {"foo": [{"bar": 1}], "baz": "a"}
+    ).success
+    assert all(schema_snapshot.validation_plans[key] is plan for key, plan in plans.items())
+
+
+def test_nested_error_paths():
+    config_type = Shape({"outer": Field([{str: Shape({"inner": Field(Int)})}])})
+    result = eval_config_value_from_dagster_type(
+        config_type, {"outer": [{"a": {"inner": 1}}, {"b": {"inner": "not_an_int"}}]}
+    )
+    assert not result.success
+    [error] = result.errors  # pyright: ignore[reportGeneralTypeIssues]
+    assert error.stack.entries == [
+        EvaluationStackPathEntry("outer"),
+        EvaluationStackListItemEntry(1),
+        EvaluationStackMapValueEntry("b"),
+        EvaluationStackPathEntry("inner"),
+    ]
+    assert "at path root:outer[1]:'b':value:inner" in error.message
@@ -1165,7 +1165,7 @@ def partitioned_asset():
             if throw_store_event_batch_error:
                 stack.enter_context(
                     patch(
-                        "dagster._core.storage.event_log.base.EventLogStorage.store_event_batch",
+                        "dagster._core.storage.event_log.sqlite.sqlite_event_log.SqliteEventLogStorage.store_event_batch",
                         side_effect=Exception("failed"),
                     )
                 )
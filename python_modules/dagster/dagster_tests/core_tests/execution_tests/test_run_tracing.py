@@ -0,0 +1,108 @@
+import os
+
+from dagster import job, op, reconstructable, resource
+from dagster._core.execution.api import execute_job
+from dagster._core.execution.run_tracing import (
+    RunTracer,
+    get_run_trace_events,
+    summarize_trace_events,
+    to_otlp_trace,
+    trace_span,
+)
+from dagster._core.storage.tags import RUN_TRACING_TAG
+from dagster._core.test_utils import instance_for_test
+
+
+@resource
+def a_resource():
+    return 1
+
+
+@op(required_resource_keys={"a_resource"})
+def return_one(context):
+    return context.resources.a_resource
+
+
+@op
+def add_one(num):
+    return num + 1
+
+
+@job(resource_defs={"a_resource": a_resource})
+def traced_job():
+    add_one(return_one())
+
+
+def test_ring_buffer():
+    tracer = RunTracer(max_spans=2)
+    for i in range(3):
+        with tracer.span(f"span_{i}", {"index": str(i)}):
+            pass
+
+    assert tracer.span_count == 3
+    trace_events = tracer.get_trace_events()
+    assert [trace_event["name"] for trace_event in trace_events] == ["span_1", "span_2"]
+    assert trace_events[0]["args"] == {"index": "1"}
+    assert trace_events[0]["ph"] == "X"
+    assert trace_events[0]["pid"] == os.getpid()
+
+
+def test_tracing_disabled():
+    with instance_for_test() as instance:
+        with execute_job(reconstructable(traced_job), instance=instance) as result:
+            assert result.success
+            assert get_run_trace_events(instance, result.run_id) == []
+
+    # spans outside of a traced run are not recorded
+    with trace_span("store_event"):
+        pass
+
+
+def test_tracing_multiprocess():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(traced_job), instance=instance, tags={RUN_TRACING_TAG: "true"}
+        ) as result:
+            assert result.success
+            run_id = result.run_id
+
+        trace_events = get_run_trace_events(instance, run_id)
+
+    # the run worker and each step process record their own spans
+    assert len({trace_event["pid"] for trace_event in trace_events}) == 3
+    assert {trace_event["name"] for trace_event in trace_events} >= {
+        "create_execution_plan",
+        "child_process_start",
+        "load_job_definition",
+        "resources_init",
+        "execute_step",
+        "load_input",
+        "handle_output",
+        "store_event",
+    }
+    load_input_events = [
+        trace_event for trace_event in trace_events if trace_event["name"] == "load_input"
+    ]
+    assert [trace_event["args"] for trace_event in load_input_events] == [
+        {"step_key": "add_one", "input_name": "num"}
+    ]
+
+    summaries = summarize_trace_events(trace_events)
+    assert [summary.total_ms for summary in summaries] == sorted(
+        [summary.total_ms for summary in summaries], reverse=True
+    )
+    execute_step_summary = next(summary for summary in summaries if summary.name == "execute_step")
+    assert execute_step_summary.count == 2
+
+    otlp_trace = to_otlp_trace(trace_events, run_id)
+    assert len(otlp_trace["resourceSpans"]) == 3
+    spans = [
+        span
+        for resource_spans in otlp_trace["resourceSpans"]
+        for scope_spans in resource_spans["scopeSpans"]
+        for span in scope_spans["spans"]
+    ]
+    assert len(spans) == len(trace_events)
+    assert {span["traceId"] for span in spans} == {run_id.replace("-", "")}
+    assert len({span["spanId"] for span in spans}) == len(spans)
+    assert all(int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"]) for span in spans)
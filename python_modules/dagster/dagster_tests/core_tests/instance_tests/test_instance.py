@@ -788,6 +788,42 @@ def test_report_runless_asset_event() -> None:
         assert records[0].status == AssetCheckExecutionRecordStatus.FAILED
 
 
+def test_report_runless_asset_events() -> None:
+    with instance_for_test() as instance:
+        my_asset_key = AssetKey("my_asset")
+        my_check = "my_check"
+
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            instance.report_runless_asset_events(
+                [
+                    AssetMaterialization(my_asset_key, partition="a"),
+                    AssetObservation(my_asset_key),
+                    AssetCheckEvaluation(
+                        asset_key=my_asset_key, check_name=my_check, passed=True, metadata={}
+                    ),
+                    AssetMaterialization(my_asset_key, partition="b"),
+                    AssetMaterialization(my_asset_key, partition="c"),
+                ]
+            )
+        # the check evaluation splits the events into two batches, to preserve their order
+        assert [len(call.args[0]) for call in store_event_batch.call_args_list] == [2, 2]
+
+        records = instance.fetch_materializations(my_asset_key, limit=10).records
+        assert [record.partition_key for record in records] == ["c", "b", "a"]
+        assert len(instance.fetch_observations(my_asset_key, limit=10).records) == 1
+
+        check_records = instance.event_log_storage.get_asset_check_execution_history(
+            check_key=AssetCheckKey(asset_key=my_asset_key, name=my_check),
+            limit=1,
+        )
+        assert len(check_records) == 1
+        assert check_records[0].status == AssetCheckExecutionRecordStatus.SUCCEEDED
+
+
 def test_invalid_run_id():
     with instance_for_test() as instance:
         with pytest.raises(
@@ -1,3 +1,4 @@
+import dagster._check as check
 from dagster import (
     AssetCheckSpec,
     AssetOut,
@@ -28,6 +29,7 @@
     ResourceJobUsageEntry,
 )
 from dagster._core.snap import JobSnap
+from dagster._serdes import deserialize_value, serialize_value
 
 
 def test_repository_snap_all_props():
@@ -754,3 +756,66 @@ def my_schedule_two(foo: MyResource, baz: MyResource):
 
     assert set(baz.schedules_using) == set({"my_schedule_two"})
     assert set(baz.sensors_using) == set()
+
+
+def test_repository_snap_shared_job_snapshots():
+    class MyConfig(Config):
+        value: int
+
+    @asset
+    def upstream(config: MyConfig):
+        return config.value
+
+    @asset
+    def downstream(upstream):
+        return upstream
+
+    @op
+    def my_op():
+        pass
+
+    @job
+    def my_job():
+        my_op()
+
+    defs = Definitions(
+        assets=[upstream, downstream],
+        jobs=[my_job, define_asset_job("downstream_job", selection="downstream")],
+    )
+    repo = defs.get_repository_def()
+
+    repo_snap = RepositorySnap.from_def(repo)
+    shared_repo_snap = RepositorySnap.from_def(repo, share_job_snapshots=True)
+    assert shared_repo_snap.job_datas is None
+    assert shared_repo_snap.job_refs is None
+    assert shared_repo_snap.job_snap_table
+    assert shared_repo_snap.has_job_data()
+
+    serialized = serialize_value(shared_repo_snap)
+    assert len(serialized) < len(serialize_value(repo_snap))
+
+    # components shared between jobs are only stored once
+    table = shared_repo_snap.job_snap_table
+    component_ids = [
+        component_id
+        for job_data in table.job_datas
+        for component_id in job_data.job.config_type_ids
+    ]
+    assert len(table.compressed_components_by_id) < len(component_ids)
+
+    loaded_repo_snap = deserialize_value(serialized, RepositorySnap)
+    loaded_table = check.not_none(loaded_repo_snap.job_snap_table)
+    assert loaded_table._components_by_id == {}  # noqa: SLF001
+
+    job_data = loaded_repo_snap.get_job_data("my_job")
+    assert job_data == repo_snap.get_job_data("my_job")
+    assert job_data.job.snapshot_id == repo_snap.get_job_snap("my_job").snapshot_id
+    assert loaded_table.get_job_ref("my_job").snapshot_id == job_data.job.snapshot_id
+    # only the components of the loaded job have been deserialized
+    assert 0 < len(loaded_table._components_by_id) < len(table.compressed_components_by_id)  # noqa: SLF001
+
+    assert [job_data.name for job_data in loaded_repo_snap.get_job_datas()] == [
+        job_data.name for job_data in repo_snap.get_job_datas()
+    ]
+    for job_data in repo_snap.get_job_datas():
+        assert loaded_repo_snap.get_job_data(job_data.name) == job_data
@@ -1,6 +1,6 @@
 import time
 import warnings
-from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextvars import ContextVar
 from typing import NamedTuple
 
@@ -11,6 +11,7 @@
 from dagster._core.utils import (
     InheritContextThreadPoolExecutor,
     check_dagster_package_version,
+    imap,
     parse_env_var,
 )
 from dagster._utils import hash_collection, library_version_from_core_version
@@ -168,3 +169,63 @@ def sleepy_thread():
         f = None
         # now they dont
         assert executor.weak_tracked_futures_count == 0
+
+
+def test_imap_preserves_order():
+    def slow_square(i: int) -> int:
+        time.sleep(0.01 * (i % 3))
+        return i * i
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(imap(executor, iter(range(20)), slow_square)) == [i * i for i in range(20)]
+
+
+def test_imap_max_pending():
+    num_read = 0
+
+    def _iterator():
+        nonlocal num_read
+        for i in range(100):
+            num_read += 1
+            yield i
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = imap(executor, _iterator(), lambda i: i, max_pending=5)
+
+        try:
+            assert next(results) == 0
+            time.sleep(0.5)
+            # the input iterator is not read further ahead than the number of pending elements
+            assert num_read == 6
+
+            assert list(results) == list(range(1, 100))
+            assert num_read == 100
+        finally:
+            results.close()
+
+
+def test_imap_max_pending_stops_early():
+    def _iterator():
+        yield from range(100)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = imap(executor, _iterator(), lambda i: i, max_pending=2)
+        assert next(results) == 0
+        results.close()
+
+    # exiting the executor does not hang waiting on the blocked enqueuing task
+
+
+def test_imap_raises_iterator_error():
+    def _iterator():
+        yield 1
+        yield 2
+        raise Exception("iterator failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = []
+        with pytest.raises(Exception, match="iterator failed"):
+            for result in imap(executor, _iterator(), lambda i: i, max_pending=1):
+                results.append(result)
+
+        assert results == [1, 2]
@@ -0,0 +1,93 @@
+from dagster import (
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    StaticPartitionsDefinition,
+    asset,
+    evaluate_automation_conditions,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_evaluation_cache import (
+    AutomationConditionEvaluationCache,
+)
+
+partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+
+@asset(partitions_def=partitions_def)
+def upstream() -> None: ...
+
+
+def _downstream(name: str):
+    @asset(
+        name=name,
+        deps=[upstream],
+        partitions_def=partitions_def,
+        automation_condition=AutomationCondition.eager(),
+    )
+    def _asset() -> None: ...
+
+    return _asset
+
+
+defs = Definitions(assets=[upstream, *(_downstream(f"downstream_{i}") for i in range(3))])
+
+
+def test_is_stateless() -> None:
+    assert AutomationCondition.missing().is_stateless
+    assert AutomationCondition.any_deps_match(AutomationCondition.missing()).is_stateless
+    assert (~AutomationCondition.any_deps_in_progress()).is_stateless
+    assert not AutomationCondition.will_be_requested().is_stateless
+    assert not AutomationCondition.any_deps_missing().is_stateless
+    assert not AutomationCondition.newly_updated().is_stateless
+    assert not AutomationCondition.any_deps_updated().is_stateless
+    assert not AutomationCondition.missing().newly_true().is_stateless
+    assert not AutomationCondition.eager().is_stateless
+
+
+def test_structural_hash() -> None:
+    missing = AutomationCondition.any_deps_match(AutomationCondition.missing())
+    in_progress = AutomationCondition.any_deps_match(AutomationCondition.in_progress())
+
+    # the unique id does not account for operands of dep conditions
+    assert missing.get_unique_id() == in_progress.get_unique_id()
+    assert missing.get_structural_hash() != in_progress.get_structural_hash()
+    assert (
+        missing.get_structural_hash()
+        == AutomationCondition.any_deps_match(AutomationCondition.missing()).get_structural_hash()
+    )
+
+
+def test_reuse_shared_dep_conditions(monkeypatch) -> None:
+    instance = DagsterInstance.ephemeral()
+
+    result = evaluate_automation_conditions(defs=defs, instance=instance)
+    assert result.total_requested == 0
+
+    # each condition is evaluated once over each downstream asset, and every downstream asset
+    # evaluates it over the shared upstream asset
+    stats = {s.condition_name: s for s in result.evaluation_stats.values()}
+    for name in ["missing", "in_progress"]:
+        assert stats[name].num_misses == 4
+        assert stats[name].num_hits == 2
+        assert stats[name].hit_rate == 2 / 6
+
+    instance.report_runless_asset_event(AssetMaterialization("upstream", partition="a"))
+    cached_result = evaluate_automation_conditions(
+        defs=defs, instance=instance, cursor=result.cursor
+    )
+    assert cached_result.total_requested == 3
+
+    # evaluating without the cache produces identical results and cursors
+    monkeypatch.setattr(AutomationConditionEvaluationCache, "get_cache_key", lambda *_: None)
+    uncached_result = evaluate_automation_conditions(
+        defs=defs, instance=instance, cursor=result.cursor
+    )
+    assert uncached_result.evaluation_stats == {}
+    assert uncached_result.total_requested == 3
+
+    cached_results = sorted(cached_result.results, key=lambda r: r.key)
+    uncached_results = sorted(uncached_result.results, key=lambda r: r.key)
+    for cached, uncached in zip(cached_results, uncached_results):
+        assert cached.value_hash == uncached.value_hash
+        assert cached.get_child_node_cursors() == uncached.get_child_node_cursors()
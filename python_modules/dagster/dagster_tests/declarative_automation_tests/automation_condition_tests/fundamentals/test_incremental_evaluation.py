@@ -0,0 +1,124 @@
+import datetime
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    asset,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._time import get_current_datetime
+
+
+@asset
+def upstream() -> None: ...
+
+
+@asset(deps=[upstream], automation_condition=AutomationCondition.eager())
+def downstream() -> None: ...
+
+
+@asset
+def other_upstream() -> None: ...
+
+
+@asset(
+    deps=[other_upstream],
+    automation_condition=AutomationCondition.eager()
+    | AutomationCondition.cron_tick_passed("0 * * * *"),
+)
+def other_downstream() -> None: ...
+
+
+defs = Definitions(assets=[upstream, downstream, other_upstream, other_downstream])
+evaluated_keys = {AssetKey("downstream"), AssetKey("other_downstream")}
+
+
+def _evaluate(
+    instance: DagsterInstance,
+    cursor: AssetDaemonCursor,
+    evaluation_time: datetime.datetime,
+    incremental: bool = True,
+):
+    evaluator = AutomationConditionEvaluator(
+        entity_keys=evaluated_keys,
+        instance=instance,
+        asset_graph=defs.get_asset_graph(),
+        cursor=cursor,
+        emit_backfills=False,
+        evaluation_time=evaluation_time,
+        incremental=incremental,
+    )
+    results, requested_subsets = evaluator.evaluate()
+    new_cursor = cursor.with_updates(
+        evaluation_id=cursor.evaluation_id + 1,
+        evaluation_timestamp=evaluation_time.timestamp(),
+        newly_observe_requested_asset_keys=[],
+        condition_cursors=[result.get_new_cursor() for result in results],
+    )
+    return (
+        {result.key for result in results},
+        {subset.key for subset in requested_subsets},
+        new_cursor,
+    )
+
+
+def test_incremental_evaluation() -> None:
+    instance = DagsterInstance.ephemeral()
+    # start just after an hourly cron tick
+    start = get_current_datetime().replace(minute=1, second=0, microsecond=0)
+    cursor = AssetDaemonCursor.empty()
+
+    # every entity is evaluated until its result is unchanged across two quiet ticks
+    for minute in range(3):
+        evaluated, requested, cursor = _evaluate(
+            instance, cursor, start + datetime.timedelta(minutes=minute)
+        )
+        assert evaluated == evaluated_keys
+        assert requested == set()
+    evaluated, requested, cursor = _evaluate(
+        instance, cursor, start + datetime.timedelta(minutes=3)
+    )
+    assert evaluated == set()
+    assert requested == set()
+
+    # only the entity downstream of the new materialization is dirty
+    instance.report_runless_asset_event(AssetMaterialization("upstream"))
+    evaluated, requested, cursor = _evaluate(
+        instance, cursor, start + datetime.timedelta(minutes=4)
+    )
+    assert evaluated == {AssetKey("downstream")}
+    assert requested == {AssetKey("downstream")}
+
+    # entities which were just requested are evaluated until their result settles again
+    for minute in range(5, 8):
+        evaluated, requested, cursor = _evaluate(
+            instance, cursor, start + datetime.timedelta(minutes=minute)
+        )
+        assert evaluated == {AssetKey("downstream")}
+        assert requested == set()
+    evaluated, requested, cursor = _evaluate(
+        instance, cursor, start + datetime.timedelta(minutes=8)
+    )
+    assert evaluated == set()
+
+    # crossing a cron boundary dirties the entities whose conditions depend on it
+    next_tick = start + datetime.timedelta(hours=1)
+    evaluated, requested, cursor = _evaluate(instance, cursor, next_tick)
+    assert evaluated == {AssetKey("other_downstream")}
+    assert requested == {AssetKey("other_downstream")}
+
+    # non-incremental evaluations always evaluate every entity, and do not mark results as stable
+    evaluated, requested, cursor = _evaluate(
+        instance, cursor, next_tick + datetime.timedelta(minutes=1), incremental=False
+    )
+    assert evaluated == evaluated_keys
+    evaluated, requested, cursor = _evaluate(
+        instance, cursor, next_tick + datetime.timedelta(minutes=2)
+    )
+    assert evaluated == evaluated_keys
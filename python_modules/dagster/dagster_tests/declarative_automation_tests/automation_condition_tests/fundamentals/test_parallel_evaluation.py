@@ -0,0 +1,149 @@
+import datetime
+
+import pytest
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    HourlyPartitionsDefinition,
+    asset,
+    asset_check,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    AutomationConditionEvaluator,
+)
+from dagster._serdes import serialize_value
+from dagster._time import get_current_datetime
+
+hourly = HourlyPartitionsDefinition(start_date="2024-01-01-00:00")
+
+
+def _build_defs(width: int) -> Definitions:
+    roots = [asset(name=f"root_{i}", partitions_def=hourly)(lambda: None) for i in range(width)]
+    middle = [
+        asset(
+            name=f"middle_{i}",
+            partitions_def=hourly,
+            deps=[roots[i], roots[(i + 1) % width]],
+            automation_condition=AutomationCondition.eager(),
+        )(lambda: None)
+        for i in range(width)
+    ]
+    leaves = [
+        asset(
+            name=f"leaf_{i}",
+            deps=[middle[i]],
+            automation_condition=AutomationCondition.on_cron("@hourly")
+            | AutomationCondition.any_deps_updated().since_last_handled(),
+        )(lambda: None)
+        for i in range(width)
+    ]
+
+    @asset_check(
+        asset=middle[0], automation_condition=AutomationCondition.cron_tick_passed("@hourly")
+    )
+    def middle_check(): ...
+
+    return Definitions(assets=[*roots, *middle, *leaves], asset_checks=[middle_check])
+
+
+def _evaluate(
+    defs: Definitions,
+    instance: DagsterInstance,
+    cursor: AssetDaemonCursor,
+    evaluation_time: datetime.datetime,
+    num_evaluation_workers: int,
+    incremental: bool,
+):
+    asset_graph = defs.get_asset_graph()
+    evaluator = AutomationConditionEvaluator(
+        entity_keys={
+            key
+            for key in asset_graph.get_all_asset_keys() | asset_graph.asset_check_keys
+            if asset_graph.get(key).automation_condition is not None
+        },
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=cursor,
+        emit_backfills=False,
+        evaluation_time=evaluation_time,
+        incremental=incremental,
+        num_evaluation_workers=num_evaluation_workers,
+    )
+    results, requested_subsets = evaluator.evaluate()
+    condition_cursors = [result.get_new_cursor() for result in results]
+    new_cursor = cursor.with_updates(
+        evaluation_id=cursor.evaluation_id + 1,
+        evaluation_timestamp=evaluation_time.timestamp(),
+        newly_observe_requested_asset_keys=[],
+        condition_cursors=condition_cursors,
+    )
+    return (
+        {result.key: result.value_hash for result in results},
+        {
+            subset.key: serialize_value(subset.convert_to_serializable_subset())
+            for subset in requested_subsets
+        },
+        {cursor.key: serialize_value(cursor) for cursor in condition_cursors},
+        new_cursor,
+    )
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_parallel_evaluation_matches_serial(incremental: bool) -> None:
+    defs = _build_defs(width=4)
+    instance = DagsterInstance.ephemeral()
+    start = get_current_datetime().replace(minute=30, second=0, microsecond=0)
+
+    serial_cursor = AssetDaemonCursor.empty()
+    parallel_cursor = AssetDaemonCursor.empty()
+    for tick in range(5):
+        if tick == 2:
+            for i in range(0, 4, 3):
+                instance.report_runless_asset_event(
+                    AssetMaterialization(
+                        f"root_{i}",
+                        partition=hourly.get_last_partition_key(current_time=start),
+                    )
+                )
+        elif tick == 4:
+            instance.report_runless_asset_event(AssetMaterialization("middle_1", partition=None))
+
+        evaluation_time = start + datetime.timedelta(minutes=20 * tick)
+        *serial, serial_cursor = _evaluate(
+            defs, instance, serial_cursor, evaluation_time, 1, incremental
+        )
+        *parallel, parallel_cursor = _evaluate(
+            defs, instance, parallel_cursor, evaluation_time, 4, incremental
+        )
+        assert parallel == serial
+
+    assert {
+        key: serialize_value(cursor)
+        for key, cursor in parallel_cursor.previous_condition_cursors_by_key.items()
+    } == {
+        key: serialize_value(cursor)
+        for key, cursor in serial_cursor.previous_condition_cursors_by_key.items()
+    }
+
+
+def test_parallel_evaluation_error() -> None:
+    @asset(automation_condition=AutomationCondition.eager())
+    def a() -> None: ...
+
+    @asset(deps=[a], automation_condition=AutomationCondition.on_cron("not a cron"))
+    def b() -> None: ...
+
+    defs = Definitions(assets=[a, b])
+    with pytest.raises(Exception, match="Error while evaluating conditions for b"):
+        _evaluate(
+            defs,
+            DagsterInstance.ephemeral(),
+            AssetDaemonCursor.empty(),
+            get_current_datetime(),
+            num_evaluation_workers=2,
+            incremental=False,
+        )
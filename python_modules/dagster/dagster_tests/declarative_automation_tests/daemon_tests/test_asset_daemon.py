@@ -271,6 +271,26 @@ def test_asset_daemon_with_sensor(scenario: AssetDaemonScenario, num_threads: in
             )
 
 
+@pytest.mark.parametrize(
+    "scenario",
+    auto_materialize_sensor_scenarios,
+    ids=[scenario.id for scenario in auto_materialize_sensor_scenarios],
+)
+def test_asset_daemon_with_sensor_entity_cursor_storage(scenario: AssetDaemonScenario) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"use_entity_cursor_storage": True}}
+    ) as instance:
+        scenario.evaluate_daemon(instance, sensor_name="default_automation_condition_sensor")
+
+        sensor_states = instance.schedule_storage.all_instigator_state(  # pyright: ignore[reportOptionalMemberAccess]
+            instigator_type=InstigatorType.SENSOR
+        )
+        assert sensor_states
+        for sensor_state in sensor_states:
+            # only a manifest of the condition cursors is stored on the sensor
+            assert cast(SensorInstigatorData, sensor_state.instigator_data).cursor.startswith("1")  # pyright: ignore[reportOptionalMemberAccess]
+
+
 def _get_asset_daemon_ticks(instance: DagsterInstance) -> Sequence[InstigatorTick]:
     """Returns the set of ticks created by the asset daemon for the given instance."""
     return sorted(
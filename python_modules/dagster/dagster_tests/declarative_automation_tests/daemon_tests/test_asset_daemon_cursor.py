@@ -1,12 +1,26 @@
+import dataclasses
 import datetime
 import json
 
-from dagster import StaticPartitionsDefinition, asset
+import dagster._check as check
+from dagster import (
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    StaticPartitionsDefinition,
+    asset,
+    evaluate_automation_conditions,
+)
 from dagster._core.definitions.asset_daemon_cursor import (
     AssetDaemonCursor,
     backcompat_deserialize_asset_daemon_cursor_str,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._daemon.asset_daemon import (
+    asset_daemon_cursor_from_instigator_serialized_cursor,
+    asset_daemon_cursor_to_instigator_serialized_cursor,
+    write_asset_daemon_cursor_to_instigator_serialized_cursor,
+)
 from dagster._serdes.serdes import deserialize_value, serialize_value
 
 partitions = StaticPartitionsDefinition(partition_keys=["a", "b", "c"])
@@ -77,3 +91,105 @@ def asset2(): ...
         serialized, AssetGraph.from_assets([asset1, asset2]), 0
     )
     assert cursor.evaluation_id == 25
+
+
+def test_entity_cursor_storage(monkeypatch) -> None:
+    @asset(automation_condition=AutomationCondition.eager())
+    def a(): ...
+
+    @asset(automation_condition=AutomationCondition.missing().newly_true())
+    def b(): ...
+
+    instance = DagsterInstance.ephemeral()
+    cursor = evaluate_automation_conditions(
+        defs=Definitions(assets=[a, b]), instance=instance
+    ).cursor
+    # copy the cursor to avoid serializing cached properties
+    inline_serialized = asset_daemon_cursor_to_instigator_serialized_cursor(
+        dataclasses.replace(cursor)
+    )
+    assert cursor.previous_condition_cursors_by_key.keys() == {a.key, b.key}
+
+    written_keys = []
+    original_set_cursor_values = instance.daemon_cursor_storage.set_cursor_values
+
+    def _set_cursor_values(pairs):
+        written_keys.extend(pairs.keys())
+        original_set_cursor_values(pairs)
+
+    monkeypatch.setattr(instance.daemon_cursor_storage, "set_cursor_values", _set_cursor_values)
+
+    serialized = write_asset_daemon_cursor_to_instigator_serialized_cursor(
+        instance, "selector", cursor, None
+    )
+    assert len(written_keys) == 2
+    assert serialized.startswith("1")
+    # the manifest is much smaller than the inline cursor
+    assert len(serialized) < len(inline_serialized)
+
+    loaded = asset_daemon_cursor_from_instigator_serialized_cursor(serialized, None, instance)
+    assert loaded.evaluation_id == cursor.evaluation_id
+    assert loaded.previous_condition_cursors_by_key == cursor.previous_condition_cursors_by_key
+
+    # condition cursors are only loaded when an instance is provided
+    assert (
+        asset_daemon_cursor_from_instigator_serialized_cursor(serialized, None).evaluation_id
+        == cursor.evaluation_id
+    )
+    assert (
+        asset_daemon_cursor_from_instigator_serialized_cursor(
+            serialized, None
+        ).previous_condition_cursors_by_key
+        == {}
+    )
+
+    # only the requested condition cursors are loaded
+    partially_loaded = asset_daemon_cursor_from_instigator_serialized_cursor(
+        serialized, None, instance, entity_keys={a.key}
+    )
+    assert partially_loaded.previous_condition_cursors_by_key.keys() == {a.key}
+
+    # only changed cursors are written, and cursors which were not loaded are carried over
+    new_a_cursor = dataclasses.replace(
+        check.not_none(cursor.get_previous_condition_cursor(a.key)), effective_timestamp=1.0
+    )
+    written_keys.clear()
+    new_serialized = write_asset_daemon_cursor_to_instigator_serialized_cursor(
+        instance,
+        "selector",
+        partially_loaded.with_updates(
+            evaluation_id=cursor.evaluation_id + 1,
+            evaluation_timestamp=1.0,
+            newly_observe_requested_asset_keys=[],
+            condition_cursors=[new_a_cursor],
+        ),
+        serialized,
+    )
+    assert len(written_keys) == 1
+    new_loaded = asset_daemon_cursor_from_instigator_serialized_cursor(
+        new_serialized, None, instance
+    )
+    assert new_loaded.evaluation_id == cursor.evaluation_id + 1
+    assert new_loaded.get_previous_condition_cursor(a.key) == new_a_cursor
+    assert new_loaded.get_previous_condition_cursor(b.key) == cursor.get_previous_condition_cursor(
+        b.key
+    )
+
+    # the previous cursor is unaffected, in case the new cursor is never committed
+    assert (
+        asset_daemon_cursor_from_instigator_serialized_cursor(
+            serialized, None, instance
+        ).previous_condition_cursors_by_key
+        == cursor.previous_condition_cursors_by_key
+    )
+
+    # empty cursors round trip
+    empty = asset_daemon_cursor_from_instigator_serialized_cursor(
+        write_asset_daemon_cursor_to_instigator_serialized_cursor(
+            instance, "other_selector", AssetDaemonCursor.empty(5), None
+        ),
+        None,
+        instance,
+    )
+    assert empty.evaluation_id == 5
+    assert empty.previous_condition_cursors_by_key == {}
@@ -229,6 +229,7 @@ def _evaluate_tick_daemon(
                         check.not_none(auto_materialize_instigator_state).instigator_data,
                     ).cursor,
                     self.asset_graph,
+                    instance=self.instance,
                 )
             else:
                 new_cursor = _get_pre_sensor_auto_materialize_cursor(
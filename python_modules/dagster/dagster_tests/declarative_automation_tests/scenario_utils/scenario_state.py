@@ -23,10 +23,10 @@
     RunsFilter,
     SensorDefinition,
     asset,
+    materialize,
     multi_asset,
     op,
 )
-from dagster._core.definitions import materialize
 from dagster._core.definitions.asset_check_spec import AssetCheckSpec
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.asset_spec import (
@@ -19,6 +19,7 @@
     weekly_partitioned_config,
 )
 from dagster._check import CheckError
+from dagster._core.definitions import time_window_partitions
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     ScheduleType,
@@ -30,7 +31,7 @@
 from dagster._core.test_utils import freeze_time
 from dagster._record import copy
 from dagster._serdes import deserialize_value, serialize_value
-from dagster._time import create_datetime, parse_time_string
+from dagster._time import create_datetime, datetime_from_timestamp, parse_time_string
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -1831,3 +1832,110 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+def test_partition_timeline_shared_between_definitions():
+    partitions_def = HourlyPartitionsDefinition(start_date="2023-01-01-00:00")
+    with_end = HourlyPartitionsDefinition(
+        start_date="2023-01-01-00:00", end_date="2023-06-01-00:00"
+    )
+    with_end_offset = HourlyPartitionsDefinition(start_date="2023-01-01-00:00", end_offset=2)
+    other_timezone = HourlyPartitionsDefinition(
+        start_date="2023-01-01-00:00", timezone="America/Los_Angeles"
+    )
+
+    timeline = partitions_def._partition_timeline  # noqa: SLF001
+    assert with_end._partition_timeline is timeline  # noqa: SLF001
+    assert with_end_offset._partition_timeline is timeline  # noqa: SLF001
+    assert other_timezone._partition_timeline is not timeline  # noqa: SLF001
+
+
+def _clear_time_window_partitions_caches():
+    time_window_partitions.get_partition_timeline.cache_clear()
+    for method in [
+        TimeWindowPartitionsDefinition.time_window_for_partition_key,
+        TimeWindowPartitionsDefinition.time_windows_for_partition_keys,
+        TimeWindowPartitionsDefinition._get_first_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_last_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+    ]:
+        method.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2023-01-01-00:00", timezone="America/Los_Angeles"),
+        HourlyPartitionsDefinition(
+            start_date="2023-01-01-00:00", timezone="Europe/Berlin", end_offset=-2
+        ),
+        DailyPartitionsDefinition(start_date="2023-01-01", timezone="America/Los_Angeles"),
+        TimeWindowPartitionsDefinition(
+            start="2023-01-01",
+            end="2023-11-05",
+            cron_schedule="30 2 * * *",
+            fmt="%Y-%m-%d",
+            timezone="America/Los_Angeles",
+            end_offset=1,
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2023-01-01",
+            cron_schedule="0 9 * * 1-5",
+            fmt="%Y-%m-%d",
+            timezone="Europe/Berlin",
+        ),
+    ],
+)
+@pytest.mark.parametrize("max_timeline_size", [100_000, 50])
+def test_partition_timeline_matches_cron_iteration(
+    partitions_def: TimeWindowPartitionsDefinition, max_timeline_size: int, monkeypatch
+):
+    current_time = create_datetime(2023, 11, 20, 13, 17)
+    rng = random.Random(0)
+    timestamps = [
+        rng.uniform(
+            create_datetime(2023, 1, 1).timestamp(), create_datetime(2023, 12, 1).timestamp()
+        )
+        for _ in range(20)
+    ]
+
+    def _lookups():
+        partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+        sampled_keys = random.Random(0).sample(partition_keys, 20)
+        time_windows = [
+            TimeWindow(
+                datetime_from_timestamp(timestamp, partitions_def.timezone),
+                datetime_from_timestamp(timestamp + 40 * 86400, partitions_def.timezone),
+            )
+            for timestamp in timestamps
+        ]
+        return [
+            partition_keys,
+            partitions_def.get_num_partitions(current_time=current_time),
+            partitions_def.get_last_partition_window(current_time=current_time),
+            partitions_def.time_windows_for_partition_keys(frozenset(sampled_keys), validate=False),
+            [
+                (
+                    partitions_def.time_window_for_partition_key(key),
+                    partitions_def.has_partition_key(key, current_time=current_time),
+                    partitions_def.get_next_partition_key(key, current_time=current_time),
+                )
+                for key in sampled_keys
+            ],
+            [partitions_def.get_partition_keys_in_time_window(window) for window in time_windows],
+            [partitions_def.get_num_partitions_in_window(window) for window in time_windows],
+            [
+                partitions_def.get_prev_partition_window(window.end, respect_bounds=False)
+                for window in time_windows
+            ],
+        ]
+
+    monkeypatch.setattr(time_window_partitions, "MAX_PARTITION_TIMELINE_SIZE", 0)
+    _clear_time_window_partitions_caches()
+    expected = _lookups()
+
+    monkeypatch.setattr(time_window_partitions, "MAX_PARTITION_TIMELINE_SIZE", max_timeline_size)
+    _clear_time_window_partitions_caches()
+    # compare the reprs to also check timezones and DST folds
+    assert repr(_lookups()) == repr(expected)
+    assert repr(_lookups()) == repr(expected)
@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+from multiprocessing import forkserver
 
 import pytest
 from dagster import (
@@ -107,6 +108,49 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+@pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
+def test_forkserver_preload_definitions():
+    # the forkserver process is shared by the whole test process, so restart it to make it preload
+    # the definitions of this job
+    forkserver._forkserver._stop()  # noqa: SLF001
+    try:
+        with instance_for_test() as instance:
+            recon_job = reconstructable(define_diamond_job)
+            with execute_job(
+                recon_job,
+                run_config={
+                    "execution": {
+                        "config": {
+                            "multiprocess": {
+                                "start_method": {"forkserver": {"preload_definitions": True}}
+                            }
+                        }
+                    },
+                },
+                instance=instance,
+            ) as result:
+                assert result.success
+                assert result.output_for_node("adder") == 11
+
+                load_events = [
+                    event
+                    for event in result.all_events
+                    if event.is_engine_event
+                    and event.message
+                    and event.message.startswith("Loaded job definition")
+                ]
+                assert {event.step_key for event in load_events} == {
+                    "return_two",
+                    "add_three",
+                    "mult_three",
+                    "adder",
+                }
+                for event in load_events:
+                    assert event.engine_event_data.metadata["preloaded"] == MetadataValue.bool(True)
+    finally:
+        forkserver._forkserver._stop()  # noqa: SLF001
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -1,6 +1,8 @@
 import pytest
 from dagster import (
     DagsterInstance,
+    DynamicOut,
+    DynamicOutput,
     Int,
     Out,
     Output,
@@ -17,8 +19,10 @@
     DagsterUnknownStepStateError,
 )
 from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.plan.inputs import FromConfig, FromDefaultValue
 from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.plan import should_skip_step
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._core.utils import make_new_run_id
@@ -402,6 +406,80 @@ def tag_concurrency_limits_job():
             active_execution.mark_skipped(step_key)
 
 
+def test_plan_steps_reused_across_builds():
+    @op
+    def return_num(num: int = 0):
+        return num
+
+    @op
+    def add_one(num: int):
+        return num + 1
+
+    @job
+    def config_input_job():
+        add_one(return_num())
+
+    def _run_config(value):
+        return {"ops": {"return_num": {"inputs": {"num": {"value": value}}}}}
+
+    plan = create_execution_plan(config_input_job, run_config=_run_config(1))
+
+    # steps do not depend on the values in the run config, so they are shared between plans
+    other_plan = create_execution_plan(config_input_job, run_config=_run_config(2))
+    assert other_plan.get_step_by_key("add_one") is plan.get_step_by_key("add_one")
+    assert other_plan.step_dict is not plan.step_dict
+
+    subset_plan = create_execution_plan(
+        config_input_job, run_config=_run_config(1), step_keys_to_execute=["add_one"]
+    )
+    assert subset_plan.step_keys_to_execute == ["add_one"]
+    assert subset_plan.get_step_by_key("add_one") is plan.get_step_by_key("add_one")
+
+    # steps are rebuilt for a run config that changes where inputs are loaded from
+    default_input_plan = create_execution_plan(config_input_job)
+    assert default_input_plan.get_step_by_key("add_one") is not plan.get_step_by_key("add_one")
+    [config_input] = plan.get_step_by_key("return_num").step_inputs
+    [default_input] = default_input_plan.get_step_by_key("return_num").step_inputs
+    assert isinstance(config_input.source, FromConfig)
+    assert isinstance(default_input.source, FromDefaultValue)
+
+
+def test_dynamic_resolution_does_not_modify_cached_steps():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(x):
+        return x * 2
+
+    @op
+    def total(xs):
+        return sum(xs)
+
+    @job
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    known_state = KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1"]}})
+    resolved_plan = create_execution_plan(
+        dynamic_job,
+        step_keys_to_execute=["double[?]", "total"],
+        known_state=known_state,
+    )
+    assert resolved_plan.step_keys_to_execute == ["double[?]", "total"]
+    assert [step.key for step in resolved_plan.get_steps_to_execute_in_topo_order()] == [
+        "double[0]",
+        "double[1]",
+        "total",
+    ]
+
+    plan = create_execution_plan(dynamic_job)
+    assert {step.key for step in plan.steps} == {"emit", "double[?]", "total"}
+    assert [step.key for step in plan.get_steps_to_execute_in_topo_order()] == ["emit"]
+
+
 def test_executor_not_created_for_execute_plan():
     instance = DagsterInstance.ephemeral()
     pipe = define_diamond_job()
@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+from dagster import AssetExecutionContext, AssetKey, asset, materialize
+from dagster._core.pipes.utils import (
+    PipesEnvContextInjector,
+    PipesFileMessageReader,
+    _decode_message_batch,
+    open_pipes_session,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster._utils import tail_file_batches
+from dagster_pipes import _make_message
+
+
+def _log(message: str, level: str = "INFO"):
+    return _make_message(method="log", params={"message": message, "level": level})
+
+
+def test_tail_file_batches(tmp_path):
+    path = os.path.join(tmp_path, "messages")
+    with open(path, "w") as f:
+        f.write("a\nb\n\nc")
+
+    should_stop = threading.Event()
+    batches = tail_file_batches(path, should_stop.is_set, chunk_size=3)
+    assert next(batches) == ["a"]
+    assert next(batches) == ["b"]
+
+    # the trailing line without a newline is only yielded once we stop
+    should_stop.set()
+    assert list(batches) == [["c"]]
+
+
+def test_decode_message_batch():
+    messages = [_log("foo"), _log("bar")]
+    lines = [json.dumps(message) for message in messages]
+    assert _decode_message_batch(lines) == messages
+
+    with pytest.raises(json.JSONDecodeError):
+        _decode_message_batch([lines[0], "not json"])
+
+    assert _decode_message_batch(
+        [lines[0], "not json", "1, 2", json.dumps({"foo": "bar"}), lines[1]], skip_invalid=True
+    ) == [messages[0], messages[1]]
+
+
+@pytest.mark.parametrize("batch_size", [0, 100])
+def test_file_message_reader_batches(tmp_path, monkeypatch, batch_size):
+    monkeypatch.setenv("DAGSTER_EVENT_BATCH_SIZE", str(batch_size))
+    messages_path = os.path.join(tmp_path, "messages")
+
+    messages = [
+        _make_message(method="opened", params={}),
+        *[_log(f"info {i}") for i in range(3)],
+        _log("warning 0", "WARNING"),
+        _log("debug 0", "DEBUG"),
+        _make_message(
+            method="report_asset_materialization",
+            params={"asset_key": "my_asset", "metadata": None, "data_version": None},
+        ),
+        _log("info 3"),
+        _make_message(method="closed", params={}),
+    ]
+
+    @asset
+    def my_asset(context: AssetExecutionContext):
+        with open_pipes_session(
+            context=context,
+            message_reader=PipesFileMessageReader(messages_path),
+            context_injector=PipesEnvContextInjector(),
+        ) as session:
+            with open(messages_path, "w") as f:
+                f.writelines(f"{json.dumps(message)}\n" for message in messages)
+        return session.get_results()
+
+    with instance_for_test() as instance:
+        with patch.object(
+            instance.event_log_storage,
+            "store_event_batch",
+            wraps=instance.event_log_storage.store_event_batch,
+        ) as store_event_batch:
+            result = materialize([my_asset], instance=instance)
+        assert result.success
+
+        [mat] = result.get_asset_materialization_events()
+        assert mat.asset_key == AssetKey("my_asset")
+
+        user_messages = [
+            record.user_message
+            for record in instance.all_logs(result.run_id)
+            if not record.is_dagster_event and "[pipes]" not in record.user_message
+        ]
+        assert user_messages == ["info 0\ninfo 1\ninfo 2", "warning 0", "debug 0", "info 3"]
+
+        if batch_size:
+            # the coalesced log entries before the materialization are stored together
+            assert any(len(call.args[0]) == 3 for call in store_event_batch.call_args_list)
+        else:
+            store_event_batch.assert_not_called()
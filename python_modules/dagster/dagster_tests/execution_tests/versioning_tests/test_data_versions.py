@@ -23,6 +23,7 @@
     SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD,
     DataProvenance,
     DataVersion,
+    DataVersionsByPartition,
     StaleCause,
     StaleCauseCategory,
     StaleStatus,
@@ -683,6 +684,70 @@ def asset3(asset2):
         assert status_resolver.get_status(asset3.key, "beta") == StaleStatus.STALE
 
 
+def test_stale_status_by_partition() -> None:
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+
+    class AssetConfig(Config):
+        value: int = 1
+
+    @observable_source_asset(partitions_def=partitions_def)
+    def source1():
+        return DataVersionsByPartition({"c": "1"})
+
+    @asset(partitions_def=partitions_def, code_version="1", deps=[source1])
+    def asset1(config: AssetConfig):
+        return Output(1, data_version=DataVersion(str(config.value)))
+
+    @asset(partitions_def=partitions_def, code_version="1")
+    def asset2(asset1):
+        return 1
+
+    all_assets = [source1, asset1, asset2]
+    partition_keys = partitions_def.get_partition_keys()
+
+    def assert_matches_single_partition_apis() -> None:
+        bulk_resolver = get_stale_status_resolver(instance, all_assets)
+        resolver = get_stale_status_resolver(instance, all_assets)
+        for key in [source1.key, asset1.key, asset2.key]:
+            assert bulk_resolver.get_status_by_partition(key, partition_keys) == [
+                resolver.get_status(key, partition_key) for partition_key in partition_keys
+            ]
+            assert bulk_resolver.get_stale_root_causes_by_partition(key, partition_keys) == [
+                resolver.get_stale_root_causes(key, partition_key)
+                for partition_key in partition_keys
+            ]
+            assert bulk_resolver.get_current_data_version_by_partition(key, partition_keys) == [
+                resolver.get_current_data_version(key, partition_key)
+                for partition_key in partition_keys
+            ]
+
+    with instance_for_test() as instance:
+        assert_matches_single_partition_apis()
+
+        for partition_key in ["a", "b", "c"]:
+            materialize_asset(all_assets, asset1, instance, partition_key=partition_key)
+        materialize_asset(all_assets, asset2, instance, partition_key="a")
+        materialize_asset(all_assets, asset2, instance, partition_key="b")
+        assert_matches_single_partition_apis()
+        assert get_stale_status_resolver(instance, all_assets).get_status_by_partition(
+            asset2.key, partition_keys
+        ) == [StaleStatus.FRESH, StaleStatus.FRESH, StaleStatus.MISSING, StaleStatus.MISSING]
+
+        materialize_asset(
+            all_assets,
+            asset1,
+            instance,
+            partition_key="b",
+            run_config=RunConfig({"asset1": AssetConfig(value=2)}),
+        )
+        materialize_asset(all_assets, asset1, instance, partition_key="a")
+        observe([source1], instance=instance)
+        assert_matches_single_partition_apis()
+        assert get_stale_status_resolver(instance, all_assets).get_status_by_partition(
+            asset2.key, partition_keys
+        ) == [StaleStatus.FRESH, StaleStatus.STALE, StaleStatus.MISSING, StaleStatus.MISSING]
+
+
 @pytest.mark.parametrize(
     ("num_partitions", "expected_status"),
     [
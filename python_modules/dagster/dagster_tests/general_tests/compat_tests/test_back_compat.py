@@ -1543,7 +1543,7 @@ def test_add_run_tags_run_id_idx():
         with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
             instance.upgrade()
 
-        assert get_current_alembic_version(db_path) == "6b7fb194ff9c"
+        assert get_current_alembic_version(db_path) == "3c1d9e2a7f40"
         assert "run_tags" in get_sqlite3_tables(db_path)
         assert "idx_run_tags" not in get_sqlite3_indexes(db_path, "run_tags")
         assert "idx_run_tags_run_id" in get_sqlite3_indexes(db_path, "run_tags")
@@ -1556,6 +1556,39 @@ def test_add_run_tags_run_id_idx():
         assert "idx_run_tags_run_id" not in get_sqlite3_indexes(db_path, "run_tags")
 
 
+def test_add_runs_feed_indexes():
+    src_dir = file_relative_path(__file__, "snapshot_1_9_3_add_run_tags_run_id_idx/sqlite")
+
+    with copy_directory(src_dir) as test_dir:
+        db_path = os.path.join(test_dir, "history", "runs.db")
+
+        assert "idx_runs_feed" not in get_sqlite3_indexes(db_path, "runs")
+        assert "idx_runs_by_create_timestamp" not in get_sqlite3_indexes(db_path, "runs")
+        assert "idx_bulk_actions_by_timestamp" not in get_sqlite3_indexes(db_path, "bulk_actions")
+        assert "idx_backfill_tags_key_value" not in get_sqlite3_indexes(db_path, "backfill_tags")
+
+        with DagsterInstance.from_ref(InstanceRef.from_dir(test_dir)) as instance:
+            instance.upgrade()
+
+            assert get_current_alembic_version(db_path) == "3c1d9e2a7f40"
+            assert "idx_runs_feed" in get_sqlite3_indexes(db_path, "runs")
+            assert "idx_runs_by_create_timestamp" in get_sqlite3_indexes(db_path, "runs")
+            assert "idx_bulk_actions_by_timestamp" in get_sqlite3_indexes(db_path, "bulk_actions")
+            assert "idx_backfill_tags_key_value" in get_sqlite3_indexes(db_path, "backfill_tags")
+
+            instance.run_storage._alembic_downgrade(rev="6b7fb194ff9c")  # pyright: ignore[reportAttributeAccessIssue]
+
+            assert get_current_alembic_version(db_path) == "6b7fb194ff9c"
+            assert "idx_runs_feed" not in get_sqlite3_indexes(db_path, "runs")
+            assert "idx_runs_by_create_timestamp" not in get_sqlite3_indexes(db_path, "runs")
+            assert "idx_bulk_actions_by_timestamp" not in get_sqlite3_indexes(
+                db_path, "bulk_actions"
+            )
+            assert "idx_backfill_tags_key_value" not in get_sqlite3_indexes(
+                db_path, "backfill_tags"
+            )
+
+
 # Prior to 0.10.0, it was possible to have `Materialization` events with no asset key.
 # `AssetMaterialization` is _supposed_ to runtime-check for null `AssetKey`, but it doesn't, so we
 # can deserialize a `Materialization` with a null asset key directly to an `AssetMaterialization`.
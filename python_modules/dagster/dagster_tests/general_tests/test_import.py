@@ -1,6 +1,12 @@
+import ast
+import importlib
 import subprocess
+import sys
 
+import dagster._check as check
 import pytest
+from dagster import AssetKey
+from dagster._serdes import serialize_value
 from dagster._seven import IS_WINDOWS
 from dagster._utils import file_relative_path
 
@@ -38,3 +44,75 @@ def test_import_perf():
         "`pip install tuna`, then run "
         "`python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt`."
     )
+
+
+def _type_checking_imports(module_path: str) -> dict[str, str]:
+    with open(module_path) as f:
+        tree = ast.parse(f.read())
+
+    imports = {}
+    for node in tree.body:
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING":
+            for stmt in node.body:
+                if isinstance(stmt, ast.ImportFrom):
+                    for alias in stmt.names:
+                        imports[alias.asname or alias.name] = check.not_none(stmt.module)
+    return imports
+
+
+@pytest.mark.parametrize(
+    "module_name, exports_attr",
+    [
+        ("dagster", "_PUBLIC_API"),
+        ("dagster._core.definitions", "_EXPORTS"),
+        ("dagster._core.definitions.decorators", "_EXPORTS"),
+        ("dagster._core.remote_representation", "_EXPORTS"),
+    ],
+)
+def test_lazy_exports_match_type_checking_imports(module_name: str, exports_attr: str):
+    module = importlib.import_module(module_name)
+    exports = getattr(module, exports_attr)
+    assert _type_checking_imports(check.not_none(module.__file__)) == exports
+
+    for name, defining_module_name in exports.items():
+        assert getattr(module, name) is getattr(importlib.import_module(defining_module_name), name)
+        assert name in dir(module)
+
+
+def _run_python(script: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return result.stdout
+
+
+def test_import_dagster_is_lazy():
+    imported = _run_python(
+        "import sys; import dagster; print(','.join(sorted(sys.modules)))"
+    ).strip()
+    assert "dagster._core.definitions.assets" not in imported.split(",")
+
+
+def test_step_worker_command_imports():
+    imported = _run_python(
+        "import sys\n"
+        "import click\n"
+        "from dagster._cli import cli\n"
+        "cli.get_command(click.Context(cli), 'api')\n"
+        "print(','.join(sorted(sys.modules)))\n"
+    ).strip()
+    modules = imported.split(",")
+    assert "dagster._cli.api" in modules
+    for module in ["dagster._cli.project", "dagster._generate", "dagster._cli.dev", "jinja2"]:
+        assert module not in modules
+
+
+def test_deserialize_before_import():
+    serialized = serialize_value(AssetKey(["foo", "bar"]))
+    result = _run_python(
+        "import sys\n"
+        "from dagster._serdes import deserialize_value\n"
+        "assert 'dagster._core.definitions.events' not in sys.modules\n"
+        f"print(type(deserialize_value({serialized!r})).__name__)\n"
+    )
+    assert result.strip() == "AssetKey"
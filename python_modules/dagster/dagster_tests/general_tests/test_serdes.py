@@ -12,6 +12,11 @@
 from dagster._check.functions import CheckError
 from dagster._model import DagsterModel
 from dagster._record import IHaveNew, record, record_custom
+from dagster._serdes.compression import (
+    compress_serialized_value,
+    decompress_serialized_value,
+    is_compressed_value,
+)
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     EnumSerializer,
@@ -23,6 +28,7 @@
     WhitelistMap,
     _whitelist_for_serdes,
     deserialize_value,
+    deserialize_values,
     get_prefix_for_a_serialized,
     get_storage_name,
     pack_value,
@@ -1217,3 +1223,23 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_compressed_values():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Foo(NamedTuple):
+        color: str
+        sizes: Sequence[int]
+
+    foos = [Foo(color="red", sizes=[1, 2]), Foo(color="blue", sizes=[])]
+    serialized = [serialize_value(foo, whitelist_map=test_map) for foo in foos]
+    compressed = [compress_serialized_value(val) for val in serialized]
+
+    assert all(is_compressed_value(val) for val in compressed)
+    assert not any(is_compressed_value(val) for val in serialized)
+    assert [decompress_serialized_value(val) for val in compressed] == serialized
+    assert deserialize_value(compressed[0], Foo, whitelist_map=test_map) == foos[0]
+    # compressed and uncompressed values can be deserialized together
+    assert deserialize_values([compressed[0], serialized[1]], Foo, whitelist_map=test_map) == foos
@@ -869,9 +869,11 @@ def test_engine_events(
     if run_config is None:  # multiprocess
         messages = [
             "Started process for run",
+            "Loaded job definition",
             "Executing steps using multiprocess executor",
             'Launching subprocess for "return_one"',
             'Executing step "return_one" in subprocess.',
+            "Loaded job definition",
             "Starting initialization of resources",
             "Finished initialization of resources",
             # multiply_by_2 and multiply_by_3 launch and execute in non-deterministic order
@@ -883,8 +885,11 @@ def test_engine_events(
             "",
             "",
             "",
+            "",
+            "",
             'Launching subprocess for "add"',
             'Executing step "add" in subprocess',
+            "Loaded job definition",
             "Starting initialization of resources",
             "Finished initialization of resources",
             "Multiprocess executor: parent process exiting",
@@ -893,6 +898,7 @@ def test_engine_events(
     else:
         messages = [
             "Started process for run",
+            "Loaded job definition",
             "Executing steps in process",
             "Starting initialization of resources",
             "Finished initialization of resources",
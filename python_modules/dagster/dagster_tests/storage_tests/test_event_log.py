@@ -23,13 +23,16 @@
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster._core.storage.event_log.migration import reencode_event_log_data
 from dagster._core.storage.event_log.schema import ConcurrencyLimitsTable, ConcurrencySlotsTable
+from dagster._core.storage.event_log.sqlite import sqlite_event_log
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import create_run_for_test, environ, instance_for_test
 from dagster._core.utils import make_new_run_id
+from dagster._serdes.compression import is_compressed_value
 from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
 from sqlalchemy import __version__ as sqlalchemy_version
 from sqlalchemy.engine import Connection
@@ -114,6 +117,41 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data(self, storage):
         with pytest.raises(DagsterEventLogInvalidForRun):
             storage.get_logs_for_run(run_id_2)
 
+    def test_compressed_events(self, instance, storage):
+        run = create_run_for_test(instance)
+        instance.report_engine_event("uncompressed", run)
+        with environ({"DAGSTER_EVENT_LOG_COMPRESSION": "1"}):
+            instance.report_engine_event("compressed", run)
+
+        def _stored_events():
+            with storage.run_connection(run.run_id) as conn:
+                return [
+                    event
+                    for (event,) in conn.execute(
+                        db_select([SqlEventLogStorageTable.c.event]).order_by(
+                            SqlEventLogStorageTable.c.id
+                        )
+                    ).fetchall()
+                ]
+
+        assert [is_compressed_value(event) for event in _stored_events()] == [False, True]
+        # compressed and uncompressed events are read alike
+        assert [event.message for event in storage.get_logs_for_run(run.run_id)] == [
+            "uncompressed",
+            "compressed",
+        ]
+
+        with environ({"DAGSTER_EVENT_LOG_COMPRESSION": "1"}):
+            reencode_event_log_data(instance)
+        assert [is_compressed_value(event) for event in _stored_events()] == [True, True]
+
+        reencode_event_log_data(instance)
+        assert [is_compressed_value(event) for event in _stored_events()] == [False, False]
+        assert [event.message for event in storage.get_logs_for_run(run.run_id)] == [
+            "uncompressed",
+            "compressed",
+        ]
+
     def cmd(self, exceptions, tmpdir_path):
         storage = SqliteEventLogStorage(tmpdir_path)
         try:
@@ -145,6 +183,39 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
             excs.append(exceptions.get())
         assert not excs, excs
 
+    def test_shard_engines_are_reused(self, storage, monkeypatch):
+        monkeypatch.setattr(sqlite_event_log, "MAX_CACHED_SHARD_ENGINES", 2)
+        run_id_1, run_id_2 = [make_new_run_id() for _ in range(2)]
+
+        with storage.run_connection(run_id_1) as conn:
+            engine = conn.engine
+        with storage.run_connection(run_id_1) as conn:
+            assert conn.engine is engine
+
+        storage.get_logs_for_run(run_id_2)
+        storage.has_table("event_logs")
+
+        # the least recently used shard engine is disposed once the cache is full
+        with storage.run_connection(run_id_1) as conn:
+            assert conn.engine is not engine
+
+    def test_nested_shard_connections_share_transaction(self, storage):
+        run_id = make_new_run_id()
+        event_insert = SqlEventLogStorageTable.insert().values(
+            run_id=run_id, event="{}", dagster_event_type=None, timestamp=None
+        )
+
+        with pytest.raises(ZeroDivisionError):
+            with storage.run_connection(run_id) as conn:
+                conn.execute(event_insert)
+                with storage.run_connection(run_id) as nested_conn:
+                    assert nested_conn is conn
+                    nested_conn.execute(event_insert)
+                1 / 0  # noqa: B018
+
+        with storage.run_connection(run_id) as conn:
+            assert not conn.execute(db_select([SqlEventLogStorageTable.c.id])).fetchall()
+
 
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
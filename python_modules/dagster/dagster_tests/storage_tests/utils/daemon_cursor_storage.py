@@ -33,3 +33,12 @@ def test_kvs(self, storage):
             "bar": "2",
             "key": "3",
         }
+
+        # a mix of existing and new keys
+        storage.set_cursor_values({"foo": "4", "baz": "5"})
+        assert storage.get_cursor_values({"foo", "bar", "baz", "key"}) == {
+            "foo": "4",
+            "bar": "2",
+            "baz": "5",
+            "key": "3",
+        }
@@ -3080,6 +3080,104 @@ def _store_partition_event(asset_key, partition, tags) -> int:
                 "p1": {DATA_VERSION_TAG: "3"},
             }
 
+    @pytest.mark.parametrize(
+        "dagster_event_type",
+        [DagsterEventType.ASSET_OBSERVATION, DagsterEventType.ASSET_MATERIALIZATION],
+    )
+    def test_get_latest_asset_partition_events(self, storage, instance, dagster_event_type):
+        a = AssetKey(["a"])
+        b = AssetKey(["b"])
+        c = AssetKey(["c"])
+        run_id = make_new_run_id()
+
+        def _store_partition_event(asset_key, partition, tags) -> int:
+            if dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                event_specific_data = StepMaterializationData(
+                    AssetMaterialization(asset_key=asset_key, partition=partition, tags=tags)
+                )
+            else:
+                event_specific_data = AssetObservationData(
+                    AssetObservation(asset_key=asset_key, partition=partition, tags=tags)
+                )
+            storage.store_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message="",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        dagster_event_type.value,
+                        "nonce",
+                        event_specific_data=event_specific_data,
+                    ),
+                )
+            )
+            return storage.get_event_records(
+                EventRecordsFilter(dagster_event_type),
+                limit=1,
+                ascending=False,
+            )[0].storage_id
+
+        def _get_latest_events(asset_keys):
+            latest_events_by_key = storage.get_latest_asset_partition_events(
+                asset_keys, dagster_event_type
+            )
+            # the bulk query should match the generic implementation on the base class
+            generic_latest_events_by_key = EventLogStorage.get_latest_asset_partition_events(
+                storage, asset_keys, dagster_event_type
+            )
+            for asset_key, latest_events in latest_events_by_key.items():
+                generic_latest_events = generic_latest_events_by_key[asset_key]
+                assert (
+                    latest_events._replace(
+                        timestamps=pytest.approx(generic_latest_events.timestamps)
+                    )
+                    == generic_latest_events
+                )
+            assert set(latest_events_by_key.keys()) == set(asset_keys)
+            return {
+                asset_key: {
+                    partition: (storage_id, data_version)
+                    for partition, storage_id, data_version in zip(
+                        latest_events.partition_keys,
+                        latest_events.storage_ids,
+                        latest_events.data_versions,
+                    )
+                }
+                for asset_key, latest_events in latest_events_by_key.items()
+            }
+
+        with create_and_delete_test_runs(instance, [run_id]):
+            assert storage.get_latest_asset_partition_events([], dagster_event_type) == {}
+            assert _get_latest_events([a, b]) == {a: {}, b: {}}
+
+            a1 = _store_partition_event(a, "p1", tags={DATA_VERSION_TAG: "1"})
+            a2 = _store_partition_event(a, "p2", tags=None)
+            b1 = _store_partition_event(b, "p1", tags={DATA_VERSION_TAG: "..."})
+            a1 = _store_partition_event(a, "p1", tags={DATA_VERSION_TAG: "2"})
+            _store_partition_event(c, "p1", tags=None)
+
+            assert _get_latest_events([a, b]) == {
+                a: {"p1": (a1, "2"), "p2": (a2, None)},
+                b: {"p1": (b1, "...")},
+            }
+            latest_events = storage.get_latest_asset_partition_events([a], dagster_event_type)[a]
+            assert latest_events.run_ids == [run_id, run_id]
+            assert all(timestamp > 0 for timestamp in latest_events.timestamps)
+            assert (
+                latest_events.storage_id_by_partition
+                == storage.get_latest_storage_id_by_partition(a, dagster_event_type)
+            )
+
+            storage.wipe_asset(a)
+            assert _get_latest_events([a, b]) == {a: {}, b: {"p1": (b1, "...")}}
+            a1 = _store_partition_event(a, "p1", tags={DATA_VERSION_TAG: "3"})
+            assert _get_latest_events([a, b]) == {
+                a: {"p1": (a1, "3")},
+                b: {"p1": (b1, "...")},
+            }
+
     def test_get_latest_asset_partition_materialization_attempts_without_materializations(
         self, storage, instance
     ):
@@ -24,7 +24,7 @@
     RemoteRepositoryOrigin,
 )
 from dagster._core.run_coordinator import DefaultRunCoordinator
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
 from dagster._core.storage.event_log import InMemoryEventLogStorage
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
@@ -267,6 +267,26 @@ def test_fetch_by_snapshot_id(self, storage):
         assert len(runs_b) == 1
         assert runs_b[0].run_id == two
 
+    def test_get_run_watermark(self, storage: RunStorage):
+        assert storage
+        assert storage.get_run_watermark() is None
+
+        one = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=one, job_name="foo"))
+        after_add = storage.get_run_watermark()
+        assert after_add
+
+        storage.add_run_tags(one, {"tag1": "val1"})
+        after_tags = storage.get_run_watermark()
+        assert after_tags
+        assert after_tags != after_add
+        assert after_tags[0] == after_add[0]
+
+        storage.add_run(TestRunStorage.build_run(run_id=make_new_run_id(), job_name="foo"))
+        after_second_add = storage.get_run_watermark()
+        assert after_second_add
+        assert after_second_add[0] > after_tags[0]
+
     def test_add_run_tags(self, storage: RunStorage):
         assert storage
         one = make_new_run_id()
@@ -697,6 +717,67 @@ def test_get_run_ids(self, storage):
         assert storage.get_run_ids(RunsFilter(job_name="some_pipeline")) == [three, two, one]
         assert storage.get_run_ids(RunsFilter(job_name="some_pipeline"), limit=1) == [three]
 
+    def test_prepared_runs_queries(self, storage):
+        assert storage
+        one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
+        storage.add_run(
+            TestRunStorage.build_run(run_id=one, job_name="foo", tags={"mytag": "hello"})
+        )
+        storage.add_run(
+            TestRunStorage.build_run(run_id=two, job_name="bar", tags={"mytag": "goodbye"})
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                job_name="foo",
+                tags={"mytag": "goodbye"},
+                status=DagsterRunStatus.SUCCESS,
+            )
+        )
+
+        # queries with the same shape but different values reuse the same statement
+        assert storage.get_run_ids(RunsFilter(job_name="foo")) == [three, one]
+        assert storage.get_run_ids(RunsFilter(job_name="bar")) == [two]
+        assert storage.get_run_ids(RunsFilter(job_name="baz")) == []
+        assert storage.get_run_ids(RunsFilter(tags={"mytag": "hello"})) == [one]
+        assert storage.get_run_ids(RunsFilter(tags={"mytag": "goodbye"})) == [three, two]
+        assert storage.get_run_ids(RunsFilter(tags={"mytag": ["hello", "goodbye"]})) == [
+            three,
+            two,
+            one,
+        ]
+        assert storage.get_run_ids(RunsFilter(tags={"mytag": ["hello"]})) == [one]
+        assert storage.get_run_ids(RunsFilter(run_ids=[one, two])) == [two, one]
+        assert storage.get_run_ids(RunsFilter(run_ids=[three])) == [three]
+        assert storage.get_run_ids(cursor=three, limit=1) == [two]
+        assert storage.get_run_ids(cursor=two, limit=2) == [one]
+        assert storage.get_runs_count(RunsFilter(job_name="foo")) == 2
+        assert storage.get_runs_count(RunsFilter(job_name="bar")) == 1
+        assert storage.get_runs_count(RunsFilter(statuses=[DagsterRunStatus.SUCCESS])) == 1
+        assert storage.get_runs_count(RunsFilter(statuses=[DagsterRunStatus.FAILURE])) == 0
+        assert [
+            record.dagster_run.run_id
+            for record in storage.get_run_records(RunsFilter(job_name="foo"), limit=1)
+        ] == [three]
+        assert [
+            record.dagster_run.run_id
+            for record in storage.get_run_records(RunsFilter(job_name="foo"), limit=2)
+        ] == [three, one]
+        assert storage.get_run_tags(["mytag"], value_prefix="h") == [("mytag", {"hello"})]
+        assert storage.get_run_tags(["mytag"], value_prefix="g") == [("mytag", {"goodbye"})]
+
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        latency_stats = storage.get_query_latency_stats()
+        assert latency_stats["get_run_ids"].count >= 11
+        assert latency_stats["get_runs_count"].count >= 4
+        assert latency_stats["get_run_tags"].count >= 2
+        stats = latency_stats["get_run_records"]
+        assert stats.count >= 2
+        assert sum(stats.bucket_counts) == stats.count
+        assert 0 < stats.get_percentile_upper_bound(50) <= stats.max_seconds
+
     def test_fetch_by_status(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1654,6 +1735,115 @@ def test_backfill_tags_filtering_multiple_results(self, storage: RunStorage):
         not_present_filter = BulkActionsFilter(tags={"not": "present"})
         self.get_backfills_and_assert_expected_count(storage, not_present_filter, 0)
 
+    def test_iter_runs_feed_entries(self, storage: RunStorage):
+        origin = self.fake_partition_set_origin("fake_partition_set")
+        run_ids = []
+        backfill_ids = []
+        for i in range(3):
+            backfill = PartitionBackfill(
+                f"backfill_{i}",
+                partition_set_origin=origin,
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["a", "b", "c"],
+                from_failure=False,
+                tags={"even": str(i % 2 == 0)},
+                backfill_timestamp=time.time(),
+            )
+            storage.add_backfill(backfill)
+            backfill_ids.append(backfill.backfill_id)
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    job_name="some_pipeline",
+                    tags={"even": str(i % 2 == 0), BACKFILL_ID_TAG: backfill.backfill_id},
+                )
+            )
+            # several runs are created within the same second, so their creation timestamps tie
+            for _ in range(2):
+                run_id = make_new_run_id()
+                storage.add_run(
+                    TestRunStorage.build_run(
+                        run_id=run_id, job_name="some_pipeline", tags={"even": str(i % 2 == 0)}
+                    )
+                )
+                run_ids.append(run_id)
+
+        def _ids(entries):
+            return [
+                entry.dagster_run.run_id if isinstance(entry, RunRecord) else entry.backfill_id
+                for entry in entries
+            ]
+
+        def _timestamps(entries):
+            return [
+                entry.create_timestamp.timestamp()
+                if isinstance(entry, RunRecord)
+                else entry.backfill_timestamp
+                for entry in entries
+            ]
+
+        entries = list(
+            storage.iter_runs_feed_entries(
+                RunsFilter(exclude_subruns=True), BulkActionsFilter(), page_size=2
+            )
+        )
+        assert sorted(_ids(entries)) == sorted(run_ids + backfill_ids)
+        assert _timestamps(entries) == sorted(_timestamps(entries), reverse=True)
+        assert [
+            entry.dagster_run.run_id for entry in entries if isinstance(entry, RunRecord)
+        ] == list(reversed(run_ids))
+        assert [
+            entry.backfill_id for entry in entries if isinstance(entry, PartitionBackfill)
+        ] == list(reversed(backfill_ids))
+
+        # resuming from the last run and backfill of a page continues where the page left off,
+        # including runs which were created in the same second as the last run of the page
+        first_page = entries[:5]
+        last_run = next(entry for entry in reversed(first_page) if isinstance(entry, RunRecord))
+        last_backfill = next(
+            entry for entry in reversed(first_page) if isinstance(entry, PartitionBackfill)
+        )
+        rest = list(
+            storage.iter_runs_feed_entries(
+                RunsFilter(exclude_subruns=True),
+                BulkActionsFilter(),
+                run_cursor=last_run.dagster_run.run_id,
+                backfill_cursor=last_backfill.backfill_id,
+                page_size=2,
+            )
+        )
+        assert sorted(_ids(first_page + rest)) == sorted(run_ids + backfill_ids)
+
+        # a source without a filter is excluded from the feed
+        assert _ids(
+            storage.iter_runs_feed_entries(RunsFilter(exclude_subruns=True), None, page_size=2)
+        ) == list(reversed(run_ids))
+        assert _ids(storage.iter_runs_feed_entries(None, BulkActionsFilter(), page_size=2)) == list(
+            reversed(backfill_ids)
+        )
+
+        # entries created after the max creation timestamp are excluded
+        assert _ids(
+            storage.iter_runs_feed_entries(
+                None,
+                BulkActionsFilter(),
+                max_creation_timestamp=storage.get_backfill(backfill_ids[1]).backfill_timestamp,  # pyright: ignore[reportOptionalMemberAccess]
+            )
+        ) == [backfill_ids[1], backfill_ids[0]]
+
+        assert _ids(
+            storage.iter_runs_feed_entries(
+                RunsFilter(tags={"even": "True"}, exclude_subruns=True), None, page_size=1
+            )
+        ) == [run_ids[5], run_ids[4], run_ids[1], run_ids[0]]
+
+        if self.supports_backfill_tags_filtering_queries():
+            assert _ids(
+                storage.iter_runs_feed_entries(
+                    None, BulkActionsFilter(tags={"even": "True"}), page_size=1
+                )
+            ) == [backfill_ids[2], backfill_ids[0]]
+
     def test_backfill_simple_job_name_filtering(self, storage: RunStorage):
         if not self.supports_backfill_job_name_filtering_queries():
             pytest.skip("storage does not support filtering backfills by job_name")
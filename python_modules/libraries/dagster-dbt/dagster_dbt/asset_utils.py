@@ -33,6 +33,7 @@
     LocalFileCodeReference,
 )
 
+from dagster_dbt.dbt_spec_cache import DbtSpecCache
 from dagster_dbt.metadata_set import DbtMetadataSet
 from dagster_dbt.utils import (
     ASSET_RESOURCE_TYPES,
@@ -789,6 +790,51 @@ def build_dbt_specs(
     exclude: str,
     io_manager_key: Optional[str],
     project: Optional["DbtProject"],
+) -> tuple[Sequence[AssetSpec], Sequence[AssetCheckSpec]]:
+    from dagster_dbt.dagster_dbt_translator import DbtManifestWrapper
+
+    spec_cache = DbtSpecCache.create(
+        translator=translator,
+        manifest=manifest,
+        select=select,
+        exclude=exclude,
+        io_manager_key=io_manager_key,
+        project=project,
+    )
+    live_metadata = {
+        DAGSTER_DBT_MANIFEST_METADATA_KEY: DbtManifestWrapper(manifest=manifest),
+        DAGSTER_DBT_TRANSLATOR_METADATA_KEY: translator,
+    }
+    if spec_cache:
+        cached_specs = spec_cache.load(live_metadata=live_metadata)
+        if cached_specs is not None:
+            return cached_specs
+
+    specs, check_specs = _build_dbt_specs(
+        translator=translator,
+        manifest=manifest,
+        select=select,
+        exclude=exclude,
+        io_manager_key=io_manager_key,
+        project=project,
+    )
+
+    if spec_cache:
+        spec_cache.store(
+            specs=specs, check_specs=check_specs, live_metadata_keys=list(live_metadata.keys())
+        )
+
+    return specs, check_specs
+
+
+def _build_dbt_specs(
+    *,
+    translator: "DagsterDbtTranslator",
+    manifest: Mapping[str, Any],
+    select: str,
+    exclude: str,
+    io_manager_key: Optional[str],
+    project: Optional["DbtProject"],
 ) -> tuple[Sequence[AssetSpec], Sequence[AssetCheckSpec]]:
     dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(manifest)
     group_props = {group["name"]: group for group in manifest.get("groups", {}).values()}
@@ -35,6 +35,7 @@
     os.getenv("DAGSTER_DBT_TERMINATION_TIMEOUT_SECONDS", "25")
 )
 DEFAULT_EVENT_POSTPROCESSING_THREADPOOL_SIZE: Final[int] = 4
+DEFAULT_EVENT_POSTPROCESSING_MAX_PENDING_EVENTS: Final[int] = 64
 
 
 logger = get_dagster_logger()
@@ -95,6 +96,9 @@ class DbtCliInvocation:
     postprocessing_threadpool_num_threads: int = field(
         init=False, default=DEFAULT_EVENT_POSTPROCESSING_THREADPOOL_SIZE
     )
+    postprocessing_max_pending_events: int = field(
+        init=False, default=DEFAULT_EVENT_POSTPROCESSING_MAX_PENDING_EVENTS
+    )
     _stdout: list[Union[str, dict[str, Any]]] = field(init=False, default_factory=list)
     _error_messages: list[str] = field(init=False, default_factory=list)
 
@@ -416,10 +420,10 @@ def _stream_stdout(self) -> Iterator[Union[str, dict[str, Any]]]:
 
             with self.process.stdout:
                 for raw_line in self.process.stdout or []:
-                    raw_event_str = raw_line.decode().strip()
-
                     try:
-                        raw_event = orjson.loads(raw_event_str)
+                        # orjson parses the raw bytes directly, so we only decode the line if
+                        # it is not a structured log event.
+                        raw_event = orjson.loads(raw_line)
 
                         # Parse the error message from the event, if it exists.
                         is_error_message = raw_event["info"]["level"] == "error"
@@ -428,7 +432,7 @@ def _stream_stdout(self) -> Iterator[Union[str, dict[str, Any]]]:
 
                         yield raw_event
                     except:
-                        yield raw_event_str
+                        yield raw_line.decode().strip()
 
         except DagsterExecutionInterruptedError:
             logger.info(f"Forwarding interrupt signal to dbt command: `{self.dbt_command}`.")
@@ -32,6 +32,8 @@
 # will be able to see the inner type of the iterator, rather than just `DbtEventIterator`.
 T = TypeVar("T", bound=DbtDagsterEventType)
 
+MetadataFn = Callable[["DbtCliInvocation", DbtDagsterEventType], Optional[dict[str, Any]]]
+
 
 def _get_dbt_resource_props_from_event(
     invocation: "DbtCliInvocation", event: DbtDagsterEventType
@@ -199,8 +201,16 @@ def __init__(
         self._inner_iterator = events
         self._dbt_cli_invocation = dbt_cli_invocation
 
+        # Metadata functions which are applied to each event in a single, shared post-processing
+        # stage, rather than in one threadpool per chained call.
+        self._metadata_fns: tuple[MetadataFn, ...] = ()
+        self._event_stream: Optional[Iterator[T]] = None
+
     def __next__(self) -> T:
-        return next(self._inner_iterator)
+        if self._event_stream is None:
+            self._event_stream = self._build_event_stream()
+
+        return next(self._event_stream)
 
     def __iter__(self) -> "DbtEventIterator[T]":
         return self
@@ -250,10 +260,14 @@ def fetch_column_metadata(
 
     def _attach_metadata(
         self,
-        fn: Callable[["DbtCliInvocation", DbtDagsterEventType], Optional[dict[str, Any]]],
+        fn: MetadataFn,
     ) -> "DbtEventIterator[DbtDagsterEventType]":
         """Runs a threaded task to attach metadata to each event in the iterator.
 
+        Metadata functions attached by chained calls, before the iterator is consumed, are fused
+        into a single post-processing stage. Each event then makes one trip through one shared,
+        bounded threadpool, and the functions are applied to it in the order they were attached.
+
         Args:
             fn (Callable[[DbtCliInvocation, DbtDagsterEventType], Optional[Dict[str, Any]]]):
                 A function which takes a DbtCliInvocation and a DbtDagsterEventType and returns
@@ -264,19 +278,38 @@ def _attach_metadata(
                 A set of corresponding Dagster events for dbt models, with any metadata output
                 by the function attached, yielded in the order they are emitted by dbt.
         """
+        # If this iterator has already started yielding events, we can no longer fuse the
+        # function into its post-processing stage, so we post-process its output instead.
+        if self._event_stream is not None:
+            event_iterator = DbtEventIterator(self, dbt_cli_invocation=self._dbt_cli_invocation)
+            event_iterator._metadata_fns = (fn,)  # noqa: SLF001
+            return event_iterator
+
+        event_iterator = DbtEventIterator(
+            self._inner_iterator, dbt_cli_invocation=self._dbt_cli_invocation
+        )
+        event_iterator._metadata_fns = (*self._metadata_fns, fn)  # noqa: SLF001
+        return event_iterator
+
+    def _build_event_stream(self) -> Iterator[T]:
+        if not self._metadata_fns:
+            return self._inner_iterator
+
+        metadata_fns = self._metadata_fns
 
         def _map_fn(event: DbtDagsterEventType) -> DbtDagsterEventType:
-            result = fn(self._dbt_cli_invocation, event)
-            if result is None:
-                return event
+            for fn in metadata_fns:
+                result = fn(self._dbt_cli_invocation, event)
+                if result is not None:
+                    event = event.with_metadata({**event.metadata, **result})
 
-            return event.with_metadata({**event.metadata, **result})
+            return event
 
         # If the adapter is DuckDB, we need to wait for the dbt CLI process to complete
         # so that the DuckDB lock is released. This is because DuckDB does not allow for
         # opening multiple connections to the same database when a write connection, such
         # as the one dbt uses, is open.
-        event_stream = self
+        event_stream = self._inner_iterator
         if (
             self._dbt_cli_invocation.adapter
             and self._dbt_cli_invocation.adapter.__class__.__name__ == "DuckDBAdapter"
@@ -284,25 +317,24 @@ def _map_fn(event: DbtDagsterEventType) -> DbtDagsterEventType:
             from dbt.adapters.duckdb import DuckDBAdapter
 
             if isinstance(self._dbt_cli_invocation.adapter, DuckDBAdapter):
-                event_stream = exhaust_iterator_and_yield_results_with_exception(self)
+                event_stream = exhaust_iterator_and_yield_results_with_exception(event_stream)
 
-        def _threadpool_wrap_map_fn() -> (
-            Iterator[Union[Output, AssetMaterialization, AssetObservation, AssetCheckResult]]
-        ):
+        def _threadpool_wrap_map_fn() -> Iterator[T]:
             with ThreadPoolExecutor(
                 max_workers=self._dbt_cli_invocation.postprocessing_threadpool_num_threads,
-                thread_name_prefix=f"dbt_attach_metadata_{fn.__name__}",
+                thread_name_prefix="dbt_attach_metadata",
             ) as executor:
+                # Bound the number of events being post-processed at once. Once the bound is
+                # reached, we stop reading from the dbt CLI process until the consumer catches up,
+                # which applies backpressure to the process through its stdout pipe.
                 yield from imap(
                     executor=executor,
                     iterable=event_stream,
                     func=_map_fn,
+                    max_pending=self._dbt_cli_invocation.postprocessing_max_pending_events,
                 )
 
-        return DbtEventIterator(
-            _threadpool_wrap_map_fn(),
-            dbt_cli_invocation=self._dbt_cli_invocation,
-        )
+        return cast(Iterator[T], _threadpool_wrap_map_fn())
 
     @public
     @experimental
@@ -39,12 +39,18 @@ class DagsterDbtTranslatorSettings:
             Defaults to False.
         enable_dbt_selection_by_name (bool): Whether to enable selecting dbt resources by name,
             rather than fully qualified name. Defaults to False.
+        enable_spec_cache (bool): Whether to cache the asset specs built from the dbt manifest on
+            disk, so that code locations load faster when the manifest has not changed. Cache
+            entries are keyed by the contents of the manifest and the translator, and are stored
+            in the directory set by the `DAGSTER_DBT_SPEC_CACHE_DIR` environment variable, or in
+            the target directory of the dbt project. Defaults to False.
     """
 
     enable_asset_checks: bool = True
     enable_duplicate_source_asset_keys: bool = False
     enable_code_references: bool = False
     enable_dbt_selection_by_name: bool = False
+    enable_spec_cache: bool = False
 
 
 class DagsterDbtTranslator:
@@ -0,0 +1,242 @@
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+import orjson
+from dagster import AssetCheckSpec, AssetSpec, get_dagster_logger
+from dagster.version import __version__ as dagster_version
+
+from dagster_dbt.version import __version__ as dagster_dbt_version
+
+if TYPE_CHECKING:
+    from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator
+    from dagster_dbt.dbt_project import DbtProject
+
+logger = get_dagster_logger()
+
+DAGSTER_DBT_SPEC_CACHE_DIR_ENV_VAR = "DAGSTER_DBT_SPEC_CACHE_DIR"
+DEFAULT_SPEC_CACHE_DIR_NAME = "dagster_dbt_spec_cache"
+
+# Bump this whenever the structure of the cached payload or the way specs are built changes in a
+# way that makes previously written cache entries invalid.
+_SPEC_CACHE_FORMAT_VERSION = "1"
+
+# Values that refer to live, in-process objects (the parsed manifest and the translator) are not
+# written to disk. They are replaced by this placeholder and re-attached when the entry is loaded.
+_LIVE_METADATA_PLACEHOLDER = "__dagster_dbt_spec_cache_live_value__"
+
+
+class _SpecPickler(pickle.Pickler):
+    """Pickler that can round-trip Dagster's NamedTuple-based definitions.
+
+    Classes like `AssetSpec` and `AssetKey` define a keyword-only `__new__` with validation, which
+    the default NamedTuple pickle protocol cannot call. The stored field values were already
+    validated when the spec was built, so we restore them with `tuple.__new__` directly.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        obj_type = type(obj)
+        if (
+            isinstance(obj, tuple)
+            and hasattr(obj_type, "_fields")
+            and obj_type.__reduce__ is tuple.__reduce__
+        ):
+            return tuple.__new__, (obj_type, tuple.__getitem__(obj, slice(None)))
+        return NotImplemented
+
+
+def _is_live_metadata_placeholder(value: Any) -> bool:
+    return isinstance(value, str) and value == _LIVE_METADATA_PLACEHOLDER
+
+
+def _dumps(obj: Any) -> bytes:
+    buffer = io.BytesIO()
+    _SpecPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+def get_manifest_hash(manifest: Mapping[str, Any]) -> str:
+    """Returns a hash of the contents of a parsed dbt manifest."""
+    return hashlib.sha256(orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def get_translator_fingerprint(translator: "DagsterDbtTranslator") -> Optional[str]:
+    """Returns a fingerprint of the translator class hierarchy, its source code and its instance
+    state, or None if the translator cannot be fingerprinted reliably.
+    """
+    hasher = hashlib.sha256()
+    try:
+        for cls in type(translator).__mro__:
+            if cls is object:
+                continue
+
+            hasher.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+            hasher.update(inspect.getsource(cls).encode())
+
+        hasher.update(_dumps(sorted(vars(translator).items())))
+    except Exception:
+        return None
+
+    return hasher.hexdigest()
+
+
+def get_spec_cache_dir(project: Optional["DbtProject"]) -> Path:
+    """Returns the directory in which cached specs are stored.
+
+    The location can be set with the `DAGSTER_DBT_SPEC_CACHE_DIR` environment variable. Otherwise,
+    the cache is placed in the target directory of the dbt project, or in the system temporary
+    directory if no project was supplied.
+    """
+    cache_dir = os.getenv(DAGSTER_DBT_SPEC_CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return Path(cache_dir)
+
+    if project:
+        return project.project_dir.joinpath(project.target_path, DEFAULT_SPEC_CACHE_DIR_NAME)
+
+    return Path(tempfile.gettempdir(), DEFAULT_SPEC_CACHE_DIR_NAME)
+
+
+class DbtSpecCache:
+    """An on-disk cache of the asset specs and asset check specs built from a dbt manifest.
+
+    Each cache entry is stored in its own file, named after the inputs that determine how specs are
+    built (the translator, the dbt selection and the project). The file holds the hash of the
+    manifest it was built from, so an entry is invalidated and overwritten as soon as the manifest
+    changes.
+    """
+
+    def __init__(self, path: Path, manifest_hash: str):
+        self._path = path
+        self._manifest_hash = manifest_hash
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @staticmethod
+    def create(
+        *,
+        translator: "DagsterDbtTranslator",
+        manifest: Mapping[str, Any],
+        select: str,
+        exclude: str,
+        io_manager_key: Optional[str],
+        project: Optional["DbtProject"],
+    ) -> Optional["DbtSpecCache"]:
+        """Returns the cache for the given set of build inputs, or None if caching is disabled or
+        the inputs cannot be fingerprinted.
+        """
+        if not translator.settings.enable_spec_cache:
+            return None
+
+        translator_fingerprint = get_translator_fingerprint(translator)
+        if translator_fingerprint is None:
+            logger.debug(
+                f"Unable to fingerprint {type(translator).__name__}, skipping the dbt spec cache."
+            )
+            return None
+
+        try:
+            manifest_hash = get_manifest_hash(manifest)
+        except orjson.JSONEncodeError:
+            return None
+
+        entry_key = hashlib.sha256(
+            orjson.dumps(
+                [
+                    _SPEC_CACHE_FORMAT_VERSION,
+                    dagster_version,
+                    dagster_dbt_version,
+                    translator_fingerprint,
+                    select,
+                    exclude,
+                    io_manager_key,
+                    os.fspath(project.project_dir.resolve()) if project else None,
+                ]
+            )
+        ).hexdigest()
+
+        return DbtSpecCache(
+            path=get_spec_cache_dir(project).joinpath(f"{entry_key}.pkl"),
+            manifest_hash=manifest_hash,
+        )
+
+    def load(
+        self,
+        *,
+        live_metadata: Mapping[str, Any],
+    ) -> Optional[tuple[Sequence[AssetSpec], Sequence[AssetCheckSpec]]]:
+        """Returns the cached specs, or None if there is no valid entry for the current manifest.
+
+        Args:
+            live_metadata (Mapping[str, Any]): The metadata values that were replaced by a
+                placeholder when the entry was written, keyed by metadata key.
+        """
+        try:
+            with self._path.open("rb") as f:
+                if f.readline().rstrip(b"\n").decode() != self._manifest_hash:
+                    return None
+
+                specs, check_specs = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug(f"Unable to read dbt spec cache entry {self._path}, ignoring it.")
+            return None
+
+        return [
+            spec._replace(
+                metadata={
+                    key: live_metadata[key] if _is_live_metadata_placeholder(value) else value
+                    for key, value in spec.metadata.items()
+                }
+            )
+            for spec in specs
+        ], check_specs
+
+    def store(
+        self,
+        *,
+        specs: Sequence[AssetSpec],
+        check_specs: Sequence[AssetCheckSpec],
+        live_metadata_keys: Sequence[str],
+    ) -> None:
+        """Writes the specs to the cache. Failures are logged and otherwise ignored, since the
+        cache is only an optimization.
+        """
+        serializable_specs = [
+            spec._replace(
+                metadata={
+                    key: _LIVE_METADATA_PLACEHOLDER if key in live_metadata_keys else value
+                    for key, value in spec.metadata.items()
+                }
+            )
+            for spec in specs
+        ]
+
+        temp_path = None
+        try:
+            payload = _dumps((serializable_specs, list(check_specs)))
+
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self._path.parent, prefix=f"{self._path.stem}.", delete=False
+            ) as f:
+                temp_path = f.name
+                f.write(f"{self._manifest_hash}\n".encode())
+                f.write(payload)
+
+            # Replace the entry atomically so that concurrent code servers never read a partially
+            # written file.
+            os.replace(temp_path, self._path)
+        except Exception:
+            logger.debug(f"Unable to write dbt spec cache entry {self._path}, skipping it.")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,116 @@
+# ruff: noqa: T201
+import argparse
+import copy
+import os
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from dagster import Definitions
+from dagster_dbt import (
+    DagsterDbtTranslator,
+    DagsterDbtTranslatorSettings,
+    DbtCliResource,
+    dbt_assets,
+)
+from dagster_dbt.dbt_spec_cache import DAGSTER_DBT_SPEC_CACHE_DIR_ENV_VAR
+
+from dagster_dbt_tests.dbt_projects import test_jaffle_shop_path
+
+DESC = """
+Measure the time it takes to load a code location containing `@dbt_assets` built from dbt
+manifests of increasing size, with and without the on-disk dbt spec cache.
+
+A synthetic manifest is generated for each size by cloning the `customers` model of the jaffle
+shop test project N times. Each clone depends on the previous two clones, so that the dependency
+structure is non-trivial. For each manifest, the script reports:
+
+  - the uncached load time (`enable_spec_cache=False`)
+  - the cold cache load time (`enable_spec_cache=True`, cache is empty)
+  - the warm cache load time (`enable_spec_cache=True`, cache is populated)
+"""
+
+parser = argparse.ArgumentParser(prog="dbt_code_location_load", description=DESC)
+
+parser.add_argument(
+    "--num-models",
+    type=int,
+    nargs="+",
+    default=[100, 1_000, 5_000],
+    help="The manifest sizes (number of models) to benchmark.",
+)
+
+
+def build_manifest(base_manifest: Mapping[str, Any], num_models: int) -> Mapping[str, Any]:
+    manifest = copy.deepcopy(dict(base_manifest))
+    template = manifest["nodes"]["model.jaffle_shop.customers"]
+
+    for i in range(num_models):
+        name = f"generated_model_{i}"
+        unique_id = f"model.jaffle_shop.{name}"
+        parents = [f"model.jaffle_shop.generated_model_{j}" for j in range(max(0, i - 2), i)]
+
+        node = copy.deepcopy(template)
+        node.update(
+            unique_id=unique_id,
+            name=name,
+            alias=name,
+            fqn=["jaffle_shop", "generated", name],
+            path=f"generated/{name}.sql",
+            original_file_path=f"models/generated/{name}.sql",
+            relation_name=f'"{node["database"]}"."{node["schema"]}"."{name}"',
+            depends_on={"macros": [], "nodes": parents},
+        )
+
+        manifest["nodes"][unique_id] = node
+        manifest["parent_map"][unique_id] = parents
+        manifest["child_map"][unique_id] = []
+        for parent in parents:
+            manifest["child_map"][parent].append(unique_id)
+
+    return manifest
+
+
+def load_code_location(manifest: Mapping[str, Any], enable_spec_cache: bool) -> float:
+    start = time.perf_counter()
+
+    @dbt_assets(
+        manifest=manifest,
+        dagster_dbt_translator=DagsterDbtTranslator(
+            DagsterDbtTranslatorSettings(enable_spec_cache=enable_spec_cache)
+        ),
+    )
+    def my_dbt_assets(): ...
+
+    Definitions(assets=[my_dbt_assets]).get_repository_def().load_all_definitions()
+
+    return time.perf_counter() - start
+
+
+def main(num_models: Sequence[int]) -> None:
+    base_manifest = (
+        DbtCliResource(
+            project_dir=os.fspath(test_jaffle_shop_path), global_config_flags=["--quiet"]
+        )
+        .cli(["parse"])
+        .wait()
+        .get_artifact("manifest.json")
+    )
+
+    print(f"{'models':>10} {'uncached (s)':>14} {'cold cache (s)':>16} {'warm cache (s)':>16}")
+    for n in num_models:
+        manifest = build_manifest(base_manifest, n)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ[DAGSTER_DBT_SPEC_CACHE_DIR_ENV_VAR] = cache_dir
+
+            uncached = load_code_location(manifest, enable_spec_cache=False)
+            cold = load_code_location(manifest, enable_spec_cache=True)
+            warm = load_code_location(manifest, enable_spec_cache=True)
+
+        print(f"{n:>10} {uncached:>14.3f} {cold:>16.3f} {warm:>16.3f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_models)
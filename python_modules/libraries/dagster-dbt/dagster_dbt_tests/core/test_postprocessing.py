@@ -16,7 +16,7 @@
 from dagster._core.definitions.metadata.table import TableRecord
 from dagster_dbt.asset_decorator import dbt_assets
 from dagster_dbt.core.dbt_cli_invocation import DbtCliInvocation, DbtDagsterEventType
-from dagster_dbt.core.dbt_event_iterator import _get_dbt_resource_props_from_event
+from dagster_dbt.core.dbt_event_iterator import DbtEventIterator, _get_dbt_resource_props_from_event
 from dagster_dbt.core.resource import DbtCliResource
 
 from dagster_dbt_tests.conftest import _create_dbt_invocation
@@ -321,3 +321,32 @@ def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
         len(summary.records) > 0 and "column_name" in summary.records[0].data
         for summary in summaries_by_asset_key.values()
     ), str(summaries_by_asset_key)
+
+
+def test_attach_metadata_fused_stage() -> None:
+    invocation = mock.MagicMock(
+        adapter=None, postprocessing_threadpool_num_threads=2, postprocessing_max_pending_events=2
+    )
+    events = [
+        AssetMaterialization(asset_key=f"asset_{i}", metadata={"index": i}) for i in range(20)
+    ]
+
+    def _double(_invocation, event):
+        return {"doubled": event.metadata["index"].value * 2}
+
+    def _quadruple(_invocation, event):
+        # metadata attached by earlier calls is visible to later ones
+        return {"quadrupled": event.metadata["doubled"].value * 2}
+
+    event_iterator = DbtEventIterator(iter(events), dbt_cli_invocation=invocation)
+    event_iterator = event_iterator._attach_metadata(_double)  # noqa: SLF001
+    event_iterator = event_iterator._attach_metadata(_quadruple)  # noqa: SLF001
+
+    # chained calls are fused into a single post-processing stage
+    assert event_iterator._metadata_fns == (_double, _quadruple)  # noqa: SLF001
+
+    results = cast(list[AssetMaterialization], list(event_iterator))
+    assert [event.asset_key.to_user_string() for event in results] == [
+        f"asset_{i}" for i in range(20)
+    ]
+    assert [event.metadata["quadrupled"].value for event in results] == [i * 4 for i in range(20)]
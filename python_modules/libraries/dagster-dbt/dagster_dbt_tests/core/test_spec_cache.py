@@ -0,0 +1,133 @@
+import copy
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+from dagster import AssetKey, AutomationCondition, DailyPartitionsDefinition
+from dagster_dbt.asset_utils import (
+    DAGSTER_DBT_MANIFEST_METADATA_KEY,
+    DAGSTER_DBT_TRANSLATOR_METADATA_KEY,
+    build_dbt_specs,
+)
+from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator, DagsterDbtTranslatorSettings
+from dagster_dbt.dbt_spec_cache import DAGSTER_DBT_SPEC_CACHE_DIR_ENV_VAR
+
+
+class CountingDagsterDbtTranslator(DagsterDbtTranslator):
+    def __init__(self, settings: DagsterDbtTranslatorSettings):
+        super().__init__(settings)
+        self.num_asset_key_calls = 0
+
+    def get_asset_key(self, dbt_resource_props: Mapping[str, Any]) -> AssetKey:
+        self.num_asset_key_calls += 1
+        return super().get_asset_key(dbt_resource_props).with_prefix("cached")
+
+    def get_automation_condition(self, dbt_resource_props: Mapping[str, Any]):
+        return AutomationCondition.eager()
+
+    def get_partitions_def(self, dbt_resource_props: Mapping[str, Any]):
+        return DailyPartitionsDefinition(start_date="2024-01-01")
+
+
+@pytest.fixture(name="spec_cache_dir")
+def spec_cache_dir_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(DAGSTER_DBT_SPEC_CACHE_DIR_ENV_VAR, str(tmp_path))
+    return tmp_path
+
+
+def _build(translator: DagsterDbtTranslator, manifest: Mapping[str, Any]):
+    return build_dbt_specs(
+        translator=translator,
+        manifest=manifest,
+        select="fqn:*",
+        exclude="",
+        io_manager_key=None,
+        project=None,
+    )
+
+
+def _count_calls(manifest: Mapping[str, Any]) -> tuple[int, Any]:
+    translator = CountingDagsterDbtTranslator(DagsterDbtTranslatorSettings(enable_spec_cache=True))
+    result = _build(translator, manifest)
+    return translator.num_asset_key_calls, result
+
+
+def test_spec_cache_disabled_by_default(
+    test_jaffle_shop_manifest: dict[str, Any], spec_cache_dir: Path
+) -> None:
+    _build(DagsterDbtTranslator(), test_jaffle_shop_manifest)
+
+    assert not list(spec_cache_dir.iterdir())
+
+
+def test_spec_cache_hit(test_jaffle_shop_manifest: dict[str, Any], spec_cache_dir: Path) -> None:
+    uncached_calls, (uncached_specs, uncached_check_specs) = _count_calls(test_jaffle_shop_manifest)
+    assert uncached_calls > 0
+    assert len(list(spec_cache_dir.glob("*.pkl"))) == 1
+
+    cached_calls, (cached_specs, cached_check_specs) = _count_calls(test_jaffle_shop_manifest)
+    assert cached_calls == 0
+
+    assert cached_check_specs == uncached_check_specs
+    assert len(cached_specs) == len(uncached_specs)
+    for cached_spec, uncached_spec in zip(cached_specs, uncached_specs):
+        assert cached_spec.key == uncached_spec.key
+        assert cached_spec.deps == uncached_spec.deps
+        assert cached_spec.automation_condition == uncached_spec.automation_condition
+        assert cached_spec.partitions_def == uncached_spec.partitions_def
+        assert list(cached_spec.metadata.keys()) == list(uncached_spec.metadata.keys())
+        assert (
+            cached_spec.metadata[DAGSTER_DBT_MANIFEST_METADATA_KEY].manifest
+            is test_jaffle_shop_manifest
+        )
+        assert isinstance(
+            cached_spec.metadata[DAGSTER_DBT_TRANSLATOR_METADATA_KEY],
+            CountingDagsterDbtTranslator,
+        )
+
+
+def test_spec_cache_invalidated_by_manifest_change(
+    test_jaffle_shop_manifest: dict[str, Any], spec_cache_dir: Path
+) -> None:
+    _count_calls(test_jaffle_shop_manifest)
+
+    manifest = copy.deepcopy(test_jaffle_shop_manifest)
+    manifest["nodes"]["model.jaffle_shop.customers"]["description"] = "A new description."
+
+    calls, (specs, _) = _count_calls(manifest)
+    assert calls > 0
+    assert next(
+        spec.description for spec in specs if spec.key == AssetKey(["cached", "customers"])
+    ).startswith("A new description.")
+
+    # the entry for the previous manifest is overwritten rather than accumulated
+    assert len(list(spec_cache_dir.glob("*.pkl"))) == 1
+
+
+def test_spec_cache_invalidated_by_translator_change(
+    test_jaffle_shop_manifest: dict[str, Any], spec_cache_dir: Path
+) -> None:
+    _count_calls(test_jaffle_shop_manifest)
+
+    translator = CountingDagsterDbtTranslator(
+        DagsterDbtTranslatorSettings(enable_spec_cache=True, enable_asset_checks=False)
+    )
+    _, check_specs = _build(translator, test_jaffle_shop_manifest)
+
+    assert translator.num_asset_key_calls > 0
+    assert not check_specs
+    assert len(list(spec_cache_dir.glob("*.pkl"))) == 2
+
+
+def test_spec_cache_corrupt_entry(
+    test_jaffle_shop_manifest: dict[str, Any], spec_cache_dir: Path
+) -> None:
+    _, (specs, _) = _count_calls(test_jaffle_shop_manifest)
+
+    [cache_entry_path] = spec_cache_dir.glob("*.pkl")
+    cache_entry_path.write_bytes(cache_entry_path.read_bytes()[:100])
+
+    calls, (rebuilt_specs, _) = _count_calls(test_jaffle_shop_manifest)
+    assert calls > 0
+    assert [spec.key for spec in rebuilt_specs] == [spec.key for spec in specs]